@@ -27,7 +27,7 @@
 
 struct {
     char *driver, *database, *table, *sql, *fs, *vs, *nv, *input, *output;
-    int c, d, h, test_only;
+    int c, d, h, test_only, json;
 } parms;
 
 /* function prototypes */
@@ -35,6 +35,7 @@ static void parse_command_line(int, char **);
 static int sel(dbDriver *, dbString *);
 static int get_stmt(FILE *, dbString *);
 static int stmt_is_empty(dbString *);
+static void print_json_value(dbColumn *, dbValue *, dbString *);
 
 int main(int argc, char **argv)
 {
@@ -144,6 +145,36 @@ int sel(dbDriver *driver, dbString *stmt)
 
     db_init_string(&value_string);
 
+    if (parms.json) {
+        /* one record per line, so the output can be read line by line */
+        int first_rec = TRUE;
+
+        fprintf(stdout, "{\"records\":[\n");
+        while (TRUE) {
+            if (db_fetch(&cursor, DB_NEXT, &more) != DB_OK)
+                return DB_FAILED;
+            if (!more)
+                break;
+            if (!first_rec)
+                fprintf(stdout, ",\n");
+            first_rec = FALSE;
+
+            fprintf(stdout, "{");
+            for (col = 0; col < ncols; col++) {
+                column = db_get_table_column(table, col);
+                value = db_get_column_value(column);
+                if (col)
+                    fprintf(stdout, ",");
+                fprintf(stdout, "\"%s\":", db_get_column_name(column));
+                print_json_value(column, value, &value_string);
+            }
+            fprintf(stdout, "}");
+        }
+        fprintf(stdout, "\n]}\n");
+
+        return DB_OK;
+    }
+
     /* column names if horizontal output */
     if (parms.h && parms.c) {
         for (col = 0; col < ncols; col++) {
@@ -186,10 +217,48 @@ int sel(dbDriver *driver, dbString *stmt)
     return DB_OK;
 }
 
+void print_json_value(dbColumn *column, dbValue *value,
+                      dbString *value_string)
+{
+    char *str;
+    int type;
+
+    if (db_test_value_isnull(value)) {
+        fprintf(stdout, "null");
+        return;
+    }
+    db_convert_column_value_to_string(column, value_string);
+    str = db_get_string(value_string);
+
+    /* Don't quote numbers, quote text and datetime. */
+    type = db_sqltype_to_Ctype(db_get_column_sqltype(column));
+    if (type == DB_C_TYPE_INT || type == DB_C_TYPE_DOUBLE) {
+        fprintf(stdout, "%s", str);
+        return;
+    }
+
+    /* JSON (mandatory) escapes: \" \\ \r \n \t \f \b */
+    if (strchr(str, '\\'))
+        str = G_str_replace(str, "\\", "\\\\");
+    if (strchr(str, '\r'))
+        str = G_str_replace(str, "\r", "\\r");
+    if (strchr(str, '\n'))
+        str = G_str_replace(str, "\n", "\\n");
+    if (strchr(str, '\t'))
+        str = G_str_replace(str, "\t", "\\t");
+    if (strchr(str, '"'))
+        str = G_str_replace(str, "\"", "\\\"");
+    if (strchr(str, '\f'))
+        str = G_str_replace(str, "\f", "\\f");
+    if (strchr(str, '\b'))
+        str = G_str_replace(str, "\b", "\\b");
+    fprintf(stdout, "\"%s\"", str);
+}
+
 void parse_command_line(int argc, char **argv)
 {
     struct Option *driver, *database, *table, *sql, *fs, *vs, *nv, *input,
-        *output;
+        *output, *format;
     struct Flag *c, *d, *v, *flag_test;
     struct GModule *module;
     const char *drv, *db;
@@ -238,6 +307,17 @@ void parse_command_line(int argc, char **argv)
     output->description =
         _("Name for output file (if omitted or \"-\" output to stdout)");
 
+    format = G_define_option();
+    format->key = "format";
+    format->type = TYPE_STRING;
+    format->required = YES;
+    format->label = _("Output format");
+    format->options = "plain,json";
+    format->descriptions = _("plain;Configurable plain text output;"
+                             "json;JSON (JavaScript Object Notation);");
+    format->answer = "plain";
+    format->guisection = _("Format");
+
     c = G_define_flag();
     c->key = 'c';
     c->description = _("Do not include column names in output");
@@ -292,6 +372,10 @@ void parse_command_line(int argc, char **argv)
         parms.h = FALSE;
 
     parms.test_only = flag_test->answer;
+    parms.json = strcmp(format->answer, "json") == 0;
+    if (parms.json && v->answer)
+        G_fatal_error(_("Flag -%c cannot be used with format <%s>"), v->key,
+                      format->answer);
 
     if (parms.input && *parms.input == 0) {
         G_usage();
@@ -9,6 +9,7 @@ Classes:
  - frame::DataCursor
  - frame::TplotFrame
  - frame::LookUp
+ - frame::RasterRowPool
 
 (C) 2012-2016 by the GRASS Development Team
 
@@ -19,6 +20,7 @@ This program is free software under the GNU General Public License
 @author start stvds support Matej Krejci
 """
 import os
+import time
 import six
 from itertools import cycle
 import numpy as np
@@ -52,6 +54,7 @@ except ImportError as e:
 
 import grass.temporal as tgis
 from core.gcmd import GMessage, GError, GException, RunCommand
+from core.gthread import gThread
 from gui_core.widgets import CoordinatesValidator
 from gui_core import gselect
 from core import globalvar
@@ -73,6 +76,18 @@ from gui_core.wrap import CheckBox, TextCtrl, Button, StaticText
 ALPHA = 0.5
 COLORS = ["b", "g", "r", "c", "m", "y", "k"]
 LINEAR_REG_LINE_COLOR = (0.56, 0.00, 1.00)
+# maximal number of raster maps kept open for sampling
+RASTER_POOL_SIZE = 256
+# interval in seconds between updates of the plot while sampling
+SAMPLING_UPDATE_INTERVAL = 0.25
+# keys of timeDataR items which are not maps
+DATASET_KEYS = [
+    "temporalType",
+    "granularity",
+    "validTopology",
+    "unit",
+    "temporalDataType",
+]
 
 
 def check_version(*version):
@@ -121,6 +136,15 @@ class TplotFrame(wx.Frame):
         self.Bind(wx.EVT_CLOSE, self.onClose)
         self.region = Region()
 
+        # properties and map lists of raster datasets, reused until
+        # a dataset is changed
+        self._strdsState = {}
+        # values are sampled in a thread which keeps the raster maps open
+        self._rasterPool = RasterRowPool()
+        self._samplingThread = gThread()
+        self._samplingId = 0
+        self._sampling = False
+
     def init(self):
         self.timeDataR = OrderedDict()
         self.timeDataV = OrderedDict()
@@ -131,6 +155,8 @@ class TplotFrame(wx.Frame):
         self.plotNameListV = []
         self.poi = None
         self.csvpath = None
+        # plotted lines of raster datasets updated while sampling
+        self._plotsR = {}
 
     def __del__(self):
         """Close the database interface and stop the messenger and C-interface
@@ -138,6 +164,9 @@ class TplotFrame(wx.Frame):
         """
         if self.dbif.connected is True:
             self.dbif.close()
+        # stop sampling and close the raster maps in the sampling thread
+        self._samplingId += 1
+        self._samplingThread.Run(callable=self._rasterPool.Close)
         tgis.stop_subprocesses()
 
     def onClose(self, evt):
@@ -411,8 +440,62 @@ class TplotFrame(wx.Frame):
         self.vbox.Fit(self)
         self.mainPanel.Fit()
 
+    def _getSTRDSState(self, fullname, etype):
+        """Get properties and list of maps of a raster dataset
+
+        The state is cached and read again from the temporal database
+        only when the dataset was changed.
+
+        :param str fullname: name of dataset with mapset
+        :param str etype: type of dataset
+
+        :return: dictionary with the state or None if dataset does not exist
+        """
+        sp = tgis.dataset_factory(etype, fullname)
+        if not sp.is_in_db(dbif=self.dbif):
+            return None
+        sp.select(dbif=self.dbif)
+        key = (
+            sp.base.get_mtime(),
+            sp.metadata.get_number_of_maps(),
+            sp.get_temporal_extent_as_tuple(),
+            sp.metadata.get_min_min(),
+            sp.metadata.get_max_max(),
+        )
+        state = self._strdsState.get(fullname)
+        if state and state["key"] == key:
+            return state
+        if state:
+            # registered maps could be changed together with the dataset
+            self._samplingThread.Run(
+                callable=self._rasterPool.Close,
+                names=[mapId for mapName, mapId, start, end in state["maps"]],
+            )
+
+        maps = sp.get_registered_maps_as_objects(order="start_time", dbif=self.dbif)
+        state = {
+            "key": key,
+            "temporalType": sp.get_temporal_type(),
+            "granularity": sp.get_granularity(),
+            "validTopology": sp.check_temporal_topology(maps=maps, dbif=self.dbif),
+            "unit": None,  # only with relative
+            "minmin": sp.metadata.get_min_min(),
+            "maps": [],
+        }
+        if state["temporalType"] == "relative":
+            start, end, state["unit"] = sp.get_relative_time()
+        for mapp in maps or []:
+            start, end = mapp.get_temporal_extent_as_tuple()
+            state["maps"].append((mapp.get_name(), mapp.get_id(), start, end))
+        self._strdsState[fullname] = state
+        return state
+
     def _getSTRDdata(self, timeseries):
         """Load data and read properties
+
+        Values of the maps are sampled in a thread,
+        see _startSampling().
+
         :param list timeseries: a list of timeseries
         """
         if not self.poi:
@@ -422,28 +505,26 @@ class TplotFrame(wx.Frame):
             return
         mode = None
         unit = None
-        columns = ",".join(["name", "start_time", "end_time"])
+        requests = []
         for series in timeseries:
             name = series[0]
             fullname = name + "@" + series[1]
             etype = series[2]
-            sp = tgis.dataset_factory(etype, fullname)
-            if not sp.is_in_db(dbif=self.dbif):
+            state = self._getSTRDSState(fullname, etype)
+            if state is None:
                 GError(
                     message=_("Dataset <%s> not found in temporal " "database")
                     % (fullname),
                     parent=self,
                 )
                 return
-            sp.select(dbif=self.dbif)
 
-            minmin = sp.metadata.get_min_min()
             self.plotNameListR.append(name)
             self.timeDataR[name] = OrderedDict()
 
             self.timeDataR[name]["temporalDataType"] = etype
-            self.timeDataR[name]["temporalType"] = sp.get_temporal_type()
-            self.timeDataR[name]["granularity"] = sp.get_granularity()
+            self.timeDataR[name]["temporalType"] = state["temporalType"]
+            self.timeDataR[name]["granularity"] = state["granularity"]
 
             if mode is None:
                 mode = self.timeDataR[name]["temporalType"]
@@ -458,15 +539,10 @@ class TplotFrame(wx.Frame):
                 )
                 return
 
-            # check topology
-            maps = sp.get_registered_maps_as_objects(dbif=self.dbif)
-            self.timeDataR[name]["validTopology"] = sp.check_temporal_topology(
-                maps=maps, dbif=self.dbif
-            )
+            self.timeDataR[name]["validTopology"] = state["validTopology"]
 
-            self.timeDataR[name]["unit"] = None  # only with relative
+            self.timeDataR[name]["unit"] = state["unit"]
             if self.timeDataR[name]["temporalType"] == "relative":
-                start, end, self.timeDataR[name]["unit"] = sp.get_relative_time()
                 if unit is None:
                     unit = self.timeDataR[name]["unit"]
                 elif self.timeDataR[name]["unit"] != unit:
@@ -480,26 +556,117 @@ class TplotFrame(wx.Frame):
                     )
                     return
 
-            rows = sp.get_registered_maps(
-                columns=columns, where=None, order="start_time", dbif=self.dbif
+            for mapName, mapId, start, end in state["maps"]:
+                self.timeDataR[name][mapName] = {}
+                self.timeDataR[name][mapName]["start_datetime"] = start
+                self.timeDataR[name][mapName]["end_datetime"] = end
+                self.timeDataR[name][mapName]["value"] = None
+            requests.append(
+                (
+                    name,
+                    [(mapName, mapId) for mapName, mapId, start, end in state["maps"]],
+                    state["minmin"],
+                )
             )
-            for row in rows:
-                self.timeDataR[name][row[0]] = {}
-                self.timeDataR[name][row[0]]["start_datetime"] = row[1]
-                self.timeDataR[name][row[0]]["end_datetime"] = row[2]
-                r = RasterRow(row[0])
-                r.open()
-                val = r.get_value(self.poi)
-                r.close()
-                if val == -2147483648 and val < minmin:
-                    self.timeDataR[name][row[0]]["value"] = None
-                else:
-                    self.timeDataR[name][row[0]]["value"] = val
 
         self.unit = unit
         self.temporalType = mode
+        self._startSampling(requests)
         return
 
+    def _startSampling(self, requests):
+        """Start sampling values of raster maps at the query point
+
+        Sampling of a previous query point is stopped.
+
+        :param list requests: list of (dataset name, list of (map name,
+                              map id), minimum of dataset)
+        """
+        self._samplingId += 1
+        point = self.poi.coords()
+        app = wx.GetApp()
+        if app is None or not app.IsMainLoopRunning():
+            # without the main loop (e.g., plot is saved to a file),
+            # values cannot be sent to the plot progressively
+            self._sampleValues(self._samplingId, requests, point, self._onSampledValues)
+            return
+        self._sampling = True
+        self._samplingThread.Run(
+            callable=self._sampleInThread,
+            samplingId=self._samplingId,
+            requests=requests,
+            point=point,
+        )
+
+    def _sampleValues(self, samplingId, requests, point, notify):
+        """Read values of raster maps at the point
+
+        The values are passed to notify in chunks as they are read.
+        The raster maps are kept open in the pool, so only the cells
+        are read for the next query point.
+        """
+        region = Region()
+        for name, maps, minmin in requests:
+            values = {}
+            lastUpdate = time.time()
+            for mapName, mapId in maps:
+                if samplingId != self._samplingId:
+                    # sampling of another point was requested
+                    return
+                val = self._rasterPool.Get(mapId).get_value(point, region)
+                if val == -2147483648 and val < minmin:
+                    val = None
+                values[mapName] = val
+                if time.time() - lastUpdate > SAMPLING_UPDATE_INTERVAL:
+                    notify(samplingId, name, values)
+                    values = {}
+                    lastUpdate = time.time()
+            notify(samplingId, name, values)
+
+    def _sampleInThread(self, samplingId, requests, point):
+        """Sample values in the sampling thread and send them to the plot"""
+
+        def notify(samplingId, name, values):
+            wx.CallAfter(self._onSampledValues, samplingId, name, values)
+
+        try:
+            self._sampleValues(samplingId, requests, point, notify)
+        except Exception as e:
+            wx.CallAfter(
+                GError,
+                parent=self,
+                message=_("Unable to read raster map values: %s") % e,
+                showTraceback=False,
+            )
+        wx.CallAfter(self._onSamplingDone, samplingId)
+
+    def _onSampledValues(self, samplingId, name, values):
+        """Update plot with values sampled by the thread"""
+        if samplingId != self._samplingId or name not in self.timeDataR:
+            return
+        for mapName, value in six.iteritems(values):
+            self.timeDataR[name][mapName]["value"] = value
+        line = self._plotsR.get(name)
+        if line is None:
+            return
+        line.set_ydata(
+            [
+                np.nan if item["value"] is None else item["value"]
+                for key, item in six.iteritems(self.timeDataR[name])
+                if key not in DATASET_KEYS
+            ]
+        )
+        self.axes2d.relim()
+        self.axes2d.autoscale_view()
+        self.canvas.draw_idle()
+
+    def _onSamplingDone(self, samplingId):
+        """Draw final plot when all values are sampled"""
+        if samplingId != self._samplingId:
+            return
+        self._sampling = False
+        self._drawFigure()
+
     def _parseVDbConn(self, mapp, layerInp):
         """find attribute key according to layer of input map"""
         vdb = Module("v.db.connect", map=mapp, flags="g", stdout_=PIPE)
@@ -833,6 +1000,7 @@ class TplotFrame(wx.Frame):
     def drawR(self):
         ycsv = []
         xcsv = []
+        self._plotsR = {}
         for i, name in enumerate(self.datasetsR):
             name = name[0]
             # just name; with mapset it would be long
@@ -841,19 +1009,13 @@ class TplotFrame(wx.Frame):
             xdata = []
             ydata = []
             for keys, values in six.iteritems(self.timeDataR[name]):
-                if keys in [
-                    "temporalType",
-                    "granularity",
-                    "validTopology",
-                    "unit",
-                    "temporalDataType",
-                ]:
+                if keys in DATASET_KEYS:
                     continue
                 xdata.append(self.convert(values["start_datetime"]))
                 ydata.append(values["value"])
                 xcsv.append(values["start_datetime"])
 
-            if len(ydata) == ydata.count(None):
+            if len(ydata) == ydata.count(None) and not self._sampling:
                 GError(
                     parent=self,
                     showTraceback=False,
@@ -867,9 +1029,17 @@ class TplotFrame(wx.Frame):
             color = next(self.colors)
             self.plots.append(
                 self.axes2d.plot(
-                    xdata, ydata, marker="o", color=color, label=self.plotNameListR[i]
+                    xdata,
+                    [np.nan if y is None else y for y in ydata],
+                    marker="o",
+                    color=color,
+                    label=self.plotNameListR[i],
                 )[0]
             )
+            self._plotsR[name] = self.plots[-1]
+            if self._sampling:
+                # the plot is updated while values are sampled
+                continue
 
             if self.linRegRaster.IsChecked():
                 self._drawSimpleLinRegLine(xdata=xdata, ydata=ydata)
@@ -877,7 +1047,7 @@ class TplotFrame(wx.Frame):
             if self.csvpath:
                 ycsv.append(ydata)
 
-        if self.csvpath:
+        if self.csvpath and not self._sampling:
             self._writeCSV(xcsv, ycsv)
         self._setLabels(self.timeDataR[name]["granularity"])
         # legend
@@ -1324,6 +1494,46 @@ class TplotFrame(wx.Frame):
             self.attribute.Clear()
 
 
+class RasterRowPool:
+    """Pool of open raster maps used for sampling values
+
+    At most size maps are kept open, the least recently used map is
+    closed when another map needs to be opened. Maps are opened and read
+    by the sampling thread only.
+    """
+
+    def __init__(self, size=RASTER_POOL_SIZE):
+        self.size = size
+        self._maps = OrderedDict()
+
+    def Get(self, name):
+        """Get open raster map
+
+        :param str name: name of the raster map
+        """
+        rast = self._maps.pop(name, None)
+        if rast is None:
+            while len(self._maps) >= self.size:
+                oldestName, oldest = self._maps.popitem(last=False)
+                oldest.close()
+            rast = RasterRow(name)
+            rast.open()
+        self._maps[name] = rast
+        return rast
+
+    def Close(self, names=None):
+        """Close raster maps
+
+        :param list names: names of maps to close, all maps if None
+        """
+        if names is None:
+            names = list(self._maps.keys())
+        for name in names:
+            rast = self._maps.pop(name, None)
+            if rast is not None:
+                rast.close()
+
+
 class LookUp:
     """Helper class for searching info by coordinates"""
 
@@ -55,10 +55,11 @@ CREATE TABLE  GRASS_MAP_spatial_extent (
   PRIMARY KEY (id)
 );
 
--- We have a specific table that stores the space time dataset ids in which the maps a registered
+-- We have a specific table that stores the space time dataset ids in which the maps a registered,
+-- one row for each map and space time dataset
 
-CREATE TABLE  GRASS_MAP_stds_register (
-  id VARCHAR NOT NULL,                  -- The id (PK) is the unique identifier for all tables, it is based on name (layer) and mapset (name(:layer)@mapset) and is used as primary key
-  registered_stds VARCHAR,              -- This column stores the names of all space time datasets in which a specific map is registered
-  PRIMARY KEY (id)
+CREATE TABLE  GRASS_MAP_stds_membership (
+  map_id VARCHAR NOT NULL,              -- The id of the map (name(:layer)@mapset)
+  stds_id VARCHAR NOT NULL,             -- The id of the space time dataset in which the map is registered
+  PRIMARY KEY (map_id, stds_id)
 );
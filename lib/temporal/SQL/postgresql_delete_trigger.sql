@@ -20,7 +20,7 @@ DELETE FROM raster_absolute_time WHERE id = OLD.id;
 DELETE FROM raster_relative_time WHERE id = OLD.id;
 DELETE FROM raster_spatial_extent WHERE id = OLD.id;
 DELETE FROM raster_metadata WHERE id = OLD.id;
-DELETE FROM raster_stds_register WHERE id = OLD.id;
+DELETE FROM raster_stds_membership WHERE map_id = OLD.id;
 RETURN OLD;
 END;
 $$ LANGUAGE plpgsql;
@@ -41,7 +41,7 @@ DELETE FROM raster3d_absolute_time WHERE id = OLD.id;
 DELETE FROM raster3d_relative_time WHERE id = OLD.id;
 DELETE FROM raster3d_spatial_extent WHERE id = OLD.id;
 DELETE FROM raster3d_metadata WHERE id = OLD.id;
-DELETE FROM raster3d_stds_register WHERE id = OLD.id;
+DELETE FROM raster3d_stds_membership WHERE map_id = OLD.id;
 RETURN OLD;
 END;
 $$ LANGUAGE plpgsql;
@@ -62,7 +62,7 @@ DELETE FROM vector_absolute_time WHERE id = OLD.id;
 DELETE FROM vector_relative_time WHERE id = OLD.id;
 DELETE FROM vector_spatial_extent WHERE id = OLD.id;
 DELETE FROM vector_metadata WHERE id = OLD.id;
-DELETE FROM vector_stds_register WHERE id = OLD.id;
+DELETE FROM vector_stds_membership WHERE map_id = OLD.id;
 RETURN OLD;
 END;
 $$ LANGUAGE plpgsql;
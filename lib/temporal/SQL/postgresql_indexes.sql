@@ -12,3 +12,7 @@ CREATE INDEX raster3d_absolute_time_index ON raster3d_absolute_time (start_time,
 
 CREATE INDEX vector_relative_time_index ON vector_relative_time (start_time, end_time);
 CREATE INDEX vector_absolute_time_index ON vector_absolute_time (start_time, end_time);
+
+CREATE INDEX raster_stds_membership_index ON raster_stds_membership (stds_id);
+CREATE INDEX raster3d_stds_membership_index ON raster3d_stds_membership (stds_id);
+CREATE INDEX vector_stds_membership_index ON vector_stds_membership (stds_id);
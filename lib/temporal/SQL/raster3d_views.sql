@@ -17,12 +17,11 @@ CREATE VIEW raster3d_view_abs_time AS SELECT
             A4.datatype, A4.cols, A4.rows, A4.depths,
             A4.nsres, A4.ewres, A4.tbres,
             A4.min, A4.max,
-            A4.number_of_cells, A5.registered_stds
+            A4.number_of_cells
             FROM raster3d_base A1, raster3d_absolute_time A2,
-            raster3d_spatial_extent A3, raster3d_metadata A4,
-            raster3d_stds_register A5
+            raster3d_spatial_extent A3, raster3d_metadata A4
             WHERE A1.id = A2.id AND A1.id = A3.id AND
-            A1.id = A4.id AND A1.id = A5.id;
+            A1.id = A4.id;
 
 CREATE VIEW raster3d_view_rel_time AS SELECT
             A1.id, A1.mapset,
@@ -34,9 +33,8 @@ CREATE VIEW raster3d_view_rel_time AS SELECT
             A4.datatype, A4.cols, A4.rows, A4.depths,
             A4.nsres, A4.ewres, A4.tbres,
             A4.min, A4.max,
-            A4.number_of_cells, A5.registered_stds
+            A4.number_of_cells
             FROM raster3d_base A1, raster3d_relative_time A2,
-            raster3d_spatial_extent A3, raster3d_metadata A4,
-            raster3d_stds_register A5
+            raster3d_spatial_extent A3, raster3d_metadata A4
             WHERE A1.id = A2.id AND A1.id = A3.id AND
-            A1.id = A4.id AND A1.id = A5.id;
+            A1.id = A4.id;
@@ -16,12 +16,11 @@ CREATE VIEW raster_view_abs_time AS SELECT
             A3.north, A3.south, A3.east, A3.west, A3.bottom, A3.top, A3.proj,
             A4.datatype, A4.cols, A4.rows,
             A4.nsres, A4.ewres, A4.min, A4.max,
-            A4.number_of_cells, A4.semantic_label, A5.registered_stds
+            A4.number_of_cells, A4.semantic_label
             FROM raster_base A1, raster_absolute_time A2,
-            raster_spatial_extent A3, raster_metadata A4,
-            raster_stds_register A5
+            raster_spatial_extent A3, raster_metadata A4
             WHERE A1.id = A2.id AND A1.id = A3.id AND
-            A1.id = A4.id AND A1.id = A5.id;
+            A1.id = A4.id;
 
 CREATE VIEW raster_view_rel_time AS SELECT
             A1.id, A1.mapset,
@@ -32,9 +31,8 @@ CREATE VIEW raster_view_rel_time AS SELECT
             A3.north, A3.south, A3.east, A3.west, A3.bottom, A3.top, A3.proj,
             A4.datatype, A4.cols, A4.rows,
             A4.nsres, A4.ewres, A4.min, A4.max,
-            A4.number_of_cells, A4.semantic_label, A5.registered_stds
+            A4.number_of_cells, A4.semantic_label
             FROM raster_base A1, raster_relative_time A2,
-            raster_spatial_extent A3, raster_metadata A4,
-            raster_stds_register A5
+            raster_spatial_extent A3, raster_metadata A4
             WHERE A1.id = A2.id AND A1.id = A3.id AND
-            A1.id = A4.id AND A1.id = A5.id;
+            A1.id = A4.id;
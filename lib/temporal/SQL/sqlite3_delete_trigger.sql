@@ -20,7 +20,7 @@ CREATE TRIGGER delete_raster_base AFTER DELETE ON raster_base
     DELETE FROM raster_relative_time WHERE id = old.id;
     DELETE FROM raster_spatial_extent WHERE id = old.id;
     DELETE FROM raster_metadata WHERE id = old.id;
-    DELETE FROM raster_stds_register WHERE id = old.id;
+    DELETE FROM raster_stds_membership WHERE map_id = old.id;
   END;
 
 CREATE TRIGGER delete_str3ds_base AFTER DELETE ON str3ds_base
@@ -37,7 +37,7 @@ CREATE TRIGGER delete_raster3d_base AFTER DELETE ON raster3d_base
     DELETE FROM raster3d_relative_time WHERE id = old.id;
     DELETE FROM raster3d_spatial_extent WHERE id = old.id;
     DELETE FROM raster3d_metadata WHERE id = old.id;
-    DELETE FROM raster3d_stds_register WHERE id = old.id;
+    DELETE FROM raster3d_stds_membership WHERE map_id = old.id;
   END;
 
 CREATE TRIGGER delete_stvds_base AFTER DELETE ON stvds_base
@@ -54,5 +54,5 @@ CREATE TRIGGER delete_vector_base AFTER DELETE ON vector_base
     DELETE FROM vector_relative_time WHERE id = old.id;
     DELETE FROM vector_spatial_extent WHERE id = old.id;
     DELETE FROM vector_metadata WHERE id = old.id;
-    DELETE FROM vector_stds_register WHERE id = old.id;
+    DELETE FROM vector_stds_membership WHERE map_id = old.id;
   END;
@@ -0,0 +1,47 @@
+--#############################################################################
+-- This SQL script generates the sqlite3 R*Tree spatial index of the
+-- spatial extent of the GRASS_MAP maps. The index requires the R*Tree
+-- module of SQLite.
+--
+-- The R*Tree entries are identified by the rowid of the spatial extent
+-- table and are kept up-to-date by triggers.
+--#############################################################################
+
+-- GRASS_MAP is a placeholder for specific map type: raster, raster3d or vector
+
+CREATE VIRTUAL TABLE GRASS_MAP_spatial_extent_rtree USING rtree (
+  id,                   -- The rowid of the spatial extent table entry
+  min_x, max_x,         -- west, east
+  min_y, max_y,         -- south, north
+  min_z, max_z          -- bottom, top
+);
+
+CREATE TRIGGER insert_GRASS_MAP_spatial_extent_rtree AFTER INSERT ON GRASS_MAP_spatial_extent
+  BEGIN
+    INSERT INTO GRASS_MAP_spatial_extent_rtree VALUES (new.rowid,
+      min(new.west, new.east), max(new.west, new.east),
+      min(new.south, new.north), max(new.south, new.north),
+      min(new.bottom, new.top), max(new.bottom, new.top));
+  END;
+
+CREATE TRIGGER update_GRASS_MAP_spatial_extent_rtree AFTER UPDATE ON GRASS_MAP_spatial_extent
+  BEGIN
+    DELETE FROM GRASS_MAP_spatial_extent_rtree WHERE id = old.rowid;
+    INSERT INTO GRASS_MAP_spatial_extent_rtree VALUES (new.rowid,
+      min(new.west, new.east), max(new.west, new.east),
+      min(new.south, new.north), max(new.south, new.north),
+      min(new.bottom, new.top), max(new.bottom, new.top));
+  END;
+
+CREATE TRIGGER delete_GRASS_MAP_spatial_extent_rtree AFTER DELETE ON GRASS_MAP_spatial_extent
+  BEGIN
+    DELETE FROM GRASS_MAP_spatial_extent_rtree WHERE id = old.rowid;
+  END;
+
+-- Index the maps that are already registered
+
+INSERT INTO GRASS_MAP_spatial_extent_rtree SELECT rowid,
+  min(west, east), max(west, east),
+  min(south, north), max(south, north),
+  min(bottom, top), max(bottom, top)
+  FROM GRASS_MAP_spatial_extent;
@@ -0,0 +1,36 @@
+--#############################################################################
+-- This SQL script upgrades TGIS DB from version 3 to version 4.
+--
+-- The comma separated lists of space time datasets in the
+-- GRASS_MAP_stds_register tables are replaced by the normalized
+-- GRASS_MAP_stds_membership tables. The existing entries are moved
+-- into the new tables and the delete triggers are recreated by
+-- upgrade_temporal_database().
+--#############################################################################
+
+-- map_tables_template.sql
+CREATE TABLE raster_stds_membership (
+  map_id VARCHAR NOT NULL,
+  stds_id VARCHAR NOT NULL,
+  PRIMARY KEY (map_id, stds_id)
+);
+CREATE TABLE raster3d_stds_membership (
+  map_id VARCHAR NOT NULL,
+  stds_id VARCHAR NOT NULL,
+  PRIMARY KEY (map_id, stds_id)
+);
+CREATE TABLE vector_stds_membership (
+  map_id VARCHAR NOT NULL,
+  stds_id VARCHAR NOT NULL,
+  PRIMARY KEY (map_id, stds_id)
+);
+
+-- sqlite3_indexes.sql, postgresql_indexes.sql
+CREATE INDEX raster_stds_membership_index ON raster_stds_membership (stds_id);
+CREATE INDEX raster3d_stds_membership_index ON raster3d_stds_membership (stds_id);
+CREATE INDEX vector_stds_membership_index ON vector_stds_membership (stds_id);
+
+-- tgis_metadata
+UPDATE tgis_metadata
+  SET value = '4'
+  WHERE key = 'tgis_db_version';
@@ -0,0 +1,13 @@
+--#############################################################################
+-- This SQL script upgrades TGIS DB from version 4 to version 5.
+--
+-- The start time indexes of the map tables (sqlite3_indexes.sql) and the
+-- R*Tree spatial index of the map extents
+-- (sqlite3_spatial_index_template.sql) are created for the SQLite backend
+-- by upgrade_temporal_database(). The PostgreSQL indexes are unchanged.
+--#############################################################################
+
+-- tgis_metadata
+UPDATE tgis_metadata
+  SET value = '5'
+  WHERE key = 'tgis_db_version';
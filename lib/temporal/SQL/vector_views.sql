@@ -16,12 +16,11 @@ CREATE VIEW vector_view_abs_time AS SELECT
             A4.is_3d, A4.points, A4.lines,
             A4.boundaries, A4.centroids, A4.faces, A4.kernels,
             A4.primitives, A4.nodes, A4.areas, A4.islands,
-            A4.holes, A4.volumes, A5.registered_stds
+            A4.holes, A4.volumes
             FROM vector_base A1, vector_absolute_time A2,
-            vector_spatial_extent A3, vector_metadata A4,
-            vector_stds_register A5
+            vector_spatial_extent A3, vector_metadata A4
             WHERE A1.id = A2.id AND A1.id = A3.id AND
-            A1.id = A4.id AND A1.id = A5.id;
+            A1.id = A4.id;
 
 CREATE VIEW vector_view_rel_time AS SELECT
             A1.id, A1.mapset,
@@ -33,9 +32,8 @@ CREATE VIEW vector_view_rel_time AS SELECT
             A4.is_3d, A4.points, A4.lines,
             A4.boundaries, A4.centroids, A4.faces, A4.kernels,
             A4.primitives, A4.nodes, A4.areas, A4.islands,
-            A4.holes, A4.volumes, A5.registered_stds
+            A4.holes, A4.volumes
             FROM vector_base A1, vector_relative_time A2,
-            vector_spatial_extent A3, vector_metadata A4,
-            vector_stds_register A5
+            vector_spatial_extent A3, vector_metadata A4
             WHERE A1.id = A2.id AND A1.id = A3.id AND
-            A1.id = A4.id AND A1.id = A5.id;
+            A1.id = A4.id;
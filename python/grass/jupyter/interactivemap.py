@@ -31,16 +31,25 @@ class Raster:
         use_region=False,
         saved_region=None,
         renderer=None,
+        tiled=False,
         **kwargs,
     ):
         """Reproject GRASS raster, export to PNG, and compute bounding box.
 
+        With tiled=True, the raster is not rendered at once, but as XYZ tiles
+        reprojected only when they are displayed in the current view,
+        which is faster for large rasters. Tiles are provided by a local
+        server, so this works only when the notebook runs on the same
+        machine as the web browser.
+
         param str name: raster name
         param str title: title of raster to display in layer control legend
         param bool use_region: use computational region of current mapset
         param str saved_region: name of saved computation region
         param renderer: instance of ReprojectionRenderer
+        param bool tiled: render raster lazily as tiles
         **kwargs: keyword arguments passed to folium.raster_layers.ImageOverlay()
+                  or folium.raster_layers.TileLayer() when tiled
         """
         import folium  # pylint: disable=import-outside-toplevel
 
@@ -62,13 +71,27 @@ class Raster:
         # By doing this here instead of in add_to, we avoid rendering
         # twice if added to multiple maps. This mimics the behavior
         # folium.raster_layers.ImageOverlay()
-        self._filename, self._bounds = self._renderer.render_raster(name)
+        self._tiled = tiled
+        if self._tiled:
+            self._tiles_url, self._bounds = self._renderer.render_raster_tiles(name)
+        else:
+            self._filename, self._bounds = self._renderer.render_raster(name)
 
     def add_to(self, folium_map):
         """Add raster to folium map with folium.raster_layers.ImageOverlay()
+        or folium.raster_layers.TileLayer() when tiled
 
         A folium map is an instance of folium.Map.
         """
+        if self._tiled:
+            self._folium.raster_layers.TileLayer(
+                tiles=self._tiles_url,
+                attr=self._title,
+                name=self._title,
+                overlay=True,
+                **self._overlay_kwargs,
+            ).add_to(folium_map)
+            return
         # Overlay image on folium map
         img = self._folium.raster_layers.ImageOverlay(
             image=self._filename,
@@ -154,6 +177,7 @@ class InteractiveMap:
         API_key=None,  # pylint: disable=invalid-name
         use_region=False,
         saved_region=None,
+        cache_dir=None,
     ):
         """Creates a blank folium map centered on g.region.
 
@@ -175,12 +199,17 @@ class InteractiveMap:
         Vector data are always reprojected without any clipping,
         i.e., region options don't do anything.
 
+        If cache_dir is provided, reprojected rasters and vectors are stored
+        in that directory and reused next time the same map is displayed
+        with the same region and resolution, even in a different session.
+
         :param int height: height in pixels of figure (default 400)
         :param int width: width in pixels of figure (default 400)
         :param str tiles: map tileset to use
         :param str API_key: API key for Mapbox or Cloudmade tiles
         :param bool use_region: use computational region of current mapset
         :param str saved_region: name of saved computation region
+        :param str cache_dir: directory for persistent cache of reprojected maps
         """
         import folium  # pylint: disable=import-outside-toplevel
 
@@ -202,7 +231,7 @@ class InteractiveMap:
         self.layer_control_object = None
 
         self._renderer = ReprojectionRenderer(
-            use_region=use_region, saved_region=saved_region
+            use_region=use_region, saved_region=saved_region, cache_dir=cache_dir
         )
 
     def add_vector(self, name, title=None, **kwargs):
@@ -216,7 +245,7 @@ class InteractiveMap:
         """
         Vector(name, title=title, renderer=self._renderer, **kwargs).add_to(self.map)
 
-    def add_raster(self, name, title=None, **kwargs):
+    def add_raster(self, name, title=None, tiled=False, **kwargs):
         """Imports raster into temporary WGS84 location,
         exports as png and overlays on folium map.
 
@@ -230,9 +259,13 @@ class InteractiveMap:
 
         :param str name: name of raster to add to display; positional-only parameter
         :param str title: raster name for layer control
+        :param bool tiled: render only tiles in the current view (for large rasters)
         :**kwargs: keyword arguments passed to folium.raster_layers.ImageOverlay()
+                   or folium.raster_layers.TileLayer() when tiled
         """
-        Raster(name, title=title, renderer=self._renderer, **kwargs).add_to(self.map)
+        Raster(
+            name, title=title, renderer=self._renderer, tiled=tiled, **kwargs
+        ).add_to(self.map)
 
     def add_layer_control(self, **kwargs):
         """Add layer control to display"
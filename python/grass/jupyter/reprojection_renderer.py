@@ -14,11 +14,18 @@
 """Reprojects rasters to Pseudo-Mercator and vectors to WGS84. Exports reprojected
  rasters and vectors to PNGs and geoJSONs, respectively."""
 
+import hashlib
+import json
+import math
 import os
+import shutil
 import tempfile
+import threading
 import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 import grass.script as gs
+from grass.exceptions import CalledModuleError
 from .map import Map
 from .utils import (
     get_location_proj_string,
@@ -28,6 +35,94 @@ from .utils import (
 )
 from .region import RegionManagerForInteractiveMap
 
+# size of XYZ tiles in pixels
+TILE_SIZE = 256
+# half of the extent of the Pseudo-Mercator projection in meters
+PSMERC_ORIGIN = math.pi * 6378137
+
+
+def tile_bounds(z, x, y):
+    """Return bounds of XYZ tile in Pseudo-Mercator as (north, south, east, west)"""
+    size = 2 * PSMERC_ORIGIN / 2**z
+    west = -PSMERC_ORIGIN + x * size
+    north = PSMERC_ORIGIN - y * size
+    return north, north - size, west + size, west
+
+
+def _map_timestamp(file_info, element, env):
+    """Return time of the last modification of a raster or vector map.
+
+    For rasters, the header, data, and color table files are considered
+    (including secondary color table in the current mapset),
+    for vectors, all files in the map directory.
+    """
+    if element == "vector":
+        paths = [entry.path for entry in os.scandir(file_info["file"])]
+    else:
+        mapset_path = os.path.dirname(os.path.dirname(file_info["file"]))
+        paths = [
+            os.path.join(mapset_path, directory, file_info["name"])
+            for directory in ("cell", "fcell", "cellhd", "colr")
+        ]
+        env_info = gs.gisenv(env=env)
+        paths.append(
+            os.path.join(
+                env_info["GISDBASE"],
+                env_info["LOCATION_NAME"],
+                env_info["MAPSET"],
+                "colr2",
+                file_info["mapset"],
+                file_info["name"],
+            )
+        )
+    return max((os.path.getmtime(path) for path in paths if os.path.exists(path)))
+
+
+def _cache_key(*parts):
+    """Return hash usable as a file name for given JSON-serializable values"""
+    return hashlib.sha256(
+        json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _store_file(source, destination):
+    """Copy file into cache so that readers never see partially written file"""
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    temp_file = f"{destination}.{os.getpid()}.{threading.get_ident()}"
+    shutil.copyfile(source, temp_file)
+    os.replace(temp_file, destination)
+
+
+class _TileRequestHandler(BaseHTTPRequestHandler):
+    """Serves XYZ tiles rendered on request by ReprojectionRenderer"""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle request for /layer/z/x/y.png"""
+        renderer = self.server.renderer()
+        filename = None
+        try:
+            layer, z, x, y = self.path.strip("/").split("/")
+            y = y.rsplit(".", 1)[0]
+            if renderer:
+                filename = renderer.render_raster_tile(
+                    int(layer), int(z), int(x), int(y)
+                )
+        except (ValueError, IndexError, CalledModuleError):
+            filename = None
+        if not filename:
+            self.send_error(404)
+            return
+        with open(filename, "rb") as tile_file:
+            data = tile_file.read()
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Do not print requests into the notebook"""
+
 
 class ReprojectionRenderer:
     """This class reprojects rasters and vectors to folium-compatible temporary location
@@ -37,13 +132,20 @@ class ReprojectionRenderer:
     PNG images.
     """
 
-    def __init__(self, use_region=False, saved_region=None, work_dir=None):
+    def __init__(
+        self, use_region=False, saved_region=None, work_dir=None, cache_dir=None
+    ):
         """Creates Pseudo-Mercator and WGS84 locations. If no work_dir provided, also
         creates temporary working directory to contain locations.
 
+        If cache_dir is provided, reprojected rasters and vectors are stored
+        there and reused by later calls (also from other notebook sessions)
+        as long as the map, computational region, and resolution are the same.
+
         param bool use_region: use computational region of current mapset
         param str saved_region: name of saved computation region to use
         param work_dir: path to directory where locations, files should be written
+        param cache_dir: path to directory for persistent cache of rendered files
         """
         # Temporary folder for all our files
         if not work_dir:
@@ -79,6 +181,11 @@ class ReprojectionRenderer:
             use_region, saved_region, self._src_env, self._psmerc_env
         )
 
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        # raster layers rendered as tiles and server providing them
+        self._tile_layers = []
+        self._tile_server = None
+
     def get_bbox(self):
         """Return bounding box of computation region in WGS84"""
         return self._region_manager.bbox
@@ -96,6 +203,18 @@ class ReprojectionRenderer:
         mapset = file_info["mapset"]
 
         self._region_manager.set_region_from_raster(full_name)
+        if self._cache_dir:
+            key = _cache_key(
+                full_name,
+                _map_timestamp(file_info, "cell", self._src_env),
+                gs.region(env=self._src_env),
+                gs.region(env=self._psmerc_env),
+                self._region_manager.resolution,
+            )
+            cached_file = self._cache_dir / "rasters" / f"{key}.png"
+            bounds_file = self._cache_dir / "rasters" / f"{key}.json"
+            if cached_file.exists() and bounds_file.exists():
+                return str(cached_file), json.loads(bounds_file.read_text())
         # Reproject raster into WGS84/epsg3857 location
         env_info = gs.gisenv(env=self._src_env)
         tgt_name = full_name.replace("@", "_")
@@ -130,9 +249,125 @@ class ReprojectionRenderer:
             [bounds["north"], bounds["west"]],
             [bounds["south"], bounds["east"]],
         ]
+        if self._cache_dir:
+            _store_file(filename, cached_file)
+            bounds_file.write_text(json.dumps(new_bounds))
+            filename = str(cached_file)
 
         return filename, new_bounds
 
+    def render_raster_tiles(self, name):
+        """Prepare raster for rendering as XYZ tiles in Pseudo-Mercator.
+
+        Instead of reprojecting the whole raster at once, only tiles requested
+        by the map view are reprojected and rendered. The tiles are provided
+        by a local HTTP server started on first use, so the URL is accessible
+        only when the notebook runs on the same machine as the web browser.
+        Return URL template of tiles and bounding box in WGS84.
+
+        param str name: name of raster
+        """
+        file_info = gs.find_file(name, element="cell", env=self._src_env)
+        full_name = file_info["fullname"]
+        self._region_manager.set_region_from_raster(full_name)
+
+        # extent of raster in Pseudo-Mercator for skipping empty tiles
+        info = gs.raster_info(full_name, env=self._src_env)
+        from_proj = get_location_proj_string(env=self._src_env)
+        extent = reproject_region(
+            info, from_proj, get_location_proj_string(env=self._psmerc_env)
+        )
+        bounds = reproject_region(
+            info, from_proj, get_location_proj_string(env=self._wgs84_env)
+        )
+        key = _cache_key(full_name, _map_timestamp(file_info, "cell", self._src_env))
+        tile_dir = (self._cache_dir or Path(self._tmp_dir.name)) / "tiles" / key
+        self._tile_layers.append(
+            {"file_info": file_info, "extent": extent, "directory": tile_dir}
+        )
+
+        if not self._tile_server:
+            self._tile_server = ThreadingHTTPServer(
+                ("127.0.0.1", 0), _TileRequestHandler
+            )
+            self._tile_server.daemon_threads = True
+            self._tile_server.renderer = weakref.ref(self)
+            threading.Thread(
+                target=self._tile_server.serve_forever, daemon=True
+            ).start()
+
+            def shutdown(server):
+                server.shutdown()
+                server.server_close()
+
+            weakref.finalize(self, shutdown, self._tile_server)
+
+        host, port = self._tile_server.server_address
+        url = f"http://{host}:{port}/{len(self._tile_layers) - 1}/{{z}}/{{x}}/{{y}}.png"
+        return url, [
+            [bounds["north"], bounds["west"]],
+            [bounds["south"], bounds["east"]],
+        ]
+
+    def render_raster_tile(self, layer, z, x, y):
+        """Reproject and render one XYZ tile of raster prepared by render_raster_tiles.
+        Return PNG filename or None when the tile is outside of the raster.
+
+        param int layer: index of layer as used in the URL of tiles
+        param int z: zoom level
+        param int x: tile column
+        param int y: tile row
+        """
+        layer = self._tile_layers[layer]
+        filename = layer["directory"] / str(z) / str(x) / f"{y}.png"
+        if filename.exists():
+            return str(filename)
+        north, south, east, west = tile_bounds(z, x, y)
+        extent = layer["extent"]
+        if (
+            north <= extent["south"]
+            or south >= extent["north"]
+            or east <= extent["west"]
+            or west >= extent["east"]
+        ):
+            return None
+
+        file_info = layer["file_info"]
+        tgt_name = "{}_{}_{}_{}".format(
+            file_info["fullname"].replace("@", "_"), z, x, y
+        )
+        env = self._psmerc_env.copy()
+        env["GRASS_REGION"] = gs.region_env(
+            n=north, s=south, e=east, w=west, rows=TILE_SIZE, cols=TILE_SIZE, env=env
+        )
+        env_info = gs.gisenv(env=self._src_env)
+        gs.run_command(
+            "r.proj",
+            input=file_info["name"],
+            output=tgt_name,
+            mapset=file_info["mapset"],
+            location=env_info["LOCATION_NAME"],
+            dbase=env_info["GISDBASE"],
+            overwrite=True,
+            quiet=True,
+            env=env,
+        )
+        tile_file = os.path.join(self._tmp_dir.name, f"{tgt_name}.png")
+        img = Map(
+            width=TILE_SIZE,
+            height=TILE_SIZE,
+            env=env,
+            filename=tile_file,
+            use_region=True,
+        )
+        img.run("d.rast", map=tgt_name)
+        gs.run_command(
+            "g.remove", type="raster", name=tgt_name, flags="f", quiet=True, env=env
+        )
+        _store_file(tile_file, str(filename))
+        os.remove(tile_file)
+        return str(filename)
+
     def render_vector(self, name):
         """Reproject vector to WGS84 and save geoJSON in working directory. Return
         geoJSON filename.
@@ -146,6 +381,14 @@ class ReprojectionRenderer:
         new_name = full_name.replace("@", "_")
         # set bbox
         self._region_manager.set_bbox_vector(full_name)
+        if self._cache_dir:
+            # vectors are reprojected without clipping, region does not matter
+            key = _cache_key(
+                full_name, _map_timestamp(file_info, "vector", self._src_env)
+            )
+            cached_file = self._cache_dir / "vectors" / f"{key}.json"
+            if cached_file.exists():
+                return cached_file
         # Reproject vector into WGS84 Location
         env_info = gs.gisenv(env=self._src_env)
         gs.run_command(
@@ -166,5 +409,8 @@ class ReprojectionRenderer:
             format="GeoJSON",
             env=self._wgs84_env,
         )
+        if self._cache_dir:
+            _store_file(json_file, cached_file)
+            return cached_file
 
         return json_file
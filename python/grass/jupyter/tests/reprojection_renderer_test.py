@@ -31,3 +31,40 @@ def test_render_vector(simple_dataset):
     renderer = ReprojectionRenderer()
     filename = renderer.render_vector(simple_dataset.vector_name)
     assert Path(filename).exists()
+
+
+def test_render_raster_cache(simple_dataset, tmp_path):
+    """Check rendered raster is reused from cache by another renderer"""
+    renderer = ReprojectionRenderer(cache_dir=tmp_path)
+    filename, bbox = renderer.render_raster(simple_dataset.raster_name)
+    assert Path(filename).parent.parent == tmp_path
+    modified = Path(filename).stat().st_mtime_ns
+    renderer = ReprojectionRenderer(cache_dir=tmp_path)
+    cached_filename, cached_bbox = renderer.render_raster(simple_dataset.raster_name)
+    assert cached_filename == filename
+    assert cached_bbox == approx(bbox)
+    assert Path(filename).stat().st_mtime_ns == modified
+
+
+def test_render_vector_cache(simple_dataset, tmp_path):
+    """Check reprojected vector is reused from cache"""
+    renderer = ReprojectionRenderer(cache_dir=tmp_path)
+    filename = renderer.render_vector(simple_dataset.vector_name)
+    assert Path(filename).exists()
+    renderer = ReprojectionRenderer(cache_dir=tmp_path)
+    assert renderer.render_vector(simple_dataset.vector_name) == filename
+
+
+def test_render_raster_tiles(simple_dataset):
+    """Check only tiles overlapping raster are rendered"""
+    renderer = ReprojectionRenderer()
+    url, bbox = renderer.render_raster_tiles(simple_dataset.raster_name)
+    assert url.endswith("/0/{z}/{x}/{y}.png")
+    assert bbox[0] == approx([0.00072155, -85.48874388])
+    # tile containing the raster (lon -85.488, lat 0.0004) at zoom level 10
+    zoom = 10
+    x = int((180 - 85.488) / 360 * 2**zoom)
+    y = 2 ** (zoom - 1) - 1
+    filename = renderer.render_raster_tile(0, zoom, x, y)
+    assert Path(filename).exists()
+    assert renderer.render_raster_tile(0, zoom, 0, 0) is None
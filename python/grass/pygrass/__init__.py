@@ -0,0 +1,22 @@
+import importlib
+
+# The subpackages are imported on first access, since most of them
+# load the ctypes bindings of the C-libraries
+_submodules = (
+    "errors",
+    "gis",
+    "messages",
+    "modules",
+    "raster",
+    "rpc",
+    "shell",
+    "utils",
+    "vector",
+)
+
+
+def __getattr__(name):
+    """Import the pygrass subpackages on first access"""
+    if name in _submodules:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -13,12 +13,16 @@ for details.
 
 @author Soeren Gebbert
 """
+import os
 import sys
+import threading
 from multiprocessing import Process, Lock, Pipe
 
-import grass.lib.gis as libgis
-
 from grass.exceptions import FatalError
+from grass.script.utils import lazy_import
+
+# The C-library is imported on the first message
+libgis = lazy_import("grass.lib.gis")
 
 
 def message_server(lock, conn):
@@ -76,38 +80,63 @@ def message_server(lock, conn):
             libgis.G_debug(1, "Stop messenger server")
             sys.exit()
 
-        message = data[1]
-        # libgis limitation
-        if isinstance(message, type(" ")):
-            if len(message) >= 2000:
-                message = message[:1999]
-
-        if message_type == "PERCENT":
-            n = int(data[1])
-            d = int(data[2])
-            s = int(data[3])
-            libgis.G_percent(n, d, s)
-        elif message_type == "DEBUG":
-            level = data[1]
-            message = data[2]
-            libgis.G_debug(level, message)
-        elif message_type == "VERBOSE":
-            libgis.G_verbose_message(message)
-        elif message_type == "INFO":
-            libgis.G_message(message)
-        elif message_type == "IMPORTANT":
-            libgis.G_important_message(message)
-        elif message_type == "WARNING":
-            libgis.G_warning(message)
-        elif message_type == "ERROR":
-            libgis.G_important_message("ERROR: %s" % message)
         # This is for testing only
-        elif message_type == "FATAL":
-            libgis.G_fatal_error(message)
+        if message_type == "FATAL":
+            libgis.G_fatal_error(_escape_message(data[1]))
+
+        call_message_function(data)
 
         lock.release()
 
 
+def _escape_message(message):
+    """Prepare a message to be used as format string of the C-library
+    message functions"""
+    # libgis limitation
+    if len(message) >= 2000:
+        message = message[:1999]
+    return message.replace("%", "%%")
+
+
+def call_message_function(data):
+    """Call the C-library message function that is specified by data
+
+    :param data: A list of values, see message_server() for details
+
+    This function is used by the message server and by the in-process
+    message backend of the Messenger. It never calls G_fatal_error().
+    """
+    message_type = data[0]
+
+    if message_type == "PERCENT":
+        n = int(data[1])
+        d = int(data[2])
+        s = int(data[3])
+        libgis.G_percent(n, d, s)
+    elif message_type == "DEBUG":
+        level = data[1]
+        message = data[2]
+        libgis.G_debug(level, _escape_message(message))
+    elif message_type == "VERBOSE":
+        libgis.G_verbose_message(_escape_message(data[1]))
+    elif message_type == "INFO":
+        libgis.G_message(_escape_message(data[1]))
+    elif message_type == "IMPORTANT":
+        libgis.G_important_message(_escape_message(data[1]))
+    elif message_type == "WARNING":
+        libgis.G_warning(_escape_message(data[1]))
+    elif message_type == "ERROR":
+        libgis.G_important_message(_escape_message("ERROR: %s" % data[1]))
+
+
+# The message backend that is used if no backend is specified
+# when creating a Messenger object: "direct" or "process"
+default_backend = os.getenv("GRASS_MESSENGER_BACKEND", "direct")
+
+# The C-library message functions are not thread safe
+_direct_lock = threading.Lock()
+
+
 class Messenger(object):
     """Fast and exit-safe interface to GRASS C-library message functions
 
@@ -117,12 +146,26 @@ class Messenger(object):
 
     Note:
 
-    The C-library message functions a called via ctypes in a subprocess
-    using a pipe (multiprocessing.Pipe) to transfer the text messages.
-    Hence, the process that uses the Messenger interface will not be
-    exited, if a G_fatal_error() was invoked in the subprocess.
-    In this case the Messenger object will simply start a new subprocess
-    and restarts the pipeline.
+    Two message backends are available:
+
+    - "direct"   The C-library message functions are called via ctypes
+                 in the current process. G_fatal_error() is never called,
+                 fatal() is emulated in Python, so the process that uses
+                 the Messenger interface will not be exited. This is the
+                 default backend.
+    - "process"  The C-library message functions are called via ctypes in
+                 a subprocess using a pipe (multiprocessing.Pipe) to
+                 transfer the text messages. Hence, the process that uses
+                 the Messenger interface will not be exited, if a
+                 G_fatal_error() was invoked in the subprocess.
+                 In this case the Messenger object will simply start a
+                 new subprocess and restarts the pipeline.
+
+    The default backend can be set with the GRASS_MESSENGER_BACKEND
+    environment variable.
+
+    Progress reports of percent() are only passed to G_percent() if
+    G_percent() would print them, to avoid calls that print nothing.
 
 
     Usage:
@@ -136,6 +179,11 @@ class Messenger(object):
     >>> msgr.warning("Ohh")
     >>> msgr.error("Ohh no")
 
+    >>> msgr = Messenger(backend="process")
+    >>> msgr.message("message")
+    >>> msgr.percent(1, 1, 1)
+    >>> msgr.stop()
+
     >>> msgr = Messenger()
     >>> msgr.fatal("Ohh no no no!")
     Traceback (most recent call last):
@@ -168,12 +216,27 @@ class Messenger(object):
 
     """
 
-    def __init__(self, raise_on_error=False):
+    def __init__(self, raise_on_error=False, backend=None):
+        """Constructor
+
+        :param raise_on_error: if True a FatalError exception will be
+                               raised instead of calling sys.exit(1)
+        :param backend: The message backend "direct" or "process",
+                        default_backend is used if None
+        """
+        if backend is None:
+            backend = default_backend
+        if backend not in ("direct", "process"):
+            raise ValueError("Unknown messenger backend <%s>" % backend)
         self.client_conn = None
         self.server_conn = None
         self.server = None
         self.raise_on_error = raise_on_error
-        self.start_server()
+        self.backend = backend
+        # The last percentage printed by G_percent(), -1 if none
+        self._percent_prev = -1
+        if backend == "process":
+            self.start_server()
 
     def start_server(self):
         """Start the messenger server and open the pipe"""
@@ -185,6 +248,9 @@ class Messenger(object):
 
     def _check_restart_server(self):
         """Restart the server if it was terminated"""
+        if self.server is None:
+            self.start_server()
+            return
         if self.server.is_alive() is True:
             return
         self.client_conn.close()
@@ -192,16 +258,25 @@ class Messenger(object):
         self.start_server()
         self.warning("Needed to restart the messenger server")
 
+    def _send(self, data):
+        """Call the C-library message function specified by data using
+        the message backend"""
+        if self.backend == "direct":
+            with _direct_lock:
+                call_message_function(data)
+        else:
+            self._check_restart_server()
+            self.client_conn.send(data)
+
     def message(self, message):
         """Send a message to stderr
 
         :param message: the text of message
         :type message: str
 
-           G_message() will be called in the messenger server process
+           G_message() will be called by the message backend
         """
-        self._check_restart_server()
-        self.client_conn.send(["INFO", message])
+        self._send(["INFO", message])
 
     def verbose(self, message):
         """Send a verbose message to stderr
@@ -209,10 +284,9 @@ class Messenger(object):
         :param message: the text of message
         :type message: str
 
-           G_verbose_message() will be called in the messenger server process
+           G_verbose_message() will be called by the message backend
         """
-        self._check_restart_server()
-        self.client_conn.send(["VERBOSE", message])
+        self._send(["VERBOSE", message])
 
     def important(self, message):
         """Send an important message to stderr
@@ -220,10 +294,9 @@ class Messenger(object):
         :param message: the text of message
         :type message: str
 
-           G_important_message() will be called in the messenger server process
+           G_important_message() will be called by the message backend
         """
-        self._check_restart_server()
-        self.client_conn.send(["IMPORTANT", message])
+        self._send(["IMPORTANT", message])
 
     def warning(self, message):
         """Send a warning message to stderr
@@ -231,10 +304,9 @@ class Messenger(object):
         :param message: the text of message
         :type message: str
 
-           G_warning() will be called in the messenger server process
+           G_warning() will be called by the message backend
         """
-        self._check_restart_server()
-        self.client_conn.send(["WARNING", message])
+        self._send(["WARNING", message])
 
     def error(self, message):
         """Send an error message to stderr
@@ -243,10 +315,9 @@ class Messenger(object):
         :type message: str
 
            G_important_message() with an additional "ERROR:" string at
-           the start will be called in the messenger server process
+           the start will be called by the message backend
         """
-        self._check_restart_server()
-        self.client_conn.send(["ERROR", message])
+        self._send(["ERROR", message])
 
     def fatal(self, message):
         """Send an error message to stderr, call sys.exit(1) or raise FatalError
@@ -259,8 +330,7 @@ class Messenger(object):
            is set True while creating the messenger object, a FatalError
            exception will be raised instead of calling sys.exit(1).
         """
-        self._check_restart_server()
-        self.client_conn.send(["ERROR", message])
+        self._send(["ERROR", message])
         self.stop()
 
         if self.raise_on_error is True:
@@ -274,10 +344,9 @@ class Messenger(object):
         :param message: the text of message
         :type message: str
 
-           G_debug() will be called in the messenger server process
+           G_debug() will be called by the message backend
         """
-        self._check_restart_server()
-        self.client_conn.send(["DEBUG", level, message])
+        self._send(["DEBUG", level, message])
 
     def percent(self, n, d, s):
         """Send a percentage to stderr
@@ -286,10 +355,24 @@ class Messenger(object):
         :type message: str
 
 
-           G_percent() will be called in the messenger server process
+           G_percent() will be called by the message backend, in case
+           it will print the percentage
         """
-        self._check_restart_server()
-        self.client_conn.send(["PERCENT", n, d, s])
+        n = int(n)
+        d = int(d)
+        s = int(s)
+        # Mirror the G_percent() state to skip calls that print nothing,
+        # the integer division of C truncates towards zero
+        if d <= 0 or s <= 0:
+            x = 100
+        elif n < 0:
+            x = -(-100 * n // d)
+        else:
+            x = 100 * n // d
+        if n > 0 and n < d and x <= self._percent_prev + s:
+            return
+        self._percent_prev = -1 if x >= 100 else x
+        self._send(["PERCENT", n, d, s])
 
     def stop(self):
         """Stop the messenger server and close the pipe"""
@@ -328,7 +411,11 @@ class Messenger(object):
         return self.raise_on_error
 
     def test_fatal_error(self, message):
-        """Force the messenger server to call G_fatal_error()"""
+        """Force the messenger server to call G_fatal_error()
+
+        The messenger server is started for this purpose in case the
+        direct message backend is used.
+        """
         import time
 
         self._check_restart_server()
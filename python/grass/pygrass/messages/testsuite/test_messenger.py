@@ -0,0 +1,130 @@
+"""Test the message backends of the Messenger
+
+(C) 2023 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+import os
+import subprocess
+import sys
+
+from grass.gunittest.case import TestCase
+from grass.gunittest.main import test
+
+import grass.pygrass.messages as gmessages
+
+
+def run_python(code, **env):
+    """Run Python code in a new process and return its stdout and stderr"""
+    process_env = os.environ.copy()
+    process_env.pop("GRASS_MESSENGER_BACKEND", None)
+    process_env.update(GRASS_VERBOSE="2", GRASS_MESSAGE_FORMAT="plain")
+    process_env.update(env)
+    process = subprocess.run(
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        env=process_env,
+    )
+    if process.returncode:
+        raise RuntimeError(process.stderr)
+    return process.stdout, process.stderr
+
+
+MESSAGES = """
+from grass.pygrass.messages import Messenger
+msgr = Messenger({args})
+msgr.message("message with 100% and %s")
+msgr.warning("warning with 50%")
+msgr.important("important message")
+msgr.stop()
+print(msgr.backend, msgr.server is not None)
+"""
+
+PERCENT = """
+from grass.pygrass.messages import Messenger
+import grass.lib.gis as libgis
+msgr = Messenger({args})
+for s in (10, 3, 25):
+    for i in range(0, 201, 7):
+        {call}(i, 200, s)
+    {call}(200, 200, s)
+msgr.stop()
+"""
+
+
+class TestMessenger(TestCase):
+    def assert_messages(self, args, backend, **env):
+        """Check that the messages are printed by the backend"""
+        stdout, stderr = run_python(MESSAGES.format(args=args), **env)
+        self.assertEqual(
+            stdout.split(), [backend, str(backend == "process")], msg=stderr
+        )
+        self.assertIn("message with 100% and %s", stderr)
+        self.assertIn("warning with 50%", stderr)
+        self.assertIn("important message", stderr)
+
+    def test_direct_backend(self):
+        """The direct backend is the default and prints in-process"""
+        self.assert_messages("", "direct")
+        self.assert_messages("backend='direct'", "direct")
+
+    def test_process_backend(self):
+        """The process backend prints in the message server"""
+        self.assert_messages("backend='process'", "process")
+
+    def test_environment_backend(self):
+        """The default backend is set by GRASS_MESSENGER_BACKEND"""
+        self.assert_messages("", "process", GRASS_MESSENGER_BACKEND="process")
+        self.assert_messages("", "direct", GRASS_MESSENGER_BACKEND="direct")
+        self.assert_messages(
+            "backend='direct'", "direct", GRASS_MESSENGER_BACKEND="process"
+        )
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            gmessages.Messenger(backend="unknown")
+
+    def test_percent_output(self):
+        """percent() prints the same progress as G_percent()"""
+        expected = run_python(PERCENT.format(args="", call="libgis.G_percent"))[1]
+        self.assertIn("100", expected)
+        for args in ("backend='direct'", "backend='process'"):
+            stderr = run_python(PERCENT.format(args=args, call="msgr.percent"))[1]
+            self.assertEqual(stderr, expected, msg=args)
+
+    def test_percent_calls(self):
+        """percent() forwards only the steps that G_percent() prints"""
+        msgr = gmessages.Messenger(backend="direct")
+        sent = []
+        msgr._send = sent.append
+        for i in range(101):
+            msgr.percent(i, 100, 10)
+        # G_percent() prints if the percentage exceeds the last printed
+        # percentage by more than the step
+        self.assertEqual(
+            [data[1] for data in sent], [0, 11, 22, 33, 44, 55, 66, 77, 88, 99, 100]
+        )
+        # The percentage is reset after 100 percent
+        del sent[:]
+        for i in (0, 5, 20, 100):
+            msgr.percent(i, 100, 10)
+        self.assertEqual([data[1] for data in sent], [0, 20, 100])
+        # Steps of zero percent and zero totals always print
+        del sent[:]
+        msgr.percent(1, 100, 0)
+        msgr.percent(1, 0, 10)
+        self.assertEqual(len(sent), 2)
+        self.assertTrue(all(data[0] == "PERCENT" for data in sent))
+        # The percentage of negative values is truncated towards zero
+        del sent[:]
+        msgr.percent(-1, 200, 3)
+        msgr.percent(20, 200, 10)
+        self.assertEqual([data[1] for data in sent], [-1])
+
+
+if __name__ == "__main__":
+    test()
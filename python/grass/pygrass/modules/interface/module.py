@@ -15,6 +15,7 @@ from xml.etree.ElementTree import fromstring
 from grass.exceptions import CalledModuleError, GrassError, ParameterError
 from grass.script.core import Popen, PIPE, use_temp_region, del_temp_region
 from grass.script.utils import encode, decode
+from grass.utils import tracing
 from .docstring import docstring_property
 from .parameter import Parameter
 from .flag import Flag
@@ -299,6 +300,7 @@ class ParallelModuleQueue(object):
         """
         return self._finished_modules
 
+    @tracing.trace_function("module")
     def wait(self):
         """Wait for all Module processes that are in the list to finish
         and set the modules stdout and stderr output options
@@ -811,6 +813,7 @@ class Module(object):
 
         cmd = self.make_cmd()
         self.start_time = time.time()
+        self._trace_start = tracing.now()
         self._popen = Popen(
             cmd,
             stdin=self.stdin_,
@@ -839,6 +842,16 @@ class Module(object):
             self.time = time.time() - self.start_time
             self.returncode = self._popen.returncode
             self._finished = True
+            if tracing.get_tracer() is not None:
+                # Each module process gets its own track in the trace
+                tracing.add_span(
+                    self.name,
+                    self._trace_start,
+                    tracing.now(),
+                    category="module",
+                    args={"command": self.get_bash(), "returncode": self.returncode},
+                    tid=self._popen.pid,
+                )
 
             if self._popen.poll():
                 raise CalledModuleError(
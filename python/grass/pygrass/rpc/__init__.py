@@ -17,15 +17,15 @@ from multiprocessing import Process, Lock, Pipe
 from ctypes import CFUNCTYPE, c_void_p
 
 from grass.exceptions import FatalError
-from grass.pygrass.vector import VectorTopo
-from grass.pygrass.vector.basic import Bbox
-from grass.pygrass.raster import RasterRow, raster2numpy_img
-import grass.lib.gis as libgis
+from grass.script.utils import lazy_import
 from .base import RPCServerBase
-from grass.pygrass.gis.region import Region
-from grass.pygrass import utils
 import logging
 
+# The C-libraries and the raster and vector interfaces are only used in
+# the server process, import them on first use
+libgis = lazy_import("grass.lib.gis")
+utils = lazy_import("grass.pygrass.utils")
+
 ###############################################################################
 ###############################################################################
 
@@ -47,6 +47,9 @@ def _get_raster_image_as_np(lock, conn, data):
     :param conn: A multiprocessing.Pipe instance used to send True or False
     :param data: The list of data entries [function_id, raster_name, extent, color]
     """
+    from grass.pygrass.raster import RasterRow, raster2numpy_img
+    from grass.pygrass.gis.region import Region
+
     array = None
     try:
         name = data[1]
@@ -94,6 +97,8 @@ def _get_vector_table_as_dict(lock, conn, data):
     :param data: The list of data entries [function_id, name, mapset, where]
 
     """
+    from grass.pygrass.vector import VectorTopo
+
     ret = None
     try:
         name = data[1]
@@ -136,6 +141,9 @@ def _get_vector_features_as_wkb_list(lock, conn, data):
                                            feature_type, field]
 
     """
+    from grass.pygrass.vector import VectorTopo
+    from grass.pygrass.vector.basic import Bbox
+
     wkb_list = None
     try:
         name = data[1]
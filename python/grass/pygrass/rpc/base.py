@@ -11,6 +11,7 @@ for details.
 """
 
 from grass.exceptions import FatalError
+from grass.utils import tracing
 import time
 import threading
 import sys
@@ -166,7 +167,8 @@ class RPCServerBase(object):
         logging.debug("Receive message: {message}")
 
         try:
-            ret = self.client_conn.recv()
+            with tracing.span(message, category="rpc"):
+                ret = self.client_conn.recv()
             if isinstance(ret, FatalError):
                 raise ret
             return ret
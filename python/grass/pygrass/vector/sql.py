@@ -27,6 +27,16 @@ DROP_COL_SQLITE = ";\n".join(
         "DROP TABLE {tname}_backup",
     ]
 )
+# single copy of the table to add, drop, and rename columns at once
+REBUILD_TAB_SQLITE = ";\n".join(
+    [
+        "CREATE TABLE {tname}_rebuild({coldef})",
+        "INSERT INTO {tname}_rebuild({newcolnames}) SELECT {colnames} FROM {tname}",
+        "DROP TABLE {tname}",
+        "ALTER TABLE {tname}_rebuild RENAME TO {tname}",
+        "CREATE UNIQUE INDEX {tname}_cat ON {tname} ({keycol} )",
+    ]
+)
 RENAME_COL = "ALTER TABLE {tname} RENAME COLUMN {old_name} TO {new_name};"
 CAST_COL = "ALTER TABLE {tname} ALTER COLUMN {col} SET DATA TYPE {ctype};"
 RENAME_TAB = "ALTER TABLE {old_name} RENAME TO {new_name};"
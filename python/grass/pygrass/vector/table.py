@@ -18,7 +18,7 @@ import sys
 
 import ctypes
 import numpy as np
-from sqlite3 import OperationalError
+from sqlite3 import OperationalError, sqlite_version_info
 
 try:
     from collections import OrderedDict
@@ -47,6 +47,10 @@ test_vector_name = "table_doctest_map"
 DRIVERS = ("sqlite", "pg")
 UNSUPPORTED_DRIVERS = ("ogr", "dbf")
 
+# first SQLite versions supporting ALTER TABLE RENAME COLUMN and DROP COLUMN
+SQLITE_RENAME_COLUMN = (3, 25, 0)
+SQLITE_DROP_COLUMN = (3, 35, 0)
+
 
 def get_path(path, vect_name=None):
     """Return the full path to the database; replacing environment variable
@@ -400,6 +404,28 @@ class Columns(object):
         """
         return list(self.odict.items())
 
+    @staticmethod
+    def _check_type(col_type):
+        """Check the column type if it is supported by GRASS
+
+        :param col_type: the type of column
+        :type col_type: str
+        """
+        valid_type = (
+            "DOUBLE PRECISION",
+            "DOUBLE",
+            "INT",
+            "INTEGER",
+            "DATE",
+            "VARCHAR",
+        )
+        col = col_type.upper()
+        valid = [col.startswith(tp) for tp in valid_type]
+        if not any(valid):
+            str_err = "Type: %r is not supported." "\nSupported types are: %s"
+            raise TypeError(str_err % (col_type, ", ".join(valid_type)))
+        return col_type
+
     def add(self, col_name, col_type):
         """Add a new column to the table.
 
@@ -427,33 +453,12 @@ class Columns(object):
 
         """
 
-        def check(col_type):
-            """Check the column type if it is supported by GRASS
-
-            :param col_type: the type of column
-            :type col_type: str
-            """
-            valid_type = (
-                "DOUBLE PRECISION",
-                "DOUBLE",
-                "INT",
-                "INTEGER",
-                "DATE",
-                "VARCHAR",
-            )
-            col = col_type.upper()
-            valid = [col.startswith(tp) for tp in valid_type]
-            if not any(valid):
-                str_err = "Type: %r is not supported." "\nSupported types are: %s"
-                raise TypeError(str_err % (col_type, ", ".join(valid_type)))
-            return col_type
-
         col_type = (
             [
-                check(col_type),
+                self._check_type(col_type),
             ]
             if isinstance(col_type, (str, unicode))
-            else [check(col) for col in col_type]
+            else [self._check_type(col) for col in col_type]
         )
         col_name = (
             [
@@ -506,29 +511,7 @@ class Columns(object):
         >>> remove('mycensus', 'vect')
 
         """
-        cur = self.conn.cursor()
-        if self.is_pg():
-            cur.execute(
-                sql.RENAME_COL.format(
-                    tname=self.tname, old_name=old_name, new_name=new_name
-                )
-            )
-            self.conn.commit()
-            cur.close()
-            self.update_odict()
-        else:
-            cur.execute(
-                sql.ADD_COL.format(
-                    tname=self.tname, cname=new_name, ctype=str(self.odict[old_name])
-                )
-            )
-            cur.execute(
-                sql.UPDATE.format(tname=self.tname, new_col=new_name, old_col=old_name)
-            )
-            self.conn.commit()
-            cur.close()
-            self.update_odict()
-            self.drop(old_name)
+        self.alter(rename={old_name: new_name})
 
     def cast(self, col_name, new_type):
         """Change the column type.
@@ -577,7 +560,7 @@ class Columns(object):
     def drop(self, col_name):
         """Drop a column from the table.
 
-        :param col_name: the name of column to remove
+        :param col_name: the name of column to remove or a list of names
         :type col_name: str
 
         >>> import sqlite3
@@ -599,21 +582,102 @@ class Columns(object):
         >>> remove('mycensus','vect')
 
         """
+        self.alter(drop=col_name)
+
+    def alter(self, add=None, drop=None, rename=None):
+        """Add, drop, and rename columns of the table at once.
+
+        With SQLite, native ALTER TABLE statements are used when the SQLite
+        library supports them, otherwise (or when a column cannot be dropped
+        natively, e.g. because it is indexed) the table is copied only once
+        for all the changes.
+
+        :param add: columns to add as a list of (name, type) pairs or a dict
+        :type add: list of tuple
+        :param drop: name or list of names of columns to drop
+        :type drop: str or list
+        :param rename: dictionary mapping old column names to new ones
+        :type rename: dict
+
+        >>> import sqlite3
+        >>> path = '$GISDBASE/$LOCATION_NAME/$MAPSET/sqlite/sqlite.db'
+        >>> from grass.pygrass.utils import copy, remove
+        >>> copy(test_vector_name,'mycensus','vect')
+        >>> cols_sqlite = Columns('mycensus',
+        ...                       sqlite3.connect(get_path(path)))
+        >>> cols_sqlite.alter(add=[('n_pizza', 'INT')], drop=['name'],
+        ...                   rename={'value': 'n_pasta'})
+        >>> cols_sqlite.names()
+        ['cat', 'n_pasta', 'n_pizza']
+        >>> remove('mycensus','vect')
+
+        """
+        add = list(add.items()) if isinstance(add, dict) else list(add or [])
+        drop = [drop] if isinstance(drop, (str, unicode)) else list(drop or [])
+        rename = dict(rename or {})
+        for cname, ctype in add:
+            self._check_type(ctype)
+        for cname in drop + list(rename):
+            if cname not in self.odict:
+                raise DBError("Column %r not found in table %r." % (cname, self.tname))
+        if self.key in drop:
+            raise DBError("Key column %r can not be dropped." % self.key)
+
+        # rename first, so that new names can be reused by added columns
+        sqlcode = [
+            sql.RENAME_COL.format(tname=self.tname, old_name=old, new_name=new)
+            for old, new in rename.items()
+        ]
+        sqlcode += [sql.DROP_COL.format(tname=self.tname, cname=cn) for cn in drop]
+        sqlcode += [
+            sql.ADD_COL.format(tname=self.tname, cname=cn, ctype=ct) for cn, ct in add
+        ]
         cur = self.conn.cursor()
         if self.is_pg():
-            cur.execute(sql.DROP_COL.format(tname=self.tname, cname=col_name))
-        else:
-            desc = str(self.sql_descr(remove=col_name))
-            names = ", ".join(self.names(remove=col_name, unicod=False))
-            queries = sql.DROP_COL_SQLITE.format(
-                tname=self.tname, keycol=self.key, coldef=desc, colnames=names
-            ).split("\n")
-            for query in queries:
+            for query in sqlcode:
                 cur.execute(query)
-        self.conn.commit()
+            self.conn.commit()
+        else:
+            native = sqlite_version_info >= (
+                SQLITE_DROP_COLUMN if drop else SQLITE_RENAME_COLUMN
+            )
+            if not (drop or rename) or native:
+                try:
+                    self._execute_transaction(cur, sqlcode)
+                except OperationalError:
+                    if not (drop or rename):
+                        raise
+                    native = False
+            if not native:
+                self._execute_transaction(cur, self._rebuild_sqlite(add, drop, rename))
         cur.close()
         self.update_odict()
 
+    def _execute_transaction(self, cur, queries):
+        """Execute all queries in a single transaction, roll back on error"""
+        self.conn.commit()
+        try:
+            cur.execute("BEGIN")
+            for query in queries:
+                cur.execute(query)
+            self.conn.commit()
+        except OperationalError:
+            self.conn.rollback()
+            raise
+
+    def _rebuild_sqlite(self, add, drop, rename):
+        """Return queries copying SQLite table once with changed columns"""
+        colnames = [cname for cname in self.odict if cname not in drop]
+        newcols = [(rename.get(cname, cname), self.odict[cname]) for cname in colnames]
+        coldef = newcols + add
+        return sql.REBUILD_TAB_SQLITE.format(
+            tname=self.tname,
+            coldef=", ".join("%s %s" % col for col in coldef),
+            newcolnames=", ".join(cname for cname, ctype in newcols),
+            colnames=", ".join(colnames),
+            keycol=rename.get(self.key, self.key),
+        ).split("\n")
+
 
 class Link(object):
     """Define a Link between vector map and the attributes table.
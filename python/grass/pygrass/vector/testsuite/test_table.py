@@ -171,6 +171,28 @@ class ColumnsTestCase(DBconnection, TestCase):
         update = "UPDATE %s SET cint=?,creal=?,ctxt=? WHERE cat=?;"
         self.assertEqual(self.cols.update_str, update % self.tname)
 
+    def test_alter(self):
+        """Check columns are added, dropped and renamed at once"""
+        cur = self.connection.cursor()
+        cur.execute("SELECT cat, creal FROM %s" % self.tname)
+        values = cur.fetchall()
+        self.cols.alter(
+            add=[("cnew", "INT")], drop=["cint", "ctxt"], rename={"creal": "cfloat"}
+        )
+        self.assertListEqual(self.cols.names(), ["cat", "cfloat", "cnew"])
+        cur.execute("SELECT cat, cfloat FROM %s" % self.tname)
+        self.assertListEqual(values, cur.fetchall())
+
+    def test_drop_indexed(self):
+        """Check indexed column is dropped"""
+        cur = self.connection.cursor()
+        cur.execute("CREATE INDEX %s_cint ON %s (cint)" % (self.tname, self.tname))
+        self.connection.commit()
+        self.cols.drop("cint")
+        self.assertListEqual(self.cols.names(), ["cat", "creal", "ctxt"])
+        cur.execute("SELECT COUNT(*) FROM %s" % self.tname)
+        self.assertEqual(cur.fetchone()[0], 10)
+
 
 class TableInsertTestCase(DBconnection, TestCase):
     def setUp(self):
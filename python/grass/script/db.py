@@ -25,6 +25,8 @@ from .core import (
     run_command,
     parse_command,
     read_command,
+    pipe_command,
+    handle_errors,
     tempfile,
     fatal,
     list_strings,
@@ -198,6 +200,143 @@ def db_select(sql=None, filename=None, table=None, env=None, **args):
     return tuple(result)
 
 
+def _read_json_records(module, env=None, **args):
+    """Read records from JSON output of *db.select* or *v.db.select*
+
+    Both modules write each record on a separate line, so the records
+    are parsed one by one without keeping the whole output in memory.
+
+    :return: generator of dictionaries
+    """
+    import json
+
+    process = pipe_command(module, format="json", quiet=True, env=env, **args)
+    finished = False
+    try:
+        for line in process.stdout:
+            line = line.strip()
+            if line.endswith(b","):
+                line = line[:-1]
+            if not line or line in (b'{"records":[', b"]}"):
+                continue
+            yield json.loads(line)
+        finished = True
+    finally:
+        process.stdout.close()
+        if not finished:
+            # reading was stopped by the caller
+            process.kill()
+        returncode = process.wait()
+    handle_errors(returncode, None, [module], args)
+
+
+def _records_to_arrays(records):
+    """Convert list of records to dictionary of NumPy arrays
+
+    Integer columns with NULL values and columns with both integer and
+    floating point values are converted to floating point with NaN for NULL,
+    other columns with non-numeric values are stored as object arrays.
+    """
+    import numpy as np
+
+    columns = {}
+    for name in records[0]:
+        values = [record[name] for record in records]
+        kinds = {type(value) for value in values if value is not None}
+        if kinds <= {int} and None not in values:
+            columns[name] = np.array(values, dtype=np.int64)
+        elif kinds <= {int, float}:
+            columns[name] = np.array(
+                [np.nan if value is None else value for value in values],
+                dtype=np.float64,
+            )
+        else:
+            columns[name] = np.array(values, dtype=object)
+    return columns
+
+
+def _chunks(records, chunk_size):
+    """Group records into lists of at most *chunk_size* records"""
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _select_args(sql, table, args):
+    """Add SQL statement or table name to db.select arguments"""
+    if sql:
+        args["sql"] = sql
+    elif table:
+        args["table"] = table
+    else:
+        fatal(
+            _("Programmer error: '%(sql)s' or '%(table)s' must be provided")
+            % {"sql": "sql", "table": "table"}
+        )
+    return args
+
+
+def db_select_records(sql=None, table=None, env=None, **args):
+    """Perform SQL select statement and iterate over resulting rows
+
+    Unlike :func:`db_select()`, rows are read one by one as they are
+    produced by *db.select* and values have their types (numbers are
+    ``int`` or ``float``, NULL is ``None``), so even very large tables
+    can be processed in constant memory.
+
+    >>> run_command('g.copy', vector='firestations,myfirestations')
+    0
+    >>> for row in db_select_records(
+    ...     sql='SELECT cat,CITY FROM myfirestations WHERE cat < 3'
+    ... ):
+    ...     print(row)
+    {'cat': 1, 'CITY': 'Morrisville'}
+    {'cat': 2, 'CITY': 'Morrisville'}
+    >>> run_command('g.remove', flags='f', type='vector', name='myfirestations')
+    0
+
+    :param str sql: SQL statement to perform (or None)
+    :param str table: name of table to query (or None)
+    :param str args: see *db.select* arguments
+    :param env: environment
+
+    :return: generator of dictionaries with column names as keys
+    """
+    return _read_json_records("db.select", env=env, **_select_args(sql, table, args))
+
+
+def db_select_chunks(sql=None, table=None, chunk_size=100000, env=None, **args):
+    """Perform SQL select statement and iterate over chunks of columns
+
+    Each chunk is a dictionary with column names as keys and NumPy arrays
+    of at most *chunk_size* values as values. Integer columns with NULL
+    values in the chunk are returned as floating point arrays with NaN,
+    text columns as object arrays.
+
+    >>> for chunk in db_select_chunks(table='firestations', chunk_size=50):
+    ...     print(len(chunk['cat']), chunk['cat'].dtype)
+    50 int64
+    21 int64
+
+    :param str sql: SQL statement to perform (or None)
+    :param str table: name of table to query (or None)
+    :param int chunk_size: maximal number of rows in one chunk
+    :param str args: see *db.select* arguments
+    :param env: environment
+
+    :return: generator of dictionaries of NumPy arrays
+    """
+    for chunk in _chunks(
+        db_select_records(sql=sql, table=table, env=env, **args), chunk_size
+    ):
+        yield _records_to_arrays(chunk)
+
+
 def db_table_in_vector(table, mapset=".", env=None):
     """Return the name of vector connected to the table.
     By default it check only in the current mapset, because the same table
@@ -253,3 +392,204 @@ def db_commit_transaction(driver):
     if driver in ("sqlite", "pg", "mysql"):
         return "COMMIT"
     return ""
+
+
+def _read_column_chunks(sql, chunk_size, env=None, **args):
+    """Read values of a single numeric column in chunks as NumPy arrays
+
+    Output of *db.select* is read in blocks of *chunk_size* bytes,
+    empty lines (NULL values) are skipped.
+
+    :return: generator of NumPy arrays
+    """
+    import numpy as np
+
+    process = pipe_command("db.select", flags="c", sql=sql, quiet=True, env=env, **args)
+    remainder = b""
+    while True:
+        block = process.stdout.read(chunk_size)
+        if not block:
+            break
+        block = remainder + block
+        end = block.rfind(b"\n") + 1
+        remainder = block[end:]
+        yield np.array(block[:end].split(), dtype=np.float64)
+    if remainder.strip():
+        yield np.array(remainder.split(), dtype=np.float64)
+    process.stdout.close()
+    handle_errors(process.wait(), None, ["db.select"], dict(sql=sql, **args))
+
+
+class _QuantileSketch:
+    """Approximate quantiles of a stream of values in bounded memory
+
+    Values are kept in levels where a value on level *i* stands for
+    2**i original values. When a level grows over *size* values, it is
+    sorted and every other value is promoted to the next level.
+    The total weight of all kept values is always the number of values
+    added, the rank error is proportional to 1 / *size*.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.levels = []
+        self._offset = 0
+
+    def update(self, values):
+        """Add NumPy array of values to the sketch"""
+        import numpy as np
+
+        level = 0
+        while len(values):
+            if len(self.levels) <= level:
+                self.levels.append(values[:0])
+            values = np.concatenate((self.levels[level], values))
+            if len(values) < self.size:
+                self.levels[level] = values
+                return
+            values.sort()
+            # odd value stays on its level to keep the total weight exact
+            self.levels[level] = values[len(values) - len(values) % 2 :]
+            self._offset ^= 1
+            values = values[self._offset : len(values) - len(values) % 2 : 2]
+            level += 1
+
+    def values_at(self, positions):
+        """Return approximate values at 0-based positions of sorted values"""
+        import numpy as np
+
+        values = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(level), 2**i) for i, level in enumerate(self.levels)]
+        )
+        order = np.argsort(values, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        indices = np.searchsorted(cumulative, np.asarray(positions) + 1)
+        return values[order][np.minimum(indices, len(values) - 1)]
+
+
+def _univar_position(n, fraction):
+    """Return 0-based position of quantile in n sorted values"""
+    position = round(n * fraction)
+    if position == 0:
+        position = 1
+    return position - 1
+
+
+def db_univar(
+    column,
+    table=None,
+    sql=None,
+    where=None,
+    extended=False,
+    percentile=(90,),
+    sketch_size=None,
+    chunk_size=1048576,
+    env=None,
+    **args,
+):
+    """Calculate univariate statistics of a numeric column
+
+    Values are streamed from *db.select* and processed in chunks using
+    NumPy. Percentiles are computed exactly using partition-based
+    selection which keeps all non-null values in memory as a compact
+    array. When *sketch_size* is given, percentiles are approximated
+    using a quantile sketch of that size instead so the memory use
+    does not depend on the number of rows.
+
+    >>> stats = db_univar("elev", table="myfirestations")  # doctest: +SKIP
+    >>> stats["n"]  # doctest: +SKIP
+    71
+
+    :param str column: name of numeric column
+    :param str table: name of table to query
+    :param str sql: SELECT statement returning one numeric column to use
+        instead of *table* and *column*
+    :param str where: WHERE conditions of SQL statement without 'where' keyword
+    :param bool extended: compute quartiles and percentiles
+    :param percentile: list of percentiles to compute with *extended*
+    :param int sketch_size: size of quantile sketch for approximate percentiles
+    :param int chunk_size: size of chunks read from db.select in bytes
+    :param env: environment
+    :param args: see *db.select* arguments (e.g., database, driver)
+
+    :return: dictionary with statistics (keys as in db.univar JSON output),
+        values are None when there are no non-null values
+    """
+    import numpy as np
+
+    if not sql:
+        sql = "SELECT %s FROM %s" % (column, table)
+        if where:
+            sql += " WHERE " + where
+    for key in ("database", "driver"):
+        if key in args and not args[key]:
+            args.pop(key)
+
+    n = 0
+    total = 0.0
+    total_sq = 0.0
+    total_abs = 0.0
+    minimum = np.inf
+    maximum = -np.inf
+    chunks = []
+    sketch = _QuantileSketch(sketch_size) if sketch_size else None
+    for values in _read_column_chunks(sql, chunk_size, env=env, **args):
+        if not len(values):
+            continue
+        n += len(values)
+        total += values.sum()
+        total_sq += np.dot(values, values)
+        total_abs += np.abs(values).sum()
+        minimum = min(minimum, values.min())
+        maximum = max(maximum, values.max())
+        if extended:
+            if sketch:
+                sketch.update(values)
+            else:
+                chunks.append(values)
+
+    keys = ["min", "max", "range", "mean", "mean_abs", "variance", "stddev"]
+    keys += ["coeff_var", "sum"]
+    if extended:
+        keys += ["first_quartile", "median", "third_quartile", "percentile_values"]
+    result = dict.fromkeys(keys)
+    result["n"] = n
+    if extended:
+        result["percentiles"] = list(percentile)
+    if not n:
+        return result
+
+    variance = (total_sq - total * total / n) / n
+    if variance < 0:
+        variance = 0.0
+    result["min"] = float(minimum)
+    result["max"] = float(maximum)
+    result["range"] = float(maximum - minimum)
+    result["mean"] = float(total / n)
+    result["mean_abs"] = float(total_abs / n)
+    result["variance"] = float(variance)
+    result["stddev"] = float(np.sqrt(variance))
+    result["coeff_var"] = float(np.sqrt(variance) / (abs(total) / n))
+    result["sum"] = float(total)
+    if not extended:
+        return result
+
+    median_a = _univar_position(n, 0.5)
+    median_b = median_a + 1 - n % 2
+    positions = [_univar_position(n, 0.25), median_a, median_b]
+    positions += [_univar_position(n, 0.75)]
+    positions += [_univar_position(n, p / 100.0) for p in percentile]
+    if sketch:
+        selected = sketch.values_at(positions)
+    else:
+        values = np.concatenate(chunks)
+        del chunks
+        values.partition(sorted(set(positions)))
+        selected = values[positions]
+    selected = [float(value) for value in selected]
+    result["first_quartile"] = selected[0]
+    result["median"] = (selected[1] + selected[2]) / 2
+    result["third_quartile"] = selected[3]
+    result["percentile_values"] = selected[4:]
+    return result
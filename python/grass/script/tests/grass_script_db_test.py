@@ -0,0 +1,76 @@
+"""Test streaming functions in grass.script.db and grass.script.vector"""
+
+import numpy as np
+import pytest
+
+import grass.script as gs
+
+
+@pytest.fixture(scope="module")
+def session_with_table(tmp_path_factory):
+    """Start a session with a vector map and its attribute table"""
+    tmp_path = tmp_path_factory.mktemp("db_select")
+    location = "test"
+    gs.core._create_location_xy(tmp_path, location)  # pylint: disable=protected-access
+    with gs.setup.init(tmp_path / location):
+        gs.run_command("g.region", s=0, n=10, w=0, e=10, res=1)
+        gs.write_command(
+            "v.in.ascii",
+            input="-",
+            stdin="1|1|1.5|a\n2|2|2.5|b\n3|3|3.5|c\n",
+            output="points",
+            columns="x integer, y integer, value double precision, label varchar(20)",
+        )
+        gs.write_command(
+            "db.execute",
+            input="-",
+            stdin="UPDATE points SET value=NULL, label='b \"quoted\"' WHERE cat=2\n"
+            "UPDATE points SET label=NULL WHERE cat=3\n",
+        )
+        yield "points"
+
+
+def test_db_select_records(session_with_table):
+    """Values are typed and NULL is None"""
+    records = list(
+        gs.db_select_records(sql=f"SELECT cat, value, label FROM {session_with_table}")
+    )
+    assert records == [
+        {"cat": 1, "value": 1.5, "label": "a"},
+        {"cat": 2, "value": None, "label": 'b "quoted"'},
+        {"cat": 3, "value": 3.5, "label": None},
+    ]
+
+
+def test_db_select_stopped_early(session_with_table):
+    """Reading can be stopped before all records are read"""
+    records = gs.db_select_records(table=session_with_table)
+    assert next(records)["cat"] == 1
+    records.close()
+
+
+def test_db_select_chunks(session_with_table):
+    """Columns are returned as NumPy arrays in chunks"""
+    chunks = list(gs.db_select_chunks(table=session_with_table, chunk_size=2))
+    assert len(chunks) == 2
+    assert chunks[0]["cat"].dtype == np.int64
+    np.testing.assert_array_equal(chunks[0]["cat"], [1, 2])
+    np.testing.assert_array_equal(chunks[0]["value"], [1.5, np.nan])
+    assert list(chunks[1]["label"]) == [None]
+
+
+def test_vector_db_select_records(session_with_table):
+    """Records of vector attribute table are read with types"""
+    records = list(
+        gs.vector_db_select_records(
+            session_with_table, columns="cat,value", where="cat > 1"
+        )
+    )
+    assert records == [{"cat": 2, "value": None}, {"cat": 3, "value": 3.5}]
+
+
+def test_vector_db_select_chunks(session_with_table):
+    """Chunks of vector attribute table contain all rows"""
+    chunks = list(gs.vector_db_select_chunks(session_with_table, chunk_size=10))
+    assert len(chunks) == 1
+    np.testing.assert_array_equal(chunks[0]["x"], [1, 2, 3])
@@ -108,5 +108,24 @@ class TestDecodeLcAllC(TestDecode, LcAllC):
     pass
 
 
+class TestLazyImport(TestCase):
+    """Tests function `lazy_import` that imports modules on first use."""
+
+    def test_imported_module(self):
+        """If the module is already imported return the module"""
+        self.assertIs(utils.lazy_import("os"), os)
+
+    def test_lazy_module(self):
+        """The module is imported on first attribute access"""
+        sys.modules.pop("colorsys", None)
+        module = utils.lazy_import("colorsys")
+        self.assertIs(sys.modules["colorsys"], module)
+        self.assertEqual(module.rgb_to_hsv(1, 0, 0), (0, 1, 1))
+
+    def test_missing_module(self):
+        """If the module does not exist raise an ImportError"""
+        self.assertRaises(ImportError, utils.lazy_import, "grass.no_such_module")
+
+
 if __name__ == "__main__":
     test()
@@ -20,6 +20,7 @@ for details.
 import os
 import sys
 import shutil
+import importlib.util
 import locale
 import shlex
 import re
@@ -491,6 +492,34 @@ def set_path(modulename, dirname=None, path="."):
         sys.path.insert(0, path)
 
 
+def lazy_import(name):
+    """Return a module which is imported on first access of its attributes
+
+    Use this function for modules which are expensive to import, e.g.,
+    the ctypes bindings of the GRASS C-libraries in grass.lib, but which
+    are not needed in every code path of the importing module.
+    If the module is already imported, the module itself is returned.
+
+    >>> json = lazy_import("json")
+    >>> json.dumps([1])
+    '[1]'
+
+    :param str name: the absolute name of the module
+    :raises ModuleNotFoundError: if the module can not be found
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError("No module named '%s'" % name, name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
 def clock():
     """
     Return time counter to measure performance for chunks of code.
@@ -21,6 +21,7 @@ import os
 import sys
 
 from .utils import parse_key_val
+from .db import _chunks, _read_json_records, _records_to_arrays
 from .core import (
     run_command,
     read_command,
@@ -296,6 +297,54 @@ def vector_db_select(map, layer=1, env=None, **kwargs):
     return {"columns": columns, "values": values}
 
 
+def vector_db_select_records(map, layer=1, env=None, **kwargs):
+    """Iterate over attribute data of selected vector map layer.
+
+    Unlike :func:`vector_db_select()`, records are read one by one
+    as they are produced by *v.db.select* and values have their types
+    (numbers are ``int`` or ``float``, NULL is ``None``), so even very large
+    tables can be processed in constant memory. Example:
+
+    >>> for row in vector_db_select_records('geology', columns='cat,GEO_NAME'):
+    ...     print(row)  # doctest: +ELLIPSIS
+    {'cat': 1, 'GEO_NAME': 'Zml'}
+    ...
+
+    :param str map: map name
+    :param int layer: layer number
+    :param kwargs: v.db.select options
+    :param env: environment
+
+    :return: generator of dictionaries with column names as keys
+    """
+    return _read_json_records("v.db.select", map=map, layer=layer, env=env, **kwargs)
+
+
+def vector_db_select_chunks(map, layer=1, chunk_size=100000, env=None, **kwargs):
+    """Iterate over attribute data of selected vector map layer in chunks.
+
+    Each chunk is a dictionary with column names as keys and NumPy arrays
+    of at most *chunk_size* values as values, see
+    :func:`grass.script.db.db_select_chunks()`. Example:
+
+    >>> for chunk in vector_db_select_chunks('geology', columns='SHAPE_area'):
+    ...     print(chunk['SHAPE_area'].dtype)
+    float64
+
+    :param str map: map name
+    :param int layer: layer number
+    :param int chunk_size: maximal number of rows in one chunk
+    :param kwargs: v.db.select options
+    :param env: environment
+
+    :return: generator of dictionaries of NumPy arrays
+    """
+    for chunk in _chunks(
+        vector_db_select_records(map, layer=layer, env=env, **kwargs), chunk_size
+    ):
+        yield _records_to_arrays(chunk)
+
+
 json = None
 orderedDict = None
 
@@ -1,35 +1,134 @@
 from __future__ import absolute_import
 
-from .core import *
-from .base import *
-from .spatial_extent import *
-from .metadata import *
-from .abstract_dataset import *
-from .abstract_map_dataset import *
-from .abstract_space_time_dataset import *
-from .space_time_datasets import *
-from .datetime_math import *
-from .open_stds import *
-from .factory import *
-from .gui_support import *
-from .list_stds import *
-from .register import *
-from .sampling import *
-from .aggregation import *
-from .extract import *
-from .stds_export import *
-from .stds_import import *
-from .mapcalc import *
-from .univar_statistics import *
-from .c_libraries_interface import *
-from .spatio_temporal_relationships import *
-from .spatial_topology_dataset_connector import *
-from .temporal_extent import *
-from .temporal_topology_dataset_connector import *
-from .temporal_granularity import *
-from .temporal_algebra import *
-from .temporal_vector_algebra import *
-from .temporal_raster_base_algebra import *
-from .temporal_raster_algebra import *
-from .temporal_raster3d_algebra import *
-from .temporal_operator import *
+import importlib
+
+from grass.utils import tracing
+
+with tracing.span(__name__, category="import"):
+    from .core import *
+    from .base import *
+    from .spatial_extent import *
+    from .metadata import *
+    from .abstract_dataset import *
+    from .abstract_map_dataset import *
+    from .abstract_space_time_dataset import *
+    from .space_time_datasets import *
+    from .datetime_math import *
+    from .open_stds import *
+    from .factory import *
+    from .list_stds import *
+    from .register import *
+    from .c_libraries_interface import *
+    from .spatio_temporal_relationships import *
+    from .spatial_topology_dataset_connector import *
+    from .temporal_extent import *
+    from .temporal_topology_dataset_connector import *
+    from .temporal_granularity import *
+    from .temporal_extent_array import *
+    from .spatial_extent_array import *
+    from .map_extent_record import *
+
+# The submodules and their public names, the submodules are imported on
+# first access of one of their names, since most temporal modules and
+# scripts do not need them and the temporal algebra needs PLY to be imported.
+# The names must match the public top level names of the submodules, this
+# is checked by testsuite/test_lazy_imports.py
+_lazy_modules = {
+    "gui_support": ("tlist_grouped", "tlist"),
+    "sampling": ("sample_stds_by_stds_topology",),
+    "aggregation": (
+        "collect_map_names",
+        "aggregate_raster_maps",
+        "aggregate_by_topology",
+    ),
+    "extract": (
+        "extract_dataset",
+        "run_mapcalc2d",
+        "run_mapcalc3d",
+        "run_vector_extraction",
+    ),
+    "stds_export": (
+        "proj_file_name",
+        "init_file_name",
+        "metadata_file_name",
+        "read_file_name",
+        "list_file_name",
+        "tmp_tar_file_name",
+        "exported_maps",
+        "compression_modes",
+        "export_stds",
+    ),
+    "stds_import": (
+        "proj_file_name",
+        "init_file_name",
+        "list_file_name",
+        "imported_maps",
+        "import_stds",
+    ),
+    "mapcalc": ("dataset_mapcalculator",),
+    "univar_statistics": (
+        "compute_univar_stats",
+        "print_gridded_dataset_univar_statistics",
+        "print_vector_dataset_univar_statistics",
+    ),
+    "temporal_algebra": (
+        "FatalError",
+        "TemporalAlgebraLexer",
+        "GlobalTemporalVar",
+        "TemporalAlgebraParser",
+    ),
+    "temporal_vector_algebra": (
+        "TemporalVectorAlgebraLexer",
+        "TemporalVectorAlgebraParser",
+    ),
+    "temporal_raster_base_algebra": (
+        "TemporalRasterAlgebraLexer",
+        "TemporalRasterBaseAlgebraParser",
+    ),
+    "temporal_raster_algebra": ("TemporalRasterAlgebraParser",),
+    "temporal_raster3d_algebra": ("TemporalRaster3DAlgebraParser",),
+    "temporal_operator": ("TemporalOperatorLexer", "TemporalOperatorParser"),
+}
+# The submodule which provides a name, see _lazy_modules
+_lazy_names = {
+    name: module_name for module_name, names in _lazy_modules.items() for name in names
+}
+_imported_lazy_modules = set()
+# Names of the submodules shadow the names imported above, as their star
+# imports did, e.g. FatalError of the temporal algebra
+for _name in _lazy_names:
+    globals().pop(_name, None)
+del _name
+
+
+def _import_lazy_module(module_name):
+    """Import a lazily loaded submodule and add its public names to the
+    package namespace, other names that are already set are not replaced"""
+    if module_name in _imported_lazy_modules:
+        return importlib.import_module("." + module_name, __name__)
+    with tracing.span(__name__ + "." + module_name, category="import"):
+        module = importlib.import_module("." + module_name, __name__)
+    namespace = globals()
+    for name, value in vars(module).items():
+        if not name.startswith("_"):
+            namespace.setdefault(name, value)
+    for name in _lazy_modules[module_name]:
+        namespace[name] = getattr(module, name)
+    _imported_lazy_modules.add(module_name)
+    return module
+
+
+def __getattr__(name):
+    """Import the lazily loaded submodules on first access"""
+    if name in _lazy_modules:
+        return _import_lazy_module(name)
+    if name in _lazy_names:
+        _import_lazy_module(_lazy_names[name])
+        return globals()[name]
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    for module_name in _lazy_modules:
+        _import_lazy_module(module_name)
+    return sorted(globals())
@@ -1104,7 +1104,7 @@ class AbstractMapDataset(AbstractDataset):
         self.stds_register.select(dbif, mapset)
         datasets = self.stds_register.get_registered_stds()
 
-        if datasets is not None and datasets != "" and datasets.find("@") >= 0:
+        if datasets:
             datasets = datasets.split(",")
         else:
             datasets = None
@@ -1130,38 +1130,32 @@ class AbstractMapDataset(AbstractDataset):
         """
         self.msgr.debug(2, "AbstractMapDataset.add_stds_to_register")
 
+        if stds_id is None or stds_id == "":
+            return ""
+
         dbif, connection_state_changed = init_dbif(dbif=dbif)
 
         # only modify database in current mapset
         mapset = get_current_mapset()
         datasets = self.get_registered_stds(dbif=dbif, mapset=mapset)
 
-        if stds_id is None or stds_id == "":
-            return ""
-
-        # Check if no datasets are present
-        if datasets is None:
-            datasets = []
-
         # Check if the dataset is already present
-        if stds_id in datasets:
+        if datasets is not None and stds_id in datasets:
             if connection_state_changed:
-                dbif.close
+                dbif.close()
             return ""
 
-        datasets.append(stds_id)
-
-        self.stds_register.set_registered_stds(",".join(datasets))
-
         statement = ""
 
         if execute is True:
-            self.stds_register.update(dbif=dbif)
+            self.stds_register.add(stds_id, dbif=dbif)
         else:
-            statement = self.stds_register.get_update_statement_mogrified(dbif=dbif)
+            statement = self.stds_register.get_add_statement_mogrified(
+                stds_id, dbif=dbif
+            )
 
         if connection_state_changed:
-            dbif.close
+            dbif.close()
 
         return statement
 
@@ -1185,31 +1179,23 @@ class AbstractMapDataset(AbstractDataset):
         mapset = get_current_mapset()
         datasets = self.get_registered_stds(dbif=dbif, mapset=mapset)
 
-        # Check if no datasets are present
-        if datasets is None:
-            if connection_state_changed:
-                dbif.close
-            return ""
-
-        # Check if the dataset is already present
-        if stds_id not in datasets:
+        # Check if the dataset is present
+        if datasets is None or stds_id not in datasets:
             if connection_state_changed:
-                dbif.close
+                dbif.close()
             return ""
 
-        datasets.remove(stds_id)
-
-        self.stds_register.set_registered_stds(",".join(datasets))
-
         statement = ""
 
         if execute is True:
-            self.stds_register.update(dbif=dbif)
+            self.stds_register.remove(stds_id, dbif=dbif)
         else:
-            statement = self.stds_register.get_update_statement_mogrified(dbif=dbif)
+            statement = self.stds_register.get_remove_statement_mogrified(
+                stds_id, dbif=dbif
+            )
 
         if connection_state_changed:
-            dbif.close
+            dbif.close()
 
         return statement
 
@@ -27,7 +27,10 @@ from .abstract_dataset import AbstractDataset, AbstractDatasetComparisonKeyStart
 from .temporal_granularity import (
     check_granularity_string,
     compute_absolute_time_granularity,
+    compute_common_relative_time_granularity,
     compute_relative_time_granularity,
+    gcd_list,
+    gran_singular_unit,
 )
 from .spatio_temporal_relationships import (
     count_temporal_topology_relationships,
@@ -36,6 +39,32 @@ from .spatio_temporal_relationships import (
     create_temporal_relation_sql_where_statement,
 )
 from .datetime_math import increment_datetime_by_string, string_to_datetime
+from .temporal_extent_array import TemporalExtentArray, get_temporal_extent_array
+from .map_extent_record import MapExtentRecord
+from grass.utils import tracing
+
+# The aggregate functions of the spatial extent of the registered maps
+SPATIAL_EXTENT_AGGREGATES = (
+    ("north", max),
+    ("south", min),
+    ("east", max),
+    ("west", min),
+    ("top", max),
+    ("bottom", min),
+)
+
+
+def _aggregate(function, values):
+    """Apply the aggregate function to all values that are not None,
+    like SQL aggregate functions do
+
+    :return: The aggregated value or None if all values are None
+    """
+    values = [value for value in values if value is not None]
+    if values:
+        return function(values)
+    return None
+
 
 ###############################################################################
 
@@ -129,6 +158,15 @@ class AbstractSpaceTimeDataset(AbstractDataset):
         :param name: The name of the register table
         """
 
+    @abstractmethod
+    def get_metadata_aggregates(self):
+        """Return the type specific metadata of the space time dataset
+        that aggregates the metadata of the registered maps
+
+        :return: A tuple of (dataset column, map column, function) tuples,
+                 function is one of the builtins min, max or sum
+        """
+
     def print_self(self):
         """Print the content of the internal structure to stdout"""
         self.base.print_self()
@@ -455,7 +493,7 @@ class AbstractSpaceTimeDataset(AbstractDataset):
         """
 
         if maps is None:
-            maps = self.get_registered_maps_as_objects(
+            maps = self.get_registered_maps_as_records(
                 where=None, order="start_time", dbif=dbif
             )
 
@@ -492,6 +530,14 @@ class AbstractSpaceTimeDataset(AbstractDataset):
         :return: The numbers of gaps between temporal neighbors
         """
 
+        if maps is None:
+            extents = self.get_registered_maps_as_temporal_extent_array(dbif)
+        else:
+            extents = get_temporal_extent_array(maps)
+
+        if extents is not None:
+            return extents.count_gaps()
+
         if maps is None:
             maps = self.get_registered_maps_as_objects(
                 where=None, order="start_time", dbif=dbif
@@ -543,12 +589,17 @@ class AbstractSpaceTimeDataset(AbstractDataset):
         """
 
         if maps is None:
+            extents = self.get_registered_maps_as_temporal_extent_array(dbif)
+            if extents is not None:
+                return extents.count_temporal_relations()
+
             maps = self.get_registered_maps_as_objects(
                 where=None, order="start_time", dbif=dbif
             )
 
         return count_temporal_topology_relationships(maps1=maps, dbif=dbif)
 
+    @tracing.trace_function("temporal")
     def check_temporal_topology(self, maps=None, dbif=None):
         """Check the temporal topology of all maps of the current space time
         dataset or of an optional list of maps
@@ -582,12 +633,7 @@ class AbstractSpaceTimeDataset(AbstractDataset):
         :param dbif: The database interface to be used
         :return: True if topology is correct
         """
-        if maps is None:
-            maps = self.get_registered_maps_as_objects(
-                where=None, order="start_time", dbif=dbif
-            )
-
-        relations = count_temporal_topology_relationships(maps1=maps, dbif=dbif)
+        relations = self.count_temporal_relations(maps=maps, dbif=dbif)
 
         if relations is None:
             return False
@@ -1030,7 +1076,7 @@ class AbstractSpaceTimeDataset(AbstractDataset):
                 use_precedes,
             )
 
-            maps = self.get_registered_maps_as_objects(where, "start_time", dbif)
+            maps = self.get_registered_maps_as_records(where, "start_time", dbif)
 
             result = {}
             result["granule"] = granule
@@ -1039,15 +1085,13 @@ class AbstractSpaceTimeDataset(AbstractDataset):
 
             if maps is not None:
                 for map in maps:
-                    # Read the spatial extent
                     if spatial:
-                        map.spatial_extent.select(dbif)
                         # Ignore spatial disjoint maps
-                        if not granule.spatial_overlapping(map):
+                        if not granule.spatial_overlapping(map.get_map()):
                             continue
 
                     num_samples += 1
-                    maplist.append(copy.copy(map))
+                    maplist.append(map)
 
             # Fill with empty map in case no spatio-temporal relations found
             if maps is None or num_samples == 0:
@@ -1466,6 +1510,26 @@ class AbstractSpaceTimeDataset(AbstractDataset):
 
         return obj_list
 
+    def get_registered_maps_as_temporal_extent_array(self, dbif=None):
+        """Return the temporal extents of all registered maps ordered by
+        start time as TemporalExtentArray
+
+        No map objects are created, only the id, start and end time of
+        the registered maps are selected.
+
+        :param dbif: The database interface to be used
+        :return: The TemporalExtentArray object or None in case no maps
+                 are registered or NumPy is not available
+        """
+        rows = self.get_registered_maps(
+            "id,start_time,end_time", None, "start_time", dbif
+        )
+
+        return TemporalExtentArray.from_rows(
+            rows, self.get_temporal_type(), self.get_relative_time_unit()
+        )
+
+    @tracing.trace_function("temporal")
     def get_registered_maps_as_objects(
         self,
         where=None,
@@ -1569,13 +1633,86 @@ class AbstractSpaceTimeDataset(AbstractDataset):
                 ):
                     map.metadata.set_semantic_label(row["semantic_label"])
 
-                obj_list.append(copy.copy(map))
+                obj_list.append(map)
 
         if connection_state_changed:
             dbif.close()
 
         return obj_list
 
+    @tracing.trace_function("temporal")
+    def get_registered_maps_as_records(
+        self,
+        where=None,
+        order="start_time",
+        dbif=None,
+        spatial_extent=None,
+        spatial_relation=None,
+    ):
+        """Return all or a subset of the registered maps as ordered list of
+        lightweight MapExtentRecord objects for spatio-temporal topological
+        operations that require the spatio-temporal extent only
+
+        The records store the id, the temporal type, start time, end time,
+        west, east, south, north, bottom, top and the semantic label of
+        the maps. In contrast to get_registered_maps_as_objects() no map
+        dataset objects are created, the map dataset object of a record
+        is created on demand using its get_map() method or when an
+        attribute of the map dataset object is accessed.
+
+        :param where: The SQL where statement to select a subset of
+                      the registered maps without "WHERE"
+        :param order: The SQL order statement to be used to order the
+                      objects in the list without "ORDER BY"
+        :param dbif: The database interface to be used
+        :param spatial_extent: Return only maps with the provided spatial
+                     relation to the given spatial extent (requires
+                     spatial_relation parameter)
+        :param spatial_relation: Return only maps with the given spatial
+                     relation to the provided spatial extent (requires
+                     spatial_extent parameter)
+
+        :return: The ordered list of MapExtentRecord objects
+        """
+        rows = self.get_registered_maps(
+            None, where, order, dbif, spatial_extent, spatial_relation
+        )
+
+        if not rows:
+            return []
+
+        temporal_type = self.get_temporal_type()
+        unit = None
+        if self.is_time_relative():
+            unit = self.get_relative_time_unit()
+        has_semantic_label = "semantic_label" in rows[0].keys()
+
+        records = []
+        for row in rows:
+            semantic_label = None
+            if has_semantic_label and row["semantic_label"] != "None":
+                semantic_label = row["semantic_label"]
+
+            records.append(
+                MapExtentRecord(
+                    self.get_new_map_instance,
+                    row["id"],
+                    temporal_type,
+                    row["start_time"],
+                    row["end_time"],
+                    unit,
+                    north=row["north"],
+                    south=row["south"],
+                    east=row["east"],
+                    west=row["west"],
+                    top=row["top"],
+                    bottom=row["bottom"],
+                    semantic_label=semantic_label,
+                )
+            )
+
+        return records
+
     def _update_where_statement_by_semantic_label(self, where):
         """Update given SQL WHERE statement by semantic label.
 
@@ -1641,7 +1778,7 @@ class AbstractSpaceTimeDataset(AbstractDataset):
         return where
 
     def _update_where_statement_by_spatial_extent(
-        self, where, spatial_extent, spatial_relation
+        self, where, spatial_extent, spatial_relation, spatial_index=False
     ):
         """Update given SQL WHERE statement by spatial extent where clause
 
@@ -1664,6 +1801,9 @@ class AbstractSpaceTimeDataset(AbstractDataset):
                         within the provided spatial extent
             "is_contained": maps that are fully within the provided spatial extent
             "contains": maps that contain (fully cover) the provided spatial extent
+        :param bool spatial_index: Preselect the maps with bounding boxes
+            that intersect the provided spatial extent using the SQLite
+            R*Tree index of the map spatial extents
 
         :return: updated SQL WHERE statement
 
@@ -1722,7 +1862,7 @@ class AbstractSpaceTimeDataset(AbstractDataset):
             spatial_where_template += " AND top >= {t}" " AND bottom <= {b}"
         spatial_where_template += ")"
 
-        spatial_where_list = [spatial_where_template.format(**spatial_extent)]
+        spatial_extent_list = [spatial_extent]
 
         # Adjust the east and west in case of LL projection
         if spatial_extent["projection"] == "3":
@@ -1734,16 +1874,118 @@ class AbstractSpaceTimeDataset(AbstractDataset):
                 spatial_extent_shift["w"] = str(
                     float(spatial_extent_shift["w"]) + coord_shift
                 )
-                spatial_where_list.append(
-                    spatial_where_template.format(**spatial_extent_shift)
-                )
-        where += " OR ".join(spatial_where_list)
+                spatial_extent_list.append(spatial_extent_shift)
+        where += " OR ".join(
+            spatial_where_template.format(**extent) for extent in spatial_extent_list
+        )
+
+        if spatial_index:
+            # All spatial relations require that the bounding boxes
+            # intersect, the R*Tree selects these maps and the exact
+            # conditions above are applied only to them
+            spatial_extent_table = (
+                self.get_new_map_instance(None).get_type() + "_spatial_extent"
+            )
+            index_where_template = (
+                "SELECT id FROM %s_rtree WHERE max_x >= {w} AND min_x <= {e}"
+                " AND max_y >= {s} AND min_y <= {n}" % spatial_extent_table
+            )
+            if self.get_type() == "str3ds":
+                index_where_template += " AND max_z >= {b} AND min_z <= {t}"
+            where += ") AND (id IN (SELECT id FROM %s WHERE rowid IN (%s))" % (
+                spatial_extent_table,
+                " UNION ALL ".join(
+                    index_where_template.format(**extent)
+                    for extent in spatial_extent_list
+                ),
+            )
 
         # close WHERE statement
         where += ")"
 
         return where
 
+    def get_registered_maps_statement(
+        self,
+        columns=None,
+        where=None,
+        order=None,
+        spatial_extent=None,
+        spatial_relation=None,
+        dbif=None,
+    ):
+        """Return the SQL statement that selects the registered maps.
+
+        The statement can be used as sub-query, e.g. to compute aggregates
+        over the same subset of maps that get_registered_maps() returns.
+
+        The register table is joined with the map view, so that the
+        database can select the maps using the start time index in case
+        the where statement restricts the start time.
+
+        :param columns: Columns to be selected as SQL compliant string
+        :param where: The SQL where statement to select a subset
+                     of the registered maps without "WHERE"
+        :param order: The SQL order statement to be used to order the
+                     objects in the list without "ORDER BY"
+        :param spatial_extent: Select only maps with the provided spatial
+                     relation to the given spatial extent (requires
+                     spatial_relation parameter)
+        :param spatial_relation: Select only maps with the given spatial
+                     relation to the provided spatial extent (requires
+                     spatial_extent parameter)
+        :param dbif: The database interface to be used to check for the
+                     spatial index of the map extents, if None the spatial
+                     index is not used
+
+        :return: The SQL statement or None in case the space time dataset
+                 has no map register
+        """
+        if self.get_map_register() is None:
+            return None
+
+        # Use the correct temporal table
+        if self.get_temporal_type() == "absolute":
+            map_view = self.get_new_map_instance(None).get_type() + "_view_abs_time"
+        else:
+            map_view = self.get_new_map_instance(None).get_type() + "_view_rel_time"
+
+        if columns is None or columns == "":
+            columns = "%s.*" % map_view
+
+        sql = (
+            "SELECT %s FROM %s, (SELECT id AS registered_map_id FROM %s) AS "
+            "map_register WHERE %s.id = registered_map_id"
+            % (columns, map_view, self.get_map_register(), map_view)
+        )
+
+        # filter by semantic label identifier
+        if self.semantic_label:
+            where = self._update_where_statement_by_semantic_label(where)
+
+        # filter by spatial extent
+        if spatial_extent:
+            spatial_index = False
+            if (
+                dbif is not None
+                and dbif.get_dbmi(mapset=self.base.mapset).__name__ == "sqlite3"
+            ):
+                spatial_index = dbif.check_table(
+                    self.get_new_map_instance(None).get_type()
+                    + "_spatial_extent_rtree",
+                    mapset=self.base.mapset,
+                )
+            where = self._update_where_statement_by_spatial_extent(
+                where, spatial_extent, spatial_relation, spatial_index
+            )
+
+        if where is not None and where != "":
+            sql += " AND (%s)" % (where.split(";")[0])
+        if order is not None and order != "":
+            sql += " ORDER BY %s" % (order.split(";")[0])
+        return sql
+
+    @tracing.trace_function("temporal")
     def get_registered_maps(
         self,
         columns=None,
@@ -1779,41 +2021,10 @@ class AbstractSpaceTimeDataset(AbstractDataset):
 
         rows = None
 
-        if self.get_map_register() is not None:
-            # Use the correct temporal table
-            if self.get_temporal_type() == "absolute":
-                map_view = self.get_new_map_instance(None).get_type() + "_view_abs_time"
-            else:
-                map_view = self.get_new_map_instance(None).get_type() + "_view_rel_time"
-
-            if columns is not None and columns != "":
-                sql = "SELECT %s FROM %s  WHERE %s.id IN (SELECT id FROM %s)" % (
-                    columns,
-                    map_view,
-                    map_view,
-                    self.get_map_register(),
-                )
-            else:
-                sql = "SELECT * FROM %s  WHERE %s.id IN (SELECT id FROM %s)" % (
-                    map_view,
-                    map_view,
-                    self.get_map_register(),
-                )
-
-            # filter by semantic label identifier
-            if self.semantic_label:
-                where = self._update_where_statement_by_semantic_label(where)
-
-            # filter by semantic label identifier
-            if spatial_extent:
-                where = self._update_where_statement_by_spatial_extent(
-                    where, spatial_extent, spatial_relation
-                )
-
-            if where is not None and where != "":
-                sql += " AND (%s)" % (where.split(";")[0])
-            if order is not None and order != "":
-                sql += " ORDER BY %s" % (order.split(";")[0])
+        sql = self.get_registered_maps_statement(
+            columns, where, order, spatial_extent, spatial_relation, dbif
+        )
+        if sql is not None:
             try:
                 dbif.execute(sql, mapset=self.base.mapset)
                 rows = dbif.fetchall(mapset=self.base.mapset)
@@ -1831,6 +2042,67 @@ class AbstractSpaceTimeDataset(AbstractDataset):
 
         return rows
 
+    def iter_registered_maps(
+        self,
+        columns=None,
+        where=None,
+        order=None,
+        dbif=None,
+        spatial_extent=None,
+        spatial_relation=None,
+        chunk_size=1000,
+    ):
+        """Iterate over the SQL rows of all registered maps.
+
+        Same as get_registered_maps(), but the rows are fetched from the
+        database cursor in chunks of chunk_size rows while iterating, so
+        that the first rows are available before the whole result
+        is read into memory.
+
+        The cursor of the database interface must not be used for other
+        statements until the iteration is finished.
+
+        :param columns: Columns to be selected as SQL compliant string
+        :param where: The SQL where statement to select a subset
+                     of the registered maps without "WHERE"
+        :param order: The SQL order statement to be used to order the
+                     objects in the list without "ORDER BY"
+        :param dbif: The database interface to be used
+        :param spatial_extent: Return only maps with the provided spatial
+                     relation to the given spatial extent (requires
+                     spatial_relation parameter)
+        :param spatial_relation: Return only maps with the given spatial
+                     relation to the provided spatial extent (requires
+                     spatial_extent parameter)
+        :param chunk_size: The number of rows fetched at once
+
+        :return: Generator of SQL rows of the registered maps
+        """
+        dbif, connection_state_changed = init_dbif(dbif)
+        try:
+            sql = self.get_registered_maps_statement(
+                columns, where, order, spatial_extent, spatial_relation, dbif
+            )
+            if sql is None:
+                return
+            try:
+                dbif.execute(sql, mapset=self.base.mapset)
+            except:
+                self.msgr.error(
+                    _("Unable to get map ids from register table " "<%s>")
+                    % (self.get_map_register())
+                )
+                raise
+            while True:
+                rows = dbif.fetchmany(chunk_size, mapset=self.base.mapset)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row
+        finally:
+            if connection_state_changed:
+                dbif.close()
+
     @staticmethod
     def shift_map_list(maps, gran):
         """Temporally shift each map in the list with the provided granularity
@@ -2233,9 +2505,6 @@ class AbstractSpaceTimeDataset(AbstractDataset):
         # SELECT all needed information from the database
         self.select(dbif)
 
-        # We need to select the registered maps here
-        maps = self.get_registered_maps_as_objects(None, "start_time", dbif)
-
         # Safe old identifier
         old_ident = self.get_id()
         # We need to rename the old table
@@ -2267,10 +2536,9 @@ class AbstractSpaceTimeDataset(AbstractDataset):
             )
 
         # We need to rename the space time dataset in the maps register table
-        if maps:
-            for map in maps:
-                map.remove_stds_from_register(stds_id=old_ident, dbif=dbif)
-                map.add_stds_to_register(stds_id=ident, dbif=dbif)
+        sql = "UPDATE %s_stds_membership SET stds_id = ? WHERE stds_id = ?;\n"
+        sql = sql % self.get_new_map_instance(None).get_type()
+        statement += dbif.mogrify_sql_statement((sql, (ident, old_ident)))
 
         # Execute the accumulated statements
         dbif.execute_transaction(statement)
@@ -2278,7 +2546,7 @@ class AbstractSpaceTimeDataset(AbstractDataset):
         if connection_state_changed:
             dbif.close()
 
-    def delete(self, dbif=None, execute=True):
+    def delete(self, dbif=None, execute=True, bulk=False):
         """Delete a space time dataset from the temporal database
 
         This method removes the space time dataset from the temporal
@@ -2289,6 +2557,10 @@ class AbstractSpaceTimeDataset(AbstractDataset):
                        statements will be executed.
                        If False the prepared SQL statements are returned
                        and must be executed by the caller.
+        :param bulk: If True the space time dataset is removed from the
+                     dataset register of all registered maps by a single
+                     set based SQL statement instead of unregistering
+                     the maps one by one.
 
         :return: The SQL statements if execute == False, else an empty
                  string
@@ -2322,13 +2594,18 @@ class AbstractSpaceTimeDataset(AbstractDataset):
             self.msgr.debug(
                 1, _("Drop map register table: %s") % (self.get_map_register())
             )
-            rows = self.get_registered_maps("id", None, None, dbif)
-            # Unregister each registered map in the table
-            if rows is not None:
-                for row in rows:
-                    # Unregister map
-                    map = self.get_new_map_instance(row["id"])
-                    statement += self.unregister_map(map=map, dbif=dbif, execute=False)
+            if bulk:
+                statement += self._get_remove_from_map_registers_statement(dbif)
+            else:
+                rows = self.get_registered_maps("id", None, None, dbif)
+                # Unregister each registered map in the table
+                if rows is not None:
+                    for row in rows:
+                        # Unregister map
+                        map = self.get_new_map_instance(row["id"])
+                        statement += self.unregister_map(
+                            map=map, dbif=dbif, execute=False
+                        )
 
             # Safe the DROP table statement
             statement += "DROP TABLE IF EXISTS " + self.get_map_register() + ";\n"
@@ -2349,6 +2626,128 @@ class AbstractSpaceTimeDataset(AbstractDataset):
 
         return statement
 
+    def _get_remove_from_map_registers_statement(self, dbif):
+        """Return the SQL statement removing this space time dataset from
+        the dataset register of all its registered maps at once
+
+        :param dbif: The database interface to be used
+        :return: The SQL statement
+        """
+        sql = "DELETE FROM %s_stds_membership WHERE stds_id = %%s;\n"
+        sql = sql % self.get_new_map_instance(None).get_type()
+        if dbif.get_dbmi().paramstyle == "qmark":
+            sql = sql.replace("%s", "?")
+        return dbif.mogrify_sql_statement((sql, (self.get_id(),)))
+
+    def delete_registered_maps(self, dbif=None, execute=True):
+        """Delete all maps registered in this space time dataset from the
+        temporal database at once
+
+        This is the bulk variant of calling delete() of each registered map:
+        the maps are removed from the map register tables of all space time
+        datasets in which they are registered and their entries are deleted
+        by set based SQL statements. The timestamps of the maps in the
+        spatial database are not removed.
+
+        The other space time datasets in which the maps are registered
+        are updated if execute is True, otherwise the caller must call
+        update_from_registered_maps() of the datasets returned by
+        get_datasets_of_registered_maps() after the statements are executed.
+
+        :param dbif: The database interface to be used
+        :param execute: If True the SQL DELETE statements will be executed.
+                        If False the prepared SQL statements are
+                        returned and must be executed by the caller.
+
+        :return: The SQL statements if execute == False, else an empty
+                 string
+        """
+        mapset = get_current_mapset()
+
+        if self.get_mapset() != mapset:
+            self.msgr.fatal(
+                _(
+                    "Unable to delete maps of dataset <%(ds)s> of type "
+                    "%(type)s from the temporal database. The mapset"
+                    " of the database does not match the current "
+                    "mapset"
+                )
+                % {"ds": self.get_id(), "type": self.get_type()}
+            )
+
+        dbif, connection_state_changed = init_dbif(dbif)
+        self.metadata.select(dbif)
+
+        statement = ""
+        datasets = []
+        stds_register_table = self.get_map_register()
+        if stds_register_table is not None:
+            map_type = self.get_new_map_instance(None).get_type()
+            datasets = self.get_datasets_of_registered_maps(dbif)
+
+            for dataset in datasets:
+                stds = self.get_new_instance(dataset)
+                stds.metadata.select(dbif)
+                if stds.get_map_register() is not None:
+                    statement += "DELETE FROM %s WHERE id IN (SELECT id FROM %s);\n" % (
+                        stds.get_map_register(),
+                        stds_register_table,
+                    )
+
+            # Delete the maps, trigger functions will take care of dependencies
+            statement += "DELETE FROM %s_base WHERE id IN (SELECT id FROM %s);\n" % (
+                map_type,
+                stds_register_table,
+            )
+            self.msgr.verbose(
+                _(
+                    "Delete all maps of space time %s dataset <%s> from temporal database"
+                )
+                % (map_type, self.get_id())
+            )
+
+        if execute:
+            dbif.execute_transaction(statement, mapset=mapset)
+            statement = ""
+            for dataset in datasets:
+                stds = self.get_new_instance(dataset)
+                stds.select(dbif)
+                stds.update_from_registered_maps(dbif)
+
+        if connection_state_changed:
+            dbif.close()
+
+        return statement
+
+    def get_datasets_of_registered_maps(self, dbif=None):
+        """Return the ids of the other space time datasets in which the
+        maps of this space time dataset are registered
+
+        :param dbif: The database interface to be used
+        :return: A sorted list of space time dataset ids, this space time
+                 dataset is not included
+        """
+        dbif, connection_state_changed = init_dbif(dbif)
+        self.metadata.select(dbif)
+
+        datasets = set()
+        stds_register_table = self.get_map_register()
+        if stds_register_table is not None:
+            mapset = get_current_mapset()
+            sql = (
+                "SELECT DISTINCT stds_id FROM %s_stds_membership "
+                "WHERE map_id IN (SELECT id FROM %s)"
+                % (self.get_new_map_instance(None).get_type(), stds_register_table)
+            )
+            dbif.execute(sql, mapset=mapset)
+            datasets = set(row[0] for row in dbif.fetchall(mapset=mapset))
+            datasets.discard(self.get_id())
+
+        if connection_state_changed:
+            dbif.close()
+
+        return sorted(datasets)
+
     def is_map_registered(self, map_id, dbif=None):
         """Check if a map is registered in the space time dataset
 
@@ -2670,6 +3069,7 @@ class AbstractSpaceTimeDataset(AbstractDataset):
 
         return statement
 
+    @tracing.trace_function("temporal")
     def update_from_registered_maps(self, dbif=None):
         """This methods updates the modification time, the spatial and
         temporal extent as well as type specific metadata. It should always
@@ -2686,16 +3086,7 @@ class AbstractSpaceTimeDataset(AbstractDataset):
         :param dbif: The database interface to be used
         """
 
-        if self.get_mapset() != get_current_mapset():
-            self.msgr.fatal(
-                _(
-                    "Unable to update dataset <%(ds)s> of type "
-                    "%(type)s in the temporal database. The mapset"
-                    " of the database does not match the current "
-                    "mapset"
-                )
-                % {"ds": self.get_id(), "type": self.get_type()}
-            )
+        self._check_update_mapset()
 
         self.msgr.verbose(
             _(
@@ -2711,8 +3102,6 @@ class AbstractSpaceTimeDataset(AbstractDataset):
 
         dbif, connection_state_changed = init_dbif(dbif)
 
-        map_time = None
-
         use_start_time = False
 
         # Get basic info
@@ -2746,15 +3135,7 @@ class AbstractSpaceTimeDataset(AbstractDataset):
             "r",
         ).read()
 
-        for version in range(3, get_tgis_db_version_from_metadata() + 1):
-            sqlfile = os.path.join(
-                sql_path,
-                "update_"
-                + self.get_type()
-                + "_metadata_template_v{}.sql".format(version),
-            )
-            if os.path.exists(sqlfile):
-                sql += open(sqlfile).read()
+        sql += self._get_versioned_metadata_template()
 
         sql = sql.replace("SPACETIME_REGISTER_TABLE", stds_register_table)
         sql = sql.replace("SPACETIME_ID", self.base.get_id())
@@ -2844,8 +3225,266 @@ class AbstractSpaceTimeDataset(AbstractDataset):
 
             dbif.execute_transaction(sql, mapset=self.base.mapset)
 
-        # Count the temporal map types
-        maps = self.get_registered_maps_as_objects(dbif=dbif)
+        # Count the temporal map types and compute the granularity
+        maps = self.get_registered_maps_as_records(dbif=dbif)
+        map_time, gran = self._compute_map_time_and_granularity(maps)
+
+        # Set the map time type and update the time objects
+        self.temporal_extent.select(dbif)
+        self.metadata.select(dbif)
+        if self.metadata.get_number_of_maps() > 0:
+            self.temporal_extent.set_map_time(map_time)
+            self.temporal_extent.set_granularity(gran)
+        else:
+            self.temporal_extent.set_map_time(None)
+            self.temporal_extent.set_granularity(None)
+        self.temporal_extent.update_all(dbif)
+
+        # Set the modification time
+        self.base.set_mtime(datetime.now())
+        self.base.update(dbif)
+
+        if connection_state_changed:
+            dbif.close()
+
+    def update_from_added_maps(self, maps, dbif=None):
+        """This method updates the modification time, the spatial and
+        temporal extent as well as type specific metadata after maps were
+        registered in the space time dataset.
+
+        In contrast to update_from_registered_maps() the stored extents,
+        the number of maps and the metadata aggregates are widened using
+        only the values of the new maps, so that the costs do not depend
+        on the number of already registered maps. The granularity is
+        computed incrementally in case the new maps are appended after the
+        end of the temporal extent of the space time dataset, otherwise it
+        is computed from all registered maps.
+
+        A full update with update_from_registered_maps() is performed in
+        case the space time dataset had no registered maps before.
+
+        :param maps: A list of the newly registered map objects,
+                     their temporal and spatial extent and metadata
+                     must be selected from the temporal database
+        :param dbif: The database interface to be used
+        """
+        self._check_update_mapset()
+
+        # Nothing to do if the map register is not present
+        if not self.get_map_register() or not maps:
+            return
+
+        dbif, connection_state_changed = init_dbif(dbif)
+
+        self.select(dbif)
+        number_of_maps = self.metadata.get_number_of_maps()
+
+        if not number_of_maps:
+            self.update_from_registered_maps(dbif)
+            if connection_state_changed:
+                dbif.close()
+            return
+
+        self.msgr.verbose(
+            _(
+                "Update metadata, spatial and temporal extent from"
+                " the new maps of <%s>"
+            )
+            % (self.get_id())
+        )
+
+        maps = sorted(maps, key=AbstractDatasetComparisonKeyStartTime)
+        start_time = self.temporal_extent.get_start_time()
+        end_time = self.temporal_extent.get_end_time()
+        new_start_time = maps[0].get_temporal_extent_as_tuple()[0]
+        new_end_time = max(
+            start if end is None else end
+            for start, end in (map.get_temporal_extent_as_tuple() for map in maps)
+        )
+
+        # Widen the temporal and spatial extent and the metadata aggregates
+        self.temporal_extent.set_start_time(
+            _aggregate(min, (start_time, new_start_time))
+        )
+        self.temporal_extent.set_end_time(_aggregate(max, (end_time, new_end_time)))
+
+        for name, function in SPATIAL_EXTENT_AGGREGATES:
+            self.spatial_extent.D[name] = _aggregate(
+                function,
+                [self.spatial_extent.D.get(name)]
+                + [map.spatial_extent.D.get(name) for map in maps],
+            )
+
+        for stds_column, map_column, function in self.get_metadata_aggregates():
+            self.metadata.D[stds_column] = _aggregate(
+                function,
+                [self.metadata.D.get(stds_column)]
+                + [map.metadata.D.get(map_column) for map in maps],
+            )
+        self.metadata.D["number_of_maps"] = number_of_maps + len(maps)
+
+        # The granularity of the gaps between the last registered map and
+        # the appended maps and of the new maps is combined with the
+        # stored granularity
+        map_time = None
+        granularity = False
+        if end_time is not None and new_start_time >= end_time:
+            last_map = self._get_last_registered_map(maps, dbif)
+            if (
+                last_map is not None
+                and last_map.get_temporal_extent_as_tuple()[0] < new_start_time
+            ):
+                new_map_time, new_gran = self._compute_map_time_and_granularity(
+                    [last_map] + maps
+                )
+                map_time = self._merge_map_time(
+                    self.temporal_extent.get_map_time(), new_map_time
+                )
+                granularity = self._merge_granularity(
+                    map_time, self.temporal_extent.get_granularity(), new_gran
+                )
+
+        if granularity is False:
+            maps = self.get_registered_maps_as_records(dbif=dbif)
+            map_time, granularity = self._compute_map_time_and_granularity(maps)
+
+        self._update_extent_and_metadata(map_time, granularity, dbif)
+
+        if connection_state_changed:
+            dbif.close()
+
+    def update_from_removed_maps(self, maps, dbif=None):
+        """This method updates the modification time, the spatial and
+        temporal extent as well as type specific metadata after maps were
+        unregistered from the space time dataset.
+
+        The stored extents and minimum and maximum values are kept and only
+        the number of maps and the summed up metadata are decreased, in case
+        none of the removed maps lies on the boundary of the temporal or
+        spatial extent or holds one of the minimum or maximum values.
+        Otherwise the full update_from_registered_maps() is performed.
+        The map time type and the granularity are always computed
+        from all registered maps, since the removal of maps changes
+        the gaps between the remaining maps.
+
+        :param maps: A list of the unregistered map objects,
+                     their temporal and spatial extent and metadata
+                     must be selected from the temporal database
+        :param dbif: The database interface to be used
+        """
+        self._check_update_mapset()
+
+        # Nothing to do if the map register is not present
+        if not self.get_map_register() or not maps:
+            return
+
+        dbif, connection_state_changed = init_dbif(dbif)
+
+        self.select(dbif)
+        number_of_maps = self.metadata.get_number_of_maps()
+
+        if (
+            not number_of_maps
+            or number_of_maps <= len(maps)
+            or self._maps_touch_boundary(maps)
+        ):
+            self.update_from_registered_maps(dbif)
+            if connection_state_changed:
+                dbif.close()
+            return
+
+        self.msgr.verbose(
+            _(
+                "Update metadata, spatial and temporal extent from"
+                " the removed maps of <%s>"
+            )
+            % (self.get_id())
+        )
+
+        for stds_column, map_column, function in self.get_metadata_aggregates():
+            if function is sum and self.metadata.D.get(stds_column) is not None:
+                for map in maps:
+                    if map.metadata.D.get(map_column) is not None:
+                        self.metadata.D[stds_column] -= map.metadata.D[map_column]
+        self.metadata.D["number_of_maps"] = number_of_maps - len(maps)
+
+        maps = self.get_registered_maps_as_records(dbif=dbif)
+        map_time, granularity = self._compute_map_time_and_granularity(maps)
+
+        self._update_extent_and_metadata(map_time, granularity, dbif)
+
+        if connection_state_changed:
+            dbif.close()
+
+    def check_registered_maps_metadata(self, dbif=None):
+        """Check the stored extents and metadata of the space time
+        dataset against the registered maps
+
+        The temporal and spatial extent, the map time type, the
+        granularity and the type specific metadata are recomputed from
+        all registered maps using update_from_registered_maps(),
+        hence inconsistent values are replaced by the recomputed ones.
+
+        :param dbif: The database interface to be used
+        :return: A list of (column, stored value, recomputed value) tuples
+                 of all values that were not consistent
+        """
+        dbif, connection_state_changed = init_dbif(dbif)
+
+        self.select(dbif)
+        parts = (self.temporal_extent, self.spatial_extent, self.metadata)
+        stored = [dict(part.D) for part in parts]
+
+        self.update_from_registered_maps(dbif)
+        self.select(dbif)
+
+        differences = []
+        for values, part in zip(stored, parts):
+            for column in values:
+                if values[column] != part.D.get(column):
+                    differences.append((column, values[column], part.D.get(column)))
+
+        if connection_state_changed:
+            dbif.close()
+
+        return differences
+
+    def _check_update_mapset(self):
+        """Stop with a fatal error if the space time dataset is not located
+        in the current mapset and can therefore not be updated"""
+        if self.get_mapset() != get_current_mapset():
+            self.msgr.fatal(
+                _(
+                    "Unable to update dataset <%(ds)s> of type "
+                    "%(type)s in the temporal database. The mapset"
+                    " of the database does not match the current "
+                    "mapset"
+                )
+                % {"ds": self.get_id(), "type": self.get_type()}
+            )
+
+    def _get_versioned_metadata_template(self):
+        """Return the type specific metadata update SQL templates that were
+        added in later versions of the temporal database"""
+        sql = ""
+        sql_path = get_sql_template_path()
+        for version in range(3, get_tgis_db_version_from_metadata() + 1):
+            sqlfile = os.path.join(
+                sql_path,
+                "update_"
+                + self.get_type()
+                + "_metadata_template_v{}.sql".format(version),
+            )
+            if os.path.exists(sqlfile):
+                sql += open(sqlfile).read()
+        return sql
+
+    def _compute_map_time_and_granularity(self, maps):
+        """Compute the map time type and the granularity of maps
+
+        :param maps: A list of map objects ordered by start time
+        :return: A tuple (map_time, granularity)
+        """
         tlist = self.count_temporal_types(maps)
 
         if tlist["interval"] > 0 and tlist["point"] == 0 and tlist["invalid"] == 0:
@@ -2868,24 +3507,145 @@ class AbstractSpaceTimeDataset(AbstractDataset):
         else:
             gran = None
 
-        # Set the map time type and update the time objects
-        self.temporal_extent.select(dbif)
-        self.metadata.select(dbif)
-        if self.metadata.get_number_of_maps() > 0:
-            self.temporal_extent.set_map_time(map_time)
-            self.temporal_extent.set_granularity(gran)
-        else:
-            self.temporal_extent.set_map_time(None)
-            self.temporal_extent.set_granularity(None)
-        self.temporal_extent.update_all(dbif)
+        return map_time, gran
+
+    @staticmethod
+    def _merge_map_time(map_time, new_map_time):
+        """Merge the map time types of two sets of maps"""
+        types = set()
+        for value in (map_time, new_map_time):
+            if value == "mixed":
+                types.update(("interval", "point"))
+            elif value in ("interval", "point"):
+                types.add(value)
+            else:
+                return "invalid"
+        if len(types) > 1:
+            return "mixed"
+        return types.pop()
+
+    def _merge_granularity(self, map_time, granularity, new_granularity):
+        """Merge the granularity of the registered maps with the granularity
+        of the appended maps
+
+        :return: The merged granularity or False in case the granularities
+                 use different units and must be computed from all maps
+        """
+        if map_time == "invalid":
+            return None
+
+        if self.is_time_relative():
+            grans = [gran for gran in (granularity, new_granularity) if gran]
+            if grans:
+                return compute_common_relative_time_granularity(grans)
+            return 0
+
+        if granularity is None or new_granularity is None:
+            return granularity or new_granularity
+
+        # The granularity is the greatest common divisor of all intervals
+        # and gaps in the smallest unit, hence it can only be merged
+        # without recomputation if both use the same unit
+        unit = gran_singular_unit(granularity)
+        if unit != gran_singular_unit(new_granularity):
+            return False
+        num = gcd_list(
+            [int(granularity.split(" ")[0]), int(new_granularity.split(" ")[0])]
+        )
+        if num == 1:
+            return "%i %s" % (num, unit)
+        return "%i %ss" % (num, unit)
+
+    def _get_last_registered_map(self, maps, dbif):
+        """Return the registered map with the latest start time that is not
+        in the list of new maps
+
+        :return: The selected map object or None
+        """
+        new_ids = set(map.get_id() for map in maps)
+        rows = self.iter_registered_maps(
+            columns="id", order="start_time DESC", dbif=dbif, chunk_size=len(maps) + 1
+        )
+        last_id = None
+        for row in rows:
+            if row["id"] not in new_ids:
+                last_id = row["id"]
+                break
+        rows.close()
+
+        if last_id is None:
+            return None
+        last_map = self.get_new_map_instance(last_id)
+        last_map.select(dbif)
+        return last_map
+
+    def _maps_touch_boundary(self, maps):
+        """Check if maps lie on the boundary of the stored temporal and spatial
+        extent or hold one of the stored minimum or maximum metadata values
+
+        :param maps: A list of map objects
+        :return: True if at least one map touches the boundary
+        """
+        start_time = self.temporal_extent.get_start_time()
+        end_time = self.temporal_extent.get_end_time()
+        if start_time is None or end_time is None:
+            return True
+
+        aggregates = [
+            (self.spatial_extent, name, name, function)
+            for name, function in SPATIAL_EXTENT_AGGREGATES
+        ]
+        aggregates += [
+            (self.metadata, stds_column, map_column, function)
+            for stds_column, map_column, function in self.get_metadata_aggregates()
+            if function is not sum
+        ]
+
+        for map in maps:
+            start, end = map.get_temporal_extent_as_tuple()
+            if start is None or start <= start_time:
+                return True
+            if (start if end is None else end) >= end_time:
+                return True
+            for part, stds_column, map_column, function in aggregates:
+                if part is self.spatial_extent:
+                    value = map.spatial_extent.D.get(map_column)
+                else:
+                    value = map.metadata.D.get(map_column)
+                if value is None:
+                    continue
+                stored = part.D.get(stds_column)
+                if stored is None or function(stored, value) == value:
+                    return True
+        return False
+
+    def _update_extent_and_metadata(self, map_time, granularity, dbif):
+        """Write the temporal and spatial extent and the metadata of this
+        object into the temporal database and set the modification time
+
+        :param map_time: The map time type of the registered maps
+        :param granularity: The granularity of the registered maps
+        :param dbif: The database interface to be used
+        """
+        self.temporal_extent.set_map_time(map_time)
+        self.temporal_extent.set_granularity(granularity)
+
+        statement = self.temporal_extent.get_update_all_statement_mogrified(dbif)
+        statement += self.spatial_extent.get_update_all_statement_mogrified(dbif)
+        statement += self.metadata.get_update_all_statement_mogrified(dbif)
+
+        # Metadata that can not be aggregated incrementally
+        sql = self._get_versioned_metadata_template()
+        sql = sql.replace("SPACETIME_REGISTER_TABLE", self.get_map_register())
+        sql = sql.replace("SPACETIME_ID", self.base.get_id())
+        statement += sql
+
+        dbif.execute_transaction(statement, mapset=self.base.mapset)
 
         # Set the modification time
         self.base.set_mtime(datetime.now())
         self.base.update(dbif)
 
-        if connection_state_changed:
-            dbif.close()
-
 
 ###############################################################################
 
@@ -19,6 +19,7 @@ for details.
 
 import grass.script as gscript
 from grass.exceptions import CalledModuleError
+from grass.utils import tracing
 from .space_time_datasets import RasterDataset
 from .datetime_math import create_suffix_from_datetime
 from .datetime_math import create_time_suffix
@@ -109,6 +110,7 @@ def collect_map_names(sp, dbif, start, end, sampling):
 ###############################################################################
 
 
+@tracing.trace_function("temporal")
 def aggregate_raster_maps(
     inputs, base, start, end, count, method, register_null, dbif, offset=0
 ):
@@ -209,6 +211,7 @@ def aggregate_raster_maps(
 ##############################################################################
 
 
+@tracing.trace_function("temporal")
 def aggregate_by_topology(
     granularity_list,
     granularity,
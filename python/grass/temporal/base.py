@@ -1132,18 +1132,33 @@ class STVDSBase(STDSBase):
 
 class AbstractSTDSRegister(SQLDatabaseInterface):
     """This is the base class for all maps to store the space time datasets
-    as comma separated string in which they are registered
+    in which they are registered
+
+    Each registration is stored as (map_id, stds_id) row in the
+    membership table of the map type, so that the space time datasets
+    of a map and the maps of a space time dataset are selected using
+    indexes. The space time datasets of a map are provided
+    as comma separated string.
+
+    The rows are inserted and deleted with add() and remove(), the
+    update methods only rename the map in all of its registrations.
 
      Usage:
 
      .. code-block:: python
 
          >>> init()
-         >>> t = AbstractSTDSRegister("raster", "soil@PERMANENT", "A@P,B@P,C@P")
+         >>> t = AbstractSTDSRegister("raster_stds_membership", "soil@PERMANENT", "A@P,B@P,C@P")
          >>> t.id
          'soil@PERMANENT'
          >>> t.registered_stds
          'A@P,B@P,C@P'
+         >>> t.get_select_statement()
+         ("SELECT stds_id FROM raster_stds_membership WHERE map_id = 'soil@PERMANENT' ORDER BY stds_id;\n", ())
+         >>> t.get_add_statement("D@P")
+         ('INSERT INTO raster_stds_membership (map_id, stds_id) VALUES (?, ?);\n', ('soil@PERMANENT', 'D@P'))
+         >>> t.get_remove_statement("A@P")
+         ('DELETE FROM raster_stds_membership WHERE map_id = ? AND stds_id = ?;\n', ('soil@PERMANENT', 'A@P'))
 
     """
 
@@ -1204,6 +1219,255 @@ class AbstractSTDSRegister(SQLDatabaseInterface):
         else:
             return None
 
+    def get_delete_statement(self):
+        """Return the delete string
+        :return: The DELETE string
+        """
+        return (
+            "DELETE FROM "
+            + self.get_table_name()
+            + " WHERE map_id = '"
+            + str(self.ident)
+            + "';\n"
+        )
+
+    def get_is_in_db_statement(self):
+        """Return the selection string that checks if this map is registered
+        in a space time dataset
+        :return: The SELECT string
+        """
+        return (
+            "SELECT map_id FROM "
+            + self.get_table_name()
+            + " WHERE map_id = '"
+            + str(self.ident)
+            + "';\n"
+        )
+
+    def get_select_statement(self):
+        """Return the sql statement and the argument list in
+        database specific style
+        :return: The SELECT string
+        """
+        return (
+            "SELECT stds_id FROM "
+            + self.get_table_name()
+            + " WHERE map_id = '"
+            + str(self.ident)
+            + "' ORDER BY stds_id;\n",
+            (),
+        )
+
+    def select(self, dbif=None, mapset=None):
+        """Select the space time datasets in which this map is registered
+        from the temporal database
+
+        :param dbif: The database interface to be used,
+                     if None a temporary connection will be established
+        :return: True if the map is registered in a space time dataset,
+                 False otherwise
+        """
+        sql, args = self.get_select_statement()
+
+        # default: use the temporal database in the mapset of this map
+        if mapset is None:
+            mapset = self.mapset
+
+        if dbif:
+            dbif.execute(sql, mapset=mapset)
+            rows = dbif.fetchall(mapset=mapset)
+        else:
+            dbif = SQLDatabaseInterfaceConnection()
+            dbif.connect()
+            dbif.execute(sql, mapset=mapset)
+            rows = dbif.fetchall(mapset=mapset)
+            dbif.close()
+
+        if not rows:
+            self.set_registered_stds(None)
+            return False
+
+        self.set_registered_stds(",".join(row[0] for row in rows))
+        return True
+
+    def _get_datasets(self):
+        """Return the registered space time datasets as list"""
+        registered_stds = self.get_registered_stds()
+        if not registered_stds:
+            return []
+        return [stds_id for stds_id in registered_stds.split(",") if "@" in stds_id]
+
+    def get_add_statement(self, stds_id):
+        """Return the sql statement and the argument list to register
+        this map in a space time dataset
+
+        :param stds_id: The id of the space time dataset
+        :return: The INSERT string
+        """
+        sql = "INSERT INTO " + self.get_table_name() + " (map_id, stds_id) "
+        if self.dbmi_paramstyle == "qmark":
+            sql += "VALUES (?, ?);\n"
+        else:
+            sql += "VALUES (%s, %s);\n"
+        return sql, (self.ident, stds_id)
+
+    def get_remove_statement(self, stds_id):
+        """Return the sql statement and the argument list to remove the
+        registration of this map in a space time dataset
+
+        :param stds_id: The id of the space time dataset
+        :return: The DELETE string
+        """
+        sql = "DELETE FROM " + self.get_table_name()
+        if self.dbmi_paramstyle == "qmark":
+            sql += " WHERE map_id = ? AND stds_id = ?;\n"
+        else:
+            sql += " WHERE map_id = %s AND stds_id = %s;\n"
+        return sql, (self.ident, stds_id)
+
+    def get_add_statement_mogrified(self, stds_id, dbif=None):
+        """Return the statement registering this map in a space time
+        dataset as mogrified string
+
+        :param stds_id: The id of the space time dataset
+        :param dbif: The database interface to be used,
+                     if None a temporary connection will be established
+        :return: The INSERT string
+        """
+        if not dbif:
+            dbif = SQLDatabaseInterfaceConnection()
+
+        return dbif.mogrify_sql_statement(
+            self.get_add_statement(stds_id), mapset=get_current_mapset()
+        )
+
+    def get_remove_statement_mogrified(self, stds_id, dbif=None):
+        """Return the statement removing the registration of this map in
+        a space time dataset as mogrified string
+
+        :param stds_id: The id of the space time dataset
+        :param dbif: The database interface to be used,
+                     if None a temporary connection will be established
+        :return: The DELETE string
+        """
+        if not dbif:
+            dbif = SQLDatabaseInterfaceConnection()
+
+        return dbif.mogrify_sql_statement(
+            self.get_remove_statement(stds_id), mapset=get_current_mapset()
+        )
+
+    def add(self, stds_id, dbif=None):
+        """Register this map in a space time dataset
+
+        :param stds_id: The id of the space time dataset
+        :param dbif: The database interface to be used,
+                     if None a temporary connection will be established
+        """
+        self._execute(self.get_add_statement(stds_id), dbif)
+        self.set_registered_stds(",".join(self._get_datasets() + [stds_id]))
+
+    def remove(self, stds_id, dbif=None):
+        """Remove the registration of this map in a space time dataset
+
+        :param stds_id: The id of the space time dataset
+        :param dbif: The database interface to be used,
+                     if None a temporary connection will be established
+        """
+        self._execute(self.get_remove_statement(stds_id), dbif)
+        datasets = [dataset for dataset in self._get_datasets() if dataset != stds_id]
+        self.set_registered_stds(",".join(datasets) if datasets else None)
+
+    def get_insert_statement_mogrified(self, dbif=None):
+        """Return the statements registering this map in all space time
+        datasets of the internal structure as mogrified string
+
+        :param dbif: The database interface to be used,
+                     if None a temporary connection will be established
+        :return: The INSERT string
+        """
+        statement = ""
+        for stds_id in self._get_datasets():
+            statement += self.get_add_statement_mogrified(stds_id, dbif)
+        return statement
+
+    def insert(self, dbif=None):
+        """Register this map in all space time datasets of the internal
+        structure
+
+        :param dbif: The database interface to be used,
+                     if None a temporary connection will be established
+        """
+        for stds_id in self._get_datasets():
+            self._execute(self.get_add_statement(stds_id), dbif)
+
+    def get_update_statement(self, ident=None):
+        """Return the sql statement and the argument list that renames
+        this map in all of its registrations
+
+        :param ident: The old identifier of the map
+        :return: The UPDATE string, an empty string if the map is not renamed
+        """
+        if not ident or ident == self.ident:
+            return "", ()
+        sql = "UPDATE " + self.get_table_name()
+        if self.dbmi_paramstyle == "qmark":
+            sql += " SET map_id = ? WHERE map_id = ?;\n"
+        else:
+            sql += " SET map_id = %s WHERE map_id = %s;\n"
+        return sql, (self.ident, ident)
+
+    def get_update_statement_mogrified(self, dbif=None, ident=None):
+        """Return the update statement as mogrified string
+
+        :param dbif: The database interface to be used,
+                     if None a temporary connection will be established
+        :param ident: The old identifier of the map
+        :return: The UPDATE string
+        """
+        sql, args = self.get_update_statement(ident)
+        if not sql:
+            return ""
+        if not dbif:
+            dbif = SQLDatabaseInterfaceConnection()
+        return dbif.mogrify_sql_statement((sql, args), mapset=get_current_mapset())
+
+    def update(self, dbif=None, ident=None):
+        """Rename this map in all of its registrations
+
+        :param dbif: The database interface to be used,
+                     if None a temporary connection will be established
+        :param ident: The old identifier of the map
+        """
+        sql, args = self.get_update_statement(ident)
+        if sql:
+            self._execute((sql, args), dbif)
+
+    get_update_all_statement = get_update_statement
+    get_update_all_statement_mogrified = get_update_statement_mogrified
+    update_all = update
+
+    def _execute(self, statement, dbif=None):
+        """Execute a statement in the temporal database of the current mapset
+
+        :param statement: A tuple of the SQL string and the argument list
+        :param dbif: The database interface to be used,
+                     if None a temporary connection will be established
+        """
+        if self.ident is None:
+            self.msgr.fatal(_("Missing identifier"))
+
+        sql, args = statement
+        mapset = get_current_mapset()
+
+        if dbif:
+            dbif.execute(sql, args, mapset=mapset)
+        else:
+            dbif = SQLDatabaseInterfaceConnection()
+            dbif.connect()
+            dbif.execute(sql, args, mapset=mapset)
+            dbif.close()
+
     # Properties of this class
     id = property(fget=get_id, fset=set_id)
     registered_stds = property(fget=get_registered_stds, fset=set_registered_stds)
@@ -1217,7 +1481,7 @@ class RasterSTDSRegister(AbstractSTDSRegister):
 
     def __init__(self, ident=None, registered_stds=None):
         AbstractSTDSRegister.__init__(
-            self, "raster_stds_register", ident, registered_stds
+            self, "raster_stds_membership", ident, registered_stds
         )
 
 
@@ -1226,7 +1490,7 @@ class Raster3DSTDSRegister(AbstractSTDSRegister):
 
     def __init__(self, ident=None, registered_stds=None):
         AbstractSTDSRegister.__init__(
-            self, "raster3d_stds_register", ident, registered_stds
+            self, "raster3d_stds_membership", ident, registered_stds
         )
 
 
@@ -1235,7 +1499,7 @@ class VectorSTDSRegister(AbstractSTDSRegister):
 
     def __init__(self, ident=None, registered_stds=None):
         AbstractSTDSRegister.__init__(
-            self, "vector_stds_register", ident, registered_stds
+            self, "vector_stds_membership", ident, registered_stds
         )
 
 
@@ -16,17 +16,18 @@ from multiprocessing import Process, Lock, Pipe
 import logging
 from ctypes import byref, cast, c_int, c_void_p, CFUNCTYPE, POINTER
 from datetime import datetime
-import grass.lib.gis as libgis
-import grass.lib.raster as libraster
-import grass.lib.vector as libvector
-import grass.lib.date as libdate
-import grass.lib.raster3d as libraster3d
-import grass.lib.temporal as libtgis
 from grass.pygrass.rpc.base import RPCServerBase
-from grass.pygrass.raster import RasterRow
-from grass.pygrass.vector import VectorTopo
-from grass.script.utils import encode
-from grass.pygrass.utils import decode
+from grass.script.utils import encode, lazy_import
+
+# The C-libraries are only used in the server process, import them
+# on first use to keep the import of the temporal framework fast
+libgis = lazy_import("grass.lib.gis")
+libraster = lazy_import("grass.lib.raster")
+libvector = lazy_import("grass.lib.vector")
+libdate = lazy_import("grass.lib.date")
+libraster3d = lazy_import("grass.lib.raster3d")
+libtgis = lazy_import("grass.lib.temporal")
+pygrass_utils = lazy_import("grass.pygrass.utils")
 
 ###############################################################################
 
@@ -93,6 +94,8 @@ def _read_raster_full_info(name, mapset):
     future.
     """
 
+    from grass.pygrass.raster import RasterRow
+
     info = {}
     r = RasterRow(name=name, mapset=mapset)
     if r.exist() is True:
@@ -132,6 +135,8 @@ def _read_vector_full_info(name, mapset, layer=None):
     and return a dictionary. C
     """
 
+    from grass.pygrass.vector import VectorTopo
+
     info = {}
 
     v = VectorTopo(name=name, mapset=mapset)
@@ -208,7 +213,7 @@ def _get_mapset(lock, conn, data):
     :returns: Name of the current mapset
     """
     mapset = libgis.G_mapset()
-    conn.send(decode(mapset))
+    conn.send(pygrass_utils.decode(mapset))
 
 
 ###############################################################################
@@ -224,7 +229,7 @@ def _get_location(lock, conn, data):
     :returns: Name of the location
     """
     location = libgis.G_location()
-    conn.send(decode(location))
+    conn.send(pygrass_utils.decode(location))
 
 
 ###############################################################################
@@ -240,7 +245,7 @@ def _get_gisdbase(lock, conn, data):
     :returns: Name of the gisdatabase
     """
     gisdbase = libgis.G_gisdbase()
-    conn.send(decode(gisdbase))
+    conn.send(pygrass_utils.decode(gisdbase))
 
 
 ###############################################################################
@@ -262,7 +267,7 @@ def _get_driver_name(lock, conn, data):
         mapset = encode(mapset)
 
     drstring = libtgis.tgis_get_mapset_driver_name(mapset)
-    conn.send(decode(drstring.data))
+    conn.send(pygrass_utils.decode(drstring.data))
 
 
 ###############################################################################
@@ -296,7 +301,7 @@ def _get_database_name(lock, conn, data):
     except:
         raise
     finally:
-        conn.send(decode(dbstring))
+        conn.send(pygrass_utils.decode(dbstring))
 
 
 ###############################################################################
@@ -327,7 +332,7 @@ def _available_mapsets(lock, conn, data):
 
             c = 0
             while mapset[c] != b"\x00":
-                val = decode(mapset[c])
+                val = pygrass_utils.decode(mapset[c])
                 char_list += val
                 c += 1
 
@@ -344,7 +349,7 @@ def _available_mapsets(lock, conn, data):
 
         # We need to sort the mapset list, but the first one should be
         # the current mapset
-        current_mapset = decode(libgis.G_mapset())
+        current_mapset = pygrass_utils.decode(libgis.G_mapset())
         if current_mapset in mapset_list:
             mapset_list.remove(current_mapset)
         mapset_list.sort()
@@ -550,7 +555,7 @@ def _read_semantic_label(lock, conn, data):
             # ValueError: ctypes objects containing pointers cannot be pickled
             ret = libraster.Rast_read_semantic_label(name, mapset)
             if ret:
-                semantic_label = decode(ret)
+                semantic_label = pygrass_utils.decode(ret)
         else:
             logging.error(
                 "Unable to read semantic label. " "Unsupported map type %s" % maptype
@@ -35,6 +35,7 @@ import grass.script as gscript
 
 from .c_libraries_interface import CLibrariesInterface
 from grass.pygrass import messages
+from grass.utils import tracing
 from grass.script.utils import decode
 
 # Import all supported database backends
@@ -51,6 +52,7 @@ except:
     pass
 
 import atexit
+import threading
 from datetime import datetime
 
 if sys.version_info.major >= 3:
@@ -60,8 +62,15 @@ if sys.version_info.major >= 3:
 
 
 def profile_function(func):
-    """Profiling function provided by the temporal framework"""
+    """Profiling function provided by the temporal framework
+
+    The function is profiled with cProfile in case the environment
+    variable GRASS_TGIS_PROFILE is set to "True" or "1". In case tracing
+    is enabled with the environment variable GRASS_TRACE, a span of the
+    function call is recorded, see grass.utils.tracing.
+    """
     do_profiling = os.getenv("GRASS_TGIS_PROFILE")
+    program = os.path.basename(sys.argv[0]) or func.__name__
 
     if do_profiling == "True" or do_profiling == "1":
         import cProfile
@@ -73,7 +82,8 @@ def profile_function(func):
             import io
         pr = cProfile.Profile()
         pr.enable()
-        func()
+        with tracing.span(program, category="main"):
+            func()
         pr.disable()
         s = io.StringIO()
         sortby = "cumulative"
@@ -81,7 +91,8 @@ def profile_function(func):
         ps.print_stats()
         print(s.getvalue())
     else:
-        func()
+        with tracing.span(program, category="main"):
+            func()
 
 
 # Global variable that defines the backend
@@ -118,7 +129,7 @@ tgis_version = 2
 # can differ this value must be an integer larger than 0
 # Increase this value in case of backward incompatible changes
 # temporal database SQL layout
-tgis_db_version = 3
+tgis_db_version = 5
 
 # We need to know the parameter style of the database backend
 tgis_dbmi_paramstyle = None
@@ -424,6 +435,59 @@ def get_tgis_metadata(dbif=None):
     return rows
 
 
+def get_tgis_metadata_value(key, dbif=None):
+    """Return the value of a key stored in the tgis metadata table
+
+    :param key: The key of the metadata entry
+    :param dbif: The database interface to be used
+    :returns: The value as string or None if the key is not present
+    """
+    rows = get_tgis_metadata(dbif)
+    if rows:
+        for row in rows:
+            if row["key"] == key:
+                return row["value"]
+    return None
+
+
+###############################################################################
+
+
+def set_tgis_metadata_value(key, value, dbif=None):
+    """Store a key:value pair in the tgis metadata table
+
+    An existing entry with the same key is replaced. Modules can use this
+    to persist their own state in the temporal database, the key should
+    be prefixed with the module name.
+
+    :param key: The key of the metadata entry
+    :param value: The value to store as string, if None the entry is removed
+    :param dbif: The database interface to be used
+    """
+    dbif, connection_state_changed = init_dbif(dbif)
+
+    if get_tgis_dbmi_paramstyle() == "qmark":
+        place_holder = "?"
+    else:
+        place_holder = "%s"
+
+    statement = dbif.mogrify_sql_statement(
+        ("DELETE FROM tgis_metadata WHERE key = %s;\n" % place_holder, (key,))
+    )
+    if value is not None:
+        statement += dbif.mogrify_sql_statement(
+            (
+                "INSERT INTO tgis_metadata (key, value) VALUES (%s, %s);\n"
+                % (place_holder, place_holder),
+                (key, str(value)),
+            )
+        )
+    dbif.execute_transaction(statement)
+
+    if connection_state_changed:
+        dbif.close()
+
+
 ###############################################################################
 
 # The temporal database string set with t.connect
@@ -469,6 +533,10 @@ def stop_subprocesses():
 # We register this function to be called at exit
 atexit.register(stop_subprocesses)
 
+# The temporal database driver and database of the mapsets
+# requested by get_available_temporal_mapsets()
+_temporal_mapset_connections = {}
+
 
 def get_available_temporal_mapsets():
     """Return a list of of mapset names with temporal database driver and names
@@ -485,9 +553,13 @@ def get_available_temporal_mapsets():
     tgis_mapsets = {}
 
     for mapset in mapsets:
-        mapset = mapset
-        driver = c_library_interface.get_driver_name(mapset)
-        database = c_library_interface.get_database_name(mapset)
+        # The connection settings of a mapset are requested only once
+        # from the C-library interface, init() resets them
+        if mapset not in _temporal_mapset_connections:
+            driver = c_library_interface.get_driver_name(mapset)
+            database = c_library_interface.get_database_name(mapset)
+            _temporal_mapset_connections[mapset] = (driver, database)
+        driver, database = _temporal_mapset_connections[mapset]
 
         message_interface.debug(
             1,
@@ -517,6 +589,7 @@ def get_available_temporal_mapsets():
 ###############################################################################
 
 
+@tracing.trace_function("temporal")
 def init(raise_fatal_error=False, skip_db_version_check=False):
     """This function set the correct database backend from GRASS environmental
     variables and creates the grass temporal database structure for raster,
@@ -579,6 +652,10 @@ def init(raise_fatal_error=False, skip_db_version_check=False):
 
     raise_on_error = raise_fatal_error
 
+    # The database connections may change
+    _temporal_mapset_connections.clear()
+    close_pooled_connections()
+
     # We must run t.connect at first to create the temporal database and to
     # get the environmental variables
     gscript.run_command("t.connect", flags="c")
@@ -791,6 +868,9 @@ def init(raise_fatal_error=False, skip_db_version_check=False):
             if tgis_db_version_meta == 2 and tgis_db_version == 3:
                 # version 3 is backward compatible with version 2
                 msgr.warning(message)
+            elif tgis_db_version_meta == 4 and tgis_db_version == 5:
+                # version 5 adds only indexes to version 4
+                msgr.warning(message)
             else:
                 msgr.fatal(
                     _(
@@ -956,6 +1036,8 @@ def create_temporal_database(dbif):
     dbif.execute_transaction(delete_trigger_sql)
     # The indexes
     dbif.execute_transaction(indexes_sql)
+    if tgis_backend == "sqlite":
+        _create_spatial_index(dbif)
 
     # Create the tgis metadata table to store the database
     # initial configuration
@@ -1006,19 +1088,26 @@ def upgrade_temporal_database(dbif):
         return
 
     template_path = get_sql_template_path()
-    try:
-        upgrade_db_sql = open(
-            os.path.join(
-                template_path,
-                "upgrade_db_%s_to_%s.sql" % (upgrade_db_from, tgis_db_version),
-            ),
-            "r",
-        ).read()
-    except FileNotFoundError:
-        msgr.fatal(
-            _("Unsupported TGIS DB upgrade scenario: from version %s to %s")
-            % (upgrade_db_from, tgis_db_version)
-        )
+    upgrade_db_sql = ""
+    # Upgrade step by step from the version of the database
+    for version in range(int(upgrade_db_from), tgis_db_version):
+        try:
+            upgrade_db_sql += open(
+                os.path.join(
+                    template_path,
+                    "upgrade_db_%s_to_%s.sql" % (version, version + 1),
+                ),
+                "r",
+            ).read()
+        except FileNotFoundError:
+            msgr.fatal(
+                _("Unsupported TGIS DB upgrade scenario: from version %s to %s")
+                % (upgrade_db_from, tgis_db_version)
+            )
+        if version == 3:
+            upgrade_db_sql += _get_upgrade_db_3_to_4_statement(dbif)
+        if version == 4:
+            upgrade_db_sql += _get_upgrade_db_4_to_5_statement(dbif)
 
     drop_views_sql = open(os.path.join(template_path, "drop_views.sql"), "r").read()
 
@@ -1030,6 +1119,8 @@ def upgrade_temporal_database(dbif):
     dbif.execute_transaction(drop_views_sql)
     # Perform upgrade
     dbif.execute_transaction(upgrade_db_sql)
+    if int(upgrade_db_from) < 5 and dbif.get_dbmi().__name__ == "sqlite3":
+        _create_spatial_index(dbif)
     # Recreate views
     _create_temporal_database_views(dbif)
 
@@ -1039,6 +1130,116 @@ def upgrade_temporal_database(dbif):
 ###############################################################################
 
 
+def _get_upgrade_db_3_to_4_statement(dbif):
+    """Return the SQL statements that move the comma separated lists of
+    space time datasets of the GRASS_MAP_stds_register tables into the
+    GRASS_MAP_stds_membership tables (internal use only)
+
+    The register tables are dropped and the delete triggers that refer
+    to them are recreated.
+
+    :param dbif: The database interface to be used
+    :return: The SQL statements
+    """
+    if dbif.get_dbmi().paramstyle == "qmark":
+        sql = "INSERT INTO %s_stds_membership (map_id, stds_id) VALUES (?, ?);\n"
+    else:
+        sql = "INSERT INTO %s_stds_membership (map_id, stds_id) VALUES (%%s, %%s);\n"
+
+    statement = ""
+    for map_type in ("raster", "raster3d", "vector"):
+        dbif.execute("SELECT id, registered_stds FROM %s_stds_register;" % map_type)
+        for row in dbif.fetchall():
+            if not row[1]:
+                continue
+            for stds_id in sorted(set(row[1].split(","))):
+                if stds_id.find("@") >= 0:
+                    statement += dbif.mogrify_sql_statement(
+                        (sql % map_type, (row[0], stds_id))
+                    )
+
+    for dataset_type in ("raster", "raster3d", "vector", "strds", "str3ds", "stvds"):
+        if dbif.get_dbmi().__name__ == "sqlite3":
+            statement += "DROP TRIGGER delete_%s_base;\n" % dataset_type
+        else:
+            statement += "DROP TRIGGER delete_%s_base ON %s_base;\n" % (
+                dataset_type,
+                dataset_type,
+            )
+    for map_type in ("raster", "raster3d", "vector"):
+        statement += "DROP TABLE %s_stds_register;\n" % map_type
+
+    if dbif.get_dbmi().__name__ == "sqlite3":
+        delete_trigger_sql = "sqlite3_delete_trigger.sql"
+    else:
+        delete_trigger_sql = "postgresql_delete_trigger.sql"
+    statement += open(
+        os.path.join(get_sql_template_path(), delete_trigger_sql), "r"
+    ).read()
+
+    return statement
+
+
+###############################################################################
+
+
+def _get_upgrade_db_4_to_5_statement(dbif):
+    """Return the SQL statements that create the start time indexes of
+    the map tables in a SQLite temporal database (internal use only)
+
+    The PostgreSQL temporal database has these indexes already.
+
+    :param dbif: The database interface to be used
+    :return: The SQL statements
+    """
+    statement = ""
+    if dbif.get_dbmi().__name__ != "sqlite3":
+        return statement
+
+    for map_type in ("raster", "raster3d", "vector"):
+        for time_type in ("relative", "absolute"):
+            statement += (
+                "CREATE INDEX {map_type}_{time_type}_time_start_index ON "
+                "{map_type}_{time_type}_time (start_time, end_time);\n"
+            ).format(map_type=map_type, time_type=time_type)
+
+    return statement
+
+
+###############################################################################
+
+
+def _create_spatial_index(dbif):
+    """Create the R*Tree spatial indexes of the map extents in a SQLite
+    temporal database (internal use only)
+
+    The index is used to select the registered maps of a space time
+    dataset by spatial extent. In case the R*Tree module is not
+    available in SQLite, the maps are selected without the index.
+
+    :param dbif: The database interface to be used
+    """
+    dbif.execute("SELECT sqlite_compileoption_used('ENABLE_RTREE');")
+    row = dbif.fetchone()
+    if not row or not row[0]:
+        get_tgis_message_interface().verbose(
+            _("SQLite R*Tree module is not available, spatial index not created")
+        )
+        return
+
+    spatial_index_sql = open(
+        os.path.join(get_sql_template_path(), "sqlite3_spatial_index_template.sql"),
+        "r",
+    ).read()
+    statement = ""
+    for map_type in ("raster", "raster3d", "vector"):
+        statement += spatial_index_sql.replace("GRASS_MAP", map_type)
+    dbif.execute_transaction(statement)
+
+
+###############################################################################
+
+
 def _create_tgis_metadata_table(content, dbif=None):
     """!Create the temporal gis metadata table which stores all metadata
     information about the temporal database.
@@ -1062,10 +1263,94 @@ def _create_tgis_metadata_table(content, dbif=None):
         dbif.close()
 
 
+###############################################################################
+
+# The open database connections which are not in use, they are reused by
+# the database interfaces of the same process and thread
+_connection_pool = threading.local()
+
+# The maximal number of unused connections kept open for a database
+_max_pooled_connections = 4
+
+
+def _get_connection_pool():
+    """Return the connection pool of the current process and thread
+    (internal use only)
+
+    :return: A dictionary, the keys are the database keys created by
+             _get_database_key(), the values are dictionaries with
+             the list of unused "connections" and the "tables" dictionary
+             that caches the results of the table checks
+    """
+    if getattr(_connection_pool, "pid", None) != os.getpid():
+        # Connections of the parent process must not be used after fork
+        _connection_pool.databases = {}
+        _connection_pool.pid = os.getpid()
+    return _connection_pool.databases
+
+
+def _get_database_key(backend, dbstring):
+    """Return the key that identifies a temporal database (internal use only)
+
+    SQLite database paths are resolved, so that mapsets which refer to
+    the same database file share a connection.
+
+    :param backend: The database backend sqlite or pg
+    :param dbstring: The database connection string
+    """
+    backend = decode(backend)
+    dbstring = decode(dbstring)
+    if backend == "sqlite" and dbstring:
+        dbstring = os.path.realpath(dbstring)
+    return (backend, dbstring)
+
+
+def close_pooled_connections():
+    """Close the unused database connections of the current process and
+    thread that are kept open by the connection pool
+
+    This function is called by init(), connections in use are closed
+    when they are returned to the pool.
+
+    .. code-block:: python
+
+        >>> init()
+        >>> dbif = SQLDatabaseInterfaceConnection()
+        >>> dbif.connect()
+        >>> connection = dbif.connections[get_current_mapset()].connection
+        >>> dbif.close()
+        >>> dbif.connect()
+        >>> dbif.connections[get_current_mapset()].connection is connection
+        True
+        >>> dbif.close()
+        >>> close_pooled_connections()
+        >>> dbif.connect()
+        >>> dbif.connections[get_current_mapset()].connection is connection
+        False
+        >>> dbif.close()
+    """
+    pool = _get_connection_pool()
+    for database in pool.values():
+        for connection in database["connections"]:
+            connection.close()
+    pool.clear()
+
+
 ###############################################################################
 
 
 class SQLDatabaseInterfaceConnection(object):
+    """This class represents the interface to the temporal databases of
+    all mapsets that are accessible from the current mapset.
+
+    Mapsets that share a temporal database use a single connection.
+    Only the temporal database of the current mapset is connected by
+    connect(), the databases of other mapsets are connected when they
+    are used first. The connections are taken from the connection pool
+    and are returned to the pool by close(), so that they are reused
+    by the next database interface.
+    """
+
     def __init__(self):
         self.tgis_mapsets = get_available_temporal_mapsets()
         self.current_mapset = get_current_mapset()
@@ -1076,13 +1361,14 @@ class SQLDatabaseInterfaceConnection(object):
 
         for mapset in self.tgis_mapsets.keys():
             driver, dbstring = self.tgis_mapsets[mapset]
+            database = _get_database_key(driver, dbstring)
 
-            if dbstring not in self.unique_connections.keys():
-                self.unique_connections[dbstring] = DBConnection(
+            if database not in self.unique_connections.keys():
+                self.unique_connections[database] = DBConnection(
                     backend=driver, dbstring=dbstring
                 )
 
-            self.connections[mapset] = self.unique_connections[dbstring]
+            self.connections[mapset] = self.unique_connections[database]
 
         self.msgr = get_tgis_message_interface()
 
@@ -1108,13 +1394,9 @@ class SQLDatabaseInterfaceConnection(object):
 
         Supported backends are sqlite3 and postgresql
         """
-        for mapset in self.tgis_mapsets.keys():
-            driver, dbstring = self.tgis_mapsets[mapset]
-            conn = self.connections[mapset]
-            if conn.is_connected() is False:
-                conn.connect(dbstring)
-
         self.connected = True
+        if self.current_mapset in self.connections:
+            self._get_connection(self.current_mapset, "Unable to connect.")
 
     def is_connected(self):
         return self.connected
@@ -1126,10 +1408,22 @@ class SQLDatabaseInterfaceConnection(object):
         close all temporal databases that have been opened.
         """
         for key in self.unique_connections.keys():
-            self.unique_connections[key].close()
+            if self.unique_connections[key].is_connected():
+                self.unique_connections[key].close()
 
         self.connected = False
 
+    def get_database_mapsets(self):
+        """Return the accessible mapsets grouped by their temporal database
+
+        :return: A list of lists of mapset names, the mapsets of each list
+                 share the same temporal database
+        """
+        databases = {}
+        for mapset in self.connections.keys():
+            databases.setdefault(id(self.connections[mapset]), []).append(mapset)
+        return list(databases.values())
+
     def mogrify_sql_statement(self, content, mapset=None):
         """Return the SQL statement and arguments as executable SQL string
 
@@ -1141,43 +1435,23 @@ class SQLDatabaseInterfaceConnection(object):
                        database location, if None the current mapset
                        will be used
         """
-        if mapset is None:
-            mapset = self.current_mapset
-
-        mapset = decode(mapset)
-        if mapset not in self.tgis_mapsets.keys():
-            self.msgr.fatal(
-                _(
-                    "Unable to mogrify sql statement. "
-                    + self._create_mapset_error_message(mapset)
-                )
-            )
-
-        return self.connections[mapset].mogrify_sql_statement(content)
+        connection = self._get_connection(mapset, "Unable to mogrify sql statement.")
+        return connection.mogrify_sql_statement(content)
 
     def check_table(self, table_name, mapset=None):
         """Check if a table exists in the temporal database
 
+        The result is cached for the database until a transaction
+        is executed.
+
         :param table_name: The name of the table to be checked for existence
         :param mapset: The mapset of the abstract dataset or temporal
                        database location, if None the current mapset
                        will be used
         :returns: True if the table exists, False otherwise
-
-        TODO:
-        There may be several temporal databases in a location, hence
-        the mapset is used to query the correct temporal database.
         """
-        if mapset is None:
-            mapset = self.current_mapset
-
-        mapset = decode(mapset)
-        if mapset not in self.tgis_mapsets.keys():
-            self.msgr.fatal(
-                _("Unable to check table. " + self._create_mapset_error_message(mapset))
-            )
-
-        return self.connections[mapset].check_table(table_name)
+        connection = self._get_connection(mapset, "Unable to check table.")
+        return connection.check_table(table_name)
 
     def execute(self, statement, args=None, mapset=None):
         """
@@ -1186,43 +1460,20 @@ class SQLDatabaseInterfaceConnection(object):
                        database location, if None the current mapset
                        will be used
         """
-        if mapset is None:
-            mapset = self.current_mapset
-
-        mapset = decode(mapset)
-        if mapset not in self.tgis_mapsets.keys():
-            self.msgr.fatal(
-                _(
-                    "Unable to execute sql statement. "
-                    + self._create_mapset_error_message(mapset)
-                )
-            )
-
-        return self.connections[mapset].execute(statement, args)
+        connection = self._get_connection(mapset, "Unable to execute sql statement.")
+        with tracing.span("execute", category="db", statement=statement):
+            return connection.execute(statement, args)
 
     def fetchone(self, mapset=None):
-        if mapset is None:
-            mapset = self.current_mapset
-
-        mapset = decode(mapset)
-        if mapset not in self.tgis_mapsets.keys():
-            self.msgr.fatal(
-                _("Unable to fetch one. " + self._create_mapset_error_message(mapset))
-            )
-
-        return self.connections[mapset].fetchone()
+        return self._get_connection(mapset, "Unable to fetch one.").fetchone()
 
     def fetchall(self, mapset=None):
-        if mapset is None:
-            mapset = self.current_mapset
-
-        mapset = decode(mapset)
-        if mapset not in self.tgis_mapsets.keys():
-            self.msgr.fatal(
-                _("Unable to fetch all. " + self._create_mapset_error_message(mapset))
-            )
+        connection = self._get_connection(mapset, "Unable to fetch all.")
+        with tracing.span("fetchall", category="db"):
+            return connection.fetchall()
 
-        return self.connections[mapset].fetchall()
+    def fetchmany(self, size, mapset=None):
+        return self._get_connection(mapset, "Unable to fetch many.").fetchmany(size)
 
     def execute_transaction(self, statement, mapset=None):
         """Execute a transactional SQL statement
@@ -1232,19 +1483,34 @@ class SQLDatabaseInterfaceConnection(object):
 
         :param statement: The executable SQL statement or SQL script
         """
+        connection = self._get_connection(mapset, "Unable to execute transaction.")
+        with tracing.span("execute_transaction", category="db", statement=statement):
+            return connection.execute_transaction(statement)
+
+    def _get_connection(self, mapset, error_message):
+        """Return the connection to the temporal database of the mapset
+
+        The database is connected in case this interface is connected.
+
+        :param mapset: The mapset of the abstract dataset or temporal
+                       database location, if None the current mapset
+                       will be used
+        :param error_message: The message of the fatal error in case the
+                              mapset is not accessible
+        """
         if mapset is None:
             mapset = self.current_mapset
 
         mapset = decode(mapset)
         if mapset not in self.tgis_mapsets.keys():
             self.msgr.fatal(
-                _(
-                    "Unable to execute transaction. "
-                    + self._create_mapset_error_message(mapset)
-                )
+                _(error_message + " " + self._create_mapset_error_message(mapset))
             )
 
-        return self.connections[mapset].execute_transaction(statement)
+        connection = self.connections[mapset]
+        if self.connected and not connection.is_connected():
+            connection.connect(self.tgis_mapsets[mapset][1])
+        return connection
 
     def _create_mapset_error_message(self, mapset):
         return (
@@ -1267,6 +1533,9 @@ class DBConnection(object):
 
       - sqlite via the sqlite3 standard library
       - postgresql via psycopg2
+
+    Closed connections are kept open in the connection pool of the
+    process and thread and are reused by the next connect().
     """
 
     def __init__(self, backend=None, dbstring=None):
@@ -1276,17 +1545,16 @@ class DBConnection(object):
         param dbstring: The database connection string
         """
         self.connected = False
+        # The pool entry of the database while connected
+        self.pool = None
         if backend is None:
             global tgis_backend
-            if decode(tgis_backend) == "sqlite":
-                self.dbmi = sqlite3
-            else:
-                self.dbmi = psycopg2
+            backend = tgis_backend
+        self.backend = decode(backend)
+        if self.backend == "sqlite":
+            self.dbmi = sqlite3
         else:
-            if decode(backend) == "sqlite":
-                self.dbmi = sqlite3
-            else:
-                self.dbmi = psycopg2
+            self.dbmi = psycopg2
 
         if dbstring is None:
             global tgis_database_string
@@ -1333,8 +1601,22 @@ class DBConnection(object):
 
         dbstring = decode(dbstring)
 
+        self.database = _get_database_key(self.backend, dbstring)
+        self.pool = _get_connection_pool().setdefault(
+            self.database, {"connections": [], "tables": {}}
+        )
+
         try:
-            if self.dbmi.__name__ == "sqlite3":
+            if self.pool["connections"]:
+                # Reuse an open connection of the pool
+                self.connection = self.pool["connections"].pop()
+                if self.dbmi.__name__ == "sqlite3":
+                    self.cursor = self.connection.cursor()
+                else:
+                    self.cursor = self.connection.cursor(
+                        cursor_factory=self.dbmi.extras.DictCursor
+                    )
+            elif self.dbmi.__name__ == "sqlite3":
                 self.connection = self.dbmi.connect(
                     dbstring,
                     detect_types=self.dbmi.PARSE_DECLTYPES | self.dbmi.PARSE_COLNAMES,
@@ -1375,11 +1657,20 @@ class DBConnection(object):
         There may be several temporal databases in a location, hence
         close all temporal databases that have been opened. Use a dictionary
         to manage different connections.
+
+        The connection is kept open in the connection pool to be reused.
         """
         self.connection.commit()
         self.cursor.close()
         self.connected = False
 
+        pool = _get_connection_pool().get(self.database)
+        if pool is self.pool and len(pool["connections"]) < _max_pooled_connections:
+            pool["connections"].append(self.connection)
+        else:
+            self.connection.close()
+        self.pool = None
+
     def mogrify_sql_statement(self, content):
         """Return the SQL statement and arguments as executable SQL string
 
@@ -1482,15 +1773,11 @@ class DBConnection(object):
     def check_table(self, table_name):
         """Check if a table exists in the temporal database
 
+        The result is cached in the connection pool until a transaction
+        is executed in the database.
+
         :param table_name: The name of the table to be checked for existence
-        :param mapset: The mapset of the abstract dataset or temporal
-                       database location, if None the current mapset
-                       will be used
         :returns: True if the table exists, False otherwise
-
-        TODO:
-        There may be several temporal databases in a location, hence
-        the mapset is used to query the correct temporal database.
         """
         table_exists = False
         connected = False
@@ -1498,8 +1785,11 @@ class DBConnection(object):
             self.connect()
             connected = True
 
+        tables = self.pool["tables"]
+        if table_name in tables:
+            table_exists = tables[table_name]
         # Check if the database already exists
-        if self.dbmi.__name__ == "sqlite3":
+        elif self.dbmi.__name__ == "sqlite3":
             self.cursor.execute(
                 "SELECT name FROM sqlite_master WHERE "
                 "type='table' AND name='%s';" % table_name
@@ -1516,6 +1806,7 @@ class DBConnection(object):
             )
             if self.cursor.fetchone()[0]:
                 table_exists = True
+        tables[table_name] = table_exists
 
         if connected:
             self.close()
@@ -1555,6 +1846,11 @@ class DBConnection(object):
             return self.cursor.fetchall()
         return None
 
+    def fetchmany(self, size):
+        if self.connected:
+            return self.cursor.fetchmany(size)
+        return None
+
     def execute_transaction(self, statement, mapset=None):
         """Execute a transactional SQL statement
 
@@ -1568,6 +1864,9 @@ class DBConnection(object):
             self.connect()
             connected = True
 
+        # The transaction may create or drop tables
+        self.pool["tables"].clear()
+
         sql_script = ""
         sql_script += "BEGIN TRANSACTION;\n"
         sql_script += statement
@@ -19,13 +19,14 @@ for details.
 :authors: Vaclav Petras
 """
 
+import itertools
 import os
 from contextlib import contextmanager
 import sys
 
 import grass.script as gs
 
-from .core import get_tgis_message_interface, get_available_temporal_mapsets, init_dbif
+from .core import get_tgis_message_interface, init_dbif
 from .datetime_math import time_delta_to_relative_time
 from .factory import dataset_factory
 from .open_stds import open_old_stds
@@ -84,35 +85,51 @@ def get_dataset_list(
 
     dbif, connection_state_changed = init_dbif(dbif)
 
-    mapsets = get_available_temporal_mapsets()
-
-    result = {}
+    if temporal_type == "absolute":
+        table = sp.get_type() + "_view_abs_time"
+    else:
+        table = sp.get_type() + "_view_rel_time"
 
-    for mapset in mapsets.keys():
-        if temporal_type == "absolute":
-            table = sp.get_type() + "_view_abs_time"
-        else:
-            table = sp.get_type() + "_view_rel_time"
+    if columns and columns.find("all") == -1:
+        sql = "SELECT " + str(columns) + " FROM " + table
+        column_names = [column.strip() for column in columns.split(",")]
+    else:
+        sql = "SELECT * FROM " + table
+        column_names = ["id", "mapset"]
 
-        if columns and columns.find("all") == -1:
-            sql = "SELECT " + str(columns) + " FROM " + table
-        else:
-            sql = "SELECT * FROM " + table
+    if where:
+        sql += " WHERE (" + where + ") AND "
+    else:
+        sql += " WHERE "
 
-        if where:
-            sql += " WHERE " + where
-            sql += " AND mapset = '%s'" % (mapset)
-        else:
-            sql += " WHERE mapset = '%s'" % (mapset)
+    if order:
+        order = " ORDER BY " + order
+    else:
+        order = ""
 
-        if order:
-            sql += " ORDER BY " + order
+    result = {}
 
-        dbif.execute(sql, mapset=mapset)
-        rows = dbif.fetchall(mapset=mapset)
+    for mapsets in dbif.get_database_mapsets():
+        # The datasets of all mapsets of a temporal database are selected
+        # at once in case the mapset of each row is known
+        if len(mapsets) > 1 and ("mapset" in column_names or "id" in column_names):
+            mapsets_sql = ",".join("'%s'" % mapset for mapset in mapsets)
+            dbif.execute(
+                sql + "mapset IN (%s)" % mapsets_sql + order, mapset=mapsets[0]
+            )
+            for row in dbif.fetchall(mapset=mapsets[0]):
+                if "mapset" in column_names:
+                    row_mapset = row["mapset"]
+                else:
+                    row_mapset = row["id"].split("@")[-1]
+                result.setdefault(row_mapset, []).append(row)
+        else:
+            for mapset in mapsets:
+                dbif.execute(sql + "mapset = '%s'" % mapset + order, mapset=mapset)
+                rows = dbif.fetchall(mapset=mapset)
 
-        if rows:
-            result[mapset] = rows
+                if rows:
+                    result[mapset] = rows
 
     if connection_state_changed:
         dbif.close()
@@ -137,9 +154,13 @@ def _open_output_file(file, encoding="utf-8", **kwargs):
 def _write_line(items, separator, file):
     if not separator:
         separator = ","
-    output = separator.join([f"{item}" for item in items])
     with _open_output_file(file) as stream:
-        print(f"{output}", file=stream)
+        # Items are written as they come to avoid joining a huge string.
+        for i, item in enumerate(items):
+            if i:
+                stream.write(separator)
+            stream.write(f"{item}")
+        print(file=stream)
 
 
 def _write_plain(rows, header, separator, file):
@@ -170,15 +191,40 @@ def _write_json(rows, column_names, file):
                 return f"{o}"
             return super().default(o)
 
-    dict_rows = []
-    for row in rows:
-        new_row = {}
-        for key, value in zip(column_names, row):
-            new_row[key] = value
-        dict_rows.append(new_row)
+    encoder = ResultsEncoder()
     meta = {"column_names": column_names}
     with _open_output_file(file) as stream:
-        json.dump({"data": dict_rows, "metadata": meta}, stream, cls=ResultsEncoder)
+        # Rows are written one by one, the result is the same as json.dump
+        # of the whole {"data": [...], "metadata": {...}} object.
+        stream.write('{"data": [')
+        for i, row in enumerate(rows):
+            if i:
+                stream.write(", ")
+            stream.write(encoder.encode(dict(zip(column_names, row))))
+        stream.write('], "metadata": ')
+        stream.write(encoder.encode(meta))
+        stream.write("}")
+
+
+def _write_json_lines(rows, column_names, file):
+    # Lazy import output format-specific dependencies.
+    # pylint: disable=import-outside-toplevel
+    import json
+    import datetime
+
+    class ResultsEncoder(json.JSONEncoder):
+        """Results encoder for JSON which handles datetime objects"""
+
+        def default(self, o):
+            """Handle additional types"""
+            if isinstance(o, datetime.datetime):
+                return f"{o}"
+            return super().default(o)
+
+    encoder = ResultsEncoder()
+    with _open_output_file(file) as stream:
+        for row in rows:
+            print(encoder.encode(dict(zip(column_names, row))), file=stream)
 
 
 def _write_yaml(rows, column_names, file=sys.stdout):
@@ -246,6 +292,8 @@ def _write_csv(rows, column_names, separator, file=sys.stdout):
 def _write_table(rows, column_names, output_format, separator, file):
     if output_format == "json":
         _write_json(rows=rows, column_names=column_names, file=file)
+    elif output_format == "jsonl":
+        _write_json_lines(rows=rows, column_names=column_names, file=file)
     elif output_format == "yaml":
         _write_yaml(rows=rows, column_names=column_names, file=file)
     elif output_format == "plain":
@@ -354,6 +402,49 @@ def _get_list_of_maps_delta_gran(dataset, columns, where, method, gran, dbif, ms
     return rows
 
 
+def _get_computed_column_expressions(dataset, where, dbif):
+    """Return SQL expressions of the interval_length and distance_from_begin
+    columns
+
+    The values are the same as computed for the delta method from the map
+    objects, i.e., in days for absolute time and in the unit of the dataset
+    for relative time. The distance is measured from the earliest start
+    time of the selected maps.
+    """
+    first_start = "(%s)" % dataset.get_registered_maps_statement(
+        "min(start_time)", where
+    )
+    if dataset.is_time_absolute():
+        if dbif.get_dbmi(mapset=dataset.base.get_mapset()).__name__ == "sqlite3":
+            difference = "(strftime('%%s', %s) - strftime('%%s', %s)) / 86400.0"
+        else:
+            difference = "EXTRACT(EPOCH FROM (%s - %s)) / 86400.0"
+    else:
+        difference = "(%s - %s)"
+    return {
+        "interval_length": difference % ("end_time", "start_time"),
+        "distance_from_begin": difference % ("start_time", first_start),
+    }
+
+
+def _get_list_of_maps_sql(dataset, columns, where, order, dbif):
+    """Return generator of rows of the registered maps
+
+    The rows are streamed from the database and columns which are not
+    in the database are computed by the database as well.
+    """
+    computed = None
+    select = []
+    for column in columns:
+        if column in ["interval_length", "distance_from_begin"]:
+            if computed is None:
+                computed = _get_computed_column_expressions(dataset, where, dbif)
+            select.append(f"{computed[column]} AS {column}")
+        else:
+            select.append(column)
+    return dataset.iter_registered_maps(",".join(select), where, order, dbif)
+
+
 def _get_list_of_maps_stds(
     element_type,
     name,
@@ -365,7 +456,12 @@ def _get_list_of_maps_stds(
     gran=None,
     dbif=None,
 ):
-    dbif, connection_state_changed = init_dbif(dbif)
+    """Return rows and column names of the registered maps
+
+    Except for the deltagaps and gran methods, the rows are returned as
+    a generator which reads from the database while iterating, so the
+    database interface must stay open until the rows are consumed.
+    """
     msgr = get_tgis_message_interface()
 
     dataset = open_old_stds(name, element_type, dbif)
@@ -405,6 +501,18 @@ def _get_list_of_maps_stds(
             output_format=output_format,
             element_type=element_type,
         )
+        if method == "delta":
+            # Without gaps, the delta values can be computed by the database.
+            return (
+                _get_list_of_maps_sql(
+                    dataset=dataset,
+                    columns=columns,
+                    where=where,
+                    order="start_time",
+                    dbif=dbif,
+                ),
+                columns,
+            )
         rows = _get_list_of_maps_delta_gran(
             dataset=dataset,
             columns=columns,
@@ -414,28 +522,32 @@ def _get_list_of_maps_stds(
             dbif=dbif,
             msgr=msgr,
         )
+        return rows, columns
+
+    if columns:
+        check_columns(
+            column_names=columns,
+            output_format=output_format,
+            element_type=element_type,
+        )
     else:
-        if columns:
-            check_columns(
-                column_names=columns,
-                output_format=output_format,
-                element_type=element_type,
-            )
+        if output_format == "line":
+            # For list of values, only one column is needed.
+            columns = ["id"]
         else:
-            if output_format == "line":
-                # For list of values, only one column is needed.
-                columns = ["id"]
-            else:
-                columns = ["name", "mapset", "start_time", "end_time"]
-        if not order:
-            order = "start_time"
+            columns = ["name", "mapset", "start_time", "end_time"]
+    if not order:
+        order = "start_time"
 
-        rows = dataset.get_registered_maps(",".join(columns), where, order, dbif)
+    rows = _get_list_of_maps_sql(
+        dataset=dataset, columns=columns, where=where, order=order, dbif=dbif
+    )
 
-        # End with error for the old, custom formats. Proper formats simply return
-        # empty result whatever empty is for each format (e.g., empty list for JSON).
-        if not rows and (output_format in ["plain", "line"]):
-            dbif.close()
+    # End with error for the old, custom formats. Proper formats simply return
+    # empty result whatever empty is for each format (e.g., empty list for JSON).
+    if output_format in ["plain", "line"]:
+        first_row = next(rows, None)
+        if first_row is None:
             gs.fatal(
                 _(
                     "Nothing found in the database for space time dataset <{name}> "
@@ -450,8 +562,7 @@ def _get_list_of_maps_stds(
                     else _("Dataset is empty"),
                 )
             )
-    if connection_state_changed:
-        dbif.close()
+        rows = itertools.chain([first_row], rows)
     return rows, columns
 
 
@@ -510,33 +621,38 @@ def list_maps_of_stds(
         if isinstance(columns, str):
             columns = columns.split(",")
 
-    rows, columns = _get_list_of_maps_stds(
-        element_type=type,
-        name=input,
-        columns=columns,
-        order=order,
-        where=where,
-        method=method,
-        output_format=output_format,
-        gran=gran,
-        dbif=dbif,
-    )
-
-    if output_format == "line":
-        _write_line(
-            items=[row[0] for row in rows],
-            separator=separator,
-            file=outpath,
-        )
-    else:
-        _write_table(
-            rows=rows,
-            column_names=None if no_header else columns,
-            separator=separator,
+    dbif, connection_state_changed = init_dbif(dbif)
+    try:
+        rows, columns = _get_list_of_maps_stds(
+            element_type=type,
+            name=input,
+            columns=columns,
+            order=order,
+            where=where,
+            method=method,
             output_format=output_format,
-            file=outpath,
+            gran=gran,
+            dbif=dbif,
         )
 
+        if output_format == "line":
+            _write_line(
+                items=(row[0] for row in rows),
+                separator=separator,
+                file=outpath,
+            )
+        else:
+            _write_table(
+                rows=rows,
+                column_names=None if no_header else columns,
+                separator=separator,
+                output_format=output_format,
+                file=outpath,
+            )
+    finally:
+        if connection_state_changed:
+            dbif.close()
+
 
 ###############################################################################
 
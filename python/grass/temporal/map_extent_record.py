@@ -0,0 +1,216 @@
+"""
+Lightweight records of the spatio-temporal extent of registered maps
+
+Usage:
+
+.. code-block:: python
+
+    import grass.temporal as tgis
+
+    records = strds.get_registered_maps_as_records(order="start_time")
+    for record in records:
+        start, end = record.get_temporal_extent_as_tuple()
+        # The full map dataset object is created on demand
+        record.get_map().select()
+
+
+(C) 2023 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+###############################################################################
+
+
+class MapExtentRecord(object):
+    """Id, temporal extent, spatial extent and semantic label of a map
+
+    The record stores only the values that are needed to compute the
+    temporal and spatial topology of registered maps. The full map
+    dataset object is created on demand using get_map(), attributes and
+    methods that are not provided by the record are taken from this
+    map dataset object, so the record can be used in place of the map
+    dataset object. Modifications of the map dataset object are not
+    reflected by the values of the record.
+
+     Usage:
+
+     .. code-block:: python
+
+         >>> import grass.temporal as tgis
+         >>> from datetime import datetime
+         >>> tgis.init()
+         >>> record = MapExtentRecord(tgis.RasterDataset, "a@P", "absolute",
+         ...     datetime(2001, 1, 1), datetime(2001, 2, 1), north=80,
+         ...     south=20, east=60, west=10, top=0, bottom=0)
+         >>> record.get_id()
+         'a@P'
+         >>> record.get_temporal_extent_as_tuple()
+         (datetime.datetime(2001, 1, 1, 0, 0), datetime.datetime(2001, 2, 1, 0, 0))
+         >>> record.get_spatial_extent_as_tuple()
+         (80, 20, 60, 10, 0, 0)
+         >>> record.is_time_absolute()
+         True
+         >>> map = record.get_map()
+         >>> map.get_temporal_extent_as_tuple()
+         (datetime.datetime(2001, 1, 1, 0, 0), datetime.datetime(2001, 2, 1, 0, 0))
+         >>> map.get_spatial_extent_as_tuple()
+         (80, 20, 60, 10, 0, 0)
+         >>> record.get_map() is map
+         True
+         >>> record.get_name()
+         'a'
+
+    """
+
+    __slots__ = (
+        "id",
+        "temporal_type",
+        "start_time",
+        "end_time",
+        "unit",
+        "north",
+        "south",
+        "east",
+        "west",
+        "top",
+        "bottom",
+        "semantic_label",
+        "_new_map_instance",
+        "_map",
+    )
+
+    def __init__(
+        self,
+        new_map_instance,
+        ident,
+        temporal_type,
+        start_time,
+        end_time=None,
+        unit=None,
+        north=None,
+        south=None,
+        east=None,
+        west=None,
+        top=None,
+        bottom=None,
+        semantic_label=None,
+    ):
+        """Constructor
+
+        :param new_map_instance: A function that returns a new map dataset
+                                 object for a map id, e.g. the
+                                 get_new_map_instance() method of a
+                                 space time dataset
+        :param ident: The map id
+        :param temporal_type: The temporal type "absolute" or "relative"
+        :param start_time: The start time
+        :param end_time: The end time, None in case of a time instance
+        :param unit: The relative time unit
+        :param north: The northern edge
+        :param south: The southern edge
+        :param east: The eastern edge
+        :param west: The western edge
+        :param top: The top edge
+        :param bottom: The bottom edge
+        :param semantic_label: The semantic label
+        """
+        self.id = ident
+        self.temporal_type = temporal_type
+        self.start_time = start_time
+        self.end_time = end_time
+        self.unit = unit
+        self.north = north
+        self.south = south
+        self.east = east
+        self.west = west
+        self.top = top
+        self.bottom = bottom
+        self.semantic_label = semantic_label
+        self._new_map_instance = new_map_instance
+        self._map = None
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not provided by the record,
+        # special and private names are never taken from the map object
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.get_map(), name)
+
+    def get_map(self):
+        """Return the map dataset object of this record
+
+        The map dataset object is created on the first call and
+        initialized with the id, the temporal and spatial extent and the
+        semantic label of the record. In case more map information are
+        needed, use the select() method of the map dataset object.
+
+        :return: The map dataset object
+        """
+        if self._map is None:
+            map_ = self._new_map_instance(self.id)
+            if self.temporal_type == "absolute":
+                map_.set_absolute_time(self.start_time, self.end_time)
+            elif self.temporal_type == "relative":
+                map_.set_relative_time(self.start_time, self.end_time, self.unit)
+            map_.set_spatial_extent_from_values(
+                north=self.north,
+                south=self.south,
+                east=self.east,
+                west=self.west,
+                top=self.top,
+                bottom=self.bottom,
+            )
+            if self.semantic_label is not None:
+                map_.metadata.set_semantic_label(self.semantic_label)
+            self._map = map_
+        return self._map
+
+    def get_id(self):
+        """Return the unique identifier of the map"""
+        return self.id
+
+    def get_temporal_type(self):
+        """Return the temporal type "absolute" or "relative" """
+        return self.temporal_type
+
+    def is_time_absolute(self):
+        """Return True in case the temporal type is absolute"""
+        return self.temporal_type == "absolute"
+
+    def is_time_relative(self):
+        """Return True in case the temporal type is relative"""
+        return self.temporal_type == "relative"
+
+    def get_temporal_extent_as_tuple(self):
+        """Return a tuple of the valid start and end time"""
+        return (self.start_time, self.end_time)
+
+    def get_absolute_time(self):
+        """Return a tuple of the absolute start and end time"""
+        if self.temporal_type != "absolute":
+            return (None, None)
+        return (self.start_time, self.end_time)
+
+    def get_relative_time(self):
+        """Return a tuple of the relative start time, end time and unit"""
+        if self.temporal_type != "relative":
+            return (None, None, None)
+        return (self.start_time, self.end_time, self.unit)
+
+    def get_relative_time_unit(self):
+        """Return the relative time unit"""
+        return self.unit
+
+    def get_spatial_extent_as_tuple(self):
+        """Return the spatial extent as tuple
+
+        :return: The spatial extent as tuple (north, south, east, west,
+                 top, bottom)
+        """
+        return (self.north, self.south, self.east, self.west, self.top, self.bottom)
+
+    def get_semantic_label(self):
+        """Return the semantic label of the map, None if not set"""
+        return self.semantic_label
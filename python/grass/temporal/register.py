@@ -18,6 +18,7 @@ for details.
 """
 from datetime import datetime
 import grass.script as gscript
+from grass.utils import tracing
 from .core import get_tgis_message_interface, init_dbif, get_current_mapset
 from .open_stds import open_old_stds
 from .abstract_map_dataset import AbstractMapDataset
@@ -31,6 +32,7 @@ from .datetime_math import (
 ###############################################################################
 
 
+@tracing.trace_function("temporal")
 def register_maps_in_space_time_dataset(
     type,
     name,
@@ -443,18 +445,25 @@ def register_maps_in_space_time_dataset(
         dbif.execute_transaction(statement)
 
     # Finally Register the maps in the space time dataset
+    registered_maps = []
     if name and map_object_list:
         count = 0
         num_maps = len(map_object_list)
         for map in map_object_list:
             if count % 50 == 0:
                 msgr.percent(count, num_maps, 1)
-            sp.register_map(map=map, dbif=dbif)
+            if sp.register_map(map=map, dbif=dbif):
+                registered_maps.append(map)
             count += 1
 
     # Update the space time tables
     if name and map_object_list:
-        sp.update_from_registered_maps(dbif)
+        # Already registered maps may have been modified, hence the
+        # extent and metadata can only be widened by new maps
+        if len(registered_maps) == len(map_object_list):
+            sp.update_from_added_maps(registered_maps, dbif)
+        else:
+            sp.update_from_registered_maps(dbif)
         if update_cmd_list is True:
             sp.update_command_string(dbif=dbif)
 
@@ -52,7 +52,10 @@ from .temporal_extent import (
     STVDSAbsoluteTime,
     STVDSRelativeTime,
 )
-import grass.script.array as garray
+from grass.script.utils import lazy_import
+
+# numpy is only needed to read maps as arrays
+garray = lazy_import("grass.script.array")
 
 
 ###############################################################################
@@ -1215,6 +1218,19 @@ class SpaceTimeRasterDataset(AbstractSpaceTimeDataset):
         "with the type of this class"""
         return RasterDataset(ident)
 
+    def get_metadata_aggregates(self):
+        """Return the metadata aggregates of the registered raster maps"""
+        return (
+            ("min_min", "min", min),
+            ("min_max", "min", max),
+            ("max_min", "max", min),
+            ("max_max", "max", max),
+            ("nsres_min", "nsres", min),
+            ("nsres_max", "nsres", max),
+            ("ewres_min", "ewres", min),
+            ("ewres_max", "ewres", max),
+        )
+
     def get_map_register(self):
         """Return the name of the map register table"""
         return self.metadata.get_raster_register()
@@ -1324,6 +1340,21 @@ class SpaceTimeRaster3DDataset(AbstractSpaceTimeDataset):
         with the type of this class"""
         return Raster3DDataset(ident)
 
+    def get_metadata_aggregates(self):
+        """Return the metadata aggregates of the registered 3D raster maps"""
+        return (
+            ("min_min", "min", min),
+            ("min_max", "min", max),
+            ("max_min", "max", min),
+            ("max_max", "max", max),
+            ("nsres_min", "nsres", min),
+            ("nsres_max", "nsres", max),
+            ("ewres_min", "ewres", min),
+            ("ewres_max", "ewres", max),
+            ("tbres_min", "tbres", min),
+            ("tbres_max", "tbres", max),
+        )
+
     def get_map_register(self):
         """Return the name of the map register table"""
         return self.metadata.get_raster3d_register()
@@ -1450,6 +1481,26 @@ class SpaceTimeVectorDataset(AbstractSpaceTimeDataset):
         with the type of this class"""
         return VectorDataset(ident)
 
+    def get_metadata_aggregates(self):
+        """Return the metadata aggregates of the registered vector maps"""
+        return tuple(
+            (column, column, sum)
+            for column in (
+                "points",
+                "lines",
+                "boundaries",
+                "centroids",
+                "faces",
+                "kernels",
+                "primitives",
+                "nodes",
+                "areas",
+                "islands",
+                "holes",
+                "volumes",
+            )
+        )
+
     def get_map_register(self):
         """Return the name of the map register table"""
         return self.metadata.get_vector_register()
@@ -0,0 +1,371 @@
+"""
+Array based spatial relations of large map lists
+
+The spatial extents of a list of maps are stored in NumPy arrays to
+classify the spatial relations of many map pairs at once, without
+per map pair method calls of the spatial extent objects. The results
+are identical to the results of the spatial_relation() method of the
+map objects.
+
+Usage:
+
+.. code-block:: python
+
+    import grass.temporal as tgis
+
+    relations = tgis.compute_spatial_relations(mapsB, index_b, mapsA, index_a)
+    if relations is not None:
+        for i, j, relation in zip(index_a, index_b, relations):
+            tgis.set_spatial_relationship(mapsA[i], mapsB[j], relation)
+
+
+(C) 2023 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+from grass.script.utils import lazy_import
+from grass.utils import tracing
+
+# numpy is only imported if large map lists are processed
+try:
+    np = lazy_import("numpy")
+except ImportError:
+    np = None
+
+# Less map pairs are classified with map objects
+_min_array_pairs = 1000
+# Maximum number of map pairs that are classified at once
+_max_array_pairs = 1000000
+
+# The spatial relations in the order they are tested by spatial_relation()
+spatial_relation_names = (
+    "equivalent",
+    "contain",
+    "in",
+    "cover",
+    "covered",
+    "overlap",
+    "meet",
+    "disjoint",
+)
+
+###############################################################################
+
+
+def get_spatial_extent_array(maps):
+    """Return the spatial extents of a list of maps as SpatialExtentArray
+
+    :param maps: A list of abstract_dataset objects with initiated
+                 spatial extent
+    :return: A SpatialExtentArray object or None in case NumPy is not
+             available or the spatial extents can not be represented
+             by arrays
+    """
+    if np is None or not maps:
+        return None
+    return SpatialExtentArray.from_maps(maps)
+
+
+@tracing.trace_function("temporal")
+def compute_spatial_relations(maps, index, other_maps, other_index):
+    """Compute the spatial relations of many map pairs at once
+
+    The relation of the pair k is the relation of the map
+    maps[index[k]] to the map other_maps[other_index[k]], as returned
+    by maps[index[k]].spatial_relation(other_maps[other_index[k]]).
+
+    :param maps: A list of abstract_dataset objects with initiated
+                 spatial extent
+    :param index: The list of indices of the maps of the map pairs
+    :param other_maps: A list of abstract_dataset objects with initiated
+                       spatial extent, can be the same list as maps
+    :param other_index: The list of indices of the other maps of the
+                        map pairs
+    :return: The list of spatial relations or None in case NumPy is
+             not available, the number of pairs is small or the spatial
+             extents can not be represented by arrays
+    """
+    if np is None or len(index) < _min_array_pairs:
+        return None
+
+    extents = get_spatial_extent_array(maps)
+    if other_maps is maps:
+        other_extents = extents
+    else:
+        other_extents = get_spatial_extent_array(other_maps)
+    if extents is None or other_extents is None:
+        return None
+
+    codes = extents.spatial_relations(index, other_extents, other_index)
+    if codes is None:
+        return None
+    return np.array(spatial_relation_names)[codes].tolist()
+
+
+###############################################################################
+
+
+class SpatialExtentArray(object):
+    """Spatial extents of a list of maps stored in NumPy arrays
+
+    The edges of the extents are stored as float64 arrays, top and
+    bottom are NaN in case they are not set. The dataset types of the
+    maps are stored to select the two or three dimensional spatial
+    relation of a map pair in the same way as the spatial_relation()
+    methods of the dataset classes. The order of the maps is kept.
+
+    Only map lists with a single projection and defined north, south,
+    east and west edges are supported.
+
+     Usage:
+
+     .. code-block:: python
+
+         >>> extents = SpatialExtentArray(
+         ...     ids=["a@P", "b@P", "c@P", "d@P"],
+         ...     north=[80, 80, 70, 80], south=[20, 40, 50, 20],
+         ...     east=[60, 60, 50, 80], west=[20, 20, 30, 60],
+         ...     top=[None] * 4, bottom=[None] * 4,
+         ...     types=["raster"] * 4, projection="XY")
+         >>> len(extents)
+         4
+         >>> codes = extents.spatial_relations([0, 0, 0, 1, 2], extents,
+         ...                                   [0, 1, 2, 0, 3])
+         >>> [spatial_relation_names[code] for code in codes]
+         ['equivalent', 'cover', 'contain', 'covered', 'disjoint']
+
+         >>> extents = SpatialExtentArray(
+         ...     ids=["a@P", "b@P"], north=[80, 80], south=[40, 40],
+         ...     east=[60, 60], west=[20, 20], top=[50, 0],
+         ...     bottom=[0, -50], types=["raster3d"] * 2, projection="XY")
+         >>> codes = extents.spatial_relations([0, 1], extents, [1, 0])
+         >>> [spatial_relation_names[code] for code in codes]
+         ['meet', 'meet']
+
+    """
+
+    def __init__(self, ids, north, south, east, west, top, bottom, types, projection):
+        """Constructor
+
+        :param ids: The list of map ids
+        :param north: The northern edges
+        :param south: The southern edges
+        :param east: The eastern edges
+        :param west: The western edges
+        :param top: The top edges, None if not set
+        :param bottom: The bottom edges, None if not set
+        :param types: The dataset types of the maps, see get_type()
+        :param projection: The projection "XY" or "LL"
+        """
+        self.ids = ids
+        self.north = np.array(north, dtype=np.float64)
+        self.south = np.array(south, dtype=np.float64)
+        self.east = np.array(east, dtype=np.float64)
+        self.west = np.array(west, dtype=np.float64)
+        self.top = np.array(top, dtype=np.float64)
+        self.bottom = np.array(bottom, dtype=np.float64)
+        self.types = np.array(types, dtype=str)
+        self.projection = projection
+
+    def __len__(self):
+        return len(self.ids)
+
+    @staticmethod
+    def from_maps(maps):
+        """Create the spatial extent arrays from a list of map objects
+
+        :param maps: A list of abstract_dataset objects with initiated
+                     spatial extent
+        :return: A SpatialExtentArray object or None in case the
+                 spatial extents are not supported
+        """
+        if np is None or not maps:
+            return None
+
+        projection = maps[0].spatial_extent.get_projection()
+        ids = []
+        types = []
+        edges = []
+
+        for map_ in maps:
+            if map_.spatial_extent.get_projection() != projection:
+                return None
+            extent = map_.get_spatial_extent_as_tuple()
+            if None in extent[:4]:
+                return None
+            ids.append(map_.get_id())
+            types.append(map_.get_type())
+            edges.append(extent)
+
+        north, south, east, west, top, bottom = zip(*edges)
+
+        return SpatialExtentArray(
+            ids, north, south, east, west, top, bottom, types, projection
+        )
+
+    def spatial_relations(self, index, extents, extents_index):
+        """Classify the spatial relations of map pairs
+
+        The relation of the pair k is the relation of the map
+        self[index[k]] to the map extents[extents_index[k]], the same
+        relation as computed by the spatial_relation() method of the
+        map objects.
+
+        :param index: The indices of the maps of the map pairs
+        :param extents: The SpatialExtentArray object of the other maps,
+                        can be this object
+        :param extents_index: The indices of the other maps of the
+                              map pairs
+        :return: The int8 array of relation codes, which are the indices
+                 of the relations in spatial_relation_names, or None in
+                 case the projections are different
+        """
+        if self.projection != extents.projection:
+            return None
+
+        index = np.asarray(index, dtype=np.int64)
+        extents_index = np.asarray(extents_index, dtype=np.int64)
+        codes = np.empty(len(index), dtype=np.int8)
+
+        for first in range(0, len(index), _max_array_pairs):
+            stop = first + _max_array_pairs
+            a = index[first:stop]
+            b = extents_index[first:stop]
+            codes[first:stop] = _classify_pairs(
+                [edges[a] for edges in self._edges()],
+                [edges[b] for edges in extents._edges()],
+                self.types[a],
+                extents.types[b],
+                self.projection == "LL",
+            )
+
+        return codes
+
+    def _edges(self):
+        return self.north, self.south, self.east, self.west, self.top, self.bottom
+
+
+###############################################################################
+
+
+def _classify_pairs(edges, other_edges, types, other_types, ll):
+    """Return the spatial relation codes of the map pairs
+
+    This is the array version of SpatialExtent.spatial_relation_2d() and
+    SpatialExtent.spatial_relation() with the extents edges as self and
+    other_edges as the provided extent. The relations are tested in the
+    order of spatial_relation_names, hence the exclusions of the single
+    relation methods are not tested again.
+    """
+    N, S, E, W, T, B = edges
+    n, s, e, w, t, b = other_edges
+
+    # The three dimensional relation is used as in the spatial_relation()
+    # methods of Raster3DDataset and SpaceTimeRaster3DDataset
+    use_3d = (types == "raster3d") & (
+        (other_types == "raster3d") | (other_types == "str3ds")
+    )
+    use_3d |= (types == "str3ds") & (other_types == "str3ds")
+
+    # The east and west edges are adjusted in case of LL projection in
+    # the same way as in the methods of self (w, e) and in the methods of
+    # the provided extent (W2, E2), that are called by contain() and covered()
+    if ll:
+        W2, E2 = _adjust_east_west(W, E, w, e)
+        w2, e2 = w, e
+        w, e = _adjust_east_west(w, e, W, E)
+    else:
+        W2, E2 = W, E
+        w2, e2 = w, e
+
+    equivalent_2d = (W == w) & (E == e) & (N == n) & (S == s)
+    # The equivalent_2d relation of the provided extent to self is
+    # excluded by the cover_2d() method of the provided extent
+    equivalent_2d_other = (w2 == W2) & (e2 == E2) & (n == N) & (s == S)
+
+    contain = (w2 > W2) & (e2 < E2) & (n < N) & (s > S)
+    is_in = (W > w) & (E < e) & (N < n) & (S > s)
+    cover = ~equivalent_2d & _cover_2d(N, S, E, W, n, s, e, w)
+    covered = ~equivalent_2d_other & _cover_2d(n, s, e2, w2, N, S, E2, W2)
+    overlap = (N > s) & (S < n) & (E > w) & (W < e)
+
+    meet_east_west = (E == w) | (W == e)
+    meet_north_south = (N == s) | (S == n)
+    meet_count = (E == w).astype(np.int8) + (W == e) + (N == s) + (S == n)
+    inside_north_south = ~((N < s) | (S > n))
+    inside_east_west = ~((E < w) | (W > e))
+    meet = (meet_count == 1) & (
+        (meet_east_west & inside_north_south) | (meet_north_south & inside_east_west)
+    )
+
+    relations = [equivalent_2d, contain, is_in, cover, covered, overlap, meet]
+
+    if use_3d.any():
+        meet_top_bottom = (T == b) | (B == t)
+        inside_top_bottom = ~((T < b) | (B > t))
+        meet_3d = (meet_count + (T == b) + (B == t) == 1) & (
+            (meet_east_west & inside_north_south & inside_top_bottom)
+            | (meet_north_south & inside_east_west & inside_top_bottom)
+            | (meet_top_bottom & inside_east_west & inside_north_south)
+        )
+        relations_3d = [
+            equivalent_2d & (B == b) & (T == t),
+            contain & (b > B) & (t < T),
+            is_in & (B > b) & (T < t),
+            ~equivalent_2d & _cover_3d(N, S, E, W, T, B, n, s, e, w, t, b),
+            ~equivalent_2d_other & _cover_3d(n, s, e2, w2, t, b, N, S, E2, W2, T, B),
+            overlap & (T > b) & (B < t),
+            meet_3d,
+        ]
+        relations = [
+            np.where(use_3d, relation_3d, relation)
+            for relation, relation_3d in zip(relations, relations_3d)
+        ]
+
+    return np.select(relations, range(len(relations)), default=len(relations)).astype(
+        np.int8
+    )
+
+
+def _adjust_east_west(west, east, ref_west, ref_east):
+    """Shift the east and west edges by 360 degrees until they are
+    located at the edges of the reference extents in LL projection"""
+    west = west.copy()
+    east = east.copy()
+
+    mask = east < ref_west
+    while mask.any():
+        east[mask] += 360.0
+        west[mask] += 360.0
+        mask = east < ref_west
+
+    mask = west > ref_east
+    while mask.any():
+        east[mask] -= 360.0
+        west[mask] -= 360.0
+        mask = west > ref_east
+
+    return west, east
+
+
+def _cover_2d(N, S, E, W, n, s, e, w):
+    """The cover_2d() conditions without the equivalent_2d exclusion"""
+    # Edges of extent located outside of self are not allowed
+    inside = (E > w) & (W < e) & (N > s) & (S < n)
+    # At least one edge of extent meets an edge of self
+    touch = (W == w) | (E == e) | (N == n) | (S == s)
+    # At least one edge of extent is located in self
+    edge = ((W < w) & (E > w)) | ((E > e) & (W < e))
+    edge |= ((N > n) & (S < n)) | ((S < s) & (N > s))
+    return inside & touch & edge
+
+
+def _cover_3d(N, S, E, W, T, B, n, s, e, w, t, b):
+    """The cover() conditions without the equivalent_2d exclusion"""
+    inside = (E > w) & (W < e) & (N > s) & (S < n) & (T > b) & (B < t)
+    touch = (W == w) | (E == e) | (N == n) | (S == s) | (B == b) | (T == t)
+    edge = ((W < w) & (E > w)) | ((E > e) & (W < e))
+    edge |= ((N > n) & (S < n)) | ((S < s) & (N > s))
+    edge |= ((T > t) & (B < t)) | ((B < b) & (T > b))
+    return inside & touch & edge
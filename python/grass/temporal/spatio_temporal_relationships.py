@@ -22,9 +22,15 @@ from datetime import datetime
 from .core import init_dbif
 from .abstract_dataset import AbstractDatasetComparisonKeyStartTime
 from .datetime_math import time_delta_to_relative_time_seconds
-import grass.lib.vector as vector
-import grass.lib.rtree as rtree
-import grass.lib.gis as gis
+from .temporal_extent_array import get_temporal_extent_array
+from .spatial_extent_array import compute_spatial_relations
+from grass.script.utils import lazy_import
+from grass.utils import tracing
+
+# The R*-Tree of the C-libraries is only needed to build the topology
+vector = lazy_import("grass.lib.vector")
+rtree = lazy_import("grass.lib.rtree")
+gis = lazy_import("grass.lib.gis")
 
 ###############################################################################
 
@@ -510,6 +516,29 @@ class SpatioTemporalTopologyBuilder(object):
 
         return tree
 
+    def _set_spatial_relationships(self, mapsA, mapsB, index_a, index_b):
+        """Set the spatial relationships between the map pairs found
+        by the R*-Tree search
+
+        The spatial relations of many map pairs are classified at once
+        using arrays of the spatial extents, otherwise each map pair is
+        classified using the map objects.
+
+        :param mapsA: A list of abstract_dataset objects
+        :param mapsB: A list of abstract_dataset objects
+        :param index_a: The indices of the maps in mapsA of the map pairs
+        :param index_b: The indices of the maps in mapsB of the map pairs
+        """
+        relations = compute_spatial_relations(mapsB, index_b, mapsA, index_a)
+        if relations is None:
+            relations = [
+                mapsB[j].spatial_relation(mapsA[i]) for i, j in zip(index_a, index_b)
+            ]
+
+        for i, j, relation in zip(index_a, index_b, relations):
+            set_spatial_relationship(mapsA[i], mapsB[j], relation)
+
+    @tracing.trace_function("temporal")
     def build(self, mapsA, mapsB=None, spatial=None):
         """Build the spatio-temporal topology structure between
         one or two unordered lists of abstract dataset objects
@@ -554,6 +583,10 @@ class SpatioTemporalTopologyBuilder(object):
 
         list_ = gis.G_new_ilist()
 
+        # The map pairs that are spatially classified after the search
+        index_a = []
+        index_b = []
+
         for j in range(len(mapsB)):
             rect = self._map_to_rect(tree, mapsB[j], spatial)
             vector.RTreeSearch2(tree, rect, list_)
@@ -570,8 +603,11 @@ class SpatioTemporalTopologyBuilder(object):
                 set_temoral_relationship(A, B, relation)
 
                 if spatial is not None:
-                    relation = mapsB[j].spatial_relation(mapsA[i])
-                    set_spatial_relationship(A, B, relation)
+                    index_a.append(i)
+                    index_b.append(j)
+
+        if spatial is not None:
+            self._set_spatial_relationships(mapsA, mapsB, index_a, index_b)
 
         self._build_internal_iteratable(mapsA, spatial)
         if not identical and mapsB is not None:
@@ -790,6 +826,12 @@ def count_temporal_topology_relationships(maps1, maps2=None, dbif=None):
      :return: A dictionary with counted temporal relationships
     """
 
+    # Large single map lists are processed as arrays
+    if maps2 is None:
+        extents = get_temporal_extent_array(maps1)
+        if extents is not None:
+            return extents.count_temporal_relations()
+
     tb = SpatioTemporalTopologyBuilder()
     tb.build(maps1, maps2)
 
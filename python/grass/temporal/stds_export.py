@@ -29,6 +29,7 @@ import shutil
 import os
 import tarfile
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 import grass.script as gscript
 from grass.exceptions import CalledModuleError
@@ -47,27 +48,91 @@ tmp_tar_file_name = "archive"
 # and therefore several attribute tables
 exported_maps = {}
 
+# Mode of tarfile.open() and additional arguments for the compression
+# methods of the archive
+compression_modes = {
+    "no": ("w:", {}),
+    "fast": ("w:gz", {"compresslevel": 1}),
+    "gzip": ("w:gz", {}),
+    "bzip2": ("w:bz2", {}),
+    "xz": ("w:xz", {}),
+}
+
+
+class _MapExportError(Exception):
+    """Export of a single map failed"""
+
+
+############################################################################
+
+
+def _export_maps(rows, tar, list_file, new_cwd, nprocs, list_entry, export_map):
+    """Export maps with a pool of workers and write the files into the archive
+
+    The maps are exported by at most nprocs workers running the export
+    modules, while this thread adds the files of the finished maps in the
+    order of the rows to the archive and removes them from the working
+    directory.
+
+    :param list_entry: Function returning the line of the list file for
+                       a row or None if the map must not be exported
+    :param export_map: Function exporting the map of a row, returns the
+                       names of the created files
+    """
+    executor = ThreadPoolExecutor(max_workers=max(1, nprocs))
+    futures = []
+    try:
+        for row in rows:
+            entry = list_entry(row)
+            if entry is None:
+                continue
+            # Write the filename, the start_time and the end_time
+            list_file.write(entry)
+            futures.append(executor.submit(export_map, row))
+
+        for future in futures:
+            for file_name in future.result():
+                tar.add(file_name)
+                os.remove(file_name)
+    except _MapExportError as e:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+        shutil.rmtree(new_cwd)
+        tar.close()
+        gscript.fatal(str(e))
+    finally:
+        executor.shutdown(wait=True)
+
+
 ############################################################################
 
 
 def _export_raster_maps_as_gdal(
-    rows, tar, list_file, new_cwd, fs, format_, type_, **kwargs
+    rows, tar, list_file, new_cwd, fs, format_, type_, nprocs=1, **kwargs
 ):
     kwargs = {key: value for key, value in kwargs.items() if value is not None}
-    for row in rows:
-        name = row["name"]
+
+    def list_entry(row):
         start = row["start_time"]
         end = row["end_time"]
-        max_val = row["max"]
-        min_val = row["min"]
-        datatype = row["datatype"]
-        semantic_label = row["semantic_label"]
         if not end:
             end = start
-        string = "%s%s%s%s%s%s%s\n" % (name, fs, start, fs, end, fs, semantic_label)
-        # Write the filename, the start_time and the end_time
-        list_file.write(string)
+        return "%s%s%s%s%s%s%s\n" % (
+            row["name"],
+            fs,
+            start,
+            fs,
+            end,
+            fs,
+            row["semantic_label"],
+        )
 
+    def export_map(row):
+        name = row["name"]
+        max_val = row["max"]
+        min_val = row["min"]
+        datatype = row["datatype"]
         try:
             if format_ == "GTiff":
                 # Export the raster map with r.out.gdal as tif
@@ -124,70 +189,76 @@ def _export_raster_maps_as_gdal(
                 )
 
         except CalledModuleError:
-            shutil.rmtree(new_cwd)
-            tar.close()
-            gscript.fatal(_("Unable to export raster map <%s>" % name))
-
-        tar.add(out_name)
+            raise _MapExportError(_("Unable to export raster map <%s>" % name))
 
         # Export the color rules
-        out_name = name + ".color"
+        color_name = name + ".color"
         try:
-            gscript.run_command("r.colors.out", map=name, rules=out_name)
+            gscript.run_command("r.colors.out", map=name, rules=color_name)
         except CalledModuleError:
-            shutil.rmtree(new_cwd)
-            tar.close()
-            gscript.fatal(
+            raise _MapExportError(
                 _(
                     "Unable to export color rules for raster "
                     "map <%s> r.out.gdal" % name
                 )
             )
 
-        tar.add(out_name)
+        return [out_name, color_name]
+
+    _export_maps(rows, tar, list_file, new_cwd, nprocs, list_entry, export_map)
 
 
 ############################################################################
 
 
-def _export_raster_maps(rows, tar, list_file, new_cwd, fs):
-    for row in rows:
-        name = row["name"]
+def _export_raster_maps(rows, tar, list_file, new_cwd, fs, nprocs=1):
+    def list_entry(row):
         start = row["start_time"]
         end = row["end_time"]
-        semantic_label = row["semantic_label"]
         if not end:
             end = start
-        string = "%s%s%s%s%s%s%s\n" % (name, fs, start, fs, end, fs, semantic_label)
-        # Write the filename, the start_time and the end_time
-        list_file.write(string)
+        return "%s%s%s%s%s%s%s\n" % (
+            row["name"],
+            fs,
+            start,
+            fs,
+            end,
+            fs,
+            row["semantic_label"],
+        )
+
+    def export_map(row):
+        name = row["name"]
         # Export the raster map with r.pack
         try:
             gscript.run_command("r.pack", input=name, flags="c")
         except CalledModuleError:
-            shutil.rmtree(new_cwd)
-            tar.close()
-            gscript.fatal(_("Unable to export raster map <%s> with r.pack" % name))
+            raise _MapExportError(
+                _("Unable to export raster map <%s> with r.pack" % name)
+            )
+
+        return [name + ".pack"]
 
-        tar.add(name + ".pack")
+    _export_maps(rows, tar, list_file, new_cwd, nprocs, list_entry, export_map)
 
 
 ############################################################################
 
 
-def _export_vector_maps_as_gml(rows, tar, list_file, new_cwd, fs):
-    for row in rows:
+def _map_list_entry(row, fs):
+    start = row["start_time"]
+    end = row["end_time"]
+    if not end:
+        end = start
+    return "%s%s%s%s%s\n" % (row["name"], fs, start, fs, end)
+
+
+def _export_vector_maps_as_gml(rows, tar, list_file, new_cwd, fs, nprocs=1):
+    def export_map(row):
         name = row["name"]
-        start = row["start_time"]
-        end = row["end_time"]
         layer = row["layer"]
         if not layer:
             layer = 1
-        if not end:
-            end = start
-        string = "%s%s%s%s%s\n" % (name, fs, start, fs, end)
-        # Write the filename, the start_time and the end_time
-        list_file.write(string)
         # Export the vector map with v.out.ogr
         try:
             gscript.run_command(
@@ -198,32 +269,32 @@ def _export_vector_maps_as_gml(rows, tar, list_file, new_cwd, fs):
                 format="GML",
             )
         except CalledModuleError:
-            shutil.rmtree(new_cwd)
-            tar.close()
-            gscript.fatal(
+            raise _MapExportError(
                 _("Unable to export vector map <%s> as " "GML with v.out.ogr" % name)
             )
 
-        tar.add(name + ".xml")
-        tar.add(name + ".xsd")
+        return [name + ".xml", name + ".xsd"]
+
+    _export_maps(
+        rows,
+        tar,
+        list_file,
+        new_cwd,
+        nprocs,
+        lambda row: _map_list_entry(row, fs),
+        export_map,
+    )
 
 
 ############################################################################
 
 
-def _export_vector_maps_as_gpkg(rows, tar, list_file, new_cwd, fs):
-    for row in rows:
+def _export_vector_maps_as_gpkg(rows, tar, list_file, new_cwd, fs, nprocs=1):
+    def export_map(row):
         name = row["name"]
-        start = row["start_time"]
-        end = row["end_time"]
         layer = row["layer"]
         if not layer:
             layer = 1
-        if not end:
-            end = start
-        string = "%s%s%s%s%s\n" % (name, fs, start, fs, end)
-        # Write the filename, the start_time and the end_time
-        list_file.write(string)
         # Export the vector map with v.out.ogr
         try:
             gscript.run_command(
@@ -234,20 +305,28 @@ def _export_vector_maps_as_gpkg(rows, tar, list_file, new_cwd, fs):
                 format="GPKG",
             )
         except CalledModuleError:
-            shutil.rmtree(new_cwd)
-            tar.close()
-            gscript.fatal(
+            raise _MapExportError(
                 _("Unable to export vector map <%s> as " "GPKG with v.out.ogr" % name)
             )
 
-        tar.add(name + ".gpkg")
+        return [name + ".gpkg"]
+
+    _export_maps(
+        rows,
+        tar,
+        list_file,
+        new_cwd,
+        nprocs,
+        lambda row: _map_list_entry(row, fs),
+        export_map,
+    )
 
 
 ############################################################################
 
 
-def _export_vector_maps(rows, tar, list_file, new_cwd, fs):
-    for row in rows:
+def _export_vector_maps(rows, tar, list_file, new_cwd, fs, nprocs=1):
+    def list_entry(row):
         name = row["name"]
         start = row["start_time"]
         end = row["end_time"]
@@ -255,50 +334,55 @@ def _export_vector_maps(rows, tar, list_file, new_cwd, fs):
 
         # Export unique maps only
         if name in exported_maps:
-            continue
+            return None
+        exported_maps[name] = name
 
         if not layer:
             layer = 1
         if not end:
             end = start
-        string = "%s:%s%s%s%s%s\n" % (name, layer, fs, start, fs, end)
-        # Write the filename, the start_time and the end_time
-        list_file.write(string)
+        return "%s:%s%s%s%s%s\n" % (name, layer, fs, start, fs, end)
+
+    def export_map(row):
+        name = row["name"]
         # Export the vector map with v.pack
         try:
             gscript.run_command("v.pack", input=name, flags="c")
         except CalledModuleError:
-            shutil.rmtree(new_cwd)
-            tar.close()
-            gscript.fatal(_("Unable to export vector map <%s> with v.pack" % name))
+            raise _MapExportError(
+                _("Unable to export vector map <%s> with v.pack" % name)
+            )
 
-        tar.add(name + ".pack")
+        return [name + ".pack"]
 
-        exported_maps[name] = name
+    _export_maps(rows, tar, list_file, new_cwd, nprocs, list_entry, export_map)
 
 
 ############################################################################
 
 
-def _export_raster3d_maps(rows, tar, list_file, new_cwd, fs):
-    for row in rows:
+def _export_raster3d_maps(rows, tar, list_file, new_cwd, fs, nprocs=1):
+    def export_map(row):
         name = row["name"]
-        start = row["start_time"]
-        end = row["end_time"]
-        if not end:
-            end = start
-        string = "%s%s%s%s%s\n" % (name, fs, start, fs, end)
-        # Write the filename, the start_time and the end_time
-        list_file.write(string)
         # Export the raster 3d map with r3.pack
         try:
             gscript.run_command("r3.pack", input=name, flags="c")
         except CalledModuleError:
-            shutil.rmtree(new_cwd)
-            tar.close()
-            gscript.fatal(_("Unable to export raster map <%s> with r3.pack" % name))
+            raise _MapExportError(
+                _("Unable to export raster map <%s> with r3.pack" % name)
+            )
 
-        tar.add(name + ".pack")
+        return [name + ".pack"]
+
+    _export_maps(
+        rows,
+        tar,
+        list_file,
+        new_cwd,
+        nprocs,
+        lambda row: _map_list_entry(row, fs),
+        export_map,
+    )
 
 
 ############################################################################
@@ -313,6 +397,7 @@ def export_stds(
     format_="pack",
     type_="strds",
     datatype=None,
+    nprocs=1,
     **kwargs,
 ):
     """Export space time datasets as tar archive with optional compression
@@ -326,8 +411,10 @@ def export_stds(
     :param compression: The compression of the archive file:
 
           - "no"  no compression
+          - "fast" GNU zip compression with the fastest level
           - "gzip" GNU zip compression
           - "bzip2" Bzip compression
+          - "xz" LZMA compression
 
     :param directory: The working directory used for extraction and packing
     :param where: The temporal WHERE SQL statement to select a subset
@@ -349,6 +436,7 @@ def export_stds(
           - "str3ds" Space time 3D raster dataset
           - "stvds" Space time vector dataset
     :param datatype: Force the output datatype for r.out.gdal
+    :param nprocs: The number of maps exported in parallel
     """
 
     # Save current working directory path
@@ -368,15 +456,12 @@ def export_stds(
     sp = open_old_stds(input, type_)
     rows = sp.get_registered_maps(columns, where, "start_time", None)
 
-    if compression == "gzip":
-        flag = "w:gz"
-    elif compression == "bzip2":
-        flag = "w:bz2"
-    else:
-        flag = "w:"
+    flag, compression_kwargs = compression_modes.get(
+        compression, compression_modes["no"]
+    )
 
     # Open the tar archive to add the files
-    tar = tarfile.open(tmp_tar_file_name, flag)
+    tar = tarfile.open(tmp_tar_file_name, flag, **compression_kwargs)
     list_file = open(list_file_name, "w")
 
     fs = "|"
@@ -385,19 +470,27 @@ def export_stds(
         if type_ == "strds":
             if format_ == "GTiff" or format_ == "AAIGrid":
                 _export_raster_maps_as_gdal(
-                    rows, tar, list_file, new_cwd, fs, format_, datatype, **kwargs
+                    rows,
+                    tar,
+                    list_file,
+                    new_cwd,
+                    fs,
+                    format_,
+                    datatype,
+                    nprocs,
+                    **kwargs,
                 )
             else:
-                _export_raster_maps(rows, tar, list_file, new_cwd, fs)
+                _export_raster_maps(rows, tar, list_file, new_cwd, fs, nprocs)
         elif type_ == "stvds":
             if format_ == "GML":
-                _export_vector_maps_as_gml(rows, tar, list_file, new_cwd, fs)
+                _export_vector_maps_as_gml(rows, tar, list_file, new_cwd, fs, nprocs)
             elif format_ == "GPKG":
-                _export_vector_maps_as_gpkg(rows, tar, list_file, new_cwd, fs)
+                _export_vector_maps_as_gpkg(rows, tar, list_file, new_cwd, fs, nprocs)
             else:
-                _export_vector_maps(rows, tar, list_file, new_cwd, fs)
+                _export_vector_maps(rows, tar, list_file, new_cwd, fs, nprocs)
         elif type_ == "str3ds":
-            _export_raster3d_maps(rows, tar, list_file, new_cwd, fs)
+            _export_raster3d_maps(rows, tar, list_file, new_cwd, fs, nprocs)
 
     list_file.close()
 
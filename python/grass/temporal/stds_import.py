@@ -32,6 +32,7 @@ for details.
 import os
 import os.path
 import tarfile
+from concurrent.futures import ThreadPoolExecutor
 
 from .core import get_current_mapset, get_tgis_message_interface
 from .register import register_maps_in_space_time_dataset
@@ -51,22 +52,53 @@ imported_maps = {}
 ############################################################################
 
 
+def _import_maps(maplist, import_map, nprocs=1):
+    """Import the maps of the list running at most nprocs imports in parallel
+
+    :param import_map: Function importing the map of a row
+    """
+    with ThreadPoolExecutor(max_workers=max(1, nprocs)) as executor:
+        futures = [executor.submit(import_map, row) for row in maplist]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+############################################################################
+
+
 def _import_raster_maps_from_gdal(
-    maplist, overr, exp, location, link, format_, set_current_region=False, memory=300
+    maplist,
+    overr,
+    exp,
+    location,
+    link,
+    format_,
+    set_current_region=False,
+    memory=300,
+    nprocs=1,
 ):
     impflags = ""
     if overr:
         impflags += "o"
     if exp or location:
         impflags += "e"
-    for row in maplist:
+    if format_ == "AAIGrid" and not overr:
+        impflags += "o"
+    # Each import extends the region, concurrent updates may lose extents
+    if "e" in impflags:
+        nprocs = 1
+
+    def import_map(row):
         name = row["name"]
         if format_ == "GTiff":
             filename = row["filename"] + ".tif"
         elif format_ == "AAIGrid":
             filename = row["filename"] + ".asc"
-            if not overr:
-                impflags += "o"
 
         try:
             if link:
@@ -105,19 +137,22 @@ def _import_raster_maps_from_gdal(
                     _("Unable to set the color rules for " "raster map <%s>.") % name
                 )
 
+    _import_maps(maplist, import_map, nprocs)
+
     # Set the computational region from the last map imported
-    if set_current_region is True:
-        gscript.run_command("g.region", raster=name)
+    if set_current_region is True and maplist:
+        gscript.run_command("g.region", raster=maplist[-1]["name"])
 
 
 ############################################################################
 
 
-def _import_raster_maps(maplist, set_current_region=False):
+def _import_raster_maps(maplist, set_current_region=False, nprocs=1):
     # We need to disable the projection check because of its
     # simple implementation
     impflags = "o"
-    for row in maplist:
+
+    def import_map(row):
         name = row["name"]
         filename = row["filename"] + ".pack"
         try:
@@ -136,19 +171,25 @@ def _import_raster_maps(maplist, set_current_region=False):
                 % (name, filename)
             )
 
+    _import_maps(maplist, import_map, nprocs)
+
     # Set the computational region from the last map imported
-    if set_current_region is True:
-        gscript.run_command("g.region", raster=name)
+    if set_current_region is True and maplist:
+        gscript.run_command("g.region", raster=maplist[-1]["name"])
 
 
 ############################################################################
 
 
-def _import_vector_maps_from_gml(maplist, overr, exp, location, link):
+def _import_vector_maps_from_gml(maplist, overr, exp, location, link, nprocs=1):
     impflags = "o"
     if exp or location:
         impflags += "e"
-    for row in maplist:
+    # Each import extends the region, concurrent updates may lose extents
+    if "e" in impflags:
+        nprocs = 1
+
+    def import_map(row):
         name = row["name"]
         filename = row["filename"] + ".xml"
 
@@ -167,20 +208,28 @@ def _import_vector_maps_from_gml(maplist, overr, exp, location, link):
                 % (name, filename)
             )
 
+    _import_maps(maplist, import_map, nprocs)
+
 
 ############################################################################
 
 
-def _import_vector_maps(maplist):
+def _import_vector_maps(maplist, nprocs=1):
     # We need to disable the projection check because of its
     # simple implementation
     impflags = "o"
+
+    # Import only unique maps
+    unique_maplist = []
     for row in maplist:
         # Separate the name from the layer
         name = row["name"].split(":")[0]
-        # Import only unique maps
-        if name in imported_maps:
-            continue
+        if name not in imported_maps:
+            imported_maps[name] = name
+            unique_maplist.append(row)
+
+    def import_map(row):
+        name = row["name"].split(":")[0]
         filename = row["filename"] + ".pack"
         try:
             gscript.run_command(
@@ -198,7 +247,7 @@ def _import_vector_maps(maplist):
                 % (name, filename)
             )
 
-        imported_maps[name] = name
+    _import_maps(unique_maplist, import_map, nprocs)
 
 
 ############################################################################
@@ -219,6 +268,7 @@ def import_stds(
     base=None,
     set_current_region=False,
     memory=300,
+    nprocs=1,
 ):
     """Import space time datasets of type raster and vector
 
@@ -241,6 +291,9 @@ def import_stds(
     :param base: The base name of the new imported maps, it will be
                  extended using a numerical index.
     :param memory: Cache size for raster rows, used in r.in.gdal
+    :param nprocs: The number of maps imported in parallel, raster files
+                   and GML files are imported sequentially in case the
+                   region is extended (exp or location)
     """
 
     old_state = gscript.raise_on_error
@@ -522,14 +575,17 @@ def import_stds(
                     format_,
                     set_current_region,
                     memory,
+                    nprocs,
                 )
             if format_ == "pack":
-                _import_raster_maps(maplist, set_current_region)
+                _import_raster_maps(maplist, set_current_region, nprocs)
         elif type_ == "stvds":
             if format_ == "GML":
-                _import_vector_maps_from_gml(maplist, overr, exp, location, link)
+                _import_vector_maps_from_gml(
+                    maplist, overr, exp, location, link, nprocs
+                )
             if format_ == "pack":
-                _import_vector_maps(maplist)
+                _import_vector_maps(maplist, nprocs)
 
         # Create the space time dataset
         if sp.is_in_db() and gscript.overwrite() is True:
@@ -0,0 +1,482 @@
+"""
+Array based temporal extents of large map lists
+
+The temporal extents of a list of maps are stored in NumPy arrays to
+compute the number of gaps, the temporal granularity and the number of
+temporal relations without per map object method calls. The results
+are identical to the results of the map object based functions.
+
+Usage:
+
+.. code-block:: python
+
+    import grass.temporal as tgis
+
+    extents = tgis.get_temporal_extent_array(maps)
+    if extents is not None:
+        gaps = extents.count_gaps()
+
+
+(C) 2023 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+from datetime import datetime, timedelta
+from grass.script.utils import lazy_import
+
+# numpy is only imported if large map lists are processed
+try:
+    np = lazy_import("numpy")
+except ImportError:
+    np = None
+
+# Map lists with less maps are processed with map objects
+_min_array_maps = 1000
+# Maximum number of map pairs that are classified at once
+_max_array_pairs = 1000000
+_microseconds_per_day = 86400 * 1000000
+_epoch = datetime(1970, 1, 1)
+_microsecond = timedelta(microseconds=1)
+
+###############################################################################
+
+
+def get_temporal_extent_array(maps):
+    """Return the temporal extents of a large list of maps as
+    TemporalExtentArray
+
+    :param maps: A list of abstract_dataset objects with initiated
+                 temporal extent
+    :return: A TemporalExtentArray object or None in case NumPy is not
+             available, the list is small or the temporal extents can
+             not be represented by arrays
+    """
+    if np is None or maps is None or len(maps) < _min_array_maps:
+        return None
+    return TemporalExtentArray.from_maps(maps)
+
+
+###############################################################################
+
+
+class TemporalExtentArray(object):
+    """Temporal extents of a list of maps stored in NumPy arrays
+
+    Start and end times are stored as int64 arrays, absolute time as
+    microseconds since 1970-01-01 and relative time in its unit. The end
+    time of time instances is set to the start time and marked in an
+    additional boolean array. The order of the maps is kept.
+
+    Only map lists with a single temporal type and relative time unit,
+    defined start times, non negative relative times and end times
+    later than the start times are supported.
+
+     Usage:
+
+     .. code-block:: python
+
+         >>> from datetime import datetime
+         >>> rows = [{"id": "a@P", "start_time": datetime(2001, 1, 1),
+         ...          "end_time": datetime(2001, 2, 1)},
+         ...         {"id": "b@P", "start_time": datetime(2001, 2, 1),
+         ...          "end_time": datetime(2001, 3, 1)},
+         ...         {"id": "c@P", "start_time": datetime(2001, 4, 1),
+         ...          "end_time": None}]
+         >>> extents = TemporalExtentArray.from_rows(rows, "absolute")
+         >>> len(extents)
+         3
+         >>> extents.count_gaps()
+         1
+         >>> extents.compute_granularity()
+         '1 month'
+         >>> relations = extents.count_temporal_relations()
+         >>> relations["follows"], relations["precedes"], relations["during"]
+         (1, 1, 0)
+
+         >>> rows = [{"id": "a@P", "start_time": 0, "end_time": 8},
+         ...         {"id": "b@P", "start_time": 2, "end_time": 6},
+         ...         {"id": "c@P", "start_time": 6, "end_time": 9}]
+         >>> extents = TemporalExtentArray.from_rows(rows, "relative", "days")
+         >>> extents.compute_granularity()
+         1
+         >>> relations = extents.count_temporal_relations()
+         >>> relations["during"], relations["contains"], relations["overlaps"]
+         (1, 1, 1)
+         >>> relations["finishes"], relations["finished"], relations["follows"]
+         (0, 0, 1)
+
+    """
+
+    def __init__(self, ids, start, end, has_end, temporal_type, unit=None):
+        """Constructor
+
+        :param ids: The list of map ids
+        :param start: The int64 array of start times
+        :param end: The int64 array of end times, time instances have
+                    the start time as end time
+        :param has_end: The boolean array that is True for time intervals
+        :param temporal_type: The temporal type "absolute" or "relative"
+        :param unit: The relative time unit
+        """
+        self.ids = ids
+        self.start = start
+        self.end = end
+        self.has_end = has_end
+        self.temporal_type = temporal_type
+        self.unit = unit
+
+    def __len__(self):
+        return len(self.ids)
+
+    @staticmethod
+    def from_maps(maps):
+        """Create the temporal extent arrays from a list of map objects
+
+        :param maps: A list of abstract_dataset objects with initiated
+                     temporal extent
+        :return: A TemporalExtentArray object or None in case the
+                 temporal extents are not supported
+        """
+        if np is None:
+            return None
+
+        temporal_type = None
+        unit = None
+        ids = []
+        starts = []
+        ends = []
+
+        for map_ in maps:
+            if map_.is_time_absolute():
+                map_type, map_unit = "absolute", None
+            elif map_.is_time_relative():
+                map_type, map_unit = "relative", map_.get_relative_time_unit()
+            else:
+                return None
+
+            if temporal_type is None:
+                temporal_type, unit = map_type, map_unit
+            elif temporal_type != map_type or unit != map_unit:
+                return None
+
+            start, end = map_.get_temporal_extent_as_tuple()
+            ids.append(map_.get_id())
+            starts.append(start)
+            ends.append(end)
+
+        return TemporalExtentArray._from_values(ids, starts, ends, temporal_type, unit)
+
+    @staticmethod
+    def from_rows(rows, temporal_type, unit=None):
+        """Create the temporal extent arrays from database rows
+
+        :param rows: The rows with id, start_time and end_time columns
+                     of registered maps
+        :param temporal_type: The temporal type "absolute" or "relative"
+        :param unit: The relative time unit
+        :return: A TemporalExtentArray object or None in case the
+                 temporal extents are not supported
+        """
+        if np is None or not rows:
+            return None
+
+        ids = [row["id"] for row in rows]
+        starts = [row["start_time"] for row in rows]
+        ends = [row["end_time"] for row in rows]
+
+        return TemporalExtentArray._from_values(ids, starts, ends, temporal_type, unit)
+
+    @staticmethod
+    def _from_values(ids, starts, ends, temporal_type, unit):
+        if not ids:
+            return None
+
+        has_end = [end is not None for end in ends]
+        ends = [start if end is None else end for start, end in zip(starts, ends)]
+
+        if temporal_type == "absolute":
+            # Time zone aware and invalid time stamps raise a TypeError
+            try:
+                start = np.array(
+                    [(value - _epoch) // _microsecond for value in starts], np.int64
+                )
+                end = np.array(
+                    [(value - _epoch) // _microsecond for value in ends], np.int64
+                )
+            except TypeError:
+                return None
+        elif temporal_type == "relative" and unit is not None:
+            for value in starts + ends:
+                if not isinstance(value, int) or isinstance(value, bool):
+                    return None
+            start = np.array(starts, dtype=np.int64)
+            end = np.array(ends, dtype=np.int64)
+            if (start < 0).any():
+                return None
+        else:
+            return None
+
+        has_end = np.array(has_end, dtype=bool)
+        if (end[has_end] <= start[has_end]).any():
+            return None
+
+        return TemporalExtentArray(ids, start, end, has_end, temporal_type, unit)
+
+    def _get_gaps(self):
+        """Return the start and end times of the gaps between temporal
+        neighbors in the order of the map list
+        """
+        prev_end = np.where(self.has_end[:-1], self.end[:-1], self.start[:-1])
+        next_start = self.start[1:]
+        is_gap = next_start > prev_end
+        return prev_end[is_gap], next_start[is_gap]
+
+    def count_gaps(self):
+        """Count the number of gaps between temporal neighbors
+
+        Same as AbstractSpaceTimeDataset.count_gaps()
+
+        :return: The numbers of gaps between temporal neighbors
+        """
+        gap_start, gap_end = self._get_gaps()
+        return len(gap_start)
+
+    def compute_granularity(self):
+        """Compute the granularity of the temporal type of the maps
+
+        :return: The granularity as integer for relative time and as
+                 string "integer unit" for absolute time
+        """
+        if self.temporal_type == "absolute":
+            return self.compute_absolute_time_granularity()
+        return self.compute_relative_time_granularity()
+
+    def compute_relative_time_granularity(self):
+        """Compute the relative time granularity
+
+        Same as compute_relative_time_granularity() of the map objects
+
+        :return: An integer
+        """
+        gap_start, gap_end = self._get_gaps()
+        delta = np.concatenate(
+            (self.end[self.has_end] - self.start[self.has_end], gap_end - gap_start)
+        )
+        if len(delta) == 0:
+            return 0
+        return int(np.gcd.reduce(np.unique(delta)))
+
+    def compute_absolute_time_granularity(self):
+        """Compute the absolute time granularity
+
+        Same as compute_absolute_time_granularity() of the map objects
+
+        :return: The granularity as string "integer unit" or None
+        """
+        gap_start, gap_end = self._get_gaps()
+        start = np.concatenate((self.start[self.has_end], gap_start))
+        end = np.concatenate((self.end[self.has_end], gap_end))
+        if len(start) == 0:
+            return None
+
+        d = _compute_datetime_delta(start, end)
+        has_month = d["has_month"] & (d["month"] > 0)
+
+        if (d["second"] > 0).any():
+            values = np.select(
+                [d["second"] > 0, d["minute"] > 0, d["hour"] > 0, d["day"] > 0],
+                [d["second"], d["minute"] * 60, d["hour"] * 3600, d["day"] * 86400],
+                d["max_days"] * 86400,
+            )
+            unit = "second"
+        elif (d["minute"] > 0).any():
+            values = np.select(
+                [d["minute"] > 0, d["hour"] > 0],
+                [d["minute"], d["hour"] * 60],
+                d["day"] * 24 * 60,
+            )
+            unit = "minute"
+        elif (d["hour"] > 0).any():
+            values = np.select(
+                [d["hour"] > 0, d["day"] > 0],
+                [d["hour"], d["day"] * 24],
+                d["max_days"] * 24,
+            )
+            unit = "hour"
+        elif (d["day"] > 0).any():
+            values = np.where(d["day"] > 0, d["day"], d["max_days"])
+            unit = "day"
+        elif has_month.any():
+            has_year = ~has_month & (d["year"] > 0)
+            values = np.concatenate((d["month"][has_month], d["year"][has_year] * 12))
+            unit = "month"
+        elif (d["year"] > 0).any():
+            values = d["year"]
+            unit = "year"
+        else:
+            return None
+
+        granularity = int(np.gcd.reduce(np.unique(values)))
+        if granularity == 1:
+            return "%i %s" % (granularity, unit)
+        return "%i %ss" % (granularity, unit)
+
+    def count_temporal_relations(self):
+        """Count the temporal relations between the maps
+
+        Same as count_temporal_topology_relationships() of a single list
+        of map objects, the relations of each map to all other maps are
+        counted. Only pairs of maps with intersecting or adjacent temporal
+        extents are classified.
+
+        :return: A dictionary with counted temporal relationships
+        """
+        relations = {}
+        for name in (
+            "equal",
+            "follows",
+            "precedes",
+            "overlaps",
+            "overlapped",
+            "during",
+            "contains",
+            "starts",
+            "started",
+            "finishes",
+            "finished",
+        ):
+            relations[name] = 0
+
+        order = np.argsort(self.start, kind="stable")
+        start = self.start[order]
+        end = self.end[order]
+        has_end = self.has_end[order]
+
+        # All maps that start before the end of a map are related to it
+        num_maps = len(start)
+        last = np.searchsorted(start, end, side="right")
+        counts = last - np.arange(num_maps) - 1
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+
+        first = 0
+        while first < num_maps:
+            stop = np.searchsorted(offsets, offsets[first] + _max_array_pairs, "right")
+            stop = min(max(int(stop) - 1, first + 1), num_maps)
+            a = np.repeat(np.arange(first, stop), counts[first:stop])
+            b = (
+                a
+                + 1
+                + np.arange(len(a))
+                - np.repeat(offsets[first:stop] - offsets[first], counts[first:stop])
+            )
+            _count_pair_relations(
+                start[a], end[a], has_end[a], start[b], end[b], has_end[b], relations
+            )
+            first = stop
+
+        return relations
+
+
+###############################################################################
+
+
+def _count_pair_relations(start_a, end_a, has_end_a, start_b, end_b, has_end_b, rel):
+    """Count the temporal relations of map pairs, the maps a start not
+    later than the maps b and the maps b start not later than the end
+    of the maps a
+    """
+
+    def count(mask):
+        return int(np.count_nonzero(mask))
+
+    intervals = has_end_a & has_end_b
+    # Time instances at the same time and equal intervals
+    equal = ~has_end_a & ~has_end_b
+    equal |= intervals & (start_a == start_b) & (end_a == end_b)
+    # Time instances located in intervals
+    during = ~has_end_a & has_end_b
+    during |= has_end_a & ~has_end_b & (start_b < end_a)
+    follows = has_end_a & ~has_end_b & (start_b == end_a)
+    # Intervals
+    follows |= intervals & (start_b == end_a)
+    during |= intervals & (start_a < start_b) & (end_b < end_a)
+    starts = intervals & (start_a == start_b) & (end_a != end_b)
+    finishes = intervals & (start_a < start_b) & (end_a == end_b)
+    overlaps = intervals & (start_a < start_b) & (start_b < end_a) & (end_a < end_b)
+
+    rel["equal"] += 2 * count(equal)
+    rel["follows"] += count(follows)
+    rel["precedes"] += count(follows)
+    rel["overlaps"] += count(overlaps)
+    rel["overlapped"] += count(overlaps)
+    num_during = count(during) + count(starts) + count(finishes)
+    rel["during"] += num_during
+    rel["contains"] += num_during
+    rel["starts"] += count(starts)
+    rel["started"] += count(starts)
+    rel["finishes"] += count(finishes)
+    rel["finished"] += count(finishes)
+
+
+###############################################################################
+
+
+def _get_datetime_fields(values):
+    """Return year, month, day, hour, minute and second arrays of
+    microseconds since 1970-01-01
+    """
+    dates = values.astype("datetime64[us]")
+    years = dates.astype("datetime64[Y]")
+    months = dates.astype("datetime64[M]")
+    days = dates.astype("datetime64[D]")
+    seconds = (values - days.astype("datetime64[us]").astype(np.int64)) // 1000000
+    return (
+        years.astype(np.int64) + 1970,
+        (months - years.astype("datetime64[M]")).astype(np.int64) + 1,
+        (days - months.astype("datetime64[D]")).astype(np.int64) + 1,
+        seconds // 3600,
+        seconds // 60 % 60,
+        seconds % 60,
+    )
+
+
+def _compute_datetime_delta(start, end):
+    """Array version of compute_datetime_delta(), the month is only valid
+    where has_month is True
+    """
+    s_year, s_month, s_day, s_hour, s_minute, s_second = _get_datetime_fields(start)
+    e_year, e_month, e_day, e_hour, e_minute, e_second = _get_datetime_fields(end)
+
+    comp = {}
+    day_diff = (end - start) // _microseconds_per_day
+    comp["max_days"] = day_diff
+
+    comp["year"] = e_year - s_year
+
+    january = (s_month == 1) & (e_month == 1)
+    first_day = (s_day == 1) & (e_day == 1)
+    d = e_month - s_month
+    d = np.where(d < 0, d + 12 * comp["year"], np.where(d == 0, 12 * comp["year"], d))
+    comp["month"] = np.where(january, 0, d)
+    comp["has_month"] = january | first_day
+
+    comp["day"] = np.where(first_day, 0, day_diff)
+
+    d = e_hour - s_hour
+    d = np.where(d < 0, d + 24, d) + 24 * day_diff
+    comp["hour"] = np.where((s_hour == 0) & (e_hour == 0), 0, d)
+
+    d = e_minute - s_minute
+    d += np.where(comp["hour"] != 0, 60 * comp["hour"], 24 * 60 * day_diff)
+    comp["minute"] = np.where((s_minute == 0) & (e_minute == 0), 0, d)
+
+    d = e_second - s_second
+    d += np.where(
+        comp["minute"] != 0,
+        60 * comp["minute"],
+        np.where(comp["hour"] != 0, 3600 * comp["hour"], 24 * 60 * 60 * day_diff),
+    )
+    comp["second"] = np.where((s_second == 0) & (e_second == 0), 0, d)
+
+    return comp
@@ -19,6 +19,7 @@ for details.
 """
 from __future__ import print_function
 from .datetime_math import compute_datetime_delta
+from .temporal_extent_array import get_temporal_extent_array
 from functools import reduce
 from collections import OrderedDict
 import ast
@@ -222,6 +223,11 @@ def compute_relative_time_granularity(maps):
 
     """
 
+    # Large map lists are processed as arrays
+    extents = get_temporal_extent_array(maps)
+    if extents is not None and extents.temporal_type == "relative":
+        return extents.compute_relative_time_granularity()
+
     # The interval time must be scaled to days resolution
     granularity = None
     delta = []
@@ -345,6 +351,11 @@ def compute_absolute_time_granularity(maps):
 
     """
 
+    # Large map lists are processed as arrays
+    extents = get_temporal_extent_array(maps)
+    if extents is not None and extents.temporal_type == "absolute":
+        return extents.compute_absolute_time_granularity()
+
     has_seconds = False
     has_minutes = False
     has_hours = False
@@ -0,0 +1,61 @@
+"""Unit test of the lazily imported submodules of the temporal framework
+
+(C) 2023 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+import ast
+import os
+
+import grass.temporal as tgis
+from grass.gunittest.case import TestCase
+from grass.gunittest.main import test
+
+
+def get_public_names(module_name):
+    """Return the public top level names defined in a submodule of the
+    temporal framework, these are the names of its star import without
+    the imported names"""
+    path = os.path.join(os.path.dirname(tgis.__file__), module_name + ".py")
+    with open(path) as source:
+        tree = ast.parse(source.read(), path)
+    names = set()
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                for name in ast.walk(target):
+                    if isinstance(name, ast.Name):
+                        names.add(name.id)
+    return set(name for name in names if not name.startswith("_"))
+
+
+class TestLazyImports(TestCase):
+    def test_lazy_names(self):
+        """The names of the lazily imported submodules match their public
+        top level names"""
+        for module_name, names in tgis._lazy_modules.items():
+            self.assertEqual(set(names), get_public_names(module_name), msg=module_name)
+
+    def test_lazy_access(self):
+        """All names of the lazily imported submodules are accessible"""
+        for module_name, names in tgis._lazy_modules.items():
+            self.assertTrue(hasattr(tgis, module_name), msg=module_name)
+            for name in names:
+                self.assertTrue(hasattr(tgis, name), msg=name)
+        self.assertIs(
+            tgis.FatalError, tgis.temporal_algebra.FatalError, msg="FatalError"
+        )
+
+    def test_unknown_name(self):
+        """Unknown names raise an AttributeError"""
+        with self.assertRaises(AttributeError):
+            tgis.no_such_name
+
+
+if __name__ == "__main__":
+    test()
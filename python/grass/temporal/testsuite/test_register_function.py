@@ -115,6 +115,147 @@ class TestRasterRegisterFunctions(TestCase):
         self.assertEqual(start, datetime.datetime(2001, 1, 1))
         self.assertEqual(end, datetime.datetime(2001, 1, 3))
 
+    def test_absolute_time_strds_append(self):
+        """Test the incremental update of the extent and metadata of a
+        space time raster dataset when maps are appended
+        """
+        tgis.register_maps_in_space_time_dataset(
+            type="raster",
+            name=self.strds_abs.get_name(),
+            maps="register_map_1",
+            start="2001-01-01",
+            increment="1 day",
+            interval=True,
+        )
+        tgis.register_maps_in_space_time_dataset(
+            type="raster",
+            name=self.strds_abs.get_name(),
+            maps="register_map_2",
+            start="2001-01-03",
+            increment="1 day",
+            interval=True,
+        )
+
+        self.strds_abs.select()
+        start, end = self.strds_abs.get_absolute_time()
+        self.assertEqual(start, datetime.datetime(2001, 1, 1))
+        self.assertEqual(end, datetime.datetime(2001, 1, 4))
+        self.assertEqual(self.strds_abs.get_granularity(), "1 day")
+        self.assertEqual(self.strds_abs.get_map_time(), "interval")
+        self.assertEqual(self.strds_abs.metadata.get_number_of_maps(), 2)
+        self.assertEqual(self.strds_abs.metadata.get_min_min(), 1)
+        self.assertEqual(self.strds_abs.metadata.get_max_max(), 2)
+        self.assertEqual(self.strds_abs.check_registered_maps_metadata(), [])
+
+    def test_registered_stds(self):
+        """Test the space time datasets in which a map is registered"""
+        tgis.register_maps_in_space_time_dataset(
+            type="raster",
+            name=self.strds_abs.get_name(),
+            maps="register_map_1,register_map_2",
+            start="2001-01-01",
+            increment="1 day",
+            interval=True,
+        )
+        strds = tgis.open_new_stds(
+            name="register_test_abs_2",
+            type="strds",
+            temporaltype="absolute",
+            title="Test strds",
+            descr="Test strds",
+            semantic="field",
+            overwrite=True,
+        )
+        tgis.register_maps_in_space_time_dataset(
+            type="raster", name=strds.get_name(), maps="register_map_1"
+        )
+
+        map = tgis.RasterDataset("register_map_1@" + tgis.get_current_mapset())
+        self.assertEqual(
+            sorted(map.get_registered_stds()),
+            sorted([self.strds_abs.get_id(), strds.get_id()]),
+        )
+        map = tgis.RasterDataset("register_map_2@" + tgis.get_current_mapset())
+        self.assertEqual(map.get_registered_stds(), [self.strds_abs.get_id()])
+
+        strds.delete()
+        map = tgis.RasterDataset("register_map_1@" + tgis.get_current_mapset())
+        self.assertEqual(map.get_registered_stds(), [self.strds_abs.get_id()])
+
+    def test_registered_maps_by_spatial_extent(self):
+        """Test the selection of registered maps by spatial extent"""
+        tgis.register_maps_in_space_time_dataset(
+            type="raster",
+            name=self.strds_abs.get_name(),
+            maps="register_map_1,register_map_2",
+            start="2001-01-01",
+            increment="1 day",
+            interval=True,
+        )
+        extent = {
+            "n": 90,
+            "s": 40,
+            "e": 60,
+            "w": -10,
+            "t": 1,
+            "b": 0,
+            "projection": "1",
+        }
+        for relation, count in (("overlaps", 1), ("is_contained", 0)):
+            rows = self.strds_abs.get_registered_maps(
+                columns="id",
+                where="start_time >= '2001-01-02'",
+                spatial_extent=extent,
+                spatial_relation=relation,
+            )
+            self.assertEqual(len(rows), count)
+        extent = {
+            "n": 10,
+            "s": 5,
+            "e": 190,
+            "w": 130,
+            "t": 1,
+            "b": 0,
+            "projection": "1",
+        }
+        rows = self.strds_abs.get_registered_maps(
+            columns="id", spatial_extent=extent, spatial_relation="overlaps"
+        )
+        self.assertEqual(len(rows), 0)
+
+    def test_registered_maps_as_records(self):
+        """Test the records of registered maps against the map objects"""
+        tgis.register_maps_in_space_time_dataset(
+            type="raster",
+            name=self.strds_abs.get_name(),
+            maps="register_map_1,register_map_2",
+            start="2001-01-01",
+            increment="1 day",
+            interval=True,
+        )
+        self.strds_abs.select()
+        records = self.strds_abs.get_registered_maps_as_records()
+        maps = self.strds_abs.get_registered_maps_as_objects()
+        self.assertEqual(len(records), 2)
+        for record, map_ in zip(records, maps):
+            self.assertEqual(record.get_id(), map_.get_id())
+            self.assertEqual(
+                record.get_temporal_extent_as_tuple(),
+                map_.get_temporal_extent_as_tuple(),
+            )
+            self.assertEqual(
+                record.get_spatial_extent_as_tuple(), map_.get_spatial_extent_as_tuple()
+            )
+            self.assertEqual(record.get_name(), map_.get_name())
+            self.assertEqual(
+                record.get_map().get_temporal_extent_as_tuple(),
+                map_.get_temporal_extent_as_tuple(),
+            )
+        self.assertEqual(
+            self.strds_abs.count_temporal_types(),
+            {"point": 0, "interval": 2, "invalid": 0},
+        )
+
     def test_absolute_time_strds_2(self):
         """Test the registration of maps with absolute time in a
         space time raster dataset.
@@ -363,6 +504,50 @@ class TestRasterRegisterFunctions(TestCase):
         self.assertEqual(end, 2)
         self.assertEqual(unit, "day")
 
+    def test_relative_time_strds_append(self):
+        """Test the incremental update of the granularity of a space time
+        raster dataset with relative time when maps are appended
+        """
+        tgis.register_maps_in_space_time_dataset(
+            type="raster",
+            name=self.strds_rel.get_name(),
+            maps="register_map_1",
+            start=0,
+            increment=4,
+            unit="day",
+            interval=True,
+        )
+        tgis.register_maps_in_space_time_dataset(
+            type="raster",
+            name=self.strds_rel.get_name(),
+            maps="register_map_2",
+            start=10,
+            increment=4,
+            unit="day",
+            interval=True,
+        )
+
+        self.strds_rel.select()
+        start, end, unit = self.strds_rel.get_relative_time()
+        self.assertEqual(start, 0)
+        self.assertEqual(end, 14)
+        self.assertEqual(self.strds_rel.get_granularity(), 2)
+        self.assertEqual(self.strds_rel.metadata.get_number_of_maps(), 2)
+        self.assertEqual(self.strds_rel.check_registered_maps_metadata(), [])
+
+        self.runModule(
+            "t.unregister",
+            type="raster",
+            input=self.strds_rel.get_name(),
+            maps="register_map_2",
+            quiet=True,
+        )
+        self.strds_rel.select()
+        start, end, unit = self.strds_rel.get_relative_time()
+        self.assertEqual(end, 4)
+        self.assertEqual(self.strds_rel.get_granularity(), 4)
+        self.assertEqual(self.strds_rel.metadata.get_number_of_maps(), 1)
+
     def test_relative_time_strds_2(self):
         """Test the registration of maps with relative time in a
         space time raster dataset. The timetsamps are set for the maps using the
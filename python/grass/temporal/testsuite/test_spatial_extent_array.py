@@ -0,0 +1,107 @@
+"""Unit test of the array based classification of spatial relations
+   of map pairs
+
+(C) 2023 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+import itertools
+
+import grass.temporal as tgis
+import grass.temporal.spatial_extent_array as spatial_extent_array
+from grass.gunittest.case import TestCase
+from grass.gunittest.main import test
+import datetime
+
+
+class TestSpatialExtentArray(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Initiate the temporal GIS"""
+        tgis.init()
+
+    def create_maps(self, map_class, projection="XY"):
+        """Create maps with all combinations of the edges on a grid"""
+        maps = []
+        edges = itertools.combinations((0, 10, 20, 30), 2)
+        for i, ((south, north), (west, east)) in enumerate(
+            itertools.product(edges, repeat=2)
+        ):
+            map_ = map_class("a%i@P" % i)
+            map_.set_absolute_time(datetime.datetime(2001, 1, 1), None)
+            map_.spatial_extent.set_spatial_extent_from_values(
+                north=north,
+                south=south,
+                east=east,
+                west=west,
+                top=i % 3 * 10 + 10,
+                bottom=i % 2 * 10,
+            )
+            map_.spatial_extent.set_projection(projection)
+            maps.append(map_)
+        return maps
+
+    def assert_equal_relations(self, maps):
+        """Compare the array results with the map object results"""
+        pairs = list(itertools.product(range(len(maps)), repeat=2))
+        index_a, index_b = zip(*pairs)
+        relations = tgis.compute_spatial_relations(maps, index_b, maps, index_a)
+        self.assertIsNotNone(relations)
+        self.assertEqual(
+            relations, [maps[j].spatial_relation(maps[i]) for i, j in pairs]
+        )
+
+    def test_raster_maps(self):
+        self.assert_equal_relations(self.create_maps(tgis.RasterDataset))
+
+    def test_raster3d_maps(self):
+        self.assert_equal_relations(self.create_maps(tgis.Raster3DDataset))
+
+    def test_mixed_maps(self):
+        maps = self.create_maps(tgis.RasterDataset)
+        maps += self.create_maps(tgis.Raster3DDataset)
+        self.assert_equal_relations(maps)
+
+    def test_ll_projection(self):
+        self.assert_equal_relations(self.create_maps(tgis.VectorDataset, "LL"))
+
+    def test_unsupported_maps(self):
+        maps = self.create_maps(tgis.RasterDataset)
+        maps[0].spatial_extent.set_projection("LL")
+        self.assertIsNone(tgis.get_spatial_extent_array(maps))
+        self.assertIsNone(tgis.compute_spatial_relations(maps, [0], maps, [1]))
+
+    def test_topology_builder(self):
+        """The spatio-temporal topology is identical to the topology
+        that is built with map objects"""
+        relations = (
+            "equivalent",
+            "overlap",
+            "in",
+            "contain",
+            "meet",
+            "cover",
+            "covered",
+        )
+        topologies = []
+        for min_array_pairs in (0, 10**9):
+            maps = self.create_maps(tgis.Raster3DDataset)
+            original = spatial_extent_array._min_array_pairs
+            spatial_extent_array._min_array_pairs = min_array_pairs
+            try:
+                tgis.SpatioTemporalTopologyBuilder().build(maps, spatial="3D")
+            finally:
+                spatial_extent_array._min_array_pairs = original
+            topology = []
+            for map_ in maps:
+                for relation in relations:
+                    related = getattr(map_, "get_%s" % relation)() or []
+                    topology.append([related_map.get_id() for related_map in related])
+            topologies.append(topology)
+        self.assertEqual(topologies[0], topologies[1])
+
+
+if __name__ == "__main__":
+    test()
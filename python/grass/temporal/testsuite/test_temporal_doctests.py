@@ -40,6 +40,9 @@ def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite(grass.temporal.spatio_temporal_relationships))
     tests.addTests(doctest.DocTestSuite(grass.temporal.temporal_extent))
     tests.addTests(doctest.DocTestSuite(grass.temporal.temporal_granularity))
+    tests.addTests(doctest.DocTestSuite(grass.temporal.temporal_extent_array))
+    tests.addTests(doctest.DocTestSuite(grass.temporal.spatial_extent_array))
+    tests.addTests(doctest.DocTestSuite(grass.temporal.map_extent_record))
     tests.addTests(
         doctest.DocTestSuite(grass.temporal.temporal_topology_dataset_connector)
     )
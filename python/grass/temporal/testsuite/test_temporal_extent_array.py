@@ -0,0 +1,106 @@
+"""Unit test of the array based computation of gaps, granularity and
+   temporal relations of map lists
+
+(C) 2023 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+import grass.temporal as tgis
+from grass.gunittest.case import TestCase
+from grass.gunittest.main import test
+import datetime
+
+
+class TestTemporalExtentArray(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Initiate the temporal GIS"""
+        tgis.init()
+
+    def create_maps(self, times, unit=None):
+        maps = []
+        for i, (start, end) in enumerate(times):
+            map_ = tgis.RasterDataset("a%i@P" % i)
+            if unit:
+                map_.set_relative_time(start, end, unit)
+            else:
+                map_.set_absolute_time(start, end)
+            maps.append(map_)
+        return maps
+
+    def assert_equal_results(self, maps):
+        """Compare the array results with the map object results"""
+        extents = tgis.TemporalExtentArray.from_maps(maps)
+        self.assertIsNotNone(extents)
+
+        strds = tgis.SpaceTimeRasterDataset("test@P")
+        self.assertEqual(extents.count_gaps(), strds.count_gaps(maps))
+        self.assertEqual(
+            extents.count_temporal_relations(),
+            tgis.count_temporal_topology_relationships(maps),
+        )
+        if extents.temporal_type == "absolute":
+            granularity = tgis.compute_absolute_time_granularity(maps)
+        else:
+            granularity = tgis.compute_relative_time_granularity(maps)
+        self.assertEqual(extents.compute_granularity(), granularity)
+
+    def test_absolute_time_intervals(self):
+        dt = datetime.datetime
+        times = (
+            (dt(2001, 1, 1), dt(2001, 2, 1)),
+            (dt(2001, 2, 1), dt(2001, 4, 1)),
+            (dt(2001, 3, 1), dt(2001, 4, 1)),
+            (dt(2001, 3, 1), dt(2001, 5, 1)),
+            (dt(2001, 3, 1), dt(2001, 5, 1)),
+            (dt(2001, 6, 1), dt(2002, 1, 1)),
+            (dt(2001, 6, 1, 12), dt(2001, 7, 1)),
+        )
+        self.assert_equal_results(self.create_maps(times))
+
+    def test_absolute_time_mixed(self):
+        dt = datetime.datetime
+        times = (
+            (dt(2001, 1, 1), None),
+            (dt(2001, 1, 1), None),
+            (dt(2001, 1, 1), dt(2001, 1, 3)),
+            (dt(2001, 1, 3), None),
+            (dt(2001, 1, 5, 6, 30), None),
+            (dt(2001, 1, 6), dt(2001, 1, 8, 0, 0, 30)),
+        )
+        self.assert_equal_results(self.create_maps(times))
+
+    def test_relative_time(self):
+        times = ((0, 8), (2, 6), (5, 9), (9, None), (12, 18), (12, None), (20, 24))
+        self.assert_equal_results(self.create_maps(times, "days"))
+
+    def test_unsupported_maps(self):
+        dt = datetime.datetime
+        maps = self.create_maps(((dt(2001, 1, 1), None),))
+        maps += self.create_maps(((1, 2),), "days")
+        self.assertIsNone(tgis.TemporalExtentArray.from_maps(maps))
+        self.assertIsNone(
+            tgis.TemporalExtentArray.from_maps(self.create_maps(((-1, 2),), "days"))
+        )
+
+    def test_large_map_list(self):
+        """Large map lists are processed as arrays"""
+        start = datetime.datetime(2001, 1, 1)
+        times = [
+            (start + datetime.timedelta(hours=i), None)
+            for i in range(3000)
+            if i % 3 != 1
+        ]
+        maps = self.create_maps(times)
+        self.assertIsNotNone(tgis.get_temporal_extent_array(maps))
+        self.assertEqual(tgis.compute_absolute_time_granularity(maps), "1 hour")
+        strds = tgis.SpaceTimeRasterDataset("test@P")
+        self.assertEqual(strds.count_gaps(maps), len(maps) - 1)
+        relations = tgis.count_temporal_topology_relationships(maps)
+        self.assertEqual(sum(relations.values()), 0)
+
+
+if __name__ == "__main__":
+    test()
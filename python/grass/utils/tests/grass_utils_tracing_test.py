@@ -0,0 +1,103 @@
+"""Test functions in grass.utils.tracing"""
+
+import json
+
+import pytest
+
+from grass.utils import tracing
+
+
+@pytest.fixture
+def tracer():
+    """Enable tracing for a test and restore the previous state"""
+    previous = tracing.stop_tracing()
+    yield tracing.start_tracing()
+    tracing.stop_tracing()
+    if previous is not None:
+        tracing._tracer = previous  # pylint: disable=protected-access
+
+
+def test_disabled_tracing():
+    """Without a tracer spans and functions are not recorded"""
+    previous = tracing.stop_tracing()
+
+    @tracing.trace_function()
+    def function():
+        return 1
+
+    with tracing.span("block"):
+        assert function() == 1
+    tracing.add_span("span", 0, 1)
+    assert tracing.get_tracer() is None
+    if previous is not None:
+        tracing._tracer = previous  # pylint: disable=protected-access
+
+
+def test_spans(tracer):
+    """Spans of blocks, functions and measured spans are recorded"""
+
+    @tracing.trace_function("temporal")
+    def function(value):
+        return value
+
+    with tracing.span("block", category="db", statement="SELECT 1"):
+        assert function(2) == 2
+    tracing.add_span("module", 10, 20, category="module", tid=1)
+
+    names = [span[0] for span in tracer.spans]
+    assert names == ["test_spans.<locals>.function", "block", "module"]
+    name, category, start, end, tid, args = tracer.spans[1]
+    assert category == "db"
+    assert args == {"statement": "SELECT 1"}
+    assert start <= tracer.spans[0][2] <= tracer.spans[0][3] <= end
+
+
+def test_chrome_trace(tracer, tmp_path):
+    """The Chrome trace contains a complete event for each span"""
+    tracing.add_span("outer", 0, 100, category="main", args={"id": 1}, tid=1)
+    tracing.add_span("inner", 10, 20, tid=1)
+    filename = tmp_path / "trace.json"
+    tracer.write(str(filename))
+    events = json.loads(filename.read_text())["traceEvents"]
+    assert events[0] == {
+        "name": "outer",
+        "cat": "main",
+        "ph": "X",
+        "ts": 0,
+        "dur": 100,
+        "pid": tracer.pid,
+        "tid": 1,
+        "args": {"id": "1"},
+    }
+    assert events[1]["dur"] == 10
+
+
+def test_speedscope(tracer, tmp_path):
+    """The speedscope profiles contain properly nested events per track"""
+    tracing.add_span("outer", 0, 100, tid=1)
+    tracing.add_span("second", 50, 150, tid=1)
+    tracing.add_span("inner", 10, 20, tid=1)
+    tracing.add_span("inner", 30, 40, tid=2)
+    filename = tmp_path / "trace.speedscope.json"
+    tracer.write(str(filename))
+    trace = json.loads(filename.read_text())
+    frames = [frame["name"] for frame in trace["shared"]["frames"]]
+    assert frames == ["outer", "second", "inner"]
+    first, second = trace["profiles"]
+    events = [(event["type"], event["frame"], event["at"]) for event in first["events"]]
+    assert events == [
+        ("O", 0, 0),
+        ("O", 2, 10),
+        ("C", 2, 20),
+        ("O", 1, 50),
+        ("C", 1, 100),
+        ("C", 0, 100),
+    ]
+    assert (first["startValue"], first["endValue"]) == (0, 100)
+    assert len(second["events"]) == 2
+
+
+def test_unknown_format(tracer, tmp_path):
+    """Unknown trace formats are rejected"""
+    with pytest.raises(ValueError):
+        tracer.write(str(tmp_path / "trace.txt"), "text")
@@ -0,0 +1,290 @@
+# MODULE:    grass.utils.tracing
+#
+# PURPOSE:   Record timing spans and export them as trace files
+#
+# COPYRIGHT: (C) 2023 by the GRASS Development Team
+#
+#            This program is free software under the GNU General Public
+#            License (>=v2). Read the file COPYING that comes with GRASS
+#            for details.
+
+"""Record timing spans and export them as Chrome trace or speedscope files
+
+Tracing is enabled by setting the environment variable GRASS_TRACE to
+the name of the trace file, which is written when the process exits.
+The string ``{pid}`` in the file name is replaced by the process id.
+The trace is written in the Chrome trace event format, which can be
+opened in chrome://tracing or https://ui.perfetto.dev, unless
+GRASS_TRACE_FORMAT is set to ``speedscope`` or the file name ends
+with ``.speedscope.json``, which can be opened in https://speedscope.app.
+
+Usage::
+
+    from grass.utils import tracing
+
+    @tracing.trace_function("temporal")
+    def build_topology(maps):
+        ...
+
+    with tracing.span("SELECT", category="db", statement=statement):
+        cursor.execute(statement)
+
+If tracing is not enabled, the functions of this module do nothing.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+# Arguments of spans are truncated to this length in the trace files
+_max_arg_length = 1000
+
+
+def now():
+    """Return the current time of the trace clock in microseconds"""
+    return time.perf_counter_ns() // 1000
+
+
+class Tracer:
+    """Collect timing spans of the current process
+
+    A span has a name, a category, a start and end time in microseconds,
+    the thread (track) it belongs to and optional arguments.
+    """
+
+    def __init__(self):
+        self.spans = []
+        self.pid = os.getpid()
+
+    def add_span(self, name, start, end, category="function", args=None, tid=None):
+        """Add a span that was measured by the caller
+
+        :param name: The name of the span
+        :param start: The start time, see now()
+        :param end: The end time, see now()
+        :param category: The category of the span, e.g. "db" or "module"
+        :param args: A dictionary of additional information or None
+        :param tid: The track of the span, the current thread if None
+        """
+        if tid is None:
+            tid = threading.get_ident()
+        self.spans.append((name, category, start, end, tid, args))
+
+    def span(self, name, category="function", args=None):
+        """Return a context manager that records a span of its block"""
+        return _Span(self, name, category, args)
+
+    def to_chrome_trace(self):
+        """Return the spans as dictionary in the Chrome trace event format"""
+        events = []
+        for name, category, start, end, tid, args in self.spans:
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start,
+                "dur": end - start,
+                "pid": self.pid,
+                "tid": tid,
+            }
+            if args:
+                event["args"] = {
+                    key: str(value)[:_max_arg_length] for key, value in args.items()
+                }
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_speedscope(self, name="GRASS GIS"):
+        """Return the spans as dictionary in the speedscope file format
+
+        Each track is exported as evented profile, spans that end after
+        the span they are nested in are truncated.
+        """
+        frames = []
+        frame_index = {}
+        tracks = {}
+        for span_name, category, start, end, tid, args in self.spans:
+            if span_name not in frame_index:
+                frame_index[span_name] = len(frames)
+                frames.append({"name": span_name})
+            tracks.setdefault(tid, []).append((start, -end, frame_index[span_name]))
+
+        profiles = []
+        for tid, spans in tracks.items():
+            spans.sort()
+            events = []
+            stack = []
+            for start, end, frame in spans:
+                end = -end
+                while stack and stack[-1][0] <= start:
+                    close, closed_frame = stack.pop()
+                    events.append({"type": "C", "frame": closed_frame, "at": close})
+                if stack:
+                    end = min(end, stack[-1][0])
+                events.append({"type": "O", "frame": frame, "at": start})
+                stack.append((end, frame))
+            while stack:
+                close, closed_frame = stack.pop()
+                events.append({"type": "C", "frame": closed_frame, "at": close})
+            profiles.append(
+                {
+                    "type": "evented",
+                    "name": "Track %s" % tid,
+                    "unit": "microseconds",
+                    "startValue": events[0]["at"],
+                    "endValue": max(event["at"] for event in events),
+                    "events": events,
+                }
+            )
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "grass.utils.tracing",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+    def write(self, filename, trace_format=None):
+        """Write the spans into a trace file
+
+        :param filename: The name of the trace file
+        :param trace_format: "chrome" or "speedscope", if None the format
+                             is chosen by the file name
+        """
+        if trace_format is None:
+            if filename.endswith(".speedscope.json"):
+                trace_format = "speedscope"
+            else:
+                trace_format = "chrome"
+        if trace_format == "speedscope":
+            trace = self.to_speedscope()
+        elif trace_format == "chrome":
+            trace = self.to_chrome_trace()
+        else:
+            raise ValueError("Unknown trace format <%s>" % trace_format)
+        with open(filename, "w") as trace_file:
+            json.dump(trace, trace_file)
+
+
+class _Span:
+    """Context manager that records a span of its block"""
+
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = now()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tracer.add_span(self.name, self.start, now(), self.category, self.args)
+        return False
+
+
+class _NoSpan:
+    """Context manager that does nothing, used if tracing is disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_no_span = _NoSpan()
+
+# The tracer of this process, None if tracing is disabled
+_tracer = None
+
+
+def get_tracer():
+    """Return the tracer of this process, None if tracing is disabled"""
+    return _tracer
+
+
+def start_tracing():
+    """Enable tracing in this process and return the tracer"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing():
+    """Disable tracing in this process and return the tracer"""
+    global _tracer
+    tracer = _tracer
+    _tracer = None
+    return tracer
+
+
+def span(name, category="function", **args):
+    """Return a context manager that records a span of its block
+
+    :param name: The name of the span
+    :param category: The category of the span
+    :param args: Additional information that is stored in the span
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _no_span
+    return tracer.span(name, category, args)
+
+
+def add_span(name, start, end, category="function", args=None, tid=None):
+    """Add a span that was measured by the caller, see Tracer.add_span()"""
+    tracer = _tracer
+    if tracer is not None:
+        tracer.add_span(name, start, end, category, args, tid)
+
+
+def trace_function(category="function"):
+    """Decorator that records a span for each call of the function
+
+    :param category: The category of the spans
+    """
+
+    def decorator(func):
+        name = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            start = now()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.add_span(name, start, now(), category)
+
+        return wrapper
+
+    return decorator
+
+
+def _write_trace(filename, trace_format):
+    """Write the trace file of the process which enabled tracing"""
+    tracer = _tracer
+    # Forked processes inherit the tracer, but not the responsibility
+    if tracer is None or tracer.pid != os.getpid():
+        return
+    tracer.write(filename.replace("{pid}", str(tracer.pid)), trace_format)
+
+
+if os.getenv("GRASS_TRACE"):
+    start_tracing()
+    atexit.register(
+        _write_trace, os.getenv("GRASS_TRACE"), os.getenv("GRASS_TRACE_FORMAT")
+    )
@@ -1,4 +1,7 @@
-__all__ = [
+import importlib
+
+# The bindings are submodules, which are imported by __getattr__() on first access
+__all__ = [  # noqa: F822
     'arraystats',
     'cluster',
     'date',
@@ -12,8 +15,18 @@ __all__ = [
     'proj',
     'raster3d',
     'raster',
+    'rowio',
     'rtree',
+    'segment',
     'stats',
+    'temporal',
     'vector',
     'vedit'
 ]
+
+
+def __getattr__(name):
+    """Import the ctypes bindings of a library on first access"""
+    if name in __all__:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
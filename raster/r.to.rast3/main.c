@@ -26,7 +26,7 @@
 
 /*- params and global variables -----------------------------------------*/
 typedef struct {
-    struct Option *input, *output, *tilesize;
+    struct Option *input, *file, *output, *tilesize;
     struct Flag *mask;
 } paramType;
 
@@ -35,11 +35,11 @@ int globalRastMapType;
 int globalG3dMapType;
 
 /*- prototypes --------------------------------------------------------------*/
-void fatal_error(void *map, int *fd, int depths,
-                 char *errorMsg); /*Simple Error message */
-void set_params(void);            /*Fill the paramType structure */
+void fatal_error(void *map, int fd, char *errorMsg); /*Simple Error message */
+void set_params(void); /*Fill the paramType structure */
 void raster_to_g3d(void *map, RASTER3D_Region region,
-                   int *fd);                 /*Write the raster */
+                   char **names);                 /*Write the raster */
+char **read_input_file(const char *file, int *num); /*read the slice names */
 int open_input_raster_map(const char *name); /*opens the outputmap */
 void close_input_raster_map(int fd);         /*close the map */
 
@@ -47,10 +47,8 @@ void close_input_raster_map(int fd);         /*close the map */
 /* Error handling ********************************************************** */
 
 /* ************************************************************************* */
-void fatal_error(void *map, int *fd, int depths, char *errorMsg)
+void fatal_error(void *map, int fd, char *errorMsg)
 {
-    int i;
-
     /* Close files and exit */
     if (map != NULL) {
         /* should unopen map here! but this functionality is not jet implemented
@@ -59,10 +57,8 @@ void fatal_error(void *map, int *fd, int depths, char *errorMsg)
             Rast3d_fatal_error(_("Could not close the map"));
     }
 
-    if (fd != NULL) {
-        for (i = 0; i < depths; i++)
-            close_input_raster_map(fd[i]);
-    }
+    if (fd >= 0)
+        close_input_raster_map(fd);
 
     Rast3d_fatal_error("%s", errorMsg);
     exit(EXIT_FAILURE);
@@ -76,6 +72,14 @@ void set_params(void)
 {
     param.input = G_define_standard_option(G_OPT_R_INPUTS);
     param.input->description = _("2D raster maps which represent the slices");
+    param.input->required = NO;
+
+    param.file = G_define_standard_option(G_OPT_F_INPUT);
+    param.file->key = "file";
+    param.file->description =
+        _("Input file with one raster map name per line, empty lines "
+          "represent slices of NULL values");
+    param.file->required = NO;
 
     param.output = G_define_standard_option(G_OPT_R3_OUTPUT);
 
@@ -92,26 +96,75 @@ void set_params(void)
     param.mask->key = 'm';
     param.mask->description =
         _("Use 3D raster mask (if exists) with output map");
+
+    G_option_exclusive(param.input, param.file, NULL);
+    G_option_required(param.input, param.file, NULL);
+}
+
+/* ************************************************************************* */
+/* Read the slice names from the input file ******************************** */
+
+/* ************************************************************************* */
+char **read_input_file(const char *file, int *num)
+{
+    FILE *in;
+    char **names = NULL;
+    int max_names = 0;
+
+    if (strcmp(file, "-") == 0)
+        in = stdin;
+    else {
+        in = fopen(file, "r");
+        if (!in)
+            G_fatal_error(_("Unable to open input file <%s>"), file);
+    }
+
+    *num = 0;
+    for (;;) {
+        char buf[GNAME_MAX + GMAPSET_MAX + 2];
+        char *name;
+
+        if (!G_getl2(buf, sizeof(buf), in))
+            break;
+
+        if (*num >= max_names) {
+            max_names += 100;
+            names = G_realloc(names, (max_names + 1) * sizeof(char *));
+        }
+
+        /* Empty lines are slices of NULL values */
+        name = G_chop(buf);
+        names[(*num)++] = *name ? G_store(name) : NULL;
+    }
+
+    if (in != stdin)
+        fclose(in);
+
+    if (*num < 1)
+        G_fatal_error(_("No raster map name found in input file"));
+
+    return names;
 }
 
 /* ************************************************************************* */
 /* Write the raster maps into one RASTER3D map               *************** */
 
 /* ************************************************************************* */
-void raster_to_g3d(void *map, RASTER3D_Region region, int *fd)
+void raster_to_g3d(void *map, RASTER3D_Region region, char **names)
 {
     int x, y, z;
     int rows, cols, depths;
+    int fd;
     void *rast;
     void *ptr;
-    FCELL fvalue;
-    DCELL dvalue;
 
     rows = region.rows;
     cols = region.cols;
     depths = region.depths;
 
-    rast = Rast_allocate_buf(globalRastMapType);
+    /* The 2D rows are read in the type of the 3D raster map and
+       copied without conversion, NULL values share their bit pattern */
+    rast = Rast_allocate_buf(globalG3dMapType);
 
     G_debug(3, "raster_to_g3d: Writing %i raster maps with %i rows %i cols.",
             depths, rows, cols);
@@ -120,50 +173,28 @@ void raster_to_g3d(void *map, RASTER3D_Region region, int *fd)
     for (z = 0; z < depths; z++) { /*From the bottom to the top */
         G_percent(z, depths, 1);
         G_debug(4, "Writing g3d slice %i", z + 1);
-        for (y = 0; y < rows; y++) { /* From north to south */
 
-            Rast_get_row(fd[z], rast, y, globalRastMapType);
+        /* Only the map of the current slice is open, so the number of
+           slices is not limited by the number of open files */
+        fd = -1;
+        if (names[z])
+            fd = open_input_raster_map(names[z]);
+        else
+            Rast_set_null_value(rast, cols, globalG3dMapType);
+
+        for (y = 0; y < rows; y++) { /* From north to south */
+            if (fd >= 0)
+                Rast_get_row(fd, rast, y, globalG3dMapType);
 
             for (x = 0, ptr = rast; x < cols; x++,
-                ptr = G_incr_void_ptr(ptr, Rast_cell_size(globalRastMapType))) {
-                if (globalRastMapType == CELL_TYPE) {
-                    if (Rast_is_null_value(ptr, globalRastMapType)) {
-                        Rast3d_set_null_value(&dvalue, 1, DCELL_TYPE);
-                    }
-                    else {
-                        dvalue = *(CELL *)ptr;
-                    }
-                    if (Rast3d_put_value(map, x, y, z, (char *)&dvalue,
-                                         DCELL_TYPE) < 0)
-                        fatal_error(map, fd, depths,
-                                    "Error writing double data");
-                }
-                else if (globalRastMapType == FCELL_TYPE) {
-                    if (Rast_is_null_value(ptr, globalRastMapType)) {
-                        Rast3d_set_null_value(&fvalue, 1, FCELL_TYPE);
-                    }
-                    else {
-                        fvalue = *(FCELL *)ptr;
-                    }
-                    if (Rast3d_put_value(map, x, y, z, (char *)&fvalue,
-                                         FCELL_TYPE) < 0)
-                        fatal_error(map, fd, depths,
-                                    "Error writing float data");
-                }
-                else if (globalRastMapType == DCELL_TYPE) {
-                    if (Rast_is_null_value(ptr, globalRastMapType)) {
-                        Rast3d_set_null_value(&dvalue, 1, DCELL_TYPE);
-                    }
-                    else {
-                        dvalue = *(DCELL *)ptr;
-                    }
-                    if (Rast3d_put_value(map, x, y, z, (char *)&dvalue,
-                                         DCELL_TYPE) < 0)
-                        fatal_error(map, fd, depths,
-                                    "Error writing double data");
-                }
+                ptr = G_incr_void_ptr(ptr, Rast_cell_size(globalG3dMapType))) {
+                if (!Rast3d_put_value(map, x, y, z, ptr, globalG3dMapType))
+                    fatal_error(map, fd, _("Error writing 3D raster data"));
             }
         }
+
+        if (fd >= 0)
+            close_input_raster_map(fd);
     }
 
     G_percent(1, 1, 1);
@@ -183,11 +214,14 @@ int main(int argc, char *argv[])
     struct GModule *module;
     void *map = NULL; /*The 3D Rastermap */
     int i = 0;
-    int *fd = NULL; /*The filehandler array for the 2D inputmaps */
-    int cols, rows, opencells;
+    char **names = NULL; /*The names of the 2D inputmaps of each slice */
+    char **input_names;
+    int num_inputs;
+    int cols, rows;
     char *name;
+    const char *mapset;
     int changemask = 0;
-    int maptype_tmp, nofile = 0;
+    int maptype_tmp;
     int maxSize;
 
     /* Initialize GRASS */
@@ -214,6 +248,15 @@ int main(int argc, char *argv[])
     /* Get the tile size */
     maxSize = atoi(param.tilesize->answer);
 
+    /* Get the slice names */
+    if (param.file->answer)
+        input_names = read_input_file(param.file->answer, &num_inputs);
+    else {
+        input_names = param.input->answers;
+        for (num_inputs = 0; input_names[num_inputs]; num_inputs++)
+            ;
+    }
+
     /* Figure out the region from the map */
     Rast3d_init_defaults();
     Rast3d_get_window(&region);
@@ -236,42 +279,42 @@ int main(int argc, char *argv[])
         Rast_set_window(&window2d);
     }
 
-    /*prepare the filehandler */
-    fd = (int *)G_malloc(region.depths * sizeof(int));
+    /*prepare the slice names */
+    names = (char **)G_malloc(region.depths * sizeof(char *));
 
-    if (fd == NULL)
-        fatal_error(map, NULL, 0, _("Out of memory"));
+    if (names == NULL)
+        fatal_error(map, -1, _("Out of memory"));
 
     name = NULL;
 
-    globalRastMapType = DCELL_TYPE;
+    globalRastMapType = -1;
     globalG3dMapType = DCELL_TYPE;
-    maptype_tmp = DCELL_TYPE;
 
-    opencells = 0; /*Number of opened maps */
-    /*Loop over all output maps! open */
+    /*Loop over all output slices, check the maps without opening them */
     for (i = 0; i < region.depths; i++) {
-        /*Open only existing maps */
-        if (nofile == 0 && param.input->answers[i])
-            name = param.input->answers[i];
-        else
-            nofile = 1;
+        /*if less maps are given, the last one fills up the remaining slices */
+        if (i < num_inputs)
+            name = input_names[i];
+
+        names[i] = name;
+        if (name == NULL)
+            continue;
 
-        /*if only one map is given, open it depths - times */
-        G_verbose_message(
-            _("Open raster map %s - one time for each depth (%d/%d)"), name,
-            i + 1, region.depths);
-        fd[i] = open_input_raster_map(name);
-        opencells++;
+        G_verbose_message(_("Check raster map %s for depth (%d/%d)"), name,
+                          i + 1, region.depths);
 
-        maptype_tmp = Rast_get_map_type(fd[i]);
+        mapset = G_find_raster2(name, "");
+        if (mapset == NULL)
+            G_fatal_error(_("Raster map <%s> not found"), name);
+
+        maptype_tmp = Rast_map_type(name, mapset);
 
         /*maptype */
-        if (i == 0)
+        if (globalRastMapType == -1)
             globalRastMapType = maptype_tmp;
 
         if (maptype_tmp != globalRastMapType) {
-            fatal_error(map, fd, opencells,
+            fatal_error(map, -1,
                         _("Input maps have to be from the same type. CELL, "
                           "FCELL or DCELL!"));
         }
@@ -281,17 +324,19 @@ int main(int argc, char *argv[])
     map = NULL;
 
     /* Set the map type depending from the arster maps type */
-    if (globalRastMapType == CELL_TYPE || globalRastMapType == DCELL_TYPE)
-        globalG3dMapType = DCELL_TYPE;
-    else
+    if (globalRastMapType == FCELL_TYPE)
         globalG3dMapType = FCELL_TYPE;
+    else
+        globalG3dMapType = DCELL_TYPE;
 
+    /* The slices are written from the bottom to the top, hence caching
+       one layer of tiles keeps the memory bounded for any number of slices */
     map = Rast3d_open_new_opt_tile_size(param.output->answer,
                                         RASTER3D_USE_CACHE_XY, &region,
                                         globalG3dMapType, maxSize);
 
     if (map == NULL)
-        fatal_error(map, fd, opencells, _("Error opening 3D raster map"));
+        fatal_error(map, -1, _("Error opening 3D raster map"));
 
     /*if requested set the Mask on */
     if (param.mask->answer) {
@@ -305,7 +350,7 @@ int main(int argc, char *argv[])
     }
 
     /*Create the RASTER3D Rastermap */
-    raster_to_g3d(map, region, fd);
+    raster_to_g3d(map, region, names);
 
     /*We set the Mask off, if it was off before */
     if (param.mask->answer) {
@@ -314,12 +359,8 @@ int main(int argc, char *argv[])
                 Rast3d_mask_off(map);
     }
 
-    /*Loop over all output maps! close */
-    for (i = 0; i < region.depths; i++)
-        close_input_raster_map(fd[i]);
-
-    if (fd)
-        G_free(fd);
+    if (names)
+        G_free(names);
 
     /* Flush all tile */
     if (!Rast3d_flush_all_tiles(map))
@@ -58,53 +58,29 @@
 # % key: e
 # % description: Extended statistics (quartiles and 90th percentile)
 # %end
+# %option
+# % key: sketch_size
+# % type: integer
+# % description: Size of quantile sketch used for approximate percentiles (requires -a flag)
+# % required : no
+# % answer: 1000
+# %end
 # %flag
 # % key: g
 # % description: Print stats in shell script style
 # %end
+# %flag
+# % key: a
+# % description: Approximate quartiles and percentiles using a quantile sketch (bounded memory)
+# %end
 
 import sys
-import atexit
 import json
-import math
 
 import grass.script as gscript
 
 
-def cleanup():
-    for ext in ["", ".sort"]:
-        gscript.try_remove(tmp + ext)
-
-
-def sortfile(infile, outfile):
-    inf = open(infile, "r")
-    outf = open(outfile, "w")
-
-    if gscript.find_program("sort", "--help"):
-        gscript.run_command("sort", flags="n", stdin=inf, stdout=outf)
-    else:
-        # FIXME: we need a large-file sorting function
-        gscript.warning(_("'sort' not found: sorting in memory"))
-        lines = inf.readlines()
-        for i in range(len(lines)):
-            lines[i] = float(lines[i].rstrip("\r\n"))
-        lines.sort()
-        for line in lines:
-            outf.write(str(line) + "\n")
-
-    inf.close()
-    outf.close()
-
-
 def main():
-    # A more substantial rewrite of the code is needed, possibly to C or
-    # using Python packages such as statistics or NumPy,
-    # so ignoring the duplication of final computation of some statistics
-    # as well as pushing the limit of how long the function can be.
-    # pylint: disable=too-many-branches
-    global tmp
-    tmp = gscript.tempfile()
-
     extend = flags["e"]
     shellstyle = flags["g"]
     table = options["table"]
@@ -114,6 +90,11 @@ def main():
     where = options["where"]
     perc = options["percentile"]
     output_format = options["format"]
+    sketch_size = None
+    if flags["a"]:
+        sketch_size = int(options["sketch_size"])
+        if sketch_size < 2:
+            gscript.fatal(_("Sketch size must be at least 2"))
 
     perc = [float(p) for p in perc.split(",")]
 
@@ -145,59 +126,24 @@ def main():
         )
         gscript.message(_("Reading column values..."))
 
-    sql = "SELECT %s FROM %s" % (column, table)
-    if where:
-        sql += " WHERE " + where
+    if output_format in ["plain", "shell"] and not where and not desc_table["nrows"]:
+        gscript.fatal(_("Table <%s> contains no data.") % table)
 
-    if not database:
-        database = None
-
-    if not driver:
-        driver = None
+    # calculate statistics while streaming the column values
+    if output_format == "plain":
+        gscript.verbose(_("Calculating statistics..."))
 
-    tmpf = open(tmp, "w")
-    gscript.run_command(
-        "db.select",
-        flags="c",
+    result = gscript.db_univar(
+        column,
         table=table,
+        where=where,
+        extended=extend,
+        percentile=perc,
+        sketch_size=sketch_size,
         database=database,
         driver=driver,
-        sql=sql,
-        stdout=tmpf,
     )
-    tmpf.close()
-
-    # check if result is empty
-    tmpf = open(tmp)
-    if tmpf.read(1) == "":
-        if output_format in ["plain", "shell"]:
-            gscript.fatal(_("Table <%s> contains no data.") % table)
-        tmpf.close()
-
-    # calculate statistics
-    if output_format == "plain":
-        gscript.verbose(_("Calculating statistics..."))
-
-    N = 0
-    sum = 0.0
-    sum2 = 0.0
-    sum3 = 0.0
-    minv = 1e300
-    maxv = -1e300
-
-    tmpf = open(tmp)
-    for line in tmpf:
-        line = line.rstrip("\r\n")
-        if len(line) == 0:
-            continue
-        x = float(line)
-        N += 1
-        sum += x
-        sum2 += x * x
-        sum3 += abs(x)
-        maxv = max(maxv, x)
-        minv = min(minv, x)
-    tmpf.close()
+    N = result["n"]
 
     if N <= 0:
         if output_format in ["plain", "shell"]:
@@ -205,133 +151,50 @@ def main():
         else:
             # We produce valid JSON with a value for n even when the query returned
             # no rows or when all values are nulls.
-            result = {}
-            result["n"] = N
-            nan_value = None
-            result["min"] = nan_value
-            result["max"] = nan_value
-            result["range"] = nan_value
-            result["mean"] = nan_value
-            result["mean_abs"] = nan_value
-            result["variance"] = nan_value
-            result["stddev"] = nan_value
-            result["coeff_var"] = nan_value
-            result["sum"] = nan_value
-            json.dump({"statistics": result}, sys.stdout)
+            keys = ["n", "min", "max", "range", "mean", "mean_abs", "variance"]
+            keys += ["stddev", "coeff_var", "sum"]
+            json.dump({"statistics": {key: result[key] for key in keys}}, sys.stdout)
             return
 
     if output_format == "plain":
         sys.stdout.write("Number of values: %d\n" % N)
-        sys.stdout.write("Minimum: %.15g\n" % minv)
-        sys.stdout.write("Maximum: %.15g\n" % maxv)
-        sys.stdout.write("Range: %.15g\n" % (maxv - minv))
-        sys.stdout.write("Mean: %.15g\n" % (sum / N))
-        sys.stdout.write("Arithmetic mean of absolute values: %.15g\n" % (sum3 / N))
-        if not ((sum2 - sum * sum / N) / N) < 0:
-            sys.stdout.write("Variance: %.15g\n" % ((sum2 - sum * sum / N) / N))
-            sys.stdout.write(
-                "Standard deviation: %.15g\n" % (math.sqrt((sum2 - sum * sum / N) / N))
-            )
-            sys.stdout.write(
-                "Coefficient of variation: %.15g\n"
-                % ((math.sqrt((sum2 - sum * sum / N) / N)) / (math.sqrt(sum * sum) / N))
-            )
-        else:
-            sys.stdout.write("Variance: 0\n")
-            sys.stdout.write("Standard deviation: 0\n")
-            sys.stdout.write("Coefficient of variation: 0\n")
-        sys.stdout.write("Sum: %.15g\n" % sum)
+        sys.stdout.write("Minimum: %.15g\n" % result["min"])
+        sys.stdout.write("Maximum: %.15g\n" % result["max"])
+        sys.stdout.write("Range: %.15g\n" % result["range"])
+        sys.stdout.write("Mean: %.15g\n" % result["mean"])
+        sys.stdout.write(
+            "Arithmetic mean of absolute values: %.15g\n" % result["mean_abs"]
+        )
+        sys.stdout.write("Variance: %.15g\n" % result["variance"])
+        sys.stdout.write("Standard deviation: %.15g\n" % result["stddev"])
+        sys.stdout.write("Coefficient of variation: %.15g\n" % result["coeff_var"])
+        sys.stdout.write("Sum: %.15g\n" % result["sum"])
     elif output_format == "json":
-        result = {}
-        result["n"] = N
-        result["min"] = minv
-        result["max"] = maxv
-        result["range"] = maxv - minv
-        result["mean"] = sum / N
-        result["mean_abs"] = sum3 / N
-        if not ((sum2 - sum * sum / N) / N) < 0:
-            result["variance"] = (sum2 - sum * sum / N) / N
-            result["stddev"] = math.sqrt((sum2 - sum * sum / N) / N)
-            result["coeff_var"] = (math.sqrt((sum2 - sum * sum / N) / N)) / (
-                math.sqrt(sum * sum) / N
-            )
-        else:
-            result["variance"] = 0
-            result["stddev"] = 0
-            result["coeff_var"] = 0
-        result["sum"] = sum
         if not extend:
             json.dump({"statistics": result}, sys.stdout)
     elif output_format == "shell":
         sys.stdout.write("n=%d\n" % N)
-        sys.stdout.write("min=%.15g\n" % minv)
-        sys.stdout.write("max=%.15g\n" % maxv)
-        sys.stdout.write("range=%.15g\n" % (maxv - minv))
-        sys.stdout.write("mean=%.15g\n" % (sum / N))
-        sys.stdout.write("mean_abs=%.15g\n" % (sum3 / N))
-        if not ((sum2 - sum * sum / N) / N) < 0:
-            sys.stdout.write("variance=%.15g\n" % ((sum2 - sum * sum / N) / N))
-            sys.stdout.write("stddev=%.15g\n" % (math.sqrt((sum2 - sum * sum / N) / N)))
-            sys.stdout.write(
-                "coeff_var=%.15g\n"
-                % ((math.sqrt((sum2 - sum * sum / N) / N)) / (math.sqrt(sum * sum) / N))
-            )
-        else:
-            sys.stdout.write("variance=0\n")
-            sys.stdout.write("stddev=0\n")
-            sys.stdout.write("coeff_var=0\n")
-        sys.stdout.write("sum=%.15g\n" % sum)
+        sys.stdout.write("min=%.15g\n" % result["min"])
+        sys.stdout.write("max=%.15g\n" % result["max"])
+        sys.stdout.write("range=%.15g\n" % result["range"])
+        sys.stdout.write("mean=%.15g\n" % result["mean"])
+        sys.stdout.write("mean_abs=%.15g\n" % result["mean_abs"])
+        sys.stdout.write("variance=%.15g\n" % result["variance"])
+        sys.stdout.write("stddev=%.15g\n" % result["stddev"])
+        sys.stdout.write("coeff_var=%.15g\n" % result["coeff_var"])
+        sys.stdout.write("sum=%.15g\n" % result["sum"])
     else:
         raise ValueError(f"Unknown output format {output_format}")
 
     if not extend:
         return
 
-    # preparations:
-    sortfile(tmp, tmp + ".sort")
-
     odd = N % 2
     eostr = ["even", "odd"][odd]
-
-    q25pos = round(N * 0.25)
-    if q25pos == 0:
-        q25pos = 1
-    q50apos = round(N * 0.50)
-    if q50apos == 0:
-        q50apos = 1
-    q50bpos = q50apos + (1 - odd)
-    q75pos = round(N * 0.75)
-    if q75pos == 0:
-        q75pos = 1
-
-    ppos = {}
-    pval = {}
-    for i in range(len(perc)):
-        ppos[i] = round(N * perc[i] / 100)
-        if ppos[i] == 0:
-            ppos[i] = 1
-        pval[i] = 0
-
-    inf = open(tmp + ".sort")
-    l = 1
-    for line in inf:
-        line = line.rstrip("\r\n")
-        if len(line) == 0:
-            continue
-        if l == q25pos:
-            q25 = float(line)
-        if l == q50apos:
-            q50a = float(line)
-        if l == q50bpos:
-            q50b = float(line)
-        if l == q75pos:
-            q75 = float(line)
-        for i in range(len(ppos)):
-            if l == ppos[i]:
-                pval[i] = float(line)
-        l += 1
-
-    q50 = (q50a + q50b) / 2
+    q25 = result["first_quartile"]
+    q50 = result["median"]
+    q75 = result["third_quartile"]
+    pval = result["percentile_values"]
 
     if output_format == "plain":
         sys.stdout.write("1st Quartile: %.15g\n" % q25)
@@ -358,15 +221,6 @@ def main():
             else:
                 sys.stdout.write("%.15g Percentile: %.15g\n" % (perc[i], pval[i]))
     elif output_format == "json":
-        result["first_quartile"] = q25
-        result["median"] = q50
-        result["third_quartile"] = q75
-        if options["percentile"]:
-            percentile_values = []
-            for i in range(len(perc)):
-                percentile_values.append(pval[i])
-        result["percentiles"] = perc
-        result["percentile_values"] = percentile_values
         json.dump({"statistics": result}, sys.stdout)
     else:
         sys.stdout.write("first_quartile=%.15g\n" % q25)
@@ -380,5 +234,4 @@ def main():
 
 if __name__ == "__main__":
     options, flags = gscript.parser()
-    atexit.register(cleanup)
     main()
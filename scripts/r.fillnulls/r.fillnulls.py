@@ -99,15 +99,25 @@
 # %end
 # %option G_OPT_MEMORYMB
 # %end
+# %option G_OPT_M_NPROCS
+# % description: Number of holes filled in parallel (RST method only)
+# % guisection: RST options
+# %end
 
 
 import os
 import atexit
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import grass.script as grass
 from grass.exceptions import CalledModuleError
 
+# holes are grouped into approximately this many batches per process
+BATCHES_PER_PROCESS = 4
+# maximum number of filled holes patched into a batch map at once
+PATCH_CHUNK = 64
+
 tmp_rmaps = list()
 tmp_vmaps = list()
 usermask = None
@@ -133,6 +143,247 @@ def cleanup():
             )
 
 
+def make_batches(cat_list, hole_cells, nprocs):
+    """Group holes into batches of similar total size.
+
+    Large holes get a batch of their own, tiny holes are packed together
+    so that a worker does not spend more time on bookkeeping than on the
+    interpolation itself. Number of batches is kept low to be able to patch
+    all filled batches in a single r.patch call.
+    """
+    total_cells = sum(hole_cells.get(cat, 0) for cat in cat_list)
+    batch_cells = max(1, total_cells // (nprocs * BATCHES_PER_PROCESS))
+    holes = sorted(cat_list, key=lambda cat: hole_cells.get(cat, 0), reverse=True)
+
+    batches = []
+    batch = []
+    cells = 0
+    for cat in holes:
+        batch.append(cat)
+        cells += hole_cells.get(cat, 0)
+        if cells >= batch_cells:
+            batches.append(batch)
+            batch = []
+            cells = 0
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def fill_hole(
+    cat, input, prefix, edge, ew_res, ns_res, rst_options, quiet, rmaps, vmaps
+):
+    """Fill a single hole using v.surf.rst in a region zoomed to the hole.
+
+    The region is passed to all modules through GRASS_REGION, so several
+    holes can be processed at the same time.
+
+    Returns name of raster map with interpolated values limited to the hole
+    or None when the hole could not be filled. Names of temporary maps
+    are kept in the lists rmaps and vmaps of the batch.
+    """
+    holename = prefix + "hole_" + cat
+    env = os.environ.copy()
+
+    # cut out only CAT hole for processing
+    vmaps.append(holename + "_pol")
+    grass.run_command(
+        "v.extract",
+        flags="t",
+        input=prefix + "holes",
+        output=holename + "_pol",
+        cats=cat,
+        quiet=quiet,
+    )
+
+    # zoom to specific hole with a buffer of two cells around the hole to
+    # remove rest of data
+    env["GRASS_REGION"] = grass.region_env(
+        vector=holename + "_pol",
+        align=input,
+        w="w-%d" % (edge * 2 * ew_res),
+        e="e+%d" % (edge * 2 * ew_res),
+        n="n+%d" % (edge * 2 * ns_res),
+        s="s-%d" % (edge * 2 * ns_res),
+        env=env,
+    )
+
+    # remove temporary map to not overfill disk
+    grass.run_command(
+        "g.remove", flags="fb", type="vector", name=holename + "_pol", quiet=quiet
+    )
+    vmaps.remove(holename + "_pol")
+
+    # copy only data around hole
+    rmaps.append(holename)
+    grass.mapcalc(
+        "$out = if($inp == $catn, $inp, null())",
+        out=holename,
+        inp=prefix + "holes",
+        catn=cat,
+        env=env,
+    )
+
+    # grow hole border to get it's edge area
+    rmaps.append(holename + "_grown")
+    grass.run_command(
+        "r.grow",
+        input=holename,
+        radius=edge + 0.01,
+        old=-1,
+        out=holename + "_grown",
+        quiet=quiet,
+        env=env,
+    )
+
+    # no idea why r.grow old=-1 doesn't replace existing values with NULL
+    rmaps.append(holename + "_edges")
+    grass.mapcalc(
+        '$out = if($inp == -1, null(), "$dem")',
+        out=holename + "_edges",
+        inp=holename + "_grown",
+        dem=input,
+        env=env,
+    )
+
+    # convert to points for interpolation
+    vmaps.append(holename)
+    grass.run_command(
+        "r.to.vect",
+        input=holename + "_edges",
+        output=holename,
+        type="point",
+        flags="zt",
+        quiet=quiet,
+        env=env,
+    )
+
+    # count number of points to control segmax parameter for interpolation:
+    pointsnumber = grass.vector_info_topo(map=holename, env=env)["points"]
+    grass.verbose(_("Interpolating %d points") % pointsnumber)
+
+    if pointsnumber < 2:
+        grass.verbose(_("No points to interpolate"))
+        return None
+
+    # Avoid v.surf.rst warnings
+    if pointsnumber < rst_options["segmax"]:
+        use_npmin = pointsnumber
+        use_segmax = pointsnumber * 2
+    else:
+        use_npmin = rst_options["npmin"]
+        use_segmax = rst_options["segmax"]
+
+    # launch v.surf.rst
+    rmaps.append(holename + "_dem")
+    try:
+        grass.run_command(
+            "v.surf.rst",
+            quiet=quiet,
+            input=holename,
+            elev=holename + "_dem",
+            tension=rst_options["tension"],
+            smooth=rst_options["smooth"],
+            segmax=use_segmax,
+            npmin=use_npmin,
+            env=env,
+        )
+    except CalledModuleError:
+        # GTC Hole is NULL area in a raster map
+        grass.error(_("Failed to fill hole %s") % cat)
+        raise
+
+    # v.surf.rst sometimes fails with exit code 0
+    # related bug #1813
+    if not grass.find_file(holename + "_dem", env=env)["file"]:
+        for name in (holename, holename + "_grown", holename + "_edges"):
+            rmaps.remove(name)
+        rmaps.remove(holename + "_dem")
+        vmaps.remove(holename)
+        grass.warning(
+            _(
+                "Filling has failed silently. Leaving temporary maps "
+                "with prefix <%s> for debugging."
+            )
+            % holename
+        )
+        return None
+
+    # keep only interpolated values inside of the hole
+    rmaps.append(holename + "_fill")
+    grass.mapcalc(
+        "$out = if(isnull($inp), null(), $dem)",
+        out=holename + "_fill",
+        inp=holename,
+        dem=holename + "_dem",
+        env=env,
+    )
+
+    # remove temporary maps to not overfill disk
+    names = (holename, holename + "_grown", holename + "_edges", holename + "_dem")
+    grass.run_command("g.remove", quiet=quiet, flags="fb", type="raster", name=names)
+    for name in names:
+        rmaps.remove(name)
+    grass.run_command("g.remove", quiet=quiet, flags="fb", type="vector", name=holename)
+    vmaps.remove(holename)
+
+    return holename + "_fill"
+
+
+def patch_pieces(name, pieces, input, quiet, rmaps):
+    """Patch filled holes into (possibly existing) batch map <name>"""
+    inputs = list(pieces)
+    if grass.find_file(name)["file"]:
+        inputs.append(name)
+    env = os.environ.copy()
+    env["GRASS_REGION"] = grass.region_env(raster=inputs, align=input, env=env)
+    grass.run_command(
+        "r.patch", input=inputs, output=name + "_tmp", quiet=quiet, env=env
+    )
+    grass.run_command(
+        "g.rename", raster=(name + "_tmp", name), overwrite=True, quiet=quiet
+    )
+    grass.run_command("g.remove", quiet=quiet, flags="fb", type="raster", name=pieces)
+    for piece in pieces:
+        rmaps.remove(piece)
+
+
+def fill_batch(
+    batch, name, input, prefix, edge, ew_res, ns_res, rst_options, quiet, temp_maps
+):
+    """Fill all holes of a batch and patch them into raster map <name>
+
+    Returns tuple with name of the filled map (None if no hole was filled),
+    list of holes which were not filled and number of processed holes.
+    Names of temporary raster and vector maps created by the batch are
+    stored in the dictionary temp_maps, which is owned by this batch and
+    merged into the global lists by the main thread.
+    """
+    rmaps = temp_maps["raster"]
+    vmaps = temp_maps["vector"]
+    rmaps.append(name)
+    pieces = []
+    failed = []
+    for cat in batch:
+        piece = fill_hole(
+            cat, input, prefix, edge, ew_res, ns_res, rst_options, quiet, rmaps, vmaps
+        )
+        if piece:
+            pieces.append(piece)
+        else:
+            failed.append(prefix + "hole_" + cat)
+        # patch in chunks to keep number of open maps and of temporary maps low
+        if len(pieces) >= PATCH_CHUNK:
+            patch_pieces(name, pieces, input, quiet, rmaps)
+            pieces = []
+    if pieces:
+        patch_pieces(name, pieces, input, quiet, rmaps)
+    if not grass.find_file(name)["file"]:
+        rmaps.remove(name)
+        return None, failed, len(batch)
+    return name, failed, len(batch)
+
+
 def main():
     global usermask, mapset, tmp_rmaps, tmp_vmaps
 
@@ -146,6 +397,9 @@ def main():
     npmin = int(options["npmin"])
     lambda_ = float(options["lambda"])
     memory = options["memory"]
+    nprocs = int(options["nprocs"])
+    if nprocs < 1:
+        grass.fatal(_("Number of processes must be at least 1"))
     quiet = True  # FIXME
     mapset = grass.gisenv()["MAPSET"]
     unique = str(os.getpid())  # Shouldn't we use temp name?
@@ -153,6 +407,7 @@ def main():
     failed_list = (
         list()
     )  # a list of failed holes. Caused by issues with v.surf.rst. Connected with #1813
+    filled_maps = list()  # maps with interpolated values to patch into input
 
     # check if input file exists
     if not grass.find_file(input)["file"]:
@@ -300,272 +555,74 @@ def main():
 
         # GTC Hole is NULL area in a raster map
         grass.message(_("Processing %d map holes") % len(cat_list))
-        first = True
-        hole_n = 1
-        for cat in cat_list:
-            holename = prefix + "hole_" + cat
-            # GTC Hole is a NULL area in a raster map
-            grass.message(_("Filling hole %s of %s") % (hole_n, len(cat_list)))
-            hole_n = hole_n + 1
-            # cut out only CAT hole for processing
-            try:
-                grass.run_command(
-                    "v.extract",
-                    input=prefix + "holes",
-                    output=holename + "_pol",
-                    cats=cat,
-                    quiet=quiet,
-                )
-            except CalledModuleError:
-                grass.fatal(
-                    _(
-                        "abandoned. Removing temporary maps, restoring "
-                        "user mask if needed:"
-                    )
-                )
-            tmp_vmaps.append(holename + "_pol")
 
-            # zoom to specific hole with a buffer of two cells around the hole to
-            # remove rest of data
-            try:
-                grass.run_command(
-                    "g.region",
-                    vector=holename + "_pol",
-                    align=input,
-                    w="w-%d" % (edge * 2 * ew_res),
-                    e="e+%d" % (edge * 2 * ew_res),
-                    n="n+%d" % (edge * 2 * ns_res),
-                    s="s-%d" % (edge * 2 * ns_res),
-                    quiet=quiet,
-                )
-            except CalledModuleError:
-                grass.fatal(
-                    _(
-                        "abandoned. Removing temporary maps, restoring "
-                        "user mask if needed:"
-                    )
-                )
-
-            # remove temporary map to not overfill disk
-            try:
-                grass.run_command(
-                    "g.remove",
-                    flags="fb",
-                    type="vector",
-                    name=holename + "_pol",
-                    quiet=quiet,
-                )
-            except CalledModuleError:
-                grass.fatal(
-                    _(
-                        "abandoned. Removing temporary maps, restoring "
-                        "user mask if needed:"
-                    )
-                )
-            tmp_vmaps.remove(holename + "_pol")
+        # holes are independent once the region is zoomed to them, so they
+        # are filled in batches which can be processed in parallel
+        hole_cells = {}
+        for line in grass.read_command(
+            "r.stats", flags="cn", input=prefix + "holes", quiet=quiet
+        ).splitlines():
+            cat, cells = line.split()
+            hole_cells[cat] = int(cells)
+        batches = make_batches(cat_list, hole_cells, nprocs)
+        grass.verbose(
+            _("Filling holes in %d batches using %d processes") % (len(batches), nprocs)
+        )
 
-            # copy only data around hole
-            grass.mapcalc(
-                "$out = if($inp == $catn, $inp, null())",
-                out=holename,
-                inp=prefix + "holes",
-                catn=cat,
+        rst_options = dict(tension=tension, smooth=smooth, segmax=segmax, npmin=npmin)
+        # temporary maps of each batch, only the worker thread of the batch
+        # changes them until they are merged here
+        batch_temp_maps = [dict(raster=[], vector=[]) for batch in batches]
+
+        def merge_temp_maps():
+            for temp_maps in batch_temp_maps:
+                tmp_rmaps.extend(temp_maps["raster"])
+                tmp_vmaps.extend(temp_maps["vector"])
+                temp_maps["raster"] = []
+                temp_maps["vector"] = []
+
+        executor = ThreadPoolExecutor(max_workers=nprocs)
+        futures = [
+            executor.submit(
+                fill_batch,
+                batch=batch,
+                name=filling + "_%d" % batch_id,
+                input=input,
+                prefix=prefix,
+                edge=edge,
+                ew_res=ew_res,
+                ns_res=ns_res,
+                rst_options=rst_options,
+                quiet=quiet,
+                temp_maps=batch_temp_maps[batch_id],
             )
-            tmp_rmaps.append(holename)
-
-            # If here loop is split into two, next part of loop can be run in parallel
-            # (except final result patching)
-            # Downside - on large maps such approach causes large disk usage
-
-            # grow hole border to get it's edge area
-            tmp_rmaps.append(holename + "_grown")
-            try:
-                grass.run_command(
-                    "r.grow",
-                    input=holename,
-                    radius=edge + 0.01,
-                    old=-1,
-                    out=holename + "_grown",
-                    quiet=quiet,
-                )
-            except CalledModuleError:
-                grass.fatal(
-                    _(
-                        "abandoned. Removing temporary map, restoring "
-                        "user mask if needed:"
-                    )
+            for batch_id, batch in enumerate(batches)
+        ]
+        holes_done = 0
+        try:
+            for future in as_completed(futures):
+                filled, failed, processed = future.result()
+                if filled:
+                    filled_maps.append(filled)
+                failed_list.extend(failed)
+                holes_done += processed
+                grass.percent(holes_done, len(cat_list), 1)
+        except CalledModuleError:
+            # do not start the remaining batches, wait for the running ones
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            grass.fatal(
+                _(
+                    "abandoned. Removing temporary maps, restoring "
+                    "user mask if needed:"
                 )
-
-            # no idea why r.grow old=-1 doesn't replace existing values with NULL
-            grass.mapcalc(
-                '$out = if($inp == -1, null(), "$dem")',
-                out=holename + "_edges",
-                inp=holename + "_grown",
-                dem=input,
             )
-            tmp_rmaps.append(holename + "_edges")
-
-            # convert to points for interpolation
-            tmp_vmaps.append(holename)
-            try:
-                grass.run_command(
-                    "r.to.vect",
-                    input=holename + "_edges",
-                    output=holename,
-                    type="point",
-                    flags="z",
-                    quiet=quiet,
-                )
-            except CalledModuleError:
-                grass.fatal(
-                    _(
-                        "abandoned. Removing temporary maps, restoring "
-                        "user mask if needed:"
-                    )
-                )
-
-            # count number of points to control segmax parameter for interpolation:
-            pointsnumber = grass.vector_info_topo(map=holename)["points"]
-            grass.verbose(_("Interpolating %d points") % pointsnumber)
-
-            if pointsnumber < 2:
-                grass.verbose(_("No points to interpolate"))
-                failed_list.append(holename)
-                continue
-
-            # Avoid v.surf.rst warnings
-            if pointsnumber < segmax:
-                use_npmin = pointsnumber
-                use_segmax = pointsnumber * 2
-            else:
-                use_npmin = npmin
-                use_segmax = segmax
-
-            # launch v.surf.rst
-            tmp_rmaps.append(holename + "_dem")
-            try:
-                grass.run_command(
-                    "v.surf.rst",
-                    quiet=quiet,
-                    input=holename,
-                    elev=holename + "_dem",
-                    tension=tension,
-                    smooth=smooth,
-                    segmax=use_segmax,
-                    npmin=use_npmin,
-                )
-            except CalledModuleError:
-                # GTC Hole is NULL area in a raster map
-                grass.fatal(_("Failed to fill hole %s") % cat)
-
-            # v.surf.rst sometimes fails with exit code 0
-            # related bug #1813
-            if not grass.find_file(holename + "_dem")["file"]:
-                try:
-                    tmp_rmaps.remove(holename)
-                    tmp_rmaps.remove(holename + "_grown")
-                    tmp_rmaps.remove(holename + "_edges")
-                    tmp_rmaps.remove(holename + "_dem")
-                    tmp_vmaps.remove(holename)
-                except:
-                    pass
-                grass.warning(
-                    _(
-                        "Filling has failed silently. Leaving temporary maps "
-                        "with prefix <%s> for debugging."
-                    )
-                    % holename
-                )
-                failed_list.append(holename)
-                continue
-
-            # append hole result to interpolated version later used to patch into original DEM
-            if first:
-                tmp_rmaps.append(filling)
-                grass.run_command(
-                    "g.region", align=input, raster=holename + "_dem", quiet=quiet
-                )
-                grass.mapcalc(
-                    "$out = if(isnull($inp), null(), $dem)",
-                    out=filling,
-                    inp=holename,
-                    dem=holename + "_dem",
-                )
-                first = False
-            else:
-                tmp_rmaps.append(filling + "_tmp")
-                grass.run_command(
-                    "g.region",
-                    align=input,
-                    raster=(filling, holename + "_dem"),
-                    quiet=quiet,
-                )
-                grass.mapcalc(
-                    "$out = if(isnull($inp), if(isnull($fill), null(), $fill), $dem)",
-                    out=filling + "_tmp",
-                    inp=holename,
-                    dem=holename + "_dem",
-                    fill=filling,
-                )
-                try:
-                    grass.run_command(
-                        "g.rename",
-                        raster=(filling + "_tmp", filling),
-                        overwrite=True,
-                        quiet=quiet,
-                    )
-                except CalledModuleError:
-                    grass.fatal(
-                        _(
-                            "abandoned. Removing temporary maps, restoring user "
-                            "mask if needed:"
-                        )
-                    )
-                # this map has been removed. No need for later cleanup.
-                tmp_rmaps.remove(filling + "_tmp")
-
-            # remove temporary maps to not overfill disk
-            try:
-                tmp_rmaps.remove(holename)
-                tmp_rmaps.remove(holename + "_grown")
-                tmp_rmaps.remove(holename + "_edges")
-                tmp_rmaps.remove(holename + "_dem")
-            except:
-                pass
-            try:
-                grass.run_command(
-                    "g.remove",
-                    quiet=quiet,
-                    flags="fb",
-                    type="raster",
-                    name=(
-                        holename,
-                        holename + "_grown",
-                        holename + "_edges",
-                        holename + "_dem",
-                    ),
-                )
-            except CalledModuleError:
-                grass.fatal(
-                    _(
-                        "abandoned. Removing temporary maps, restoring "
-                        "user mask if needed:"
-                    )
-                )
-            try:
-                tmp_vmaps.remove(holename)
-            except:
-                pass
-            try:
-                grass.run_command(
-                    "g.remove", quiet=quiet, flags="fb", type="vector", name=holename
-                )
-            except CalledModuleError:
-                grass.fatal(
-                    _(
-                        "abandoned. Removing temporary maps, restoring user mask if needed:"
-                    )
-                )
+        finally:
+            # temporary maps are removed by cleanup() on exit
+            executor.shutdown(wait=True)
+            merge_temp_maps()
+        filled_maps.sort()
 
     # check if method is different from rst to use r.resamp.bspline
     if method != "rst":
@@ -578,6 +635,7 @@ def main():
         reg = grass.region()
         # launch r.resamp.bspline
         tmp_rmaps.append(prefix + "filled")
+        filled_maps.append(prefix + "filled")
         # If there are no NULL cells, r.resamp.bslpine call
         # will end with an error although for our needs it's fine
         # Only problem - this state must be read from stderr
@@ -671,9 +729,12 @@ def main():
     # patch orig and fill map
     grass.message(_("Patching fill data into NULL areas..."))
     # we can use --o here as g.parser already checks on startup
-    grass.run_command(
-        "r.patch", input=(input, prefix + "filled"), output=output, overwrite=True
-    )
+    if filled_maps:
+        grass.run_command(
+            "r.patch", input=[input] + filled_maps, output=output, overwrite=True
+        )
+    else:
+        grass.run_command("g.copy", raster=(input, output), overwrite=True)
 
     # restore the real region
     grass.del_temp_region()
@@ -49,6 +49,19 @@ class TestRFillNulls(TestCase):
         self.assertModule(module)
         self.assertRasterFitsUnivar(raster=self.mapComplete, reference=self.values)
 
+    def test_rst_parallel(self):
+        module = SimpleModule(
+            self.module,
+            input=self.mapNameCalc,
+            output=self.mapComplete,
+            segmax=1200,
+            npmin=100,
+            tension=150,
+            nprocs=4,
+        )
+        self.assertModule(module)
+        self.assertRasterFitsUnivar(raster=self.mapComplete, reference=self.values)
+
     def test_bspline(self):
         module = SimpleModule(
             self.module,
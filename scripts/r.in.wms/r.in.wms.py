@@ -169,6 +169,34 @@ This program is free software under the GNU General Public License
 # % description: User and password for HTTP proxy
 # %end
 
+# %option G_OPT_M_NPROCS
+# % description: Number of tiles downloaded in parallel (only GRASS drivers)
+# % guisection: Request
+# %end
+
+# %option G_OPT_M_DIR
+# % key: cache
+# % required: no
+# % description: Directory where downloaded tiles are cached (only GRASS drivers)
+# % guisection: Request
+# %end
+
+# %option
+# % key: cache_ttl
+# % type: integer
+# % description: Time in seconds for which cached tiles are used
+# % answer: 86400
+# % guisection: Request
+# %end
+
+# %option
+# % key: request_interval
+# % type: double
+# % description: Minimal time in seconds between two requests to the same server (only GRASS drivers)
+# % answer: 0
+# % guisection: Request
+# %end
+
 # %option G_OPT_F_BIN_INPUT
 # % key: capfile
 # % required: no
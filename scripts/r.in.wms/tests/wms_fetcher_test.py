@@ -0,0 +1,126 @@
+"""Tests of concurrent tile download and tile cache of r.in.wms"""
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.request import urlopen
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from wms_fetcher import TileCache, TileFetcher  # noqa: E402
+
+
+class TileHandler(BaseHTTPRequestHandler):
+    """Returns the request path as tile data, errors as XML"""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle tile request"""
+        self.server.requests.append(self.path)
+        if "error" in self.path:
+            content_type = "application/vnd.ogc.se_xml"
+            body = b"<ServiceException>error</ServiceException>"
+        else:
+            content_type = "image/png"
+            body = self.path.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Do not print requests"""
+
+
+@pytest.fixture
+def server():
+    """Local HTTP server standing in for a WMS server"""
+    httpd = HTTPServer(("127.0.0.1", 0), TileHandler)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def tile_urls(server, count, path="tile"):
+    """Create list of tile requests"""
+    host, port = server.server_address
+    return [
+        ("http://%s:%d/%s?TILECOL=%d" % (host, port, path, i), {"index": i})
+        for i in range(count)
+    ]
+
+
+def test_fetch_all_tiles(server):
+    """All tiles are downloaded in parallel with their references"""
+    tiles = tile_urls(server, 20)
+    fetcher = TileFetcher(urlopen, max_workers=4, max_host_connections=2)
+    result = list(fetcher.FetchTiles(tiles))
+    assert len(result) == len(tiles)
+    for url, tile_ref, data in result:
+        assert data == ("/tile?TILECOL=%d" % tile_ref["index"]).encode()
+        assert url.endswith(data.decode())
+    assert len(server.requests) == len(tiles)
+
+
+def test_cache(server, tmp_path):
+    """Repeated requests are served from cache until they expire"""
+    tiles = tile_urls(server, 5)
+    cache = TileCache(str(tmp_path), ttl=3600)
+    fetcher = TileFetcher(urlopen, max_workers=2, cache=cache)
+    first = sorted(data for url, ref, data in fetcher.FetchTiles(tiles))
+    second = sorted(data for url, ref, data in fetcher.FetchTiles(tiles))
+    assert first == second
+    assert len(server.requests) == len(tiles)
+
+    expired = TileFetcher(urlopen, cache=TileCache(str(tmp_path), ttl=-1))
+    list(expired.FetchTiles(tiles))
+    assert len(server.requests) == 2 * len(tiles)
+
+
+def test_cache_namespace(server, tmp_path):
+    """Tiles cached for one user are not served to another"""
+    tiles = tile_urls(server, 3)
+    for user in ("alice", "bob"):
+        cache = TileCache(str(tmp_path), ttl=3600, namespace=user)
+        list(TileFetcher(urlopen, cache=cache).FetchTiles(tiles))
+    assert len(server.requests) == 2 * len(tiles)
+
+
+def test_errors_not_cached(server, tmp_path):
+    """Error responses from server are not stored in cache"""
+    tiles = tile_urls(server, 2, path="error")
+    cache = TileCache(str(tmp_path), ttl=3600)
+    fetcher = TileFetcher(urlopen, cache=cache)
+    list(fetcher.FetchTiles(tiles))
+    list(fetcher.FetchTiles(tiles))
+    assert len(server.requests) == 2 * len(tiles)
+
+
+def test_retry_refused_connection(monkeypatch):
+    """Request refused by server is repeated"""
+    monkeypatch.setattr("wms_fetcher.RETRY_DELAYS", (0, 0))
+    warnings = []
+    monkeypatch.setattr("wms_fetcher.grass.warning", warnings.append)
+    calls = []
+
+    class Response:
+        def read(self):
+            return b"data"
+
+    def fetch(url):
+        calls.append(url)
+        if len(calls) < 3:
+            raise ConnectionResetError(104, "Connection reset by peer")
+        return Response()
+
+    result = list(TileFetcher(fetch).FetchTiles([("http://host/tile", None)]))
+    assert result == [("http://host/tile", None, b"data")]
+    assert len(calls) == 3
+    assert len(warnings) == 2
@@ -78,6 +78,17 @@ class WMSBase(object):
         for key in ["password", "username", "urlparams"]:
             self.params[key] = options[key]
 
+        # concurrent download and caching of tiles (GRASS drivers),
+        # d.wms does not define these options: serial and uncached download
+        self.params["nprocs"] = int(options.get("nprocs") or 1)
+        if self.params["nprocs"] < 1:
+            grass.fatal(_("Number of parallel downloads must be at least 1"))
+        self.params["cache"] = options.get("cache", "")
+        self.params["cache_ttl"] = int(options.get("cache_ttl") or 86400)
+        self.params["request_interval"] = float(options.get("request_interval") or 0)
+        if self.params["request_interval"] < 0:
+            grass.fatal(_("Interval between requests must not be negative"))
+
         if (self.params["password"] and self.params["username"] == "") or (
             self.params["password"] == "" and self.params["username"]
         ):
@@ -193,7 +204,15 @@ class WMSBase(object):
             if (
                 i_param in options
                 and options[i_param]
-                and i_param not in ["srs", "wms_version", "format"]
+                and i_param
+                not in [
+                    "srs",
+                    "wms_version",
+                    "format",
+                    "nprocs",
+                    "cache_ttl",
+                    "request_interval",
+                ]
             ):  # params with default value
                 not_relevant_params.append("<" + i_param + ">")
 
@@ -758,6 +777,10 @@ class WMSDriversInfo:
             "capfile_output",
             "username",
             "password",
+            "nprocs",
+            "cache",
+            "cache_ttl",
+            "request_interval",
         ]
         props["req_multiple_layers"] = True
 
@@ -16,11 +16,8 @@ This program is free software under the GNU General Public License
 @author Stepan Turek <stepan.turek seznam.cz> (Mentor: Martin Landa)
 """
 
-import socket
 import grass.script as grass
 
-from time import sleep
-
 try:
     from osgeo import gdal
 except:
@@ -52,6 +49,7 @@ except ImportError:  # < Python 2.7
 from wms_base import GetEpsg, GetSRSParamVal, WMSBase
 
 from wms_cap_parsers import WMTSCapabilitiesTree, OnEarthCapabilitiesTree
+from wms_fetcher import TileCache, TileFetcher
 from srs import Srs
 
 
@@ -95,29 +93,40 @@ class WMSDrv(WMSBase):
         init = True
         temp_map = None
 
-        fetch_try = 0
-
-        # iterate through all tiles and download them
+        # get urls for request of all tiles and information for placing the tiles
+        # into raster with other tiles (managers reuse the dictionary with it)
+        tiles = []
         while True:
-            if fetch_try == 0:
-                # get url for request the tile and information for placing the tile into
-                # raster with other tiles
-                tile = req_mgr.GetNextTile()
-
-            # if last tile has been already downloaded
+            tile = req_mgr.GetNextTile()
             if not tile:
                 break
+            tiles.append((tile[0], dict(tile[1])))
+
+        cache = None
+        if self.params["cache"]:
+            cache = TileCache(
+                self.params["cache"],
+                self.params["cache_ttl"],
+                namespace=self.params["username"],
+            )
+        fetcher = TileFetcher(
+            lambda url: self._fetchDataFromServer(
+                url, self.params["username"], self.params["password"]
+            ),
+            max_workers=self.params["nprocs"],
+            min_host_interval=self.params["request_interval"],
+            cache=cache,
+        )
 
-            # url for request the tile
-            query_url = tile[0]
-
-            # the tile size and offset in pixels for placing it into raster where tiles are joined
-            tile_ref = tile[1]
-            grass.debug(query_url, 2)
+        # download tiles concurrently and place them into raster
+        fetched_tiles = fetcher.FetchTiles(tiles)
+        while True:
             try:
-                wms_data = self._fetchDataFromServer(
-                    query_url, self.params["username"], self.params["password"]
-                )
+                # url for request the tile, the tile size and offset in pixels
+                # for placing it into raster where tiles are joined and tile data
+                query_url, tile_ref, wms_data = next(fetched_tiles)
+            except StopIteration:
+                break
             except (IOError, HTTPException) as e:
                 if isinstance(e, HTTPError) and e.code == 401:
                     grass.fatal(
@@ -129,41 +138,16 @@ class WMSDrv(WMSBase):
                         _("Unable to fetch data from: '%s'\n%s")
                         % (self.params["url"], str(e))
                     )
+            grass.debug(query_url, 2)
 
             temp_tile = self._tempfile()
 
-            # download data into temporary file
+            # write data into temporary file
             try:
-                temp_tile_opened = open(temp_tile, "wb")
-                temp_tile_opened.write(wms_data.read())
+                with open(temp_tile, "wb") as temp_tile_opened:
+                    temp_tile_opened.write(wms_data)
             except IOError as e:
-                # some servers are not happy with many subsequent requests for tiles done immediately,
-                # if immediate request was unsuccessful, try to repeat the request after 5s and 30s breaks
-                # TODO probably servers can return more kinds of errors related to this
-                # problem (not only 104)
-                if isinstance(e, socket.error) and e[0] == 104 and fetch_try < 2:
-                    fetch_try += 1
-
-                    if fetch_try == 1:
-                        sleep_time = 5
-                    elif fetch_try == 2:
-                        sleep_time = 30
-
-                    grass.warning(
-                        _(
-                            "Server refused to send data for a tile.\nRequest will be repeated after %d s."
-                        )
-                        % sleep_time
-                    )
-
-                    sleep(sleep_time)
-                    continue
-                else:
-                    grass.fatal(_("Unable to write data into tempfile.\n%s") % str(e))
-            finally:
-                temp_tile_opened.close()
-
-            fetch_try = 0
+                grass.fatal(_("Unable to write data into tempfile.\n%s") % str(e))
 
             tile_dataset_info = gdal.Open(temp_tile, gdal.GA_ReadOnly)
             if tile_dataset_info is None:
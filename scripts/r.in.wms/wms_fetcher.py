@@ -0,0 +1,205 @@
+"""!
+@brief Concurrent tile downloads with on-disk cache for r.in.wms GRASS drivers.
+
+List of classes:
+ - wms_fetcher::TileCache
+ - wms_fetcher::TileFetcher
+
+(C) 2023 by the GRASS Development Team
+
+This program is free software under the GNU General Public License
+(>=v2). Read the file COPYING that comes with GRASS for details.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse
+
+import grass.script as grass
+
+# some servers are not happy with many subsequent requests for tiles done
+# immediately, if a request was refused, it is repeated after these breaks
+RETRY_DELAYS = (5, 30)
+
+# number of tile downloads submitted ahead per worker thread
+MAX_PENDING_PER_WORKER = 4
+
+
+class TileCache:
+    """!On-disk cache of downloaded tiles.
+
+    Tiles are stored in files named by a hash of the request URL
+    (and namespace, e.g. user name), so the same request is served
+    locally until the cached file is older than ttl seconds.
+    """
+
+    def __init__(self, directory, ttl, namespace=""):
+        self.directory = directory
+        self.ttl = ttl
+        self.namespace = namespace
+
+    def _path(self, url):
+        """!Get path of file for cached tile"""
+        key = hashlib.sha256((self.namespace + "\n" + url).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, url):
+        """!Get cached tile data
+
+        @return data of the tile or None if tile is not cached or expired
+        """
+        path = self._path(url)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            with open(path, "rb") as tile_file:
+                return tile_file.read()
+        except (IOError, OSError):
+            return None
+
+    def put(self, url, data):
+        """!Store tile data in cache"""
+        path = self._path(url)
+        try:
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            # write into a temporary file first so that concurrent
+            # readers never get a partially written tile
+            temp_path = "%s.%d.%d" % (path, os.getpid(), threading.get_ident())
+            with open(temp_path, "wb") as tile_file:
+                tile_file.write(data)
+            os.replace(temp_path, path)
+        except (IOError, OSError) as e:
+            grass.warning(_("Unable to write tile into cache: %s") % str(e))
+
+
+class TileFetcher:
+    """!Downloads tiles concurrently using a bounded pool of threads.
+
+    Number of simultaneous connections to a single host is limited and
+    an optional minimal interval between requests to a host can be set.
+    """
+
+    def __init__(
+        self,
+        fetch,
+        max_workers=1,
+        max_host_connections=4,
+        min_host_interval=0,
+        cache=None,
+    ):
+        """!
+        @param fetch function returning file-like response for given url
+        @param max_workers maximal number of concurrent downloads
+        @param max_host_connections maximal number of concurrent downloads from one host
+        @param min_host_interval minimal time in seconds between two requests to one host
+        @param cache TileCache instance or None
+        """
+        self.fetch = fetch
+        self.max_workers = max(1, max_workers)
+        self.max_host_connections = max(1, max_host_connections)
+        self.min_host_interval = min_host_interval
+        self.cache = cache
+
+        self._lock = threading.Lock()
+        self._host_semaphores = {}
+        self._host_last_request = {}
+
+    def _hostSemaphore(self, host):
+        with self._lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.Semaphore(
+                    self.max_host_connections
+                )
+            return self._host_semaphores[host]
+
+    def _waitForHost(self, host):
+        """!Wait until minimal interval from last request to host passes"""
+        if not self.min_host_interval:
+            return
+        with self._lock:
+            now = time.time()
+            start = max(now, self._host_last_request.get(host, 0))
+            self._host_last_request[host] = start + self.min_host_interval
+        if start > now:
+            time.sleep(start - now)
+
+    def _download(self, url):
+        """!Download data, repeat the request if server refuses to send data"""
+        host = urlparse(url).netloc
+        for delay in RETRY_DELAYS + (None,):
+            with self._hostSemaphore(host):
+                self._waitForHost(host)
+                try:
+                    response = self.fetch(url)
+                    data = response.read()
+                    content_type = ""
+                    if hasattr(response, "info"):
+                        content_type = response.info().get("Content-Type", "")
+                    return data, content_type
+                except ConnectionResetError:
+                    if delay is None:
+                        raise
+            grass.warning(
+                _(
+                    "Server refused to send data for a tile.\n"
+                    "Request will be repeated after %d s."
+                )
+                % delay
+            )
+            time.sleep(delay)
+
+    def _get(self, url):
+        """!Get tile data from cache or from server"""
+        if self.cache:
+            data = self.cache.get(url)
+            if data is not None:
+                grass.debug("Tile served from cache: %s" % url, 3)
+                return data
+
+        data, content_type = self._download(url)
+
+        # do not cache error messages returned by server
+        if self.cache and not any(
+            kind in content_type.lower() for kind in ("xml", "html", "text")
+        ):
+            self.cache.put(url, data)
+        return data
+
+    def FetchTiles(self, tiles):
+        """!Fetch data of tiles
+
+        Tiles are yielded in order of completion of their download. At most
+        MAX_PENDING_PER_WORKER * max_workers downloads are submitted at once
+        and data of a tile is released once it was yielded, so memory does not
+        grow with number of tiles.
+
+        @param tiles iterable of (url, tile_ref) pairs
+
+        @return generator of (url, tile_ref, data) triplets
+        """
+        tiles = iter(tiles)
+        max_pending = self.max_workers * MAX_PENDING_PER_WORKER
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {}
+            try:
+                while True:
+                    for url, tile_ref in islice(tiles, max_pending - len(pending)):
+                        pending[executor.submit(self._get, url)] = (url, tile_ref)
+                    if not pending:
+                        break
+                    done = wait(pending, return_when=FIRST_COMPLETED).done
+                    for future in done:
+                        url, tile_ref = pending.pop(future)
+                        yield url, tile_ref, future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
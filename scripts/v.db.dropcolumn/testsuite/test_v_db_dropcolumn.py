@@ -34,6 +34,22 @@ class TestVDbDropColumn(TestCase):
         self.assertModule(m)
         self.assertNotRegexpMatches(decode(m.outputs.stdout), "SHAPE_LEN")
 
+    def test_drop_multiple_columns_check(self):
+        """Drop several columns at once, one of them indexed"""
+        run_command(
+            "db.execute", sql="CREATE INDEX myroads_label ON myroads (MAJORRDS_)"
+        )
+        module = SimpleModule(
+            "v.db.dropcolumn", map="myroads", columns="MAJORRDS_,ROAD_NAME"
+        )
+        self.assertModule(module)
+
+        m = SimpleModule("v.info", map="myroads", flags="c")
+        self.assertModule(m)
+        self.assertNotRegexpMatches(decode(m.outputs.stdout), "MAJORRDS_")
+        self.assertNotRegexpMatches(decode(m.outputs.stdout), "ROAD_NAME")
+        self.assertRegexpMatches(decode(m.outputs.stdout), "cat")
+
 
 if __name__ == "__main__":
     test()
@@ -41,6 +41,61 @@ import string
 import grass.script as grass
 from grass.exceptions import CalledModuleError
 
+# first SQLite version supporting ALTER TABLE DROP COLUMN
+SQLITE_DROP_COLUMN = (3, 35, 0)
+
+
+def sqlite_supports_drop_column(database, driver):
+    """Check if SQLite library used by the database driver can drop columns"""
+    try:
+        version = grass.read_command(
+            "db.select",
+            flags="c",
+            sql="SELECT sqlite_version()",
+            database=database,
+            driver=driver,
+        ).strip()
+        return tuple(int(num) for num in version.split(".")) >= SQLITE_DROP_COLUMN
+    except (CalledModuleError, ValueError):
+        return False
+
+
+def sqlite_drop_columns_sql(table, keycol, columns, database, driver):
+    """Get SQL copying the table once without all the given columns
+
+    Used for SQLite versions without ALTER TABLE DROP COLUMN,
+    see http://www.sqlite.org/faq.html#q11
+    """
+    colnames = []
+    coltypes = []
+    for f in grass.db_describe(table, database=database, driver=driver)["cols"]:
+        if f[0] in columns:
+            continue
+        colnames.append(f[0])
+        # see db_sqltype_name() for type names
+        if f[1] == "CHARACTER":
+            # preserve field length for sql type "CHARACTER"
+            coltypes.append("%s %s(%s)" % (f[0], f[1], f[2]))
+        else:
+            coltypes.append("%s %s" % (f[0], f[1]))
+
+    cmds = [
+        "BEGIN TRANSACTION",
+        "CREATE TABLE ${table}_rebuild (${coldef})",
+        "INSERT INTO ${table}_rebuild SELECT ${colnames} FROM ${table}",
+        "DROP TABLE ${table}",
+        "ALTER TABLE ${table}_rebuild RENAME TO ${table}",
+        "CREATE UNIQUE INDEX ${table}_cat ON ${table} (${keycol} )",
+        "COMMIT",
+    ]
+    tmpl = string.Template(";\n".join(cmds))
+    return tmpl.substitute(
+        table=table,
+        coldef=", ".join(coltypes),
+        colnames=", ".join(colnames),
+        keycol=keycol,
+    )
+
 
 def main():
     map = options["map"]
@@ -77,50 +132,43 @@ def main():
             % (keycol, table, map)
         )
 
+    existing_columns = grass.vector_columns(map, layer)
+    drop_columns = []
     for column in columns:
-        if column not in grass.vector_columns(map, layer):
+        if column not in existing_columns:
             grass.warning(
                 _("Column <%s> not found in table <%s>. Skipped") % (column, table)
             )
             continue
+        drop_columns.append(column)
+    if not drop_columns:
+        return
+
+    # all columns are dropped in a single transaction
+    cmds = [grass.db_begin_transaction(driver)]
+    cmds += ["ALTER TABLE %s DROP COLUMN %s" % (table, col) for col in drop_columns]
+    cmds.append(grass.db_commit_transaction(driver))
+    sql = "\n".join(cmd for cmd in cmds if cmd)
 
-        if driver == "sqlite":
-            # echo "Using special trick for SQLite"
-            # http://www.sqlite.org/faq.html#q11
-            colnames = []
-            coltypes = []
-            for f in grass.db_describe(table, database=database, driver=driver)["cols"]:
-                if f[0] == column:
-                    continue
-                colnames.append(f[0])
-                # see db_sqltype_name() for type names
-                if f[1] == "CHARACTER":
-                    # preserve field length for sql type "CHARACTER"
-                    coltypes.append("%s %s(%s)" % (f[0], f[1], f[2]))
-                else:
-                    coltypes.append("%s %s" % (f[0], f[1]))
-
-            colnames = ", ".join(colnames)
-            coltypes = ", ".join(coltypes)
-
-            cmds = [
-                "BEGIN TRANSACTION",
-                "CREATE TEMPORARY TABLE ${table}_backup (${coldef})",
-                "INSERT INTO ${table}_backup SELECT ${colnames} FROM ${table}",
-                "DROP TABLE ${table}",
-                "CREATE TABLE ${table}(${coldef})",
-                "INSERT INTO ${table} SELECT ${colnames} FROM ${table}_backup",
-                "CREATE UNIQUE INDEX ${table}_cat ON ${table} (${keycol} )",
-                "DROP TABLE ${table}_backup",
-                "COMMIT",
-            ]
-            tmpl = string.Template(";\n".join(cmds))
-            sql = tmpl.substitute(
-                table=table, coldef=coltypes, colnames=colnames, keycol=keycol
+    if driver == "sqlite" and sqlite_supports_drop_column(database, driver):
+        try:
+            # error is reported only if copying of the table fails as well
+            grass.write_command(
+                "db.execute",
+                input="-",
+                database=database,
+                driver=driver,
+                stdin=sql,
+                stderr=grass.PIPE,
             )
-        else:
-            sql = "ALTER TABLE %s DROP COLUMN %s" % (table, column)
+            sql = None
+        except CalledModuleError:
+            # e.g. the column is indexed
+            grass.verbose(_("Unable to drop columns directly, copying table"))
+    if driver == "sqlite" and sql:
+        sql = sqlite_drop_columns_sql(table, keycol, drop_columns, database, driver)
 
+    if sql:
         try:
             grass.write_command(
                 "db.execute", input="-", database=database, driver=driver, stdin=sql
@@ -0,0 +1,88 @@
+"""Benchmarking of v.db.join
+
+Compares the single statement join with updating each column
+by a separate statement without an index.
+"""
+
+import os
+import tempfile
+from subprocess import DEVNULL
+
+import grass.benchmark as bm
+import grass.script as gs
+from grass.pygrass.modules import Module
+
+
+def main():
+    results = []
+
+    # Users can add more or modify existing sizes of tables
+    for rows in (10000, 100000, 1000000):
+        benchmark(rows, 20, results)
+
+    for result in results:
+        print(f"{result.label}: {result.avg_time:.3f} s")
+
+
+def benchmark(rows, columns, results):
+    vector = "benchmark_v_db_join"
+    table = "benchmark_v_db_join_other"
+    column_names = [f"c{i}" for i in range(columns)]
+
+    generate_data(rows, vector, table, column_names)
+    module = Module(
+        "v.db.join",
+        map=vector,
+        column="cat",
+        other_table=table,
+        other_column="id",
+        run_=False,
+        stdout_=DEVNULL,
+        stderr_=DEVNULL,
+    )
+    results.append(
+        bm.benchmark_single(module, label=f"v.db.join_{rows}_rows", repeat=3)
+    )
+
+    # what v.db.join did before: one UPDATE for each column
+    with tempfile.NamedTemporaryFile("w", suffix=".sql", delete=False) as sql:
+        for name in column_names:
+            sql.write(
+                f"UPDATE {vector} SET {name}=(SELECT {name} FROM {table} "
+                f"WHERE {table}.id={vector}.cat)\n"
+            )
+    module = Module("db.execute", input=sql.name, run_=False, stderr_=DEVNULL)
+    results.append(
+        bm.benchmark_single(module, label=f"per_column_update_{rows}_rows", repeat=3)
+    )
+    os.remove(sql.name)
+
+    Module("g.remove", quiet=True, flags="f", type="vector", name=vector)
+    Module("db.droptable", quiet=True, flags="f", table=table)
+
+
+def generate_data(rows, vector, table, column_names):
+    Module("g.region", s=0, n=1000, w=0, e=1000, res=1)
+    Module(
+        "v.random",
+        output=vector,
+        npoints=rows,
+        column="z",
+        seed=1,
+        overwrite=True,
+    )
+    values = ", ".join(f"cat * {i + 1}.5" for i in range(len(column_names)))
+    gs.write_command(
+        "db.execute",
+        input="-",
+        stdin=(
+            f"CREATE TABLE {table} (id INTEGER, "
+            + ", ".join(f"{name} DOUBLE PRECISION" for name in column_names)
+            + ")\n"
+            f"INSERT INTO {table} SELECT cat, {values} FROM {vector}\n"
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
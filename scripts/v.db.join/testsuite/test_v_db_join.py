@@ -0,0 +1,70 @@
+"""Test of v.db.join
+
+(C) 2023 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+from grass.gunittest.case import TestCase
+from grass.gunittest.main import test
+from grass.gunittest.gmodules import SimpleModule
+
+from grass.script.core import read_command, run_command, write_command
+
+
+class TestVDbJoin(TestCase):
+    """Test v.db.join script"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create vector and table to join"""
+        cls.use_temp_region()
+        cls.runModule("g.region", n=10, s=0, e=10, w=0, res=1)
+        run_command("v.random", output="join_points", npoints=5, column="z", seed=1)
+        write_command(
+            "db.execute",
+            input="-",
+            stdin="CREATE TABLE join_table (id INTEGER, value DOUBLE PRECISION, "
+            "label VARCHAR(10))\n"
+            "INSERT INTO join_table VALUES (1, 1.5, 'one')\n"
+            "INSERT INTO join_table VALUES (2, 2.5, 'two')\n"
+            "INSERT INTO join_table VALUES (4, 4.5, 'four')\n",
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove vector and table"""
+        run_command("g.remove", type="vector", name="join_points", flags="f")
+        run_command("db.droptable", table="join_table", flags="f")
+        cls.del_temp_region()
+
+    def test_join_columns(self):
+        """All columns are joined, rows without match are NULL"""
+        module = SimpleModule(
+            "v.db.join",
+            map="join_points",
+            column="cat",
+            other_table="join_table",
+            other_column="id",
+        )
+        self.assertModule(module)
+        self.assertIn("3 rows", module.outputs.stderr)
+        values = read_command(
+            "v.db.select", map="join_points", columns="cat,value,label"
+        ).splitlines()
+        self.assertEqual(
+            values,
+            [
+                "cat|value|label",
+                "1|1.5|one",
+                "2|2.5|two",
+                "3||",
+                "4|4.5|four",
+                "5||",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    test()
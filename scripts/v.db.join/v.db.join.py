@@ -56,12 +56,73 @@
 # % description: Subset of columns from the other table
 # %end
 
+import os
 import sys
-import string
 import grass.script as grass
 from grass.exceptions import CalledModuleError
 
 
+def join_indexes(driver, keys):
+    """Get statements creating and dropping temporary indexes on join keys
+
+    :param driver: database driver
+    :param keys: list of (table, column) pairs
+
+    :return: list of (create, drop) pairs of SQL statements
+    """
+    if driver not in ("sqlite", "pg", "mysql"):
+        return []
+    indexes = []
+    for i, (table, column) in enumerate(keys):
+        name = "tmp_v_db_join_%d_%d" % (os.getpid(), i)
+        create = "CREATE INDEX %s ON %s (%s)" % (name, table, column)
+        if driver == "mysql":
+            drop = "DROP INDEX %s ON %s" % (name, table)
+        elif driver == "pg" and "." in table:
+            # index is created in the schema of the table
+            drop = "DROP INDEX %s.%s" % (table.split(".")[0], name)
+        else:
+            drop = "DROP INDEX %s" % name
+        indexes.append((create, drop))
+    return indexes
+
+
+def join_statement(driver, table, column, otable, ocolumn, colnames):
+    """Get a single UPDATE statement filling all columns from the other table
+
+    Rows without a match in the other table are set to NULL.
+    """
+    if driver == "mysql":
+        return "UPDATE %s LEFT JOIN %s ON %s.%s=%s.%s SET %s" % (
+            table,
+            otable,
+            otable,
+            ocolumn,
+            table,
+            column,
+            ", ".join(
+                "%s.%s=%s.%s" % (table, colname, otable, colname)
+                for colname in colnames
+            ),
+        )
+    where = "FROM %s WHERE %s.%s=%s.%s" % (otable, otable, ocolumn, table, column)
+    if driver in ("sqlite", "pg") and len(colnames) > 1:
+        # row value assignment does one lookup for all the columns
+        return "UPDATE %s SET (%s)=(SELECT %s %s)" % (
+            table,
+            ", ".join(colnames),
+            ", ".join("%s.%s" % (otable, colname) for colname in colnames),
+            where,
+        )
+    return "UPDATE %s SET %s" % (
+        table,
+        ", ".join(
+            "%s=(SELECT %s.%s %s)" % (colname, otable, colname, where)
+            for colname in colnames
+        ),
+    )
+
+
 def main():
     map = options["map"]
     layer = options["layer"]
@@ -130,9 +191,8 @@ def main():
     # is SQL, so we lowercase the names here and in the test.
     all_cols_tt = [name.lower() for name in all_cols_tt]
 
-    select = "SELECT $colname FROM $otable WHERE $otable.$ocolumn=$table.$column"
-    template = string.Template("UPDATE $table SET $colname=(%s);" % select)
-
+    columns_to_add = []
+    columns_to_update = []
     for col in cols_to_add:
         # skip the vector column which is used for join
         colname = col[0]
@@ -154,32 +214,53 @@ def main():
         else:
             coltype = "%s" % col[1]
 
-        colspec = "%s %s" % (colname, coltype)
-
-        # add only the new column to the table
+        # add only the new columns to the table
         if colname.lower() not in all_cols_tt:
-            try:
-                grass.run_command(
-                    "v.db.addcolumn", map=map, columns=colspec, layer=layer
-                )
-            except CalledModuleError:
-                grass.fatal(_("Error creating column <%s>") % colname)
-
-        stmt = template.substitute(
-            table=maptable,
-            column=column,
-            otable=otable,
-            ocolumn=ocolumn,
-            colname=colname,
+            columns_to_add.append("%s %s" % (colname, coltype))
+        columns_to_update.append(colname)
+
+    if not columns_to_update:
+        grass.warning(_("No columns to join from table <%s>") % otable)
+        return 0
+
+    # all columns are added, indexed and filled in a single transaction
+    statements = [grass.db_begin_transaction(driver)]
+    for colspec in columns_to_add:
+        statements.append("ALTER TABLE %s ADD COLUMN %s" % (maptable, colspec))
+    indexes = join_indexes(driver, [(maptable, column), (otable, ocolumn)])
+    statements.extend(create for create, drop in indexes)
+    statements.append(
+        join_statement(driver, maptable, column, otable, ocolumn, columns_to_update)
+    )
+    statements.extend(drop for create, drop in indexes)
+    statements.append(grass.db_commit_transaction(driver))
+    sql = "\n".join(stmt for stmt in statements if stmt) + "\n"
+    grass.debug(sql, 1)
+
+    grass.verbose(
+        _("Updating columns <%s> of vector map <%s>...")
+        % (",".join(columns_to_update), map)
+    )
+    try:
+        grass.write_command(
+            "db.execute", stdin=sql, input="-", database=database, driver=driver
         )
-        grass.debug(stmt, 1)
-        grass.verbose(_("Updating column <%s> of vector map <%s>...") % (colname, map))
-        try:
-            grass.write_command(
-                "db.execute", stdin=stmt, input="-", database=database, driver=driver
-            )
-        except CalledModuleError:
-            grass.fatal(_("Error filling column <%s>") % colname)
+    except CalledModuleError:
+        grass.fatal(_("Error joining columns <%s>") % ",".join(columns_to_update))
+
+    matched = grass.read_command(
+        "db.select",
+        flags="c",
+        sql="SELECT COUNT(*) FROM %s WHERE EXISTS "
+        "(SELECT 1 FROM %s WHERE %s.%s=%s.%s)"
+        % (maptable, otable, otable, ocolumn, maptable, column),
+        database=database,
+        driver=driver,
+    ).strip()
+    grass.message(
+        _("%s rows of table <%s> matched rows of table <%s>")
+        % (matched, maptable, otable)
+    )
 
     # write cmd history
     grass.vector_history(map)
@@ -179,3 +179,42 @@ def test_fixed_values(simple_dataset):
     ref_percentiles = [100.11, 102.11, 104.11, 106.11, 108.11]
     assert len(stats["percentiles"]) == len(ref_percentiles), "Error in the test itself"
     assert stats["percentile_values"] == ref_percentiles
+
+
+def test_approximate_percentiles(simple_dataset):
+    """Test that sketch is exact when all values fit into it"""
+    percentiles = list(range(10, 100, 20))
+    data = json.loads(
+        gs.read_command(
+            "v.db.univar",
+            map=simple_dataset.vector_name,
+            column=simple_dataset.column_name,
+            flags="ea",
+            percentile=percentiles,
+            sketch_size=100,
+            format="json",
+        )
+    )
+    stats = data["statistics"]
+    assert stats["n"] == 10
+    assert stats["median"] == approx(104.61)
+    assert stats["percentile_values"] == [100.11, 102.11, 104.11, 106.11, 108.11]
+
+
+@pytest.mark.skipif(np is None, reason="NumPy package not available")
+def test_db_univar_api(simple_dataset):
+    """Test statistics computed by the Python API"""
+    table = gs.vector_db(simple_dataset.vector_name)[1]["table"]
+    stats = gs.db_univar(
+        simple_dataset.column_name, table=table, extended=True, percentile=[50]
+    )
+    assert stats["n"] == len(simple_dataset.values)
+    assert stats["min"] == min(simple_dataset.values)
+    assert stats["max"] == max(simple_dataset.values)
+    assert stats["mean"] == approx(statistics.mean(simple_dataset.values))
+    assert stats["percentile_values"] == [104.11]
+    empty = gs.db_univar(
+        simple_dataset.column_name, table=table, where="cat < 0", extended=True
+    )
+    assert empty["n"] == 0
+    assert empty["median"] is None
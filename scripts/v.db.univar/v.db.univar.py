@@ -54,10 +54,21 @@
 # % key: e
 # % description: Extended statistics (quartiles and 90th percentile)
 # %end
+# %option
+# % key: sketch_size
+# % type: integer
+# % description: Size of quantile sketch used for approximate percentiles (requires -a flag)
+# % required : no
+# % answer: 1000
+# %end
 # %flag
 # % key: g
 # % description: Print stats in shell script style
 # %end
+# %flag
+# % key: a
+# % description: Approximate quartiles and percentiles using a quantile sketch (bounded memory)
+# %end
 
 import sys
 import os
@@ -87,14 +98,7 @@ def main():
     database = fi["database"]
     driver = fi["driver"]
 
-    passflags = None
-    if flags["e"]:
-        passflags = "e"
-    if flags["g"]:
-        if not passflags:
-            passflags = "g"
-        else:
-            passflags = passflags + "g"
+    passflags = "".join(flag for flag in "ega" if flags[flag]) or None
     output_format = options["format"]
 
     try:
@@ -107,6 +111,7 @@ def main():
             perc=perc,
             where=where,
             format=output_format,
+            sketch_size=options["sketch_size"],
             flags=passflags,
         )
     except CalledModuleError:
@@ -142,6 +142,45 @@ class TestRastStats(TestCase):
         self.runModule(v_db_select)
         self.assertLooksLike(univar_string, str(v_db_select.outputs.stdout))
 
+    def test_zone_all_single_pass(self):
+        # Same output as r.univar based statistics, computed in parallel bands
+        univar_string = """cat|value|label|a_number|a_null_cells|a_minimum|a_maximum|a_range|a_average|a_stddev|a_variance|a_coeff_var|a_sum|a_first_quartile|a_median|a_third_quartile|a_percentile_90
+1|1||1710|0|102|209|107|155.5|26.5502667908755|704.916666666667|17.0741265536177|265905|133|155.5|178|191
+2|2||6390|0|121|280|159|200.5|33.0895250293302|1094.91666666667|16.5035037552769|1281195|177|200.5|224|245
+"""
+
+        self.assertModule(
+            "v.rast.stats",
+            map="zone_map",
+            raster="map_a",
+            flags="cs",
+            column_prefix="a",
+            nprocs=2,
+        )
+        v_db_select = SimpleModule("v.db.select", map="zone_map")
+
+        self.runModule(v_db_select)
+        self.assertLooksLike(univar_string, str(v_db_select.outputs.stdout))
+
+    def test_multiple_rasters_single_pass(self):
+        univar_string = """cat|value|label|a_minimum|a_maximum|a_sum|r_minimum|r_maximum|r_sum
+1|1||102|209|265905|1|19|17100
+2|2||121|280|1281195|20|90|351450
+"""
+
+        self.assertModule(
+            "v.rast.stats",
+            map="zone_map",
+            raster=["map_a", "row_map"],
+            method=["minimum", "maximum", "sum"],
+            flags="cs",
+            column_prefix=["a", "r"],
+        )
+        v_db_select = SimpleModule("v.db.select", map="zone_map")
+
+        self.runModule(v_db_select)
+        self.assertLooksLike(univar_string, str(v_db_select.outputs.stdout))
+
     def test_small_area_with_centroid(self):
         # Output of v.rast.stats
         univar_string = """cat|name|a_number|a_null_cells|a_minimum|a_maximum|a_range|a_average|a_stddev|a_variance|a_coeff_var|a_sum|a_first_quartile|a_median|a_third_quartile|a_percentile_90
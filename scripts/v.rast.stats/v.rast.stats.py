@@ -32,6 +32,11 @@
 # % description: Continue if upload column(s) already exist
 # %end
 # %flag
+# % key: s
+# % label: Calculate statistics of all raster maps in a single pass (requires NumPy)
+# % description: Zones and raster maps are read row by row together and all columns are uploaded at once
+# %end
+# %flag
 # % key: d
 # % label: Create densified lines (default: thin lines)
 # % description: All cells touched by the line will be set, not only those on the render path
@@ -72,6 +77,9 @@
 # % answer: 90
 # % required : no
 # %end
+# %option G_OPT_M_NPROCS
+# % description: Number of row bands processed in parallel (only with -s flag)
+# %end
 
 import sys
 import os
@@ -80,6 +88,18 @@ import grass.script as grass
 from grass.script.utils import decode
 from grass.exceptions import CalledModuleError
 
+try:
+    import numpy as np
+
+    hasNumPy = True
+except ImportError:
+    hasNumPy = False
+
+# number of cells read at once in single pass mode
+CHUNK_CELLS = 1048576
+# maximum length of SQL statement accepted by db.execute (DB_SQL_MAX)
+SQL_MAX = 60000
+
 
 def cleanup():
     if rastertmp:
@@ -207,6 +227,22 @@ def main():
     # calculate statistics:
     grass.message(_("Processing input data (%d categories)...") % number)
 
+    if flags["s"]:
+        if not hasNumPy:
+            grass.fatal(_("NumPy is required for single pass statistics (-s flag)"))
+        single_pass_stats(
+            vector,
+            layer,
+            rasters,
+            percentile,
+            fi,
+            dbfdriver,
+            colprefixes,
+            basecols,
+            int(options["nprocs"]),
+        )
+        return
+
     for i in range(len(rasters)):
         raster = rasters[i]
 
@@ -504,6 +540,337 @@ def perform_stats(
         p.wait()
 
 
+def accumulate_band(zones_map, rasters, first_row, last_row, chunk_rows, extended):
+    """Accumulate zonal statistics of all raster maps for a band of rows.
+
+    :param zones_map: name of the zone raster map
+    :param rasters: names of raster maps to calculate statistics from
+    :param first_row: first row of the band
+    :param last_row: row after the last row of the band
+    :param chunk_rows: number of rows processed at once
+    :param extended: boolean saying if cell values are kept for percentiles
+    :return: list of accumulators (dictionaries of arrays indexed by zone),
+        one for each raster map
+    """
+    from grass.pygrass.raster import RasterRow
+
+    cell_null = np.iinfo(np.int32).min
+    nzones = int(grass.raster_info(zones_map)["max"]) + 1
+
+    zmap = RasterRow(zones_map)
+    zmap.open("r")
+    rmaps = []
+    accumulators = []
+    for raster in rasters:
+        rmap = RasterRow(raster)
+        rmap.open("r")
+        rmaps.append(rmap)
+        accumulators.append(
+            {
+                "n": np.zeros(nzones, dtype=np.int64),
+                "null": np.zeros(nzones, dtype=np.int64),
+                "sum": np.zeros(nzones),
+                "sumsq": np.zeros(nzones),
+                "min": np.full(nzones, np.inf),
+                "max": np.full(nzones, -np.inf),
+                "values": [],
+            }
+        )
+
+    for start in range(first_row, last_row, chunk_rows):
+        rows = range(start, min(start + chunk_rows, last_row))
+        zones = np.concatenate([np.array(zmap.get_row(row)) for row in rows])
+        inside = zones != cell_null
+        zones = zones[inside]
+        for rmap, acc in zip(rmaps, accumulators):
+            values = np.concatenate([np.array(rmap.get_row(row)) for row in rows])
+            values = values[inside]
+            if rmap.mtype == "CELL":
+                nulls = values == cell_null
+            else:
+                nulls = np.isnan(values)
+            values = values[~nulls].astype(np.float64)
+            zvalues = zones[~nulls]
+            acc["null"] += np.bincount(zones[nulls], minlength=nzones)
+            acc["n"] += np.bincount(zvalues, minlength=nzones)
+            acc["sum"] += np.bincount(zvalues, weights=values, minlength=nzones)
+            acc["sumsq"] += np.bincount(
+                zvalues, weights=values * values, minlength=nzones
+            )
+            np.minimum.at(acc["min"], zvalues, values)
+            np.maximum.at(acc["max"], zvalues, values)
+            if extended:
+                acc["values"].append((zvalues, values))
+
+    zmap.close()
+    for rmap in rmaps:
+        rmap.close()
+    return accumulators
+
+
+def merge_accumulators(accumulators, other):
+    """Merge accumulators of another band into accumulators"""
+    for acc, acc_other in zip(accumulators, other):
+        for key in ("n", "null", "sum", "sumsq"):
+            acc[key] += acc_other[key]
+        acc["min"] = np.minimum(acc["min"], acc_other["min"])
+        acc["max"] = np.maximum(acc["max"], acc_other["max"])
+        acc["values"].extend(acc_other["values"])
+    return accumulators
+
+
+def zonal_statistics(zones_map, rasters, extended, nprocs):
+    """Read the zone raster map and all raster maps row by row together.
+
+    Rows are split into nprocs bands processed in parallel.
+
+    :return: list of accumulators, one for each raster map
+    """
+    region = grass.region()
+    nrows = int(region["rows"])
+    chunk_rows = max(1, CHUNK_CELLS // int(region["cols"]))
+    nbands = max(1, min(nprocs, nrows))
+    band_rows = -(-nrows // nbands)
+    bands = [
+        (zones_map, rasters, first, min(first + band_rows, nrows), chunk_rows, extended)
+        for first in range(0, nrows, band_rows)
+    ]
+    if len(bands) == 1:
+        return accumulate_band(*bands[0])
+
+    from multiprocessing import Pool
+
+    with Pool(processes=len(bands)) as pool:
+        results = pool.starmap(accumulate_band, bands)
+    accumulators = results[0]
+    for other in results[1:]:
+        merge_accumulators(accumulators, other)
+    return accumulators
+
+
+def compute_stats(acc, percentile, extended):
+    """Compute statistics of all zones from an accumulator.
+
+    Statistics are computed in the same way as r.univar does.
+
+    :param acc: accumulator of a raster map
+    :param percentile: percentile to calculate
+    :param extended: boolean saying if percentiles are calculated
+
+    :return: array of zones and dictionary with arrays of statistics
+        indexed by position of the statistics in "r.univar -t" output
+    """
+    size = acc["n"] + acc["null"]
+    zones = np.flatnonzero(size)
+    n = acc["n"][zones]
+    total = acc["sum"][zones]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = total / n
+        variance = (acc["sumsq"][zones] - total * total / n) / n
+        variance[variance < 1.0e-15] = 0.0
+        stddev = np.sqrt(variance)
+        coeff_var = stddev / mean * 100.0
+    empty = n == 0
+    minimum = acc["min"][zones]
+    maximum = acc["max"][zones]
+    minimum[empty] = np.nan
+    maximum[empty] = np.nan
+    total[empty] = np.nan
+    stats = {
+        2: n,
+        3: acc["null"][zones],
+        4: minimum,
+        5: maximum,
+        6: maximum - minimum,
+        7: mean,
+        9: stddev,
+        10: variance,
+        11: coeff_var,
+        12: total,
+    }
+
+    if extended:
+        zvalues = np.concatenate([zv for zv, v in acc["values"]] + [[]])
+        values = np.concatenate([v for zv, v in acc["values"]] + [[]])
+        values = values[np.lexsort((values, zvalues))]
+        offsets = (np.cumsum(acc["n"]) - acc["n"])[zones]
+
+        def quantile(fraction):
+            pos = np.maximum(np.trunc(n * fraction - 0.5), 0).astype(np.int64)
+            result = np.full(len(zones), np.nan)
+            result[~empty] = values[(offsets + pos)[~empty]]
+            return result
+
+        median = np.full(len(zones), np.nan)
+        odd = ~empty & (n % 2 == 1)
+        even = ~empty & (n % 2 == 0)
+        median[odd] = values[(offsets + n // 2)[odd]]
+        median[even] = (
+            values[(offsets + n // 2 - 1)[even]] + values[(offsets + n // 2)[even]]
+        ) / 2.0
+        stats[14] = quantile(0.25)
+        stats[15] = median
+        stats[16] = quantile(0.75)
+        stats[17] = quantile(percentile / 100.0)
+
+    return zones, stats
+
+
+def format_value(value):
+    """Format value for SQL, convert nan and inf to NULL"""
+    if not np.isfinite(value):
+        return "NULL"
+    return "%.15g" % value
+
+
+def upload_stats(fi, dbfdriver, zones, columns):
+    """Upload statistics of all columns using a single db.execute call.
+
+    Values are inserted into a temporary table which is then joined with
+    the attribute table in one UPDATE statement. DBF driver does not
+    support this, so one UPDATE per category is used there.
+
+    :param fi: database connection of the vector map layer
+    :param dbfdriver: boolean saying if the driver is dbf
+    :param zones: array of categories
+    :param columns: list of (column name, array of values) pairs
+    """
+    table = fi["table"]
+    key = fi["key"]
+    colnames = [colname for colname, values in columns]
+    rows = [
+        [str(zone)] + [format_value(values[i]) for colname, values in columns]
+        for i, zone in enumerate(zones)
+    ]
+
+    with open(sqltmp, "w") as f:
+        f.write("{0}\n".format(grass.db_begin_transaction(fi["driver"])))
+        if dbfdriver:
+            for row in rows:
+                assignments = " , ".join(
+                    "%s=%s" % (colname, value)
+                    for colname, value in zip(colnames, row[1:])
+                )
+                f.write(
+                    "UPDATE %s SET %s WHERE %s=%s;\n"
+                    % (table, assignments, key, row[0])
+                )
+        else:
+            tmptable = "%s_stats_%d" % (table.split(".")[-1], os.getpid())
+            f.write(
+                "CREATE TABLE %s (cat INTEGER PRIMARY KEY, %s);\n"
+                % (
+                    tmptable,
+                    ", ".join("%s DOUBLE PRECISION" % colname for colname in colnames),
+                )
+            )
+            # pack as many rows into one INSERT as db.execute can handle
+            values = []
+            length = 0
+            for row in rows:
+                value = "(%s)" % ",".join(row)
+                if values and length + len(value) > SQL_MAX:
+                    f.write(
+                        "INSERT INTO %s VALUES %s;\n" % (tmptable, ",".join(values))
+                    )
+                    values = []
+                    length = 0
+                values.append(value)
+                length += len(value) + 1
+            if values:
+                f.write("INSERT INTO %s VALUES %s;\n" % (tmptable, ",".join(values)))
+            if fi["driver"] == "pg":
+                assignments = ", ".join(
+                    "%s=%s.%s" % (colname, tmptable, colname) for colname in colnames
+                )
+                f.write(
+                    "UPDATE %s SET %s FROM %s WHERE %s.%s=%s.cat;\n"
+                    % (table, assignments, tmptable, table, key, tmptable)
+                )
+            else:
+                assignments = ", ".join(
+                    "%s=(SELECT %s FROM %s WHERE %s.cat=%s.%s)"
+                    % (colname, colname, tmptable, tmptable, table, key)
+                    for colname in colnames
+                )
+                f.write(
+                    "UPDATE %s SET %s WHERE %s IN (SELECT cat FROM %s);\n"
+                    % (table, assignments, key, tmptable)
+                )
+            f.write("DROP TABLE %s;\n" % tmptable)
+        f.write("{0}\n".format(grass.db_commit_transaction(fi["driver"])))
+
+    grass.run_command(
+        "db.execute", input=sqltmp, database=fi["database"], driver=fi["driver"]
+    )
+
+
+def single_pass_stats(
+    vector,
+    layer,
+    rasters,
+    percentile,
+    fi,
+    dbfdriver,
+    colprefixes,
+    basecols,
+    nprocs,
+):
+    """Calculate statistics of all raster maps in a single pass.
+
+    The zone raster and all raster maps are read row by row together and
+    statistics of all raster maps are uploaded at once.
+
+    :param vector: name of vector map
+    :param layer: layer number or name
+    :param rasters: names of raster maps to calculate statistics from
+    :param percentile: percentile to calculate
+    :param fi: database connection of the vector map layer
+    :param dbfdriver: boolean saying if the driver is dbf
+    :param colprefixes: column prefixes for new attribute columns
+    :param basecols: the methods to use
+    :param nprocs: number of row bands processed in parallel
+    """
+    setups = []
+    extended = False
+    for colprefix in colprefixes:
+        setup = set_up_columns(
+            vector, layer, percentile, colprefix, basecols, dbfdriver, flags["c"]
+        )
+        extended = extended or bool(setup[4])
+        setups.append(setup)
+
+    accumulators = zonal_statistics(rastertmp, rasters, extended, nprocs)
+
+    zones = []
+    columns = []
+    for acc, setup in zip(accumulators, setups):
+        colprefix, variables_dbf, variables, colnames, extstat = setup
+        zones, stats = compute_stats(acc, float(percentile), extended)
+        for colname in colnames:
+            variable = colname.replace("%s_" % colprefix, "", 1)
+            if dbfdriver:
+                variable = variables_dbf[variable]
+            columns.append((colname, stats[variables[variable]]))
+
+    grass.message(_("Updating the database ..."))
+    try:
+        upload_stats(fi, dbfdriver, zones, columns)
+        grass.verbose(
+            _(
+                "Statistics calculated from raster maps <{rasters}>"
+                " and uploaded to attribute table"
+                " of vector map <{vector}>."
+            ).format(rasters=",".join(rasters), vector=vector)
+        )
+    except CalledModuleError:
+        grass.warning(
+            _("Failed to upload statistics to attribute table of vector map <%s>.")
+            % vector
+        )
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     options, flags = grass.parser()
     atexit.register(cleanup)
@@ -0,0 +1,67 @@
+"""Benchmarking of the import time of the temporal framework
+
+Measures the time needed to import grass.temporal and to access the
+functions that are used by common temporal modules in a new Python
+interpreter, compared to the import of all submodules as it was done
+before the submodules were loaded lazily. The number of the loaded
+ctypes bindings of the C-libraries is reported as well.
+
+The benchmark must be run in a GRASS GIS session.
+"""
+
+import subprocess
+import sys
+
+# The names are accessed like the temporal modules do
+COMMANDS = {
+    "import": "",
+    "t.info": "tgis.init; tgis.dataset_factory; tgis.open_old_stds",
+    "t.register": "tgis.init; tgis.register_maps_in_space_time_dataset",
+    "t.rast.list": "tgis.init; tgis.list_maps_of_stds",
+    "t.rast.extract": "tgis.init; tgis.extract_dataset",
+    "t.rast.algebra": "tgis.init; tgis.TemporalRasterAlgebraParser",
+    "all_submodules": "dir(tgis)",
+}
+
+SCRIPT = """
+import sys
+import time
+start = time.perf_counter()
+import grass.temporal as tgis
+{statement}
+seconds = time.perf_counter() - start
+libraries = [
+    name for name, module in list(sys.modules.items())
+    if name.startswith("grass.lib.") and type(module).__name__ == "module"
+]
+print(seconds, len(libraries))
+"""
+
+
+def main():
+    results = []
+
+    # Users can change the number of repetitions
+    for label, statement in COMMANDS.items():
+        benchmark(label, statement, 5, results)
+
+    for label, seconds, libraries in results:
+        print(f"{label}: {seconds:.4f} s, {libraries} ctypes libraries loaded")
+
+
+def benchmark(label, statement, repeat, results):
+    timings = []
+    for i in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", SCRIPT.format(statement=statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        timings.append((float(output[0]), int(output[1])))
+    seconds, libraries = min(timings)
+    results.append((label, seconds, libraries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Benchmarking of the selection of registered maps in the temporal database
+
+Compares the selection of registered maps of a space time raster dataset
+by a time window and by a bounding box in a SQLite temporal database
+version 4 (register table in IN clause, indexes led by map id) with
+version 5 (register table joined, start time indexes and R*Tree spatial
+index of the map extents).
+
+The temporal databases are created from the SQL templates of the
+current GRASS GIS installation in a temporary directory, the temporal
+database of the current mapset is not modified.
+"""
+
+import os
+import random
+import sqlite3
+import tempfile
+import timeit
+from datetime import datetime, timedelta
+
+import grass.temporal as tgis
+
+MAP_VIEW = "raster_view_abs_time"
+REGISTER = "strds_benchmark_PERMANENT_raster_register"
+
+TIME_WHERE = (
+    "start_time >= '2010-01-01 00:00:00' AND start_time < '2010-01-08 00:00:00'"
+)
+BBOX = {"n": 510, "s": 500, "e": 510, "w": 500}
+BBOX_WHERE = "(north > {s} AND south < {n} AND east > {w} AND west < {e})".format(
+    **BBOX
+)
+RTREE_WHERE = (
+    "id IN (SELECT id FROM raster_spatial_extent WHERE rowid IN "
+    "(SELECT id FROM raster_spatial_extent_rtree WHERE max_x >= {w} AND "
+    "min_x <= {e} AND max_y >= {s} AND min_y <= {n}))".format(**BBOX)
+)
+
+
+def main():
+    results = []
+
+    # Users can add more or modify existing numbers of maps
+    for maps in (10000, 100000, 1000000):
+        benchmark(maps, results)
+
+    for label, seconds in results:
+        print(f"{label}: {seconds:.4f} s")
+
+
+def benchmark(maps, results):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for version in (4, 5):
+            connection = sqlite3.connect(os.path.join(tmpdir, f"tgis_{version}.db"))
+            create_database(connection, version)
+            generate_data(connection, maps)
+            connection.execute("ANALYZE")
+
+            if version == 4:
+                statement = (
+                    f"SELECT * FROM {MAP_VIEW} WHERE {MAP_VIEW}.id IN "
+                    f"(SELECT id FROM {REGISTER}) AND (%s)"
+                )
+                bbox_where = BBOX_WHERE
+            else:
+                statement = (
+                    f"SELECT {MAP_VIEW}.* FROM {MAP_VIEW}, (SELECT id AS "
+                    f"registered_map_id FROM {REGISTER}) AS map_register "
+                    f"WHERE {MAP_VIEW}.id = registered_map_id AND (%s)"
+                )
+                bbox_where = f"{BBOX_WHERE} AND ({RTREE_WHERE})"
+
+            for name, where in (("time_window", TIME_WHERE), ("bbox", bbox_where)):
+                sql = statement % where
+                seconds = min(
+                    timeit.repeat(
+                        lambda: connection.execute(sql).fetchall(), number=1, repeat=3
+                    )
+                )
+                results.append((f"tgis_db_{version}_{name}_{maps}_maps", seconds))
+            connection.close()
+
+
+def create_database(connection, version):
+    template_path = tgis.get_sql_template_path()
+
+    def read(name):
+        with open(os.path.join(template_path, name)) as sql_file:
+            return sql_file.read()
+
+    connection.executescript(
+        read("map_tables_template.sql").replace("GRASS_MAP", "raster")
+    )
+    connection.executescript(read("raster_metadata_table.sql"))
+    connection.executescript(read("raster_views.sql"))
+    connection.executescript(
+        read("stds_map_register_table_template.sql").replace(
+            "SPACETIME_REGISTER_TABLE", REGISTER
+        )
+    )
+    for line in read("sqlite3_indexes.sql").splitlines():
+        if not line.startswith("CREATE INDEX raster_"):
+            continue
+        if version == 4 and "_time_start_index" in line:
+            continue
+        connection.execute(line)
+    if version == 5:
+        connection.executescript(
+            read("sqlite3_spatial_index_template.sql").replace("GRASS_MAP", "raster")
+        )
+
+
+def generate_data(connection, maps):
+    random.seed(1)
+    start = datetime(2000, 1, 1)
+    for first in range(0, maps, 10000):
+        rows = []
+        for i in range(first, min(first + 10000, maps)):
+            x = random.uniform(0, 1000)
+            y = random.uniform(0, 1000)
+            rows.append((f"map_{i}@PERMANENT", x, y, start + timedelta(hours=i)))
+        connection.executemany(
+            "INSERT INTO raster_base (id, name, mapset, creator, temporal_type, "
+            "creation_time) VALUES (?, ?, 'PERMANENT', 'benchmark', 'absolute', ?)",
+            [(row[0], row[0].split("@")[0], str(start)) for row in rows],
+        )
+        connection.executemany(
+            "INSERT INTO raster_absolute_time (id, start_time, end_time) "
+            "VALUES (?, ?, ?)",
+            [(row[0], str(row[3]), str(row[3] + timedelta(hours=1))) for row in rows],
+        )
+        connection.executemany(
+            "INSERT INTO raster_spatial_extent (id, north, south, east, west, "
+            "top, bottom, proj) VALUES (?, ?, ?, ?, ?, 0, 0, 'XY')",
+            [(row[0], row[2] + 1, row[2], row[1] + 1, row[1]) for row in rows],
+        )
+        connection.executemany(
+            "INSERT INTO raster_metadata (id, datatype, cols, rows, "
+            "number_of_cells, nsres, ewres) VALUES (?, 'CELL', 1, 1, 1, 1, 1)",
+            [(row[0],) for row in rows],
+        )
+        connection.executemany(
+            f"INSERT INTO {REGISTER} (id) VALUES (?)", [(row[0],) for row in rows]
+        )
+    connection.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -135,6 +135,17 @@
 # % description: Reverse time direction in cyclic accumulation
 # %end
 
+# %flag
+# % key: i
+# % description: Continue the detection of existing output space time raster datasets, only cycles that were not complete in the last run are computed
+# %end
+
+# %rules
+# % exclusive: -r, -i
+# %end
+
+import json
+
 import grass.script as grass
 
 
@@ -145,6 +156,21 @@ import grass.script as grass
 
 range_relations = ["EQUALS", "DURING", "OVERLAPS", "OVERLAPPING", "CONTAINS"]
 
+# options that must not change between incremental runs
+STATE_OPTIONS = (
+    "input",
+    "minimum",
+    "maximum",
+    "indicator",
+    "start",
+    "cycle",
+    "offset",
+    "basename",
+    "suffix",
+    "range",
+    "staend",
+)
+
 
 def main():
     # Get the options
@@ -163,6 +189,7 @@ def main():
     register_null = flags["n"]
     reverse = flags["r"]
     time_suffix = options["suffix"]
+    incremental = flags["i"]
 
     grass.set_raise_on_error(True)
 
@@ -209,7 +236,33 @@ def main():
             occurrence_id = occurrence + "@" + mapset
 
         occurrence_strds = tgis.SpaceTimeRasterDataset(occurrence_id)
-        if occurrence_strds.is_in_db(dbif):
+
+        # The state of the last detection into the occurrence dataset
+        state_key = "t.rast.accdetect:%s" % occurrence_id
+        state = None
+        if incremental and occurrence_strds.is_in_db(dbif):
+            state = tgis.get_tgis_metadata_value(state_key, dbif)
+            if state is not None:
+                state = json.loads(state)
+                if state["options"] != {key: options[key] for key in STATE_OPTIONS}:
+                    dbif.close()
+                    grass.fatal(
+                        _(
+                            "The options differ from the previous detection into "
+                            "space time raster dataset <%s>, unable to continue it"
+                        )
+                        % occurrence_id
+                    )
+            else:
+                grass.warning(
+                    _(
+                        "No state of a previous detection into space time raster "
+                        "dataset <%s> found, the detection is computed from start"
+                    )
+                    % occurrence_id
+                )
+
+        if occurrence_strds.is_in_db(dbif) and state is None:
             if not grass.overwrite():
                 dbif.close()
                 grass.fatal(
@@ -244,7 +297,7 @@ def main():
             indicator_id = indicator + "@" + mapset
 
         indicator_strds = tgis.SpaceTimeRasterDataset(indicator_id)
-        if indicator_strds.is_in_db(dbif):
+        if indicator_strds.is_in_db(dbif) and state is None:
             if not grass.overwrite():
                 dbif.close()
                 grass.fatal(
@@ -320,17 +373,36 @@ def main():
         else:
             stop = input_strds_end
 
+    count = 1
+    indi_count = 1
+
+    # Continue the detection with the first cycle that was not complete in
+    # the last run, the maps of this cycle are computed again
+    if state is not None:
+        if input_strds.is_time_absolute():
+            start = tgis.string_to_datetime(state["cycle_start"])
+        else:
+            start = int(state["cycle_start"])
+        count = state["count"]
+        indi_count = state["indi_count"]
+
     if input_strds.is_time_absolute():
         end = tgis.increment_datetime_by_string(start, cycle)
     else:
         end = start + cycle
 
-    count = 1
-    indi_count = 1
     occurrence_maps = {}
     indicator_maps = {}
+    new_state = state
+    if new_state is None:
+        new_state = {
+            "cycle_start": str(start),
+            "count": count,
+            "indi_count": indi_count,
+        }
 
     while input_strds_end > start and stop > start:
+        cycle_end = end
         # Make sure that the cyclic computation will stop at the correct time
         if stop and end > stop:
             end = stop
@@ -363,6 +435,7 @@ def main():
             minimum_strds,
             maximum_strds,
             dbif,
+            recompute=state is not None,
         )
 
         # Indicator computation is based on the occurrence so we need to start it after
@@ -403,7 +476,7 @@ def main():
 
                 # Check if new map is in the temporal database
                 if indicator_map.is_in_db(dbif):
-                    if grass.overwrite():
+                    if grass.overwrite() or state is not None:
                         # Remove the existing temporal database entry
                         indicator_map.delete(dbif)
                         indicator_map = input_strds.get_new_map_instance(
@@ -531,10 +604,24 @@ def main():
                 start = end + offset
             end = start + cycle
 
+        # The next incremental run starts with the first incomplete cycle
+        if cycle_end <= stop:
+            new_state = {
+                "cycle_start": str(start),
+                "count": count,
+                "indi_count": indi_count,
+            }
+
     empty_maps = []
 
     create_strds_register_maps(
-        input_strds, occurrence_strds, occurrence_maps, register_null, empty_maps, dbif
+        input_strds,
+        occurrence_strds,
+        occurrence_maps,
+        register_null,
+        empty_maps,
+        dbif,
+        append=state is not None,
     )
 
     if indicator:
@@ -545,8 +632,13 @@ def main():
             register_null,
             empty_maps,
             dbif,
+            append=state is not None,
         )
 
+    # Store the state to continue the detection incrementally
+    new_state["options"] = {key: options[key] for key in STATE_OPTIONS}
+    tgis.set_tgis_metadata_value(state_key, json.dumps(new_state), dbif)
+
     dbif.close()
 
     # Remove empty maps
@@ -561,18 +653,22 @@ def main():
 
 
 def create_strds_register_maps(
-    in_strds, out_strds, out_maps, register_null, empty_maps, dbif
+    in_strds, out_strds, out_maps, register_null, empty_maps, dbif, append=False
 ):
     out_id = out_strds.get_id()
 
-    if out_strds.is_in_db(dbif):
-        if grass.overwrite():
-            out_strds.delete(dbif)
-            out_strds = in_strds.get_new_instance(out_id)
+    # Register the maps of an incremental run in the existing dataset
+    if append and out_strds.is_in_db(dbif):
+        out_strds.select(dbif)
+    else:
+        if out_strds.is_in_db(dbif):
+            if grass.overwrite():
+                out_strds.delete(dbif)
+                out_strds = in_strds.get_new_instance(out_id)
 
-    temporal_type, semantic_type, title, description = in_strds.get_initial_values()
-    out_strds.set_initial_values(temporal_type, semantic_type, title, description)
-    out_strds.insert(dbif)
+        temporal_type, semantic_type, title, description = in_strds.get_initial_values()
+        out_strds.set_initial_values(temporal_type, semantic_type, title, description)
+        out_strds.insert(dbif)
 
     # Register the maps in the database
     count = 0
@@ -614,6 +710,7 @@ def compute_occurrence(
     minimum_strds,
     maximum_strds,
     dbif,
+    recompute=False,
 ):
     if minimum_strds:
         input_maps_minimum = input_strds.get_registered_maps_as_objects(
@@ -664,7 +761,7 @@ def compute_occurrence(
 
         # Check if new map is in the temporal database
         if occurrence_map.is_in_db(dbif):
-            if grass.overwrite():
+            if grass.overwrite() or recompute:
                 # Remove the existing temporal database entry
                 occurrence_map.delete(dbif)
                 occurrence_map = input_strds.get_new_map_instance(occurrence_map_id)
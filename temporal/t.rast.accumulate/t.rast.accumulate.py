@@ -152,11 +152,151 @@
 # % key: r
 # % description: Reverse time direction in cyclic accumulation
 # %end
+
+# %flag
+# % key: i
+# % description: Continue the accumulation of an existing output space time raster dataset, only new granules are computed
+# %end
+
+# %flag
+# % key: p
+# % description: Compute the accumulation in this process using NumPy instead of running r.series.accumulate for each granule
+# %end
+
+# %rules
+# % exclusive: -r, -i
+# %end
 from __future__ import print_function
 
+import ctypes
+import json
+
 import grass.script as grass
 from copy import copy
 
+# number of rows that are read and computed at once by the in-process
+# accumulation
+BAND_ROWS = 64
+
+# options that must not change between incremental runs
+STATE_OPTIONS = (
+    "input",
+    "lower",
+    "upper",
+    "start",
+    "cycle",
+    "offset",
+    "granularity",
+    "basename",
+    "suffix",
+    "limits",
+    "scale",
+    "shift",
+    "method",
+)
+
+############################################################################
+
+
+def accumulate_in_process(
+    input_names,
+    output_name,
+    basemap=None,
+    lower=None,
+    upper=None,
+    limits=(10.0, 30.0),
+    scale=1.0,
+    shift=0.0,
+    method="mean",
+):
+    """Compute the accumulation of a single granule in this process
+
+    The values are computed as r.series.accumulate does, using NumPy on
+    bands of rows of the input maps.
+    """
+    import numpy as np
+    import grass.lib.gis as libgis
+    import grass.lib.raster as libraster
+
+    # The maps are read and written by the C-library in this process
+    libgis.G_gisinit("t.rast.accumulate")
+
+    rows = libraster.Rast_window_rows()
+    cols = libraster.Rast_window_cols()
+    dcell_p = ctypes.POINTER(libraster.DCELL)
+
+    def read_band(fd, band, first):
+        for row in range(band.shape[0]):
+            libraster.Rast_get_d_row(fd, band[row].ctypes.data_as(dcell_p), first + row)
+
+    input_fds = [libraster.Rast_open_old(name, "") for name in input_names]
+    limit_fds = {}
+    for key, name in (("base", basemap), ("lower", lower), ("upper", upper)):
+        if name:
+            limit_fds[key] = libraster.Rast_open_old(name, "")
+    out_fd = libraster.Rast_open_new(output_name, libraster.DCELL_TYPE)
+
+    buf = np.empty((len(input_fds), BAND_ROWS, cols))
+    limit_bufs = {key: np.empty((BAND_ROWS, cols)) for key in limit_fds}
+    out_row = np.empty(cols)
+
+    for first in range(0, rows, BAND_ROWS):
+        grass.percent(first, rows, 2)
+        num = min(BAND_ROWS, rows - first)
+        for fd, band in zip(input_fds, buf):
+            read_band(fd, band[:num], first)
+        bands = {}
+        for key, fd in limit_fds.items():
+            bands[key] = limit_bufs[key][:num]
+            read_band(fd, bands[key], first)
+        lower_values = bands.get("lower", limits[0])
+        upper_values = bands.get("upper", limits[1])
+        if np.any(upper_values <= lower_values):
+            grass.fatal(_("'upper' must be > 'lower'"))
+
+        values = buf[:, :num] * scale + shift
+        non_null = np.count_nonzero(~np.isnan(values), axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            avg = np.nansum(values, axis=0) / non_null
+            if method == "huglin":
+                avg = (avg + np.fmax.reduce(values, axis=0)) / 2
+            elif method == "bedd":
+                avg = np.where(avg > upper_values, upper_values, avg)
+            if method == "mean":
+                value = avg
+            else:
+                value = avg - lower_values
+                value[value < 0.0] = 0.0
+
+        if "base" in bands:
+            value = np.where(non_null > 0, value + bands["base"], bands["base"])
+        else:
+            value[non_null == 0] = np.nan
+
+        for row in value:
+            out_row[:] = row
+            libraster.Rast_put_d_row(out_fd, out_row.ctypes.data_as(dcell_p))
+
+    grass.percent(1, 1, 1)
+
+    libraster.Rast_close(out_fd)
+    for fd in input_fds + list(limit_fds.values()):
+        libraster.Rast_close(fd)
+
+    history = libraster.History()
+    libraster.Rast_short_history(output_name, "raster", ctypes.byref(history))
+    libraster.Rast_command_history(ctypes.byref(history))
+    libraster.Rast_write_history(output_name, ctypes.byref(history))
+
+    if method == "gdd":
+        colors = libraster.Colors()
+        libraster.Rast_init_colors(ctypes.byref(colors))
+        libraster.Rast_make_colors(ctypes.byref(colors), "gdd", 0, 6000)
+        libraster.Rast_write_colors(
+            output_name, libgis.G_mapset(), ctypes.byref(colors)
+        )
+
+
 ############################################################################
 
 
@@ -164,6 +304,7 @@ def main():
     # lazy imports
     import grass.temporal as tgis
     from grass.pygrass.modules import Module
+    from grass.pygrass.raster import RasterRow
 
     # Get the options
     input = options["input"]
@@ -183,6 +324,8 @@ def main():
     register_null = flags["n"]
     reverse = flags["r"]
     time_suffix = options["suffix"]
+    incremental = flags["i"]
+    in_process = flags["p"]
 
     # Make sure the temporal database exists
     tgis.init()
@@ -213,7 +356,34 @@ def main():
 
     # The output space time raster dataset
     output_strds = tgis.SpaceTimeRasterDataset(out_id)
-    if output_strds.is_in_db(dbif):
+
+    # The state of the last accumulation into the output dataset
+    state_key = "t.rast.accumulate:%s" % out_id
+    state = None
+    if incremental and output_strds.is_in_db(dbif):
+        state = tgis.get_tgis_metadata_value(state_key, dbif)
+        if state is not None:
+            state = json.loads(state)
+            if state["options"] != {key: options[key] for key in STATE_OPTIONS}:
+                dbif.close()
+                grass.fatal(
+                    _(
+                        "The options differ from the previous accumulation into "
+                        "space time raster dataset <%s>, unable to continue it"
+                    )
+                    % out_id
+                )
+            output_strds.select(dbif)
+        else:
+            grass.warning(
+                _(
+                    "No state of a previous accumulation into space time raster "
+                    "dataset <%s> found, the accumulation is computed from start"
+                )
+                % out_id
+            )
+
+    if output_strds.is_in_db(dbif) and state is None:
         if not grass.overwrite():
             dbif.close()
             grass.fatal(
@@ -314,6 +484,23 @@ def main():
         else:
             stop = input_strds_end
 
+    def parse_time(time_string):
+        if input_strds.is_time_absolute():
+            return tgis.string_to_datetime(time_string)
+        return int(time_string)
+
+    count = 1
+    resume_granule = None
+    resume_map_name = None
+
+    # Continue the accumulation at the first granule that was not completely
+    # covered by the input maps in the last run
+    if state is not None:
+        start = parse_time(state["cycle_start"])
+        resume_granule = parse_time(state["granule"])
+        resume_map_name = state["basemap"]
+        count = state["count"]
+
     if input_strds.is_time_absolute():
         end = tgis.increment_datetime_by_string(start, cycle)
     else:
@@ -321,10 +508,18 @@ def main():
 
     limit_relations = ["EQUALS", "DURING", "OVERLAPS", "OVERLAPPING", "CONTAINS"]
 
-    count = 1
     output_maps = []
+    new_state = state
+    if new_state is None:
+        new_state = {
+            "cycle_start": str(start),
+            "granule": str(start),
+            "basemap": None,
+            "count": count,
+        }
 
     while input_strds_end > start and stop > start:
+        cycle_end = end
         # Make sure that the cyclic computation will stop at the correct time
         if stop and end > stop:
             end = stop
@@ -342,6 +537,8 @@ def main():
         gran_list_low = []
         gran_list_up = []
         gran_start = start
+        if resume_granule is not None:
+            gran_start = resume_granule
         while gran_start < end:
             map = input_strds.get_new_map_instance("%i@%i" % (count, count))
             if input_strds.is_time_absolute():
@@ -374,7 +571,9 @@ def main():
             gran_upper_topo = tgis.SpatioTemporalTopologyBuilder()
             gran_upper_topo.build(gran_list_up, upper_maps)
 
-        old_map_name = None
+        old_map_name = resume_map_name
+        resume_granule = None
+        resume_map_name = None
 
         # Aggregate
         num_maps = len(gran_list)
@@ -384,6 +583,10 @@ def main():
                 map = gran_list[num_maps - i - 1]
             else:
                 map = gran_list[i]
+            map_start, map_end = map.get_temporal_extent_as_tuple()
+            # Granules that are completely covered by the input maps are
+            # not computed again by the next incremental run
+            complete = not reverse and map_end <= stop
             # Select input maps based on temporal topology relations
             input_maps = []
             if map.get_equal():
@@ -399,6 +602,13 @@ def main():
 
             # Check input maps
             if len(input_maps) == 0:
+                if complete:
+                    new_state = {
+                        "cycle_start": str(start),
+                        "granule": str(map_end),
+                        "basemap": old_map_name,
+                        "count": count,
+                    }
                 continue
 
             # New output map
@@ -418,9 +628,15 @@ def main():
             output_map_id = map.build_id(output_map_name, mapset)
             output_map = input_strds.get_new_map_instance(output_map_id)
 
+            # The last granule of the previous incremental run that was not
+            # complete is computed again
+            recompute = state is not None and output_strds.is_map_registered(
+                output_map_id, dbif
+            )
+
             # Check if new map is in the temporal database
             if output_map.is_in_db(dbif):
-                if grass.overwrite():
+                if grass.overwrite() or recompute:
                     # Remove the existing temporal database entry
                     output_map.delete(dbif)
                     output_map = input_strds.get_new_map_instance(output_map_id)
@@ -433,8 +649,6 @@ def main():
                         % (output_map.get_map_id())
                     )
 
-            map_start, map_end = map.get_temporal_extent_as_tuple()
-
             if map.is_time_absolute():
                 output_map.set_absolute_time(map_start, map_end)
             else:
@@ -466,42 +680,70 @@ def main():
             for input_map in input_maps:
                 input_map_names.append(input_map.get_id())
 
-            # Set up the module
-            accmod = Module(
-                "r.series.accumulate",
-                input=input_map_names,
-                output=output_map_name,
-                run_=False,
-            )
+            overwrite = grass.overwrite() or recompute
+            if in_process:
+                if not overwrite and RasterRow(output_map_name).exist():
+                    dbif.close()
+                    grass.fatal(
+                        _("Raster map <%s> already exists, use overwrite flag")
+                        % output_map_name
+                    )
+                accumulate_in_process(
+                    input_map_names,
+                    output_map_name,
+                    basemap=old_map_name,
+                    lower=lower_map_name,
+                    upper=upper_map_name,
+                    limits=(limits_lower, limits_upper),
+                    scale=float(scale) if scale else 1.0,
+                    shift=float(shift) if shift else 0.0,
+                    method=method,
+                )
+            else:
+                # Set up the module
+                accmod = Module(
+                    "r.series.accumulate",
+                    input=input_map_names,
+                    output=output_map_name,
+                    overwrite=overwrite,
+                    run_=False,
+                )
 
-            if old_map_name:
-                accmod.inputs["basemap"].value = old_map_name
-            if lower_map_name:
-                accmod.inputs["lower"].value = lower_map_name
-            if upper_map_name:
-                accmod.inputs["upper"].value = upper_map_name
+                if old_map_name:
+                    accmod.inputs["basemap"].value = old_map_name
+                if lower_map_name:
+                    accmod.inputs["lower"].value = lower_map_name
+                if upper_map_name:
+                    accmod.inputs["upper"].value = upper_map_name
 
-            accmod.inputs["limits"].value = (limits_lower, limits_upper)
+                accmod.inputs["limits"].value = (limits_lower, limits_upper)
 
-            if shift:
-                accmod.inputs["shift"].value = float(shift)
+                if shift:
+                    accmod.inputs["shift"].value = float(shift)
 
-            if scale:
-                accmod.inputs["scale"].value = float(scale)
+                if scale:
+                    accmod.inputs["scale"].value = float(scale)
 
-            if method:
-                accmod.inputs["method"].value = method
+                if method:
+                    accmod.inputs["method"].value = method
 
-            print(accmod)
-            accmod.run()
+                print(accmod)
+                accmod.run()
 
-            if accmod.returncode != 0:
-                dbif.close()
-                grass.fatal(_("Error running r.series.accumulate"))
+                if accmod.returncode != 0:
+                    dbif.close()
+                    grass.fatal(_("Error running r.series.accumulate"))
 
             output_maps.append(output_map)
             old_map_name = output_map_name
             count += 1
+            if complete:
+                new_state = {
+                    "cycle_start": str(start),
+                    "granule": str(map_end),
+                    "basemap": old_map_name,
+                    "count": count,
+                }
 
         # Increment the cycle
         start = end
@@ -516,15 +758,36 @@ def main():
                 start = end + offset
             end = start + cycle
 
-    # Insert the maps into the output space time dataset
-    if output_strds.is_in_db(dbif):
-        if grass.overwrite():
-            output_strds.delete(dbif)
-            output_strds = input_strds.get_new_instance(out_id)
+        # The next incremental run starts with a new cycle
+        if not reverse and cycle_end <= stop:
+            new_state = {
+                "cycle_start": str(start),
+                "granule": str(start),
+                "basemap": None,
+                "count": count,
+            }
 
-    temporal_type, semantic_type, title, description = input_strds.get_initial_values()
-    output_strds.set_initial_values(temporal_type, semantic_type, title, description)
-    output_strds.insert(dbif)
+    # Insert the maps into the output space time dataset
+    if state is None:
+        if output_strds.is_in_db(dbif):
+            if grass.overwrite():
+                output_strds.delete(dbif)
+                output_strds = input_strds.get_new_instance(out_id)
+
+        (
+            temporal_type,
+            semantic_type,
+            title,
+            description,
+        ) = input_strds.get_initial_values()
+        output_strds.set_initial_values(
+            temporal_type, semantic_type, title, description
+        )
+        output_strds.insert(dbif)
+
+    # The map the next incremental run continues with must be kept,
+    # even if it is empty
+    keep_map_name = new_state["basemap"]
 
     empty_maps = []
     # Register the maps in the database
@@ -542,7 +805,8 @@ def main():
                 output_map.metadata.get_min() is None
                 and output_map.metadata.get_max() is None
             ):
-                empty_maps.append(output_map)
+                if output_map.get_name() != keep_map_name:
+                    empty_maps.append(output_map)
                 continue
 
         # Insert map in temporal database
@@ -553,6 +817,19 @@ def main():
     output_strds.update_from_registered_maps(dbif)
     grass.percent(1, 1, 1)
 
+    # An empty map kept for the last incremental run is not needed anymore
+    if state is not None and state["basemap"] not in (None, keep_map_name):
+        old_map = input_strds.get_new_map_instance("%s@%s" % (state["basemap"], mapset))
+        if not output_strds.is_map_registered(old_map.get_id(), dbif):
+            empty_maps.append(old_map)
+
+    # Store the state to continue the accumulation incrementally
+    if reverse:
+        tgis.set_tgis_metadata_value(state_key, None, dbif)
+    else:
+        new_state["options"] = {key: options[key] for key in STATE_OPTIONS}
+        tgis.set_tgis_metadata_value(state_key, json.dumps(new_state), dbif)
+
     dbif.close()
 
     # Remove empty maps
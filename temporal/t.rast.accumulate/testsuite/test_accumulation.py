@@ -338,6 +338,112 @@ class TestAccumulate(TestCase):
         )
         self.assertRasterExists("b_2001_01_01T00_00_00")
 
+    def test_in_process(self):
+        """The in-process accumulation equals the r.series.accumulate result"""
+        for output, flags in (("B", "p"), ("C", "")):
+            self.assertModule(
+                "t.rast.accumulate",
+                input="A",
+                output=output,
+                lower="Lower",
+                upper="Upper",
+                limits=[0, 40],
+                method="bedd",
+                start="2001-01-01",
+                cycle="7 days",
+                basename=output.lower(),
+                flags=flags,
+                overwrite=True,
+                verbose=True,
+            )
+        self.addCleanup(self.runModule, "t.remove", flags="df", inputs="C")
+
+        D = tgis.open_old_stds("B", type="strds")
+        reference = tgis.open_old_stds("C", type="strds")
+
+        self.assertEqual(D.metadata.get_number_of_maps(), 7)
+        self.assertEqual(D.metadata.get_min_min(), 0.0)
+        self.assertEqual(D.metadata.get_max_max(), 40.0)
+        self.assertEqual(D.check_temporal_topology(), True)
+
+        maps = D.get_registered_maps_as_objects(order="start_time")
+        reference_maps = reference.get_registered_maps_as_objects(order="start_time")
+        self.assertEqual(len(maps), len(reference_maps))
+        for map_, reference_map in zip(maps, reference_maps):
+            self.assertEqual(
+                map_.get_temporal_extent_as_tuple(),
+                reference_map.get_temporal_extent_as_tuple(),
+            )
+            self.assertRastersNoDifference(
+                actual=map_.get_id(),
+                reference=reference_map.get_id(),
+                precision=1e-6,
+            )
+
+    def test_incremental(self):
+        self.assertModule(
+            "t.rast.accumulate",
+            input="A",
+            output="B",
+            limits=[0, 40],
+            method="gdd",
+            start="2001-01-01",
+            cycle="7 days",
+            basename="b",
+            stop="2001-01-04",
+            overwrite=True,
+            verbose=True,
+        )
+        D = tgis.open_old_stds("B", type="strds")
+        self.assertEqual(D.metadata.get_number_of_maps(), 3)
+
+        # Continue the accumulation with the remaining days
+        self.assertModule(
+            "t.rast.accumulate",
+            input="A",
+            output="B",
+            limits=[0, 40],
+            method="gdd",
+            start="2001-01-01",
+            cycle="7 days",
+            basename="b",
+            stop="2001-01-04",
+            flags="i",
+            verbose=True,
+        )
+        self.assertModuleFail(
+            "t.rast.accumulate",
+            input="A",
+            output="B",
+            limits=[0, 30],
+            method="gdd",
+            start="2001-01-01",
+            cycle="7 days",
+            basename="b",
+            flags="i",
+        )
+        self.assertModule(
+            "t.rast.accumulate",
+            input="A",
+            output="B",
+            limits=[0, 40],
+            method="gdd",
+            start="2001-01-01",
+            cycle="7 days",
+            basename="b",
+            flags="i",
+            verbose=True,
+        )
+
+        D = tgis.open_old_stds("B", type="strds")
+
+        self.assertEqual(D.metadata.get_number_of_maps(), 7)
+        self.assertEqual(D.metadata.get_min_min(), 5)
+        self.assertEqual(D.metadata.get_max_max(), 105)
+        start, end = D.get_absolute_time()
+        self.assertEqual(start, datetime.datetime(2001, 1, 1))
+        self.assertEqual(end, datetime.datetime(2001, 1, 8))
+
 
 if __name__ == "__main__":
     from grass.gunittest.main import test
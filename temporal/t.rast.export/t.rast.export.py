@@ -50,7 +50,8 @@
 # % description: Compression method of the tar archive
 # % required: no
 # % multiple: no
-# % options: no,gzip,bzip2
+# % options: no,fast,gzip,bzip2,xz
+# % descriptions: no;No compression;fast;GNU zip compression with the fastest level;gzip;GNU zip compression;bzip2;Bzip compression;xz;LZMA compression
 # % answer: bzip2
 # %end
 
@@ -104,6 +105,10 @@
 # %option G_OPT_T_WHERE
 # %end
 
+# %option G_OPT_M_NPROCS
+# % description: Number of maps exported in parallel
+# %end
+
 import os
 import grass.script as grass
 
@@ -121,6 +126,7 @@ def main():
     where = options["where"]
     _format = options["format"]
     _type = options["type"]
+    nprocs = int(options["nprocs"])
     kws = {
         key: options[key] for key in ("createopt", "metaopt", "nodata") if options[key]
     }
@@ -147,7 +153,16 @@ def main():
     tgis.init()
     # Export the space time raster dataset
     tgis.export_stds(
-        _input, output, compression, directory, where, _format, "strds", _type, **kws
+        _input,
+        output,
+        compression,
+        directory,
+        where,
+        _format,
+        "strds",
+        _type,
+        nprocs=nprocs,
+        **kws,
     )
 
 
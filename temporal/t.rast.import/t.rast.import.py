@@ -78,6 +78,10 @@
 # %option G_OPT_MEMORYMB
 # %end
 
+# %option G_OPT_M_NPROCS
+# % description: Number of maps imported in parallel
+# %end
+
 # %flag
 # % key: r
 # % description: Set the current region from the last map that was imported
@@ -120,6 +124,7 @@ def main():
     location = options["location"]
     base = options["basename"]
     memory = options["memory"]
+    nprocs = int(options["nprocs"])
     set_current_region = flags["r"]
     link = flags["l"]
     exp = flags["e"]
@@ -143,6 +148,7 @@ def main():
         base,
         set_current_region,
         memory,
+        nprocs=nprocs,
     )
 
 
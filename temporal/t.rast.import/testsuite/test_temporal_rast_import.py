@@ -1,12 +1,8 @@
-"""
-Created on Fri Feb 26 14:46:06 2016
-
-@author: lucadelu
-"""
-
 """
 Test t.rast.import
 
+Created on Fri Feb 26 14:46:06 2016
+
 (C) 2014 by the GRASS Development Team
 This program is free software under the GNU General Public
 License (>=v2). Read the file COPYING that comes with GRASS
@@ -16,6 +12,7 @@ for details.
 """
 
 from grass.gunittest.case import TestCase
+from grass.gunittest.gmodules import SimpleModule
 import os
 
 
@@ -44,3 +41,68 @@ class TestRasterImport(TestCase):
 
         info = SimpleModule("t.info", flags="g", input="A")
         self.assertModuleKeyValue(module=info, reference=tinfo, precision=2, sep="=")
+
+
+class TestRasterImportExtendRegion(TestCase):
+    """Maps imported in parallel with the e flag extend the region"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create and export maps with different extents"""
+        cls.use_temp_region()
+        extents = ((0, 40, 0, 40), (40, 80, 0, 40), (0, 40, 40, 120), (60, 90, 90, 150))
+        for i, (south, north, west, east) in enumerate(extents):
+            cls.runModule("g.region", s=south, n=north, w=west, e=east, res=10)
+            cls.runModule("r.mapcalc", expression="ext_%i = %i" % (i, i))
+        cls.runModule(
+            "t.create",
+            type="strds",
+            temporaltype="absolute",
+            output="ext",
+            title="ext",
+            description="ext",
+            overwrite=True,
+        )
+        cls.runModule(
+            "t.register",
+            input="ext",
+            start="2001-01-01",
+            increment="1 month",
+            maps="ext_0,ext_1,ext_2,ext_3",
+            overwrite=True,
+        )
+        cls.runModule(
+            "t.rast.export",
+            input="ext",
+            output="ext_export.tar.gz",
+            format="GTiff",
+            compression="gzip",
+            overwrite=True,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary region and the data"""
+        cls.del_temp_region()
+        cls.runModule("t.remove", flags="df", inputs="ext,ext_import")
+        os.remove("ext_export.tar.gz")
+
+    def test_import_extend_region(self):
+        """All extents are added to the region, although nprocs > 1"""
+        self.runModule("g.region", s=0, n=10, w=0, e=10, res=10)
+        self.assertModule(
+            "t.rast.import",
+            input="ext_export.tar.gz",
+            output="ext_import",
+            basename="ext_import",
+            directory=".",
+            flags="eo",
+            nprocs=4,
+            overwrite=True,
+        )
+        self.assertModuleKeyValue(
+            module=SimpleModule("g.region", flags="g"),
+            reference=dict(n=90, s=0, w=0, e=150),
+            precision=1e-6,
+            sep="=",
+        )
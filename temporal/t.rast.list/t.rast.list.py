@@ -80,7 +80,8 @@
 # % description: Output format
 # % required: no
 # % multiple: no
-# % options: plain,line,json,yaml,csv
+# % options: plain,line,json,jsonl,yaml,csv
+# % descriptions: plain;Plain text output;line;Values on one line;json;JSON (JavaScript Object Notation);jsonl;JSON lines with one object per map;yaml;YAML (YAML Ain't Markup Language);csv;CSV (Comma Separated Values)
 # % guisection: Formatting
 # %end
 
@@ -166,7 +167,7 @@ def main():
             # except for setting it to an empty string which does not have a precedence
             # in the current code and the behavior is unclear.
             separator = ","
-    if output_format in ["json", "yaml"] and header:
+    if output_format in ["json", "jsonl", "yaml"] and header:
         gs.fatal(
             message_option_value_excludes_flag(
                 option_name="format",
@@ -225,21 +226,6 @@ def main():
                             ).format(name=column, method=method),
                         )
                     )
-    elif columns:
-        columns_list = columns.split(",")
-        for column in ["interval_length", "distance_from_begin"]:
-            if column in columns_list:
-                gs.fatal(
-                    message_option_value_excludes_option_value(
-                        option_name="method",
-                        option_value=method,
-                        excluded_option_name="columns",
-                        excluded_option_value=columns,
-                        reason=_(
-                            "Column '{name}' is not available with the method '{method}'"
-                        ).format(name=column, method=method),
-                    )
-                )
     if output_format == "line" or method == "comma":
         columns_list = columns.split(",")
         if len(columns_list) > 1:
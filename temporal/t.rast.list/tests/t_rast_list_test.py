@@ -259,3 +259,36 @@ def test_gran_json(space_time_raster_dataset):
     assert len(result["data"]) > len(
         space_time_raster_dataset.raster_names
     ), "There should be more entries because of finer granularity"
+
+
+def test_json_lines(space_time_raster_dataset):
+    """Check JSON lines contain one object per map"""
+    lines = (
+        gs.read_command(
+            "t.rast.list", input=space_time_raster_dataset.name, format="jsonl"
+        )
+        .strip()
+        .splitlines()
+    )
+    items = [json.loads(line) for line in lines]
+    names = [item["name"] for item in items]
+    assert names == space_time_raster_dataset.raster_names
+
+
+def test_computed_columns_list(space_time_raster_dataset):
+    """Computed columns with method list are the same as with method delta"""
+    columns = ["name", "interval_length", "distance_from_begin"]
+    results = [
+        json.loads(
+            gs.read_command(
+                "t.rast.list",
+                input=space_time_raster_dataset.name,
+                method=method,
+                columns=columns,
+                format="json",
+            )
+        )["data"]
+        for method in ["list", "delta", "deltagaps"]
+    ]
+    assert results[0] == results[1] == results[2]
+    assert results[0][0]["distance_from_begin"] == 0
@@ -82,6 +82,46 @@
 # % answer: 1000
 # %end
 
+# %option
+# % key: window
+# % type: integer
+# % label: Number of maps in a moving window
+# % description: Compute the aggregates for each step of a moving window over the maps in one pass and register them in new space time raster datasets named by the output option
+# % required: no
+# % options: 1-
+# % guisection: Moving window
+# %end
+
+# %option
+# % key: step
+# % type: integer
+# % description: Number of maps the moving window is shifted by
+# % required: no
+# % options: 1-
+# % answer: 1
+# % guisection: Moving window
+# %end
+
+# %option
+# % key: basename
+# % type: string
+# % label: Basename of the maps created by the moving window
+# % description: Name of the output space time raster dataset is used by default, the method name is appended if more methods are computed
+# % required: no
+# % multiple: no
+# % guisection: Moving window
+# %end
+
+# %option
+# % key: suffix
+# % type: string
+# % description: Suffix to add at basename: set 'time' for the start time of the window, 'num' for numerical suffix with a specific number of digits (default %05)
+# % answer: num
+# % required: no
+# % multiple: no
+# % guisection: Moving window
+# %end
+
 # %flag
 # % key: t
 # % description: Do not assign the space time raster dataset start and end time to the output map
@@ -92,9 +132,260 @@
 # % description: Propagate NULLs
 # %end
 
+import ctypes
+
 import grass.script as grass
 from grass.exceptions import CalledModuleError
 
+# Methods which can be computed for a moving window
+WINDOW_METHODS = ("average", "count", "minimum", "maximum", "sum")
+
+############################################################################
+
+
+def window_series(inputs, outputs, methods, window, step, nulls, memory, file_limit):
+    """Compute aggregates of a moving window over the input maps
+
+    Each input map is read once per batch of windows which fits into
+    file_limit open maps. The rows of the maps of a batch are read in
+    bands, all windows of the batch are computed for the band from
+    cumulative sums along the time axis (sum, count, average) or from
+    a sliding view (minimum, maximum) and written to the output maps.
+
+    :param inputs: List of input map ids ordered by time
+    :param outputs: List of lists of output map names, one list of
+                    names of all methods for each window step
+    :param methods: List of methods from WINDOW_METHODS
+    :param window: Number of maps in a window
+    :param step: Number of maps the window is shifted by
+    :param nulls: Propagate NULLs, any NULL in a window results in NULL
+    :param memory: Memory in MB used for the bands of rows
+    :param file_limit: Maximum number of maps open at the same time
+    """
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+    import grass.lib.gis as libgis
+    import grass.lib.raster as libraster
+
+    # The maps are read and written by the C-library in this process
+    libgis.G_gisinit("t.rast.series")
+
+    rows = libraster.Rast_window_rows()
+    cols = libraster.Rast_window_cols()
+    dcell_p = ctypes.POINTER(libraster.DCELL)
+
+    # Inputs and outputs of all windows of a batch are open at the same time
+    batch_size = max(1, (file_limit - window + step) // (step + len(methods)))
+    num_windows = len(outputs)
+
+    for first_window in range(0, num_windows, batch_size):
+        batch = outputs[first_window : first_window + batch_size]
+        first_map = first_window * step
+        names = inputs[first_map : first_map + (len(batch) - 1) * step + window]
+        grass.verbose(
+            _("Computing moving window {first} - {last} of {num}").format(
+                first=first_window + 1, last=first_window + len(batch), num=num_windows
+            )
+        )
+
+        input_fds = [libraster.Rast_open_old(name, "") for name in names]
+        output_fds = [
+            [
+                libraster.Rast_open_new(
+                    name,
+                    libraster.CELL_TYPE if method == "count" else libraster.DCELL_TYPE,
+                )
+                for name, method in zip(names_of_window, methods)
+            ]
+            for names_of_window in batch
+        ]
+
+        # Values, cumulative sums and window results of a band
+        band_rows = memory * 1024 * 1024 // (len(names) * cols * 8 * 4)
+        band_rows = max(1, min(rows, band_rows))
+        buf = np.empty((len(names), band_rows, cols))
+        starts = np.arange(len(batch)) * step
+        out_row = np.empty(cols)
+
+        for first in range(0, rows, band_rows):
+            grass.percent(first, rows, 2)
+            num = min(band_rows, rows - first)
+            values = buf[:, :num]
+            for fd, band in zip(input_fds, values):
+                for row in range(num):
+                    libraster.Rast_get_d_row(
+                        fd, band[row].ctypes.data_as(dcell_p), first + row
+                    )
+
+            valid = ~np.isnan(values)
+            count = None
+            if set(methods) & {"average", "count", "sum"} or nulls:
+                cum = np.zeros((len(names) + 1, num, cols), dtype=np.int32)
+                np.cumsum(valid, axis=0, out=cum[1:])
+                count = cum[starts + window] - cum[starts]
+            results = {}
+            if set(methods) & {"average", "sum"}:
+                cum = np.zeros((len(names) + 1, num, cols))
+                np.cumsum(np.where(valid, values, 0.0), axis=0, out=cum[1:])
+                total = cum[starts + window] - cum[starts]
+                total[count == 0] = np.nan
+                results["sum"] = total
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    results["average"] = total / count
+            if "count" in methods:
+                results["count"] = count.astype(np.float64)
+            if set(methods) & {"minimum", "maximum"}:
+                view = sliding_window_view(values, window, axis=0)[::step]
+                if "minimum" in methods:
+                    results["minimum"] = np.fmin.reduce(view, axis=-1)
+                if "maximum" in methods:
+                    results["maximum"] = np.fmax.reduce(view, axis=-1)
+            if nulls:
+                incomplete = count < window
+                for result in results.values():
+                    result[incomplete] = np.nan
+
+            for i, fds in enumerate(output_fds):
+                for fd, method in zip(fds, methods):
+                    for row in results[method][i]:
+                        out_row[:] = row
+                        libraster.Rast_put_d_row(fd, out_row.ctypes.data_as(dcell_p))
+
+        grass.percent(1, 1, 1)
+
+        for fd in input_fds:
+            libraster.Rast_close(fd)
+        for fds, names_of_window in zip(output_fds, batch):
+            for fd, name in zip(fds, names_of_window):
+                libraster.Rast_close(fd)
+                history = libraster.History()
+                libraster.Rast_short_history(name, "raster", ctypes.byref(history))
+                libraster.Rast_command_history(ctypes.byref(history))
+                libraster.Rast_write_history(name, ctypes.byref(history))
+
+
+def main_window(sp, options, flags):
+    """Compute the moving window aggregates and register them in new
+    space time raster datasets, one for each method"""
+    # lazy imports
+    import grass.temporal as tgis
+
+    window = int(options["window"])
+    step = int(options["step"])
+    methods = options["method"].split(",")
+    strds_names = options["output"].split(",")
+    suffix = options["suffix"]
+
+    unsupported = [method for method in methods if method not in WINDOW_METHODS]
+    if unsupported:
+        grass.fatal(
+            _(
+                "Method(s) <{methods}> not supported with moving window, use {supported}"
+            ).format(methods=",".join(unsupported), supported=",".join(WINDOW_METHODS))
+        )
+    if len(methods) != len(strds_names):
+        grass.fatal(_("Number requested methods and output maps do not match."))
+    if suffix == "time" and not sp.is_time_absolute():
+        grass.fatal(_("The time suffix requires an absolute space time dataset"))
+
+    dbif = tgis.SQLDatabaseInterfaceConnection()
+    dbif.connect()
+
+    maps = sp.get_registered_maps_as_objects(
+        where=options["where"], order=options["order"], dbif=dbif
+    )
+    if not maps or len(maps) < window:
+        dbif.close()
+        grass.warning(
+            _(
+                "Space time raster dataset <{name}> has fewer maps than the window"
+            ).format(name=sp.get_id())
+        )
+        return
+
+    output_strds = []
+    for name in strds_names:
+        temporal_type, semantic_type, title, description = sp.get_initial_values()
+        output_strds.append(
+            tgis.open_new_stds(
+                name,
+                "strds",
+                temporal_type,
+                title,
+                description,
+                semantic_type,
+                dbif,
+                grass.overwrite(),
+            )
+        )
+
+    mapset = grass.gisenv()["MAPSET"]
+    outputs = []
+    output_maps = [[] for unused in methods]
+    for count, first in enumerate(range(0, len(maps) - window + 1, step)):
+        window_maps = maps[first : first + window]
+        start, unused = window_maps[0].get_temporal_extent_as_tuple()
+        last_start, end = window_maps[-1].get_temporal_extent_as_tuple()
+        if end is None:
+            end = last_start
+
+        names = []
+        for i, (method, strds_name) in enumerate(zip(methods, strds_names)):
+            basename = options["basename"] or strds_name.split("@")[0]
+            if options["basename"] and len(methods) > 1:
+                basename = "{ba}_{me}".format(ba=basename, me=method)
+            if suffix == "time":
+                name = "{ba}_{su}".format(
+                    ba=basename,
+                    su=start.isoformat().replace(":", "_").replace("-", "_"),
+                )
+            else:
+                name = tgis.create_numeric_suffix(basename, count + 1, suffix)
+            map_id = name + "@" + mapset
+            if (
+                grass.find_file(name=name, element="cell", mapset=mapset)["file"]
+                and not grass.overwrite()
+            ):
+                dbif.close()
+                grass.fatal(
+                    _(
+                        "Raster map <{name}> is already in the mapset, use overwrite"
+                        " flag to overwrite"
+                    ).format(name=map_id)
+                )
+
+            new_map = sp.get_new_map_instance(map_id)
+            if new_map.is_time_absolute():
+                new_map.set_absolute_time(start, end)
+            else:
+                new_map.set_relative_time(
+                    start, end, window_maps[0].get_relative_time_unit()
+                )
+            output_maps[i].append(new_map)
+            names.append(name)
+        outputs.append(names)
+
+    window_series(
+        inputs=[map_.get_id() for map_ in maps],
+        outputs=outputs,
+        methods=methods,
+        window=window,
+        step=step,
+        nulls=flags["n"],
+        memory=int(options["memory"]),
+        file_limit=int(options["file_limit"]),
+    )
+
+    for strds, method, map_list in zip(output_strds, methods, output_maps):
+        tgis.register_map_object_list(
+            "rast", map_list, strds, False, sp.get_relative_time_unit(), dbif
+        )
+        strds.set_aggregation_type(method)
+        strds.metadata.update(dbif)
+
+    dbif.close()
+
+
 ############################################################################
 
 
@@ -131,6 +422,10 @@ def main():
 
     sp = tgis.open_old_stds(input, "strds")
 
+    if options["window"]:
+        main_window(sp, options, flags)
+        return
+
     rows = sp.get_registered_maps("id", where, order, None)
 
     if rows:
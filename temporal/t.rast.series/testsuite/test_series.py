@@ -8,6 +8,8 @@ for details.
 :authors: Soeren Gebbert
 """
 import os
+from datetime import datetime
+
 import grass.pygrass.modules as pymod
 import grass.temporal as tgis
 from grass.gunittest.case import TestCase
@@ -157,6 +159,54 @@ class TestSnapAbsoluteSTRDS(TestCase):
             map="series_quantile", refmin=300, refmax=300, msg="Minimum must be 300"
         )
 
+    def test_moving_window(self):
+        self.assertModule(
+            "t.rast.series",
+            input="A",
+            method="average,maximum,count",
+            output="window_average,window_maximum,window_count",
+            window=2,
+        )
+
+        strds = tgis.open_old_stds("window_average", type="strds")
+        maps = strds.get_registered_maps_as_objects()
+        self.assertEqual(len(maps), 3)
+        self.assertEqual(
+            maps[1].get_temporal_extent_as_tuple(),
+            (datetime(2001, 2, 1), datetime(2001, 4, 1)),
+        )
+        for i, value in enumerate([150, 250, 350], start=1):
+            self.assertRasterMinMax(
+                map="window_average_%05d" % i, refmin=value, refmax=value
+            )
+            self.assertRasterMinMax(
+                map="window_maximum_%05d" % i, refmin=value + 50, refmax=value + 50
+            )
+            self.assertRasterMinMax(map="window_count_%05d" % i, refmin=2, refmax=2)
+
+        self.runModule(
+            "t.remove",
+            flags="df",
+            type="strds",
+            inputs="window_average,window_maximum,window_count",
+        )
+
+    def test_moving_window_step(self):
+        self.assertModule(
+            "t.rast.series",
+            input="A",
+            method="sum",
+            output="window_sum",
+            window=3,
+            step=2,
+            where="start_time >= '2001-01-01'",
+        )
+
+        strds = tgis.open_old_stds("window_sum", type="strds")
+        self.assertEqual(len(strds.get_registered_maps_as_objects()), 1)
+        self.assertRasterMinMax(map="window_sum_00001", refmin=600, refmax=600)
+        self.runModule("t.remove", flags="df", type="strds", inputs="window_sum")
+
 
 class TestSnapRelativeSTRDS(TestCase):
     @classmethod
@@ -37,7 +37,6 @@
 # %end
 from __future__ import print_function
 
-import os
 import grass.script as grass
 from datetime import datetime
 from grass.exceptions import CalledModuleError
@@ -64,12 +63,6 @@ def main():
 
     maps = sp.get_registered_maps_as_objects_by_granularity()
     num_maps = len(maps)
-    # get datatype of the first map
-    if maps:
-        maps[0][0].select()
-        datatype = maps[0][0].metadata.get_datatype()
-    else:
-        datatype = None
 
     # Get the granularity and set bottom, top and top-bottom resolution
     granularity = sp.get_granularity()
@@ -129,43 +122,27 @@ def main():
     except CalledModuleError:
         grass.fatal(_("Unable to set 3D region"))
 
-    # Create a NULL map to fill the gaps
-    null_map = "temporary_null_map_%i" % os.getpid()
-    if datatype == "DCELL":
-        grass.mapcalc("%s = double(null())" % (null_map))
-    elif datatype == "FCELL":
-        grass.mapcalc("%s = float(null())" % (null_map))
-    else:
-        grass.mapcalc("%s = null()" % (null_map))
-
     if maps:
-        count = 0
-        map_names = ""
-        for map in maps:
-            # Use the first map
-            id = map[0].get_id()
-            # None ids will be replaced by NULL maps
-            if id is None:
-                id = null_map
-
-            if count == 0:
-                map_names = id
-            else:
-                map_names += ",%s" % id
-
-            count += 1
+        # The slices are passed in a file, gaps are represented by empty
+        # lines which r.to.rast3 fills with NULL values
+        map_file = grass.tempfile()
+        with open(map_file, "w") as f:
+            for map in maps:
+                # Use the first map
+                id = map[0].get_id()
+                f.write("%s\n" % (id if id is not None else ""))
 
         try:
             grass.run_command(
                 "r.to.rast3",
-                input=map_names,
+                file=map_file,
                 output=output,
                 overwrite=grass.overwrite(),
             )
         except CalledModuleError:
             grass.fatal(_("Unable to create 3D raster map <%s>" % output))
-
-    grass.run_command("g.remove", flags="f", type="raster", name=null_map)
+        finally:
+            grass.try_remove(map_file)
 
     title = _("Space time voxel cube")
     descr = _("This space time voxel cube was created with t.rast.to.rast3")
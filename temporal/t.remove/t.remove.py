@@ -66,14 +66,76 @@
 # % description: Remove stds, unregister maps from temporal database and delete them from mapset
 # %end
 
+# %flag
+# % key: b
+# % description: Remove registered maps from temporal database in bulk using set based SQL statements
+# %end
+
+# %option G_OPT_M_NPROCS
+# % description: Number of g.remove processes to run in parallel when deleting maps from mapset
+# %end
+
+# %rules
+# % requires: -b, -f
+# %end
+
+import copy
+
 import grass.script as grass
 
 
 # lazy imports at the end of the file
 
+# number of map names passed to a single g.remove call
+REMOVE_CHUNK_SIZE = 1000
+
 ############################################################################
 
 
+def remove_maps(remove, element, name_list, nprocs):
+    """Remove maps from mapset running chunks of names in parallel"""
+    process_queue = pyg.ParallelModuleQueue(nprocs)
+    for i in range(0, len(name_list), REMOVE_CHUNK_SIZE):
+        mod = copy.deepcopy(remove)
+        mod(type=element, name=name_list[i : i + REMOVE_CHUNK_SIZE])
+        process_queue.put(mod)
+    process_queue.wait()
+
+
+def bulk_remove(sp, dbif, recursive, clean, nprocs):
+    """Remove registered maps of a space time dataset at once
+
+    Return the SQL statements to delete the maps and the space time
+    dataset from the temporal database and the ids of the other space
+    time datasets in which the maps are registered, these must be
+    updated after the statements are executed
+    """
+    rows = sp.get_registered_maps("id,name", None, None, dbif)
+    if rows is None:
+        rows = []
+    name_list = []
+    for row in rows:
+        # We may have multiple layer for a single map
+        if row["name"] not in name_list:
+            name_list.append(str(row["name"]))
+        if recursive and not clean:
+            map = sp.get_new_map_instance(row["id"])
+            map.remove_timestamp_from_grass()
+
+    datasets = sp.get_datasets_of_registered_maps(dbif)
+    statement = sp.delete_registered_maps(dbif=dbif, execute=False)
+    statement += sp.delete(dbif=dbif, execute=False, bulk=True)
+    if clean and name_list:
+        remove = pyg.Module("g.remove", quiet=True, flags="f", run_=False)
+        element = {"strds": "raster", "stvds": "vector", "str3ds": "raster_3d"}
+        # The maps are removed from the temporal database first, hence
+        # a failing g.remove leaves no dangling entries
+        dbif.execute_transaction(statement)
+        remove_maps(remove, element[sp.get_type()], name_list, nprocs)
+        statement = ""
+    return statement, datasets
+
+
 def main():
     # Get the options
     datasets = options["inputs"]
@@ -82,6 +144,8 @@ def main():
     recursive = flags["r"]
     force = flags["f"]
     clean = flags["d"]
+    bulk = flags["b"]
+    nprocs = int(options["nprocs"])
 
     if datasets and file:
         grass.fatal(_("%s= and %s= are mutually exclusive") % ("input", "file"))
@@ -116,6 +180,9 @@ def main():
             dataset_list.append(dataset_name)
 
     statement = ""
+    # Space time datasets to update after the bulk removal of maps
+    update_datasets = []
+    removed_datasets = []
 
     # Create the pygrass Module object for g.remove
     remove = pyg.Module("g.remove", quiet=True, flags="f", run_=False)
@@ -130,6 +197,17 @@ def main():
             grass.message(
                 _("{stds}: {gid}".format(stds=sp.get_type().upper(), gid=sp.get_id()))
             )
+        removed_datasets.append(sp.get_id())
+        if bulk:
+            if recursive or clean:
+                bulk_statement, datasets = bulk_remove(
+                    sp, dbif, recursive, clean, nprocs
+                )
+                statement += bulk_statement
+                update_datasets.extend(datasets)
+            else:
+                statement += sp.delete(dbif=dbif, execute=False, bulk=True)
+            continue
         if recursive or clean:
             if not force:
                 if recursive:
@@ -197,6 +275,12 @@ def main():
     else:
         # Execute the collected SQL statenents
         dbif.execute_transaction(statement)
+        # Update the space time datasets which shared maps with the
+        # datasets removed in bulk
+        for dataset in sorted(set(update_datasets) - set(removed_datasets)):
+            stds = sp.get_new_instance(dataset)
+            stds.select(dbif)
+            stds.update_from_registered_maps(dbif)
         dbif.close()
 
 
@@ -0,0 +1,145 @@
+"""Test t.remove
+
+(C) 2023 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+import datetime
+
+import grass.temporal as tgis
+from grass.gunittest.case import TestCase
+from grass.gunittest.main import test
+
+
+class TestBulkRemove(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Initiate the temporal GIS and set the region"""
+        tgis.init()
+        cls.use_temp_region()
+        cls.runModule("g.gisenv", set="TGIS_USE_CURRENT_MAPSET=1")
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary region"""
+        cls.del_temp_region()
+
+    def setUp(self):
+        """Create the space time raster datasets A and B which share the
+        maps a1, a2 and a3, the maps b1 and b2 of B have a smaller extent
+        """
+        self.runModule("g.region", s=0, n=80, w=0, e=120, res=10)
+        for i in range(1, 7):
+            self.runModule(
+                "r.mapcalc", expression="a%i = %i" % (i, i * 100), overwrite=True
+            )
+        self.runModule("g.region", s=0, n=40, w=0, e=60, res=10)
+        self.runModule("r.mapcalc", expression="b1 = 10", overwrite=True)
+        self.runModule("r.mapcalc", expression="b2 = 20", overwrite=True)
+
+        for name in ("A", "B"):
+            self.runModule(
+                "t.create",
+                type="strds",
+                temporaltype="absolute",
+                output=name,
+                title="A test",
+                description="A test",
+                overwrite=True,
+            )
+        self.runModule(
+            "t.register",
+            flags="i",
+            type="raster",
+            input="A",
+            maps="a1,a2,a3,a4,a5,a6",
+            start="2001-01-01",
+            increment="3 months",
+            overwrite=True,
+        )
+        self.runModule(
+            "t.register", type="raster", input="B", maps="a1,a2,a3", overwrite=True
+        )
+        self.runModule(
+            "t.register",
+            flags="i",
+            type="raster",
+            input="B",
+            maps="b1,b2",
+            start="2001-10-01",
+            increment="3 months",
+            overwrite=True,
+        )
+        self.map_register = tgis.open_old_stds("A", type="strds").get_map_register()
+
+    def tearDown(self):
+        """Remove generated data"""
+        mapset = tgis.get_current_mapset()
+        for name in ("A", "B"):
+            if tgis.SpaceTimeRasterDataset("%s@%s" % (name, mapset)).is_in_db():
+                self.runModule("t.remove", flags="f", type="strds", inputs=name)
+        self.runModule(
+            "g.remove",
+            flags="f",
+            type="raster",
+            name="a1,a2,a3,a4,a5,a6,b1,b2",
+        )
+
+    def assert_removed(self):
+        """Check that A, its map register table and its maps are removed
+        from the temporal database"""
+        dbif = tgis.SQLDatabaseInterfaceConnection()
+        dbif.connect()
+        self.assertFalse(dbif.check_table(self.map_register))
+        mapset = tgis.get_current_mapset()
+        stds = tgis.SpaceTimeRasterDataset("A@%s" % mapset)
+        self.assertFalse(stds.is_in_db(dbif))
+        for i in range(1, 7):
+            map_ = tgis.RasterDataset("a%i@%s" % (i, mapset))
+            self.assertFalse(map_.is_in_db(dbif))
+        dbif.close()
+
+    def assert_updated(self):
+        """Check that B contains only the maps b1 and b2 and its metadata
+        and extent are updated"""
+        B = tgis.open_old_stds("B", type="strds")
+        maps = B.get_registered_maps_as_objects()
+        self.assertEqual([map_.get_name() for map_ in maps], ["b1", "b2"])
+        self.assertEqual(B.metadata.get_number_of_maps(), 2)
+        self.assertEqual(B.metadata.get_min_min(), 10)
+        self.assertEqual(B.metadata.get_max_max(), 20)
+        self.assertEqual(
+            B.get_temporal_extent_as_tuple()[0], datetime.datetime(2001, 10, 1)
+        )
+        self.assertEqual(
+            B.get_temporal_extent_as_tuple()[1], datetime.datetime(2002, 4, 1)
+        )
+        self.assertEqual(B.get_granularity(), "3 months")
+        north, south, east, west = B.get_spatial_extent_as_tuple()[:4]
+        self.assertEqual((north, south, east, west), (40, 0, 60, 0))
+
+    def test_bulk_remove_delete(self):
+        """Remove A and delete its maps in bulk"""
+        self.assertModule("t.remove", flags="dfb", type="strds", inputs="A", nprocs=2)
+        self.assert_removed()
+        for i in range(1, 7):
+            self.assertRasterDoesNotExist("a%i" % i)
+        self.assert_updated()
+
+    def test_bulk_remove_recursive(self):
+        """Remove A and unregister its maps in bulk"""
+        self.assertModule("t.remove", flags="rfb", type="strds", inputs="A")
+        self.assert_removed()
+        for i in range(1, 7):
+            self.assertRasterExists("a%i" % i)
+        self.assert_updated()
+
+    def test_bulk_remove_requires_force(self):
+        """The bulk flag requires the force flag"""
+        self.assertModuleFail("t.remove", flags="rb", type="strds", inputs="A")
+        self.assertTrue(tgis.open_old_stds("A", type="strds").is_in_db())
+
+
+if __name__ == "__main__":
+    test()
@@ -80,6 +80,12 @@
 # % description: Update metadata information, temporal and spatial extent from registered maps based on database entries.
 # %end
 
+# %flag
+# % key: c
+# % label: Check the temporal and spatial extent and metadata of the space time dataset
+# % description: Recompute the extent and metadata from all registered maps and report values that were not consistent
+# %end
+
 
 import grass.script as grass
 
@@ -100,6 +106,7 @@ def main():
     semantic = options["semantictype"]
     update = flags["u"]
     map_update = flags["m"]
+    check = flags["c"]
 
     # Make sure the temporal database exists
     tgis.init()
@@ -172,7 +179,23 @@ def main():
             stds_new.select(dbif=dbif)
             stds_new.update_from_registered_maps(dbif=dbif)
 
-    if map_update or update:
+    if check:
+        differences = stds.check_registered_maps_metadata(dbif=dbif)
+        for column, stored, computed in differences:
+            grass.warning(
+                _("Value of <{column}> was {stored} instead of {computed}").format(
+                    column=column, stored=stored, computed=computed
+                )
+            )
+        if differences:
+            grass.message(
+                _("Extent and metadata of <{}> were updated").format(stds.get_id())
+            )
+        else:
+            grass.message(
+                _("Extent and metadata of <{}> are consistent").format(stds.get_id())
+            )
+    elif map_update or update:
         stds.update_from_registered_maps(dbif=dbif)
 
     stds.update_command_string(dbif=dbif)
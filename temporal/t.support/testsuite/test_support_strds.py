@@ -111,6 +111,19 @@ class TestSupportAbsoluteSTRDS(TestCase):
         self.assertEqual(A.metadata.get_max_max(), 30)
         self.assertEqual(A.metadata.get_number_of_maps(), 3)
 
+    def test_4_check(self):
+        """Check the extent and metadata against the registered maps"""
+
+        A = tgis.open_old_stds("A", type="strds")
+        self.assertEqual(A.check_registered_maps_metadata(), [])
+
+        self.assertModule("t.support", input="A", flags="c")
+
+        A.select()
+        self.assertEqual(A.metadata.get_min_min(), 10)
+        self.assertEqual(A.metadata.get_max_max(), 30)
+        self.assertEqual(A.metadata.get_number_of_maps(), 3)
+
 
 if __name__ == "__main__":
     from grass.gunittest.main import test
@@ -72,7 +72,7 @@ def main():
     sp = tgis.open_old_stds(name, type)
 
     # Get ordered map list
-    maps = sp.get_registered_maps_as_objects(where=where, order="start_time", dbif=None)
+    maps = sp.get_registered_maps_as_records(where=where, order="start_time", dbif=None)
 
     spatial = None
 
@@ -122,6 +122,7 @@ def main():
 
     num_maps = len(maplist)
     update_dict = {}
+    removed_maps = []
     count = 0
 
     statement = ""
@@ -138,8 +139,14 @@ def main():
         if map.is_in_db(dbif, mapset=mapset):
             # Unregister from a single dataset
             if input:
+                # The extent and metadata of the removed maps are
+                # required to update the space time dataset
+                map.select(dbif)
                 # Collect SQL statements
-                statement += sp.unregister_map(map=map, dbif=dbif, execute=False)
+                map_statement = sp.unregister_map(map=map, dbif=dbif, execute=False)
+                if map_statement:
+                    removed_maps.append(map)
+                    statement += map_statement
 
             # Unregister from temporal database
             else:
@@ -175,7 +182,7 @@ def main():
         grass.message(_("Unregister maps from the temporal database"))
 
     if input:
-        sp.update_from_registered_maps(dbif)
+        sp.update_from_removed_maps(removed_maps, dbif)
         sp.update_command_string(dbif=dbif)
     elif len(update_dict) > 0:
         count = 0
@@ -48,7 +48,8 @@
 # % description: Compression method of the tar archive
 # % required: no
 # % multiple: no
-# % options: no,gzip,bzip2
+# % options: no,fast,gzip,bzip2,xz
+# % descriptions: no;No compression;fast;GNU zip compression with the fastest level;gzip;GNU zip compression;bzip2;Bzip compression;xz;LZMA compression
 # % answer: bzip2
 # %end
 
@@ -66,6 +67,10 @@
 # %option G_OPT_T_WHERE
 # %end
 
+# %option G_OPT_M_NPROCS
+# % description: Number of maps exported in parallel
+# %end
+
 import grass.script as grass
 
 
@@ -81,11 +86,14 @@ def main():
     directory = options["directory"]
     where = options["where"]
     _format = options["format"]
+    nprocs = int(options["nprocs"])
 
     # Make sure the temporal database exists
     tgis.init()
     # Export the space time vector dataset
-    tgis.export_stds(_input, output, compression, directory, where, _format, "stvds")
+    tgis.export_stds(
+        _input, output, compression, directory, where, _format, "stvds", nprocs=nprocs
+    )
 
 
 ############################################################################
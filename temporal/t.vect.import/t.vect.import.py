@@ -73,6 +73,10 @@
 # % multiple: no
 # %end
 
+# %option G_OPT_M_NPROCS
+# % description: Number of maps imported in parallel
+# %end
+
 # %flag
 # % key: e
 # % description: Extend location extents based on new dataset
@@ -104,6 +108,7 @@ def main():
     descr = options["description"]
     location = options["location"]
     base = options["basename"]
+    nprocs = int(options["nprocs"])
     exp = flags["e"]
     overr = flags["o"]
     create = flags["c"]
@@ -123,6 +128,7 @@ def main():
         create,
         "stvds",
         base,
+        nprocs=nprocs,
     )
 
 
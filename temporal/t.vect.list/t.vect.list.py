@@ -68,6 +68,17 @@
 # % answer: cols
 # %end
 
+# %option
+# % key: format
+# % type: string
+# % description: Output format
+# % required: no
+# % multiple: no
+# % options: plain,line,json,jsonl,yaml,csv
+# % descriptions: plain;Plain text output;line;Values on one line;json;JSON (JavaScript Object Notation);jsonl;JSON lines with one object per map;yaml;YAML (YAML Ain't Markup Language);csv;CSV (Comma Separated Values)
+# % guisection: Formatting
+# %end
+
 # %option G_OPT_F_SEP
 # % label: Field separator character between the output columns
 # % guisection: Formatting
@@ -102,12 +113,33 @@ def main():
     method = options["method"]
     header = flags["u"]
     output = options["output"]
+    output_format = options["format"]
+
+    if output_format in ["json", "jsonl", "yaml"] and header:
+        grass.fatal(
+            _(
+                "The flag -u is not allowed with format={output_format}."
+                " Column names are always included"
+            ).format(output_format=output_format)
+        )
+    elif output_format in ["csv", "line"] and separator == "|":
+        # Pipe is the default of the separator option, use comma for these
+        separator = ","
 
     # Make sure the temporal database exists
     tgis.init()
 
     tgis.list_maps_of_stds(
-        "stvds", input, columns, order, where, separator, method, header, outpath=output
+        "stvds",
+        input,
+        columns,
+        order,
+        where,
+        separator,
+        method,
+        header,
+        outpath=output,
+        output_format=output_format,
     )
 
 